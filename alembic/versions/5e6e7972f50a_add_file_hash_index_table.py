@@ -0,0 +1,43 @@
+"""add file_hash_index table
+
+Revision ID: 5e6e7972f50a
+Revises: b6d60f698c27
+Create Date: 2026-10-16 10:12:41.518203
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e6e7972f50a"
+down_revision: str | None = "b6d60f698c27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the file_hash_index table used by dedupe_init rescans.
+
+    Maps (directory, relative path) to the file's stat signature and content
+    hash so files whose size/mtime/inode are unchanged skip re-hashing.
+    """
+    op.create_table(
+        "file_hash_index",
+        sa.Column("directory", sa.String(), nullable=False),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("mtime_ns", sa.BigInteger(), nullable=False),
+        sa.Column("inode", sa.BigInteger(), nullable=False),
+        sa.Column("content_hash", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("directory", "path"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the file_hash_index table."""
+    op.drop_table("file_hash_index")
@@ -9,6 +9,7 @@ from collections.abc import Callable, Sequence
 from ctypes import c_int32
 from dataclasses import field
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import quote, urlencode, urlparse
 
@@ -28,6 +29,26 @@ if TYPE_CHECKING:
     from config import FanslyConfig
 
 
+# Key tuple of a decoded object -> (its ``*Id`` keys, its ``*Ids`` keys).
+# Objects of one API type share their keys, so each key set is inspected
+# once instead of every object being scanned key by key.
+_IdKeyPlan = tuple[tuple[str, ...], tuple[str, ...]]
+_ID_KEY_PLANS: dict[tuple[str, ...], _IdKeyPlan] = {}
+_MAX_ID_KEY_PLANS = 4096
+
+# Lifetime of a cached CORS preflight when the response has no
+# Access-Control-Max-Age (the Fetch standard default), and the longest
+# lifetime honoured (Chromium's cap).
+_PREFLIGHT_DEFAULT_MAX_AGE = 5.0
+_PREFLIGHT_MAX_AGE_CAP = 7200.0
+
+# Identity of a coalescable GET: URL, extra params, Fansly headers on/off and
+# the alternate token, if any
+_RequestKey = tuple[str, tuple[tuple[str, str], ...], bool, str | None]
+# Most responses kept for reuse; expired ones are dropped first
+_MAX_CACHED_RESPONSES = 64
+
+
 class FanslyApi:
     # ── URL constants ────────────────────────────────────────────────
     # Source-of-truth for every Fansly host/path in the codebase. Tests
@@ -72,6 +93,17 @@ class FanslyApi:
     DEVICE_ID_ENDPOINT: ClassVar[str] = f"{BASE_URL}device/id"
     LOGIN_ENDPOINT: ClassVar[str] = f"{BASE_URL}login?ngsw-bypass=true"
 
+    # ── Response coalescing ──────────────────────────────────────────
+    # Endpoints (matched by ``_request_template``) whose identical GETs
+    # share one in-flight request, mapped to how many seconds a 200 response
+    # is reused afterwards. The daemon's polls, ``should_process_creator``
+    # and worker items ask for the same pages within seconds of each other.
+    RESPONSE_CACHE_TTLS: ClassVar[dict[str, float]] = {
+        TIMELINE_NEW_ENDPOINT: 10.0,
+        ACCOUNT_BY_ID_ENDPOINT: 30.0,
+        ACCOUNT_MEDIA_ENDPOINT: 30.0,
+    }
+
     def __init__(
         self,
         token: str,
@@ -129,6 +161,15 @@ class FanslyApi:
         self._segment_retry = retry
         self._segment_session: httpx.Client | None = None
 
+        # CORS preflight cache shared by both clients: endpoint template ->
+        # monotonic expiry, like a browser's per-URL preflight cache.
+        self._preflight_cache: dict[str, float] = {}
+
+        # Single-flight GETs and recently completed responses, keyed by
+        # request identity; see ``RESPONSE_CACHE_TTLS``.
+        self._in_flight: dict[_RequestKey, asyncio.Future[httpx.Response]] = {}
+        self._response_cache: dict[_RequestKey, tuple[float, httpx.Response]] = {}
+
         # Internal Fansly stuff
         self.check_key = check_key
 
@@ -242,10 +283,8 @@ class FanslyApi:
             )
         return self._segment_session
 
-    async def cors_options_request(self, url: str) -> None:
-        """Performs an OPTIONS CORS request to Fansly servers."""
-
-        headers = {
+    def get_cors_headers(self) -> dict[str, str]:
+        return {
             "Accept": "*/*",
             "Accept-Language": "en-US,en;q=0.9",
             "Access-Control-Request-Headers": "authorization,fansly-client-check,fansly-client-id,fansly-client-ts,fansly-session-id",
@@ -255,10 +294,70 @@ class FanslyApi:
             "User-Agent": self.user_agent,
         }
 
-        await self.http_session.options(
+    @staticmethod
+    def _endpoint_template(url: str) -> str:
+        """Endpoint template for ``url``: numeric path IDs folded, no query.
+
+        ``timelinenew/123`` and ``timelinenew/456`` both give
+        ``TIMELINE_NEW_ENDPOINT``; cursors and ID lists in the query string
+        are dropped.
+        """
+        parsed = urlparse(url)
+        path = "/".join(
+            "{}" if part.isdigit() else part for part in parsed.path.split("/")
+        )
+        return f"{parsed.scheme}://{parsed.netloc}{path}"
+
+    @classmethod
+    def _request_template(cls, url: str) -> str:
+        """``_endpoint_template`` plus the query with its values as ``{}``.
+
+        Gives back the endpoint constant a URL was formatted from, e.g.
+        ``account?ids=1,2`` -> ``ACCOUNT_BY_ID_ENDPOINT``.
+        """
+        query = "&".join(f"{name}={{}}" for name in get_flat_qs_dict(url))
+        template = cls._endpoint_template(url)
+        return f"{template}?{query}" if query else template
+
+    @staticmethod
+    def _preflight_max_age(response: httpx.Response) -> float:
+        """Seconds a preflight response may be reused; 0 means not at all."""
+        if not response.is_success:
+            return 0.0
+        max_age = response.headers.get("Access-Control-Max-Age")
+        if max_age is None:
+            return _PREFLIGHT_DEFAULT_MAX_AGE
+        try:
+            return min(float(int(max_age)), _PREFLIGHT_MAX_AGE_CAP)
+        except ValueError:
+            return _PREFLIGHT_DEFAULT_MAX_AGE
+
+    def _preflight_cached(self, url: str) -> bool:
+        expires = self._preflight_cache.get(self._endpoint_template(url))
+        return expires is not None and expires > time.monotonic()
+
+    def _store_preflight(self, url: str, response: httpx.Response) -> None:
+        key = self._endpoint_template(url)
+        max_age = self._preflight_max_age(response)
+        if max_age > 0:
+            self._preflight_cache[key] = time.monotonic() + max_age
+        else:
+            self._preflight_cache.pop(key, None)
+
+    async def cors_options_request(self, url: str) -> None:
+        """Performs an OPTIONS CORS request to Fansly servers.
+
+        Skipped while an earlier preflight for the same endpoint is still
+        fresh per its ``Access-Control-Max-Age``, as a browser would.
+        """
+        if self._preflight_cached(url):
+            return
+
+        response = await self.http_session.options(
             url,
-            headers=headers,
+            headers=self.get_cors_headers(),
         )
+        self._store_preflight(url, response)
 
     def _summarize_request(
         self,
@@ -303,6 +402,90 @@ class FanslyApi:
         add_fansly_headers: bool = True,
         alternate_token: str | None = None,
         bypass_rate_limit: bool = False,
+        extra_headers: dict[str, str] | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> httpx.Response:
+        """GET a Fansly URL with the ngsw-bypass query and Fansly headers.
+
+        Plain GETs to an endpoint in ``RESPONSE_CACHE_TTLS`` are coalesced:
+        identical concurrent calls share one request, and a 200 response is
+        handed out again until its TTL runs out. The response object is
+        shared, so callers must only read it. ``use_cache=False`` always
+        sends a new request (e.g. to retry a page that came back empty).
+        """
+        send = partial(
+            self._send_with_ngsw,
+            url,
+            params=params,
+            cookies=cookies,
+            stream=stream,
+            add_fansly_headers=add_fansly_headers,
+            alternate_token=alternate_token,
+            bypass_rate_limit=bypass_rate_limit,
+            extra_headers=extra_headers,
+        )
+        ttl = self.RESPONSE_CACHE_TTLS.get(self._request_template(url))
+        if ttl is None or not use_cache or stream or cookies or extra_headers:
+            return await send()
+
+        key: _RequestKey = (
+            url,
+            tuple(params.items()),
+            add_fansly_headers,
+            alternate_token,
+        )
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            expires, response = cached
+            if expires > time.monotonic():
+                logger.debug(f"API Request: reusing response for {url}")
+                return response
+            del self._response_cache[key]
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(send())
+            self._in_flight[key] = flight
+            flight.add_done_callback(partial(self._finish_flight, key, ttl))
+        else:
+            logger.debug(f"API Request: joining in-flight request for {url}")
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(flight)
+
+    def _finish_flight(
+        self, key: _RequestKey, ttl: float, flight: asyncio.Future[httpx.Response]
+    ) -> None:
+        """Retire a finished single-flight GET; keep a 200 response for reuse."""
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        if flight.cancelled() or flight.exception() is not None:
+            return
+        response = flight.result()
+        if ttl <= 0 or response.status_code != 200:
+            return
+
+        now = time.monotonic()
+        if len(self._response_cache) >= _MAX_CACHED_RESPONSES:
+            for stale in [
+                k for k, (exp, _) in self._response_cache.items() if exp <= now
+            ]:
+                del self._response_cache[stale]
+            while len(self._response_cache) >= _MAX_CACHED_RESPONSES:
+                del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[key] = (now + ttl, response)
+
+    async def _send_with_ngsw(
+        self,
+        url: str,
+        *,
+        params: dict[str, str],
+        cookies: dict[str, str],
+        stream: bool,
+        add_fansly_headers: bool,
+        alternate_token: str | None,
+        bypass_rate_limit: bool,
+        extra_headers: dict[str, str] | None,
     ) -> httpx.Response:
         # Skipping when add_fansly_headers=False breaks recursion: get_device_id_info
         # itself enters here with add_fansly_headers=False.
@@ -324,6 +507,9 @@ class FanslyApi:
             add_fansly_headers=add_fansly_headers,
             alternate_token=alternate_token,
         )
+        # e.g. Range/If-Range for resumed CDN downloads
+        if extra_headers:
+            headers = {**headers, **extra_headers}
 
         # CORS-simple GETs (no custom headers) don't preflight in real browsers.
         if add_fansly_headers:
@@ -398,7 +584,7 @@ class FanslyApi:
         alternate_token: str | None = None,
         bypass_rate_limit: bool = False,
     ) -> httpx.Response:
-        """Sync variant for the m3u8 segment ThreadPoolExecutor."""
+        """Sync variant for m3u8 playlist/probe calls made on worker threads."""
         self.update_client_timestamp()
 
         default_params = self.get_ngsw_params()
@@ -417,17 +603,10 @@ class FanslyApi:
 
         # CORS-simple GETs (no custom headers) don't preflight in real browsers.
         sync = self._get_segment_session()
-        if add_fansly_headers:
-            cors_headers = {
-                "Accept": "*/*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Access-Control-Request-Headers": "authorization,fansly-client-check,fansly-client-id,fansly-client-ts,fansly-session-id",
-                "Access-Control-Request-Method": "GET",
-                "Origin": self.FANSLY_HOST,
-                "Referer": f"{self.FANSLY_HOST}/",
-                "User-Agent": self.user_agent,
-            }
-            sync.options(url, headers=cors_headers)
+        if add_fansly_headers and not self._preflight_cached(url):
+            self._store_preflight(
+                url, sync.options(url, headers=self.get_cors_headers())
+            )
 
         (_, file_url) = split_url(url)
 
@@ -599,7 +778,7 @@ class FanslyApi:
         )
 
     async def get_timeline(
-        self, creator_id: int | str, timeline_cursor: str
+        self, creator_id: int | str, timeline_cursor: str, *, use_cache: bool = True
     ) -> httpx.Response:
         custom_params = {
             "before": timeline_cursor,
@@ -611,10 +790,16 @@ class FanslyApi:
         return await self.get_with_ngsw(
             url=self.TIMELINE_NEW_ENDPOINT.format(creator_id),
             params=custom_params,
+            use_cache=use_cache,
         )
 
     async def get_wall_posts(
-        self, creator_id: int | str, wall_id: int | str, before_cursor: str = "0"
+        self,
+        creator_id: int | str,
+        wall_id: int | str,
+        before_cursor: str = "0",
+        *,
+        use_cache: bool = True,
     ) -> httpx.Response:
         """Get posts from a specific wall.
 
@@ -622,6 +807,8 @@ class FanslyApi:
             creator_id: The account ID of the creator
             wall_id: The ID of the wall to get posts from
             before_cursor: Post ID to get posts before (for pagination). Defaults to "0" for latest posts.
+            use_cache: Allow a coalesced/recently cached response (see
+                ``get_with_ngsw``); ``False`` always sends a new request.
 
         Returns:
             Response containing wall posts. Each page returns up to 15 posts.
@@ -636,6 +823,7 @@ class FanslyApi:
         return await self.get_with_ngsw(
             url=self.TIMELINE_NEW_ENDPOINT.format(creator_id),
             params=custom_params,
+            use_cache=use_cache,
         )
 
     async def get_home_timeline(self) -> httpx.Response:
@@ -1257,6 +1445,15 @@ class FanslyApi:
         return digest_str
 
     def validate_json_response(self, response: httpx.Response) -> bool:
+        self._decode_json_response(response)
+        return True
+
+    @staticmethod
+    def _decode_json_response(
+        response: httpx.Response,
+        object_hook: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> dict[str, Any]:
+        """Check status and the ``success`` flag, returning the decoded envelope."""
         response.raise_for_status()
 
         if response.status_code != 200:
@@ -1264,13 +1461,13 @@ class FanslyApi:
                 f"Fansly API: Web request failed: {response.status_code} - {response.reason_phrase}"
             )
 
-        decoded_response = response.json()
+        decoded_response = response.json(object_hook=object_hook)
 
         if (
             "success" in decoded_response
             and str(decoded_response["success"]).lower() == "true"
         ):
-            return True
+            return decoded_response
 
         raise RuntimeError(
             f"Fansly API: Invalid or failed JSON response:\n{decoded_response}"
@@ -1305,13 +1502,52 @@ class FanslyApi:
             return [FanslyApi.convert_ids_to_int(item) for item in data]
         return data
 
+    @staticmethod
+    def _convert_id_fields(obj: dict[str, Any]) -> dict[str, Any]:
+        """JSON ``object_hook`` form of :meth:`convert_ids_to_int`.
+
+        The decoder calls this for every object as soon as it is built, inner
+        objects first, so converting the object's own fields in place covers
+        the whole tree without a second pass or any copies. Which keys to
+        convert is looked up per key set in ``_ID_KEY_PLANS``.
+        """
+        keys = tuple(obj)
+        plan = _ID_KEY_PLANS.get(keys)
+        if plan is None:
+            plan = (
+                tuple(key for key in keys if key == "id" or key.endswith("Id")),
+                tuple(key for key in keys if key.endswith("Ids")),
+            )
+            if len(_ID_KEY_PLANS) >= _MAX_ID_KEY_PLANS:
+                _ID_KEY_PLANS.clear()
+            _ID_KEY_PLANS[keys] = plan
+
+        id_keys, ids_keys = plan
+        for key in id_keys:
+            value = obj[key]
+            if isinstance(value, str):
+                try:
+                    obj[key] = int(value)
+                except ValueError:
+                    continue
+        for key in ids_keys:
+            value = obj[key]
+            if isinstance(value, list):
+                obj[key] = [
+                    int(item) if isinstance(item, str) else item for item in value
+                ]
+        return obj
+
     def get_json_response_contents(
         self, response: httpx.Response
     ) -> JsonDict | list[JsonValue]:
-        """Validate response, extract the object/array payload, convert IDs to ints."""
-        self.validate_json_response(response)
-        json_data = response.json()["response"]
-        contents = self.convert_ids_to_int(json_data)
+        """Validate response, extract the object/array payload, convert IDs to ints.
+
+        The body is decoded once, with ID conversion fused into the decoder.
+        """
+        contents = self._decode_json_response(
+            response, object_hook=self._convert_id_fields
+        )["response"]
         if not isinstance(contents, (dict, list)):
             raise TypeError(
                 "Fansly API: expected an object or array response payload, got "
@@ -1419,6 +1655,7 @@ class FanslyApi:
             finally:
                 self._segment_session = None
 
+        self._response_cache.clear()
         try:
             await self.http_session.aclose()
         except Exception as e:
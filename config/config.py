@@ -169,6 +169,14 @@ def _populate_config_from_schema(config: FanslyConfig, schema: ConfigSchema) ->
     config.timeline_delay_seconds = opts.timeline_delay_seconds
     config.api_max_retries = opts.api_max_retries
     config.account_ids_batch_size = opts.account_ids_batch_size
+    config.max_concurrent_downloads = opts.max_concurrent_downloads
+    config.max_concurrent_downloads_global = opts.max_concurrent_downloads_global
+    config.max_concurrent_creators = opts.max_concurrent_creators
+    config.m3u8_segment_concurrency = opts.m3u8_segment_concurrency
+    config.m3u8_resume = opts.m3u8_resume
+    config.segmented_download_connections = opts.segmented_download_connections
+    config.segmented_download_min_mb = opts.segmented_download_min_mb
+    config.media_info_concurrency = opts.media_info_concurrency
 
     # Rate limiting
     config.rate_limiting_enabled = opts.rate_limiting_enabled
@@ -205,6 +213,8 @@ def _populate_config_from_schema(config: FanslyConfig, schema: ConfigSchema) ->
     config.pg_pool_size = pg.pg_pool_size
     config.pg_max_overflow = pg.pg_max_overflow
     config.pg_pool_timeout = pg.pg_pool_timeout
+    config.pg_cache_max_entities = pg.pg_cache_max_entities
+    config.pg_preload_scope = pg.pg_preload_scope
 
     # cache/monitoring are guaranteed non-None by ConfigSchema's
     # _instantiate_managed_optional_sections validator; bind to locals so the
@@ -305,6 +315,7 @@ def _populate_config_from_schema(config: FanslyConfig, schema: ConfigSchema) ->
     config.monitoring_livestream_manifest_poll_interval_seconds = (
         monitoring.livestream_manifest_poll_interval_seconds
     )
+    config.monitoring_livestream_live_mux = monitoring.livestream_live_mux
 
     # --- StashContext (optional) ---
     if schema.stash_context is not None:
@@ -52,6 +52,7 @@ class FanslyConfig:
     _database: Database | None = None
     _stash: StashContext | None = None
     _rate_limiter_display: RateLimiterDisplay | None = None
+    _download_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
 
     # Command line flags
     use_following: bool = False
@@ -139,6 +140,22 @@ class FanslyConfig:
     api_max_retries: int = 10
     # ids per batched /account?ids= lookup; the Fansly web client uses 5
     account_ids_batch_size: int = 5
+    # Media items downloaded concurrently within one download_media call, and
+    # the ceiling shared by every concurrent call (see get_download_slots)
+    max_concurrent_downloads: int = 4
+    max_concurrent_downloads_global: int = 8
+    # Creators processed concurrently by the batch run (download.scheduler)
+    max_concurrent_creators: int = 1
+    # HLS segments in flight per video in download.m3u8's segment tier
+    m3u8_segment_concurrency: int = 8
+    # Spool segment-tier progress so an interrupted HLS download resumes
+    m3u8_resume: bool = False
+    # Concurrent Range requests per regular file of at least
+    # segmented_download_min_mb MiB (download.media); 1 keeps one stream
+    segmented_download_connections: int = 4
+    segmented_download_min_mb: int = 64
+    # accountMedia batches in flight in download.media.fetch_and_process_media
+    media_info_concurrency: int = 4
 
     # Rate limiting configuration
     rate_limiting_enabled: bool = True
@@ -166,6 +183,10 @@ class FanslyConfig:
     pg_pool_size: int = 5
     pg_max_overflow: int = 10
     pg_pool_timeout: int = 30
+    # Entity store identity-map budget; None keeps every loaded entity
+    pg_cache_max_entities: int | None = None
+    # Entity store startup preload: "all" rows, or only the creators' rows
+    pg_preload_scope: Literal["all", "creators"] = "all"
 
     # Temporary folder for downloads
     temp_folder: Path | None = None  # When None, use system default temp folder
@@ -220,6 +241,10 @@ class FanslyConfig:
     # IVS TARGETDURATION is 6 s; capped at 15 s (max ~2.5 segments per fetch).
     # Loaded from schema.monitoring.livestream_manifest_poll_interval_seconds.
     monitoring_livestream_manifest_poll_interval_seconds: int = 3
+    # Mux segments into a fragmented MP4 while recording instead of all at
+    # once after the broadcast ends; each segment is deleted once muxed.
+    # Loaded from schema.monitoring.livestream_live_mux.
+    monitoring_livestream_live_mux: bool = False
 
     # StashContext connection: string-valued scheme/host/apikey + int port.
     stash_context_conn: dict[str, str | int] | None = None
@@ -293,6 +318,19 @@ class FanslyConfig:
 
         return self._api
 
+    def get_download_slots(self) -> asyncio.Semaphore:
+        """Return the run-wide semaphore bounding in-flight media downloads.
+
+        Shared by every ``download_media`` call so concurrent creators can't
+        multiply the per-call limit. Rebuilt when the running event loop
+        changes (a semaphore is bound to the loop it first waits on).
+        """
+        loop = asyncio.get_running_loop()
+        if self._download_slots is None or self._download_slots[0] is not loop:
+            limit = max(1, self.max_concurrent_downloads_global)
+            self._download_slots = (loop, asyncio.Semaphore(limit))
+        return self._download_slots[1]
+
     async def setup_api(self) -> FanslyApi:
         """Bootstrap device_id, login if needed, and set up the WebSocket session."""
         api = self.get_api()
@@ -625,6 +663,28 @@ def _rebuild_schema_from_config(config: FanslyConfig) -> ConfigSchema:
     _maybe_set(base.options, "timeline_delay_seconds", config.timeline_delay_seconds)
     _maybe_set(base.options, "api_max_retries", config.api_max_retries)
     _maybe_set(base.options, "account_ids_batch_size", config.account_ids_batch_size)
+    _maybe_set(
+        base.options, "max_concurrent_downloads", config.max_concurrent_downloads
+    )
+    _maybe_set(
+        base.options,
+        "max_concurrent_downloads_global",
+        config.max_concurrent_downloads_global,
+    )
+    _maybe_set(base.options, "max_concurrent_creators", config.max_concurrent_creators)
+    _maybe_set(
+        base.options, "m3u8_segment_concurrency", config.m3u8_segment_concurrency
+    )
+    _maybe_set(base.options, "m3u8_resume", config.m3u8_resume)
+    _maybe_set(
+        base.options,
+        "segmented_download_connections",
+        config.segmented_download_connections,
+    )
+    _maybe_set(
+        base.options, "segmented_download_min_mb", config.segmented_download_min_mb
+    )
+    _maybe_set(base.options, "media_info_concurrency", config.media_info_concurrency)
     _maybe_set(base.options, "rate_limiting_enabled", config.rate_limiting_enabled)
     _maybe_set(base.options, "rate_limiting_adaptive", config.rate_limiting_adaptive)
     _maybe_set(
@@ -695,6 +755,8 @@ def _rebuild_schema_from_config(config: FanslyConfig) -> ConfigSchema:
     _maybe_set(base.postgres, "pg_pool_size", config.pg_pool_size)
     _maybe_set(base.postgres, "pg_max_overflow", config.pg_max_overflow)
     _maybe_set(base.postgres, "pg_pool_timeout", config.pg_pool_timeout)
+    _maybe_set(base.postgres, "pg_cache_max_entities", config.pg_cache_max_entities)
+    _maybe_set(base.postgres, "pg_preload_scope", config.pg_preload_scope)
 
     # cache (auto-instantiated via default_factory; mutate in place)
     if base.cache is None:
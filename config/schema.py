@@ -322,6 +322,20 @@ class OptionsSection(_BaseSection):
     api_max_retries: int = 10
     # ids per batched /account?ids= lookup; the Fansly web client uses 5
     account_ids_batch_size: int = 5
+    # media items in flight per download_media call / across all creators
+    max_concurrent_downloads: int = Field(default=4, ge=1, le=32)
+    max_concurrent_downloads_global: int = Field(default=8, ge=1, le=64)
+    # creators processed at once by the batch run; 1 keeps the sequential loop
+    max_concurrent_creators: int = Field(default=1, ge=1, le=16)
+    # HLS .ts segments fetched at once per video by the segment-download tier
+    m3u8_segment_concurrency: int = Field(default=8, ge=1, le=64)
+    # keep segment-tier progress in <temp>/<creator>_<media>_hls so a retry resumes
+    m3u8_resume: bool = False
+    # byte ranges fetched at once for one regular file of at least _min_mb
+    segmented_download_connections: int = Field(default=4, ge=1, le=16)
+    segmented_download_min_mb: int = Field(default=64, ge=1)
+    # account-media batches requested ahead by download.media.fetch_and_process_media
+    media_info_concurrency: int = Field(default=4, ge=1, le=16)
     # Set to ``false`` to ignore the creator_content_unchanged short-circuit
     # in download/timeline.py and download/wall.py — forces a full scan even
     # when TimelineStats counts and wall structure match the DB. Conditional
@@ -384,6 +398,11 @@ class PostgresSection(_BaseSection):
     pg_pool_size: int = 5
     pg_max_overflow: int = 10
     pg_pool_timeout: int = 30
+    # Identity-map entity budget (LRU eviction of clean entities); null = unbounded
+    pg_cache_max_entities: int | None = Field(default=None, ge=1)
+    # Startup preload: every row ("all"), or only the selected creators' rows
+    # with further creators loaded as they are processed ("creators")
+    pg_preload_scope: Literal["all", "creators"] = "all"
 
 
 class CacheSection(_BaseSection):
@@ -788,6 +807,7 @@ class MonitoringSection(_BaseSection):
     livestream_recording_enabled: bool = False
     livestream_poll_interval_seconds: int = 30
     livestream_manifest_poll_interval_seconds: int = Field(default=3, ge=1, le=15)
+    livestream_live_mux: bool = False
 
     @field_validator("session_baseline", mode="before")
     @classmethod
@@ -649,6 +649,9 @@ async def run_dedupe_init(
         DownloadState,
     )
     from fileio.dedupe import dedupe_init  # noqa: PLC0415  # Avoid circular import
+    from fileio.hash_executor import (  # noqa: PLC0415  # Avoid circular import
+        shutdown_hashing_executor,
+    )
     from metadata.media import Media  # noqa: PLC0415  # Avoid circular import
     from pathio import (  # noqa: PLC0415  # Avoid circular import
         set_create_directory_for_download,
@@ -720,6 +723,7 @@ async def run_dedupe_init(
                     f"Hash2 DB fix: {creator} -> updated={updated}, created={created}"
                 )
     finally:
+        shutdown_hashing_executor()
         if getattr(config, "_database", None) is not None:
             config._database.close_sync()
 
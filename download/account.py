@@ -156,15 +156,10 @@ def _extract_account_data(
         return response_data
 
 
-def _update_state_from_account(
-    config: FanslyConfig,
-    state: DownloadState,
-    account: Account,
-) -> None:
+def _update_state_from_account(state: DownloadState, account: Account) -> None:
     """Update download state from the persisted Account object.
 
     Args:
-        config: The program configuration
         state: Current download state
         account: Account Pydantic object (from identity map after process_account_data)
 
@@ -192,7 +187,7 @@ def _update_state_from_account(
                 f"you most likely misspelled it! (27)"
             )
 
-        config.DUPLICATE_THRESHOLD = int(
+        state.duplicate_threshold = int(
             0.2 * (state.total_timeline_pictures + state.total_timeline_videos)
         )
 
@@ -218,6 +213,8 @@ async def get_creator_account_info(
         if isinstance(account_data["id"], str)
         else account_data["id"]
     )
+    # Scoped preload: load this creator's rows before the snapshots below
+    await store.preload_account(account_id)
 
     # Capture DB snapshots BEFORE process_account_data merges the API
     # response. fetchedAt alone is unreliable (server cache-regeneration
@@ -261,7 +258,7 @@ async def get_creator_account_info(
             f"Failed to persist account data for '{state.creator_name}'"
         )
 
-    _update_state_from_account(config, state, account)
+    _update_state_from_account(state, account)
 
     # Legacy fetchedAt path (kept for backwards compat with downstream
     # flags that look at this field). Unreliable alone — see notes above.
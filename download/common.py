@@ -2,7 +2,10 @@
 
 import asyncio
 import traceback
+from collections.abc import Coroutine
+from typing import Any, Self
 
+from httpx import Response
 from pydantic import JsonValue
 
 from config import FanslyConfig
@@ -117,6 +120,73 @@ async def check_page_duplicates(
         raise DuplicatePageError(page_type, page_id, cursor, wall_name)
 
 
+def last_item_id(page_data: JsonDict, key: str) -> str | None:
+    """ID of the last item in ``page_data[key]``, the next page's cursor.
+
+    Returns None when the list is missing or empty, or its last item has
+    no ID.
+    """
+    items = page_data.get(key)
+    if not isinstance(items, list) or not items:
+        return None
+    last = items[-1]
+    if not isinstance(last, dict) or last.get("id") is None:
+        return None
+    return str(last["id"])
+
+
+class PagePrefetcher:
+    """Requests the next page of a listing while the current one downloads.
+
+    The pagination loops start a prefetch as soon as a page has passed the
+    duplicate check and its cursor is known, then `take` it when they get
+    round to that cursor. The fetch coroutine brings its own pacing
+    (``timing_jitter``) and goes through ``get_with_ngsw``, so the
+    RateLimiter still gates every request. A prefetch for any other cursor,
+    or one still pending when the loop exits, is cancelled.
+
+    Use as a context manager so an early exit never leaves a request
+    running.
+    """
+
+    def __init__(self) -> None:
+        self._cursor: str | None = None
+        self._task: asyncio.Task[Response] | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.discard()
+
+    def start(self, cursor: str, fetch: Coroutine[Any, Any, Response]) -> None:
+        """Run ``fetch`` (the request for ``cursor``) in the background."""
+        self.discard()
+        self._cursor = cursor
+        self._task = asyncio.create_task(fetch)
+
+    def take(self, cursor: str) -> asyncio.Task[Response] | None:
+        """Hand over the prefetch for ``cursor``, or None if there isn't one."""
+        task, self._task = self._task, None
+        if task is not None and self._cursor != cursor:
+            self._drop(task)
+            return None
+        return task
+
+    def discard(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            self._drop(task)
+
+    @staticmethod
+    def _drop(task: asyncio.Task[Response]) -> None:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            # Retrieve it so an unused failure isn't reported as unhandled
+            task.exception()
+
+
 def print_download_info(config: FanslyConfig) -> None:
     if config.user_agent:
         print_info(
@@ -150,13 +220,13 @@ async def process_download_accessible_media(
         False as a break indicator for "Timeline"/"Wall" downloads, True otherwise.
     """
     # Special messages/wall threshold handling
-    original_duplicate_threshold = config.DUPLICATE_THRESHOLD
+    original_duplicate_threshold = state.duplicate_threshold
 
     if state.download_type == DownloadType.MESSAGES:
         state.total_message_items += len(accessible_media)
-        config.DUPLICATE_THRESHOLD = int(0.2 * state.total_message_items)
+        state.duplicate_threshold = int(0.2 * state.total_message_items)
     elif state.download_type == DownloadType.WALL:
-        config.DUPLICATE_THRESHOLD = max(50, int(0.3 * len(accessible_media)))
+        state.duplicate_threshold = max(50, int(0.3 * len(accessible_media)))
 
     print_info(
         f"@{state.creator_name} - amount of media in "
@@ -171,7 +241,8 @@ async def process_download_accessible_media(
     except DuplicateCountError:
         print_warning(
             f"Already downloaded all possible {state.download_type_str()} content! "
-            f"[Duplicate threshold exceeded {config.DUPLICATE_THRESHOLD}]"
+            f"[Duplicate threshold exceeded "
+            f"{state.effective_duplicate_threshold(config.DUPLICATE_THRESHOLD)}]"
         )
         if state.download_type in (DownloadType.TIMELINE, DownloadType.WALL):
             return False
@@ -184,6 +255,6 @@ async def process_download_accessible_media(
         await input_enter_continue(config.interactive)
 
     finally:
-        config.DUPLICATE_THRESHOLD = original_duplicate_threshold
+        state.duplicate_threshold = original_duplicate_threshold
 
     return True
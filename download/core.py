@@ -9,6 +9,7 @@ from .collections import download_collections
 from .common import print_download_info
 from .downloadstate import DownloadState
 from .globalstate import GlobalState
+from .media import prune_hls_resume_dirs
 from .messages import download_messages, download_messages_for_group
 from .single import download_single_post
 from .stories import download_stories
@@ -29,4 +30,5 @@ __all__ = [
     "get_creator_account_info",
     "get_following_accounts",
     "print_download_info",
+    "prune_hls_resume_dirs",
 ]
@@ -44,6 +44,10 @@ class DownloadState(GlobalState):
 
     # Batch tracking
     current_batch_duplicates: int = 0
+    # Per-creator override of config.DUPLICATE_THRESHOLD. Lives on the state
+    # rather than the shared config so creators processed concurrently don't
+    # overwrite each other's threshold.
+    duplicate_threshold: int | None = None
 
     # endregion
 
@@ -57,6 +61,20 @@ class DownloadState(GlobalState):
         """Reset batch counters for a new batch of downloads."""
         self.current_batch_duplicates = 0
 
+    def effective_duplicate_threshold(self, base: int) -> int:
+        """Gets the duplicate threshold for this creator, else ``base``."""
+        if self.duplicate_threshold is None:
+            return base
+        return self.duplicate_threshold
+
+    def progress_task_name(self, name: str) -> str:
+        """Gets ``name`` suffixed with this creator, for a progress task.
+
+        Progress task names are global and creators can be processed
+        concurrently, so each creator's bars need their own names.
+        """
+        return f"{name}_{self.creator_id or self.creator_name}"
+
     def add_duplicate(self) -> None:
         """Increment both global and batch duplicate counters."""
         self.duplicate_count += 1
@@ -17,15 +17,21 @@ output, producing a correct avcC sample description at close().
 **Do not** assign ``output_stream.time_base`` explicitly after the
 template — the override conflicts with PyAV's MP4 muxer's internal
 timestamp scale and produces EINVAL on every muxed packet.
+
+With ``monitoring.livestream_live_mux`` enabled the same per-segment mux
+runs while the broadcast is recorded (:class:`_LiveIvsMuxer`), writing a
+fragmented MP4 and deleting each segment once it is in the file.
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import queue
 import re
 import shutil
 import threading
+from collections.abc import Callable
 from pathlib import Path
 from urllib.parse import urljoin, urlsplit
 
@@ -60,6 +66,10 @@ _RETRY_DELAY_SECONDS = 15.0
 # Maximum number of times to retry opening the stream before giving up.
 _MAX_OPEN_RETRIES = 3
 
+# Marker file in a segment dir recorded with live muxing: segments still
+# in the dir were never muxed into the output MP4.
+_LIVE_MUX_MARKER = "live_mux"
+
 # Regex for IVS EXT-X-PREFETCH hint lines.
 _PREFETCH_RE = re.compile(r"^#EXT-X-PREFETCH:(.+)$", re.MULTILINE)
 
@@ -91,22 +101,28 @@ async def _record_stream(
     2. Resolve highest-bandwidth variant URL via httpx + m3u8 master parse.
     3. Run the async segment poll loop until stop or end-of-broadcast.
     4. PyAV-mux collected ``.ts`` segments → MP4 (PID-based, in thread).
+       With ``monitoring_livestream_live_mux`` the segments are muxed into
+       a fragmented MP4 as they arrive instead, and this step only
+       finalizes the file.
     5. Clean up the temp segment directory on success.
     """
-    output_path = _build_output_path(config, username, channel)
+    base_output_path = _build_output_path(config, username, channel)
     # Bump to _part2 / _part3 etc. if a prior reconnect already completed or
     # crashed mid-mux for the same broadcast (same startedAt → same base name).
     try:
         segments_base = _get_segments_base(config)
     except RuntimeError:
-        segments_base = output_path.parent  # fallback: no collision check
-    output_path = _unique_output_path(output_path, segments_base)
+        segments_base = base_output_path.parent  # fallback: no collision check
+    output_path = _unique_output_path(base_output_path, segments_base)
     # Segment dir lives in temp_folder (or <download_dir>/temp) so it does
     # not clutter the Livestreams output directory.
     temp_dir = segments_base / f"{output_path.stem}_segments"
     temp_dir.mkdir(parents=True, exist_ok=True)
     # Sidecar so the salvage pass knows where to write the final MP4.
     (temp_dir / "output_path.txt").write_text(str(output_path), encoding="utf-8")
+    live_mux = config.monitoring_livestream_live_mux
+    if live_mux:
+        (temp_dir / _LIVE_MUX_MARKER).touch()
 
     # Register a ChatRecorder now so WS events arriving before the poll
     # loop starts are also captured.
@@ -202,6 +218,11 @@ async def _record_stream(
                     )
                 )
                 chat_task.add_done_callback(_surface_chat_task_failure)
+            live_muxer: _LiveIvsMuxer | None = None
+            if live_mux:
+                live_muxer = _LiveIvsMuxer(output_path, log_prefix)
+                live_muxer.start()
+            live_result: bool | None = None
             try:
                 segments, durations = await _poll_segments_loop(
                     variant_url,
@@ -209,6 +230,7 @@ async def _record_stream(
                     combined_stop,
                     log_prefix,
                     float(config.monitoring_livestream_manifest_poll_interval_seconds),
+                    on_segment=live_muxer.add if live_muxer is not None else None,
                 )
             finally:
                 combined_stop.set()
@@ -221,6 +243,10 @@ async def _record_stream(
                     # recording over a chat-WS hiccup.
                     with contextlib.suppress(Exception, asyncio.CancelledError):
                         await chat_task
+                # Finalize even when cancelled: everything muxed so far
+                # stays a playable file.
+                if live_muxer is not None:
+                    live_result = await asyncio.to_thread(live_muxer.finish)
 
             if not segments:
                 logger.warning(
@@ -233,10 +259,14 @@ async def _record_stream(
                     await asyncio.sleep(_RETRY_DELAY_SECONDS)
                 continue
 
-            # PID-based PyAV mux — blocking, run in thread pool.
-            success = await asyncio.to_thread(
-                _mux_ivs_segments, segments, durations, output_path, log_prefix
-            )
+            if live_result is None:
+                # PID-based PyAV mux — blocking, run in thread pool. Also the
+                # fallback when the live muxer never got its output open.
+                success = await asyncio.to_thread(
+                    _mux_ivs_segments, segments, durations, output_path, log_prefix
+                )
+            else:
+                success = live_result
 
             if success:
                 logger.info(
@@ -257,6 +287,15 @@ async def _record_stream(
                 shutil.rmtree(temp_dir, ignore_errors=True)
                 break
 
+            if live_result is not None:
+                # The failed live output still holds the segments muxed so
+                # far (they are deleted from temp_dir) — keep it and record
+                # the next attempt into the next free _part slot.
+                output_path = _unique_output_path(base_output_path, segments_base)
+                (temp_dir / "output_path.txt").write_text(
+                    str(output_path), encoding="utf-8"
+                )
+
             if attempt < _MAX_OPEN_RETRIES:
                 logger.warning(
                     "download.livestream: {} mux failed "
@@ -374,6 +413,8 @@ async def _poll_segments_loop(
     stop_event: asyncio.Event,
     log_prefix: str,
     manifest_poll_interval: float = 3.0,
+    *,
+    on_segment: Callable[[Path], None] | None = None,
 ) -> tuple[list[Path], list[float]]:
     """Poll the IVS variant manifest, download new segments to *temp_dir*.
 
@@ -397,6 +438,8 @@ async def _poll_segments_loop(
         log_prefix: Log line prefix, e.g. ``"[username]"``.
         manifest_poll_interval: Seconds between manifest re-fetches.
             IVS TARGETDURATION is 6 s; default 3 s (half), max 15 s.
+        on_segment: Called with each downloaded segment path, in playlist
+            order, as soon as its batch has been fetched (live muxing).
 
     Returns:
         ``(segments, durations)`` — parallel lists of downloaded segment paths
@@ -482,6 +525,8 @@ async def _poll_segments_loop(
                         segments_collected.append(seg_path)
                         durations.append(dur)
                         last_msn = seg_msn
+                        if on_segment is not None:
+                            on_segment(seg_path)
 
                 logger.debug(
                     "download.livestream: {} +{} segments (total {}), msn={}",
@@ -521,6 +566,10 @@ async def _salvage_orphan_segments(
 
     Segment durations default to 6 s (IVS TARGETDURATION) since the
     original manifest is no longer available.
+
+    Dirs recorded with live muxing already have their output MP4; any
+    segments still in them were not muxed yet and go to the next free
+    ``_part`` file.
     """
     try:
         segments_base = _get_segments_base(config)
@@ -578,20 +627,24 @@ async def _salvage_orphan_segments(
                 continue
             output_path = Path(sidecar.read_text(encoding="utf-8").strip())
 
+            segments = sorted(orphan_dir.glob("segment_*.ts"))
+
             # Already completed by a prior salvage run.
             _exists = await asyncio.to_thread(output_path.exists)
             _size = (
                 (await asyncio.to_thread(output_path.stat)).st_size if _exists else 0
             )
             if _exists and _size > 0:
-                logger.info(
-                    "download.livestream: {} output already exists — removing orphan dir",
-                    log_prefix,
-                )
-                shutil.rmtree(orphan_dir, ignore_errors=True)
-                continue
+                if segments and (orphan_dir / _LIVE_MUX_MARKER).exists():
+                    output_path = _unique_output_path(output_path, segments_base)
+                else:
+                    logger.info(
+                        "download.livestream: {} output already exists — removing orphan dir",
+                        log_prefix,
+                    )
+                    shutil.rmtree(orphan_dir, ignore_errors=True)
+                    continue
 
-            segments = sorted(orphan_dir.glob("segment_*.ts"))
             if not segments:
                 logger.warning(
                     "download.livestream: {} orphan dir is empty — removing",
@@ -663,53 +716,26 @@ async def _download_segment(
         return True
 
 
-def _mux_ivs_segments(  # noqa: PLR0911  # multiple early-exit paths for failure modes + interrupt
+def _probe_ivs_pids(
     segments: list[Path],
-    _durations: list[float],
-    output_path: Path,
     log_prefix: str,
-    stop_event: threading.Event | None = None,
-) -> bool:
-    """PID-based PyAV mux of IVS ``.ts`` segments into a single MP4.
-
-    IVS segments have consistent PIDs across the broadcast but **inconsistent
-    stream positions** — the video stream may be at position 0 in one segment
-    and position 1 in the next.  This function probes up to
-    ``_MAX_PROBE_SEGMENTS`` segments to identify the audio and video PIDs,
-    then routes every packet by PID rather than position.  Output streams
-    are templated from the PID-resolved input streams so codec extradata
-    (SPS/PPS) is preserved.
+    video_pid: int | None = None,
+    audio_pid: int | None = None,
+) -> tuple[int | None, int | None]:
+    """Find the video and audio PIDs by opening *segments* until both are seen.
 
-    PTS rebasing ensures a continuous timeline across segment boundaries:
-    each segment's first PTS is zeroed and shifted by the running global
-    offset (max PTS of the previous segment + one packet duration).
-
-    Args:
-        segments: Ordered list of downloaded ``.ts`` segment paths.
-        durations: Matching list of declared segment durations (seconds).
-        output_path: Final MP4 destination path.
-        log_prefix: Log line prefix.
+    IVS segments swap stream positions between segments — PID matching is
+    required.  PIDs already known are passed back unchanged.
 
     Returns:
-        ``True`` if the output file was written with both video and audio.
+        ``(video_pid, audio_pid)``; either may still be ``None``.
     """
-    if not segments:
-        logger.warning("download.livestream: {} no segments to mux", log_prefix)
-        return False
-
-    # ── PID discovery ────────────────────────────────────────────────────
-    # IVS segments swap stream positions between segments — PID matching
-    # is required. Probe up to _MAX_PROBE_SEGMENTS until both PIDs found.
-    audio_pid: int | None = None
-    video_pid: int | None = None
-
-    n_probe = min(_MAX_PROBE_SEGMENTS, len(segments))
-    for probe_idx in range(n_probe):
+    for probe_idx, seg_path in enumerate(segments):
         if audio_pid is not None and video_pid is not None:
             break
         try:
             probe_container = av.open(
-                str(segments[probe_idx]),
+                str(seg_path),
                 options={"err_detect": "ignore_err", "fflags": "+discardcorrupt"},
             )
         except Exception as exc:
@@ -728,266 +754,307 @@ def _mux_ivs_segments(  # noqa: PLR0911  # multiple early-exit paths for failure
                     audio_pid = stream.id
         finally:
             probe_container.close()
+    return video_pid, audio_pid
 
-    if not audio_pid or not video_pid:
-        logger.error(
-            "download.livestream: {} could not identify audio+video PIDs "
-            "after probing {} segments — aborting mux",
-            log_prefix,
-            n_probe,
-        )
-        return False
 
-    logger.info(
-        "download.livestream: {} PIDs — video={}, audio={}",
-        log_prefix,
-        hex(video_pid),
-        hex(audio_pid),
-    )
+class _IvsSegmentMuxer:
+    """PID-routed remux of IVS ``.ts`` segments into one MP4, segment by segment.
 
-    # ── Mux ──────────────────────────────────────────────────────────────
-    output: av.container.OutputContainer | None = None
-    skipped_segments = 0
-    total_skipped_packets = 0
-    output_video_stream = None
-    output_audio_stream = None
-    video_pts_offset = 0
-    audio_pts_offset = 0
-
-    # Diagnostic counters — break out skip causes (the empty-output
-    # failure mode produced "X segments processed, file is 0 bytes"
-    # with no actionable signal; this carries the per-skip-reason
-    # breakdown to trace-logger so an investigator can see exactly
-    # which path swallowed packets).
-    total_muxed_video = 0
-    total_muxed_audio = 0
-    total_skipped_pts_none = 0
-    total_skipped_dts_none = 0
-    total_skipped_corrupt = 0
-    total_skipped_mux_exc = 0
-    first_skip_examples: list[str] = []
-    skip_examples_cap = 10
+    Holds the output container, the running PTS offsets and the diagnostic
+    counters shared by the batch mux (:func:`_mux_ivs_segments`) and the
+    live mux (:class:`_LiveIvsMuxer`).  With ``fragmented=True`` the MP4 is
+    written as ``frag_keyframe+empty_moov`` fragments: everything muxed so
+    far is playable while recording continues, and ``close()`` only flushes
+    the last fragment.
+    """
 
-    try:
-        # Explicit format="mp4" — extension-based detection works in
-        # most cases but explicit is safer and matches the MMsD HLS-mux
-        # pattern that empirically resolves the same EINVAL failure mode.
-        output = av.open(str(output_path), "w")
+    def __init__(
+        self,
+        output_path: Path,
+        log_prefix: str,
+        video_pid: int,
+        audio_pid: int,
+        *,
+        fragmented: bool = False,
+    ) -> None:
+        self.output_path = output_path
+        self.log_prefix = log_prefix
+        self.video_pid = video_pid
+        self.audio_pid = audio_pid
+        self.fragmented = fragmented
+        self.output: av.container.OutputContainer | None = None
+        self.output_video_stream: av.stream.Stream | None = None
+        self.output_audio_stream: av.stream.Stream | None = None
+        self.video_pts_offset = 0
+        self.audio_pts_offset = 0
+        self.skipped_segments = 0
+        self.total_skipped_packets = 0
+
+        # Diagnostic counters — break out skip causes (the empty-output
+        # failure mode produced "X segments processed, file is 0 bytes"
+        # with no actionable signal; this carries the per-skip-reason
+        # breakdown to trace-logger so an investigator can see exactly
+        # which path swallowed packets).
+        self.total_muxed_video = 0
+        self.total_muxed_audio = 0
+        self.total_skipped_pts_none = 0
+        self.total_skipped_dts_none = 0
+        self.total_skipped_corrupt = 0
+        self.total_skipped_mux_exc = 0
+        self.first_skip_examples: list[str] = []
+        self.skip_examples_cap = 10
+
+    def open(self, n_segments: int | str) -> None:
+        """Open the output container; raises whatever ``av.open`` raises."""
+        if self.fragmented:
+            # empty_moov writes the track headers up front and every
+            # keyframe starts a new moof/mdat fragment, so the file is
+            # playable at every fragment boundary and close() only has
+            # to flush the last fragment — no moov rewrite at the end.
+            # flush_packets pushes each fragment past the AVIO buffer so
+            # readers see it as soon as it is written.
+            self.output = av.open(
+                str(self.output_path),
+                "w",
+                container_options={
+                    "movflags": "frag_keyframe+empty_moov+default_base_moof",
+                    "flush_packets": "1",
+                },
+            )
+        else:
+            self.output = av.open(str(self.output_path), "w")
         trace_logger.trace(
             "download.livestream: {} output opened — path={} segments={}",
-            log_prefix,
-            output_path,
-            len(segments),
+            self.log_prefix,
+            self.output_path,
+            n_segments,
         )
 
-        for seg_idx, seg_path in enumerate(segments):
-            if stop_event is not None and stop_event.is_set():
-                logger.info(
-                    "download.livestream: {} mux interrupted at seg[{}/{}] — "
-                    "segments preserved",
-                    log_prefix,
-                    seg_idx + 1,
-                    len(segments),
-                )
-                return False
-            try:
-                input_container = av.open(
-                    str(seg_path),
-                    options={
-                        "err_detect": "ignore_err",
-                        "fflags": "+discardcorrupt+genpts",
-                    },
-                )
-            except Exception as exc:
-                logger.warning(
-                    "download.livestream: {} segment {} open failed — {}",
-                    log_prefix,
-                    seg_path.name,
-                    exc,
-                )
-                skipped_segments += 1
-                continue
+    def _note_skip(self, example: str) -> None:
+        if len(self.first_skip_examples) < self.skip_examples_cap:
+            self.first_skip_examples.append(example)
 
-            try:
-                seg_size = seg_path.stat().st_size
-                streams_summary = ",".join(
-                    f"id={s.id:#x}/{s.type}/"
-                    f"{s.codec_context.name if s.codec_context else '?'}"
-                    for s in input_container.streams
-                )
-                trace_logger.trace(
-                    "download.livestream: {} seg[{}/{}] {} ({}B) open ok — streams=[{}]",
+    def mux_segment(self, seg_path: Path, position: str) -> bool:
+        """Remux one segment onto the running timeline.
+
+        Args:
+            seg_path: The ``.ts`` segment to append.
+            position: ``"n/total"`` label for log lines.
+
+        Returns:
+            ``True`` if the segment was muxed, ``False`` if it was skipped.
+        """
+        output = self.output
+        if output is None:
+            raise RuntimeError("IVS muxer output is not open")
+        log_prefix = self.log_prefix
+        try:
+            input_container = av.open(
+                str(seg_path),
+                options={
+                    "err_detect": "ignore_err",
+                    "fflags": "+discardcorrupt+genpts",
+                },
+            )
+        except Exception as exc:
+            logger.warning(
+                "download.livestream: {} segment {} open failed — {}",
+                log_prefix,
+                seg_path.name,
+                exc,
+            )
+            self.skipped_segments += 1
+            return False
+
+        try:
+            seg_size = seg_path.stat().st_size
+            streams_summary = ",".join(
+                f"id={s.id:#x}/{s.type}/"
+                f"{s.codec_context.name if s.codec_context else '?'}"
+                for s in input_container.streams
+            )
+            trace_logger.trace(
+                "download.livestream: {} seg[{}] {} ({}B) open ok — streams=[{}]",
+                log_prefix,
+                position,
+                seg_path.name,
+                seg_size,
+                streams_summary,
+            )
+
+            input_video = None
+            input_audio = None
+            for stream in input_container.streams:
+                # Defensive: skip streams without codec_context (e.g.
+                # the data PID 0x102 on IVS segments). Matches the
+                # MMsD HLS-mux guard.
+                if not stream.codec_context:
+                    continue
+                if stream.id == self.video_pid:
+                    input_video = stream
+                elif stream.id == self.audio_pid:
+                    input_audio = stream
+
+            if input_video is None or input_audio is None:
+                logger.warning(
+                    "download.livestream: {} segment {} missing "
+                    "video={} audio={} — skipping",
                     log_prefix,
-                    seg_idx + 1,
-                    len(segments),
                     seg_path.name,
-                    seg_size,
-                    streams_summary,
+                    input_video is None,
+                    input_audio is None,
                 )
+                self.skipped_segments += 1
+                return False
 
-                input_video = None
-                input_audio = None
-                for stream in input_container.streams:
-                    # Defensive: skip streams without codec_context (e.g.
-                    # the data PID 0x102 on IVS segments). Matches the
-                    # MMsD HLS-mux guard.
-                    if not stream.codec_context:
-                        continue
-                    if stream.id == video_pid:
-                        input_video = stream
-                    elif stream.id == audio_pid:
-                        input_audio = stream
-
-                if input_video is None or input_audio is None:
-                    logger.warning(
-                        "download.livestream: {} segment {} missing "
-                        "video={} audio={} — skipping",
-                        log_prefix,
-                        seg_path.name,
-                        input_video is None,
-                        input_audio is None,
+            if self.output_video_stream is None:
+                # Template-from-input copies codecpar (including the
+                # 51-byte SPS/PPS extradata that PyAV's MPEG-TS
+                # demuxer DOES populate in codecpar even though
+                # `codec_context.extradata` reads empty). Do NOT set
+                # `output_stream.time_base` after this — overriding
+                # PyAV's default conflicts with the MP4 muxer's
+                # internal timestamp scale and the muxer rejects
+                # every packet with EINVAL.
+                self.output_video_stream = output.add_stream_from_template(input_video)
+                self.output_audio_stream = output.add_stream_from_template(input_audio)
+
+            # H.264 with B-frames has dts < pts on the first packet
+            # (decode-before-display reorder buffer). Rebasing by pts
+            # alone produces negative dts, which the MP4 muxer rejects
+            # with ArgumentError(22). Use min(pts, dts) — for video it
+            # tracks dts (the smaller one); for audio it's equal since
+            # AAC has no reorder.
+            seg_video_first_ts: int | None = None
+            seg_audio_first_ts: int | None = None
+            seg_video_max_pts = self.video_pts_offset
+            seg_audio_max_pts = self.audio_pts_offset
+            seg_video_last_dur = 0
+            seg_audio_last_dur = 0
+            skipped_packets = 0
+            seg_muxed_video = 0
+            seg_muxed_audio = 0
+
+            for packet in input_container.demux(input_video, input_audio):
+                pkt_pts = packet.pts
+                pkt_dts = packet.dts
+                if pkt_pts is None or pkt_dts is None or packet.is_corrupt:
+                    if pkt_pts is None:
+                        self.total_skipped_pts_none += 1
+                    if pkt_dts is None:
+                        self.total_skipped_dts_none += 1
+                    if packet.is_corrupt:
+                        self.total_skipped_corrupt += 1
+                    self._note_skip(
+                        f"{seg_path.name}: stream_id={packet.stream.id} "
+                        f"pts={pkt_pts} dts={pkt_dts} corrupt={packet.is_corrupt}"
                     )
-                    skipped_segments += 1
+                    skipped_packets += 1
                     continue
+                try:
+                    if (
+                        packet.stream is input_video
+                        and self.output_video_stream is not None
+                    ):
+                        if seg_video_first_ts is None:
+                            seg_video_first_ts = min(pkt_pts, pkt_dts)
+                        packet.pts = (
+                            pkt_pts - seg_video_first_ts + self.video_pts_offset
+                        )
+                        packet.dts = (
+                            pkt_dts - seg_video_first_ts + self.video_pts_offset
+                        )
+                        seg_video_max_pts = max(seg_video_max_pts, packet.pts)
+                        if packet.duration:
+                            seg_video_last_dur = packet.duration
+                        packet.stream = self.output_video_stream
+                        output.mux(packet)
+                        seg_muxed_video += 1
+                    elif (
+                        packet.stream is input_audio
+                        and self.output_audio_stream is not None
+                    ):
+                        if seg_audio_first_ts is None:
+                            seg_audio_first_ts = min(pkt_pts, pkt_dts)
+                        packet.pts = (
+                            pkt_pts - seg_audio_first_ts + self.audio_pts_offset
+                        )
+                        packet.dts = (
+                            pkt_dts - seg_audio_first_ts + self.audio_pts_offset
+                        )
+                        seg_audio_max_pts = max(seg_audio_max_pts, packet.pts)
+                        if packet.duration:
+                            seg_audio_last_dur = packet.duration
+                        packet.stream = self.output_audio_stream
+                        output.mux(packet)
+                        seg_muxed_audio += 1
+                except (OSError, av.error.FFmpegError) as exc:
+                    self.total_skipped_mux_exc += 1
+                    # Capture packet state at failure — names whether
+                    # the rejection is about pts/dts ordering, packet
+                    # size, stream identity, or something else.
+                    pkt_stream = getattr(packet, "stream", None)
+                    pkt_stream_idx = (
+                        getattr(pkt_stream, "index", "?")
+                        if pkt_stream is not None
+                        else "None"
+                    )
+                    self._note_skip(
+                        f"{seg_path.name}: mux exc — {exc!r} "
+                        f"packet[stream_idx={pkt_stream_idx} "
+                        f"pts={packet.pts} dts={packet.dts} "
+                        f"dur={packet.duration} size={packet.size} "
+                        f"keyframe={packet.is_keyframe}]"
+                    )
+                    skipped_packets += 1
 
-                if output_video_stream is None:
-                    # Template-from-input copies codecpar (including the
-                    # 51-byte SPS/PPS extradata that PyAV's MPEG-TS
-                    # demuxer DOES populate in codecpar even though
-                    # `codec_context.extradata` reads empty). Do NOT set
-                    # `output_stream.time_base` after this — overriding
-                    # PyAV's default conflicts with the MP4 muxer's
-                    # internal timestamp scale and the muxer rejects
-                    # every packet with EINVAL.
-                    output_video_stream = output.add_stream_from_template(input_video)
-                    output_audio_stream = output.add_stream_from_template(input_audio)
-
-                # H.264 with B-frames has dts < pts on the first packet
-                # (decode-before-display reorder buffer). Rebasing by pts
-                # alone produces negative dts, which the MP4 muxer rejects
-                # with ArgumentError(22). Use min(pts, dts) — for video it
-                # tracks dts (the smaller one); for audio it's equal since
-                # AAC has no reorder.
-                seg_video_first_ts: int | None = None
-                seg_audio_first_ts: int | None = None
-                seg_video_max_pts = video_pts_offset
-                seg_audio_max_pts = audio_pts_offset
-                seg_video_last_dur = 0
-                seg_audio_last_dur = 0
-                skipped_packets = 0
-                seg_muxed_video = 0
-                seg_muxed_audio = 0
-
-                for packet in input_container.demux(input_video, input_audio):
-                    pkt_pts = packet.pts
-                    pkt_dts = packet.dts
-                    if pkt_pts is None or pkt_dts is None or packet.is_corrupt:
-                        if pkt_pts is None:
-                            total_skipped_pts_none += 1
-                        if pkt_dts is None:
-                            total_skipped_dts_none += 1
-                        if packet.is_corrupt:
-                            total_skipped_corrupt += 1
-                        if len(first_skip_examples) < skip_examples_cap:
-                            first_skip_examples.append(
-                                f"{seg_path.name}: stream_id={packet.stream.id} "
-                                f"pts={pkt_pts} dts={pkt_dts} corrupt={packet.is_corrupt}"
-                            )
-                        skipped_packets += 1
-                        continue
-                    try:
-                        if packet.stream is input_video:
-                            if seg_video_first_ts is None:
-                                seg_video_first_ts = min(pkt_pts, pkt_dts)
-                            packet.pts = pkt_pts - seg_video_first_ts + video_pts_offset
-                            packet.dts = pkt_dts - seg_video_first_ts + video_pts_offset
-                            seg_video_max_pts = max(seg_video_max_pts, packet.pts)
-                            if packet.duration:
-                                seg_video_last_dur = packet.duration
-                            packet.stream = output_video_stream
-                            output.mux(packet)
-                            seg_muxed_video += 1
-                        elif (
-                            packet.stream is input_audio
-                            and output_audio_stream is not None
-                        ):
-                            if seg_audio_first_ts is None:
-                                seg_audio_first_ts = min(pkt_pts, pkt_dts)
-                            packet.pts = pkt_pts - seg_audio_first_ts + audio_pts_offset
-                            packet.dts = pkt_dts - seg_audio_first_ts + audio_pts_offset
-                            seg_audio_max_pts = max(seg_audio_max_pts, packet.pts)
-                            if packet.duration:
-                                seg_audio_last_dur = packet.duration
-                            packet.stream = output_audio_stream
-                            output.mux(packet)
-                            seg_muxed_audio += 1
-                    except (OSError, av.error.FFmpegError) as exc:
-                        total_skipped_mux_exc += 1
-                        if len(first_skip_examples) < skip_examples_cap:
-                            # Capture packet state at failure — names whether
-                            # the rejection is about pts/dts ordering, packet
-                            # size, stream identity, or something else.
-                            pkt_stream = getattr(packet, "stream", None)
-                            pkt_stream_idx = (
-                                getattr(pkt_stream, "index", "?")
-                                if pkt_stream is not None
-                                else "None"
-                            )
-                            first_skip_examples.append(
-                                f"{seg_path.name}: mux exc — {exc!r} "
-                                f"packet[stream_idx={pkt_stream_idx} "
-                                f"pts={packet.pts} dts={packet.dts} "
-                                f"dur={packet.duration} size={packet.size} "
-                                f"keyframe={packet.is_keyframe}]"
-                            )
-                        skipped_packets += 1
-
-                # Advance global PTS offset for next segment (continuous timeline).
-                video_pts_offset = seg_video_max_pts + seg_video_last_dur
-                audio_pts_offset = seg_audio_max_pts + seg_audio_last_dur
-
-                total_muxed_video += seg_muxed_video
-                total_muxed_audio += seg_muxed_audio
-                trace_logger.trace(
-                    "download.livestream: {} seg[{}/{}] {} done — muxed v={} a={} "
-                    "skipped={} first_ts v={} a={} max_pts v={} a={}",
-                    log_prefix,
-                    seg_idx + 1,
-                    len(segments),
-                    seg_path.name,
-                    seg_muxed_video,
-                    seg_muxed_audio,
-                    skipped_packets,
-                    seg_video_first_ts,
-                    seg_audio_first_ts,
-                    seg_video_max_pts,
-                    seg_audio_max_pts,
-                )
+            # Advance global PTS offset for next segment (continuous timeline).
+            self.video_pts_offset = seg_video_max_pts + seg_video_last_dur
+            self.audio_pts_offset = seg_audio_max_pts + seg_audio_last_dur
 
-                if skipped_packets:
-                    total_skipped_packets += skipped_packets
+            self.total_muxed_video += seg_muxed_video
+            self.total_muxed_audio += seg_muxed_audio
+            trace_logger.trace(
+                "download.livestream: {} seg[{}] {} done — muxed v={} a={} "
+                "skipped={} first_ts v={} a={} max_pts v={} a={}",
+                log_prefix,
+                position,
+                seg_path.name,
+                seg_muxed_video,
+                seg_muxed_audio,
+                skipped_packets,
+                seg_video_first_ts,
+                seg_audio_first_ts,
+                seg_video_max_pts,
+                seg_audio_max_pts,
+            )
 
-            except Exception as exc:
-                # Per-segment failures go to TRACE — at 339-690 segments
-                # per mux, WARNING-per-segment dominates the log. The
-                # end-of-mux "skipped N/M segments" WARNING and the
-                # >25%-skipped ERROR carry the operator-visible signal.
-                # First few exceptions captured to first_skip_examples
-                # so an investigator turning on TRACE sees the cause.
-                trace_logger.trace(
-                    "download.livestream: {} segment {} mux failed — {!r}",
-                    log_prefix,
-                    seg_path.name,
-                    exc,
-                )
-                if len(first_skip_examples) < skip_examples_cap:
-                    first_skip_examples.append(
-                        f"{seg_path.name}: segment-level exc — {exc!r}"
-                    )
-                skipped_segments += 1
-            finally:
-                input_container.close()
+            if skipped_packets:
+                self.total_skipped_packets += skipped_packets
 
+        except Exception as exc:
+            # Per-segment failures go to TRACE — at 339-690 segments
+            # per mux, WARNING-per-segment dominates the log. The
+            # end-of-mux "skipped N/M segments" WARNING and the
+            # >25%-skipped ERROR carry the operator-visible signal.
+            # First few exceptions captured to first_skip_examples
+            # so an investigator turning on TRACE sees the cause.
+            trace_logger.trace(
+                "download.livestream: {} segment {} mux failed — {!r}",
+                log_prefix,
+                seg_path.name,
+                exc,
+            )
+            self._note_skip(f"{seg_path.name}: segment-level exc — {exc!r}")
+            self.skipped_segments += 1
+            return False
+        finally:
+            input_container.close()
+        return True
+
+    def check_skips(self, n_segments: int) -> bool:
+        """Log the mux summary; ``False`` if more than 25% of segments were skipped."""
+        log_prefix = self.log_prefix
         # Mux-level summary always emitted — operators investigating an
         # empty-output failure can grep this single line for the totals.
         trace_logger.trace(
@@ -995,114 +1062,325 @@ def _mux_ivs_segments(  # noqa: PLR0911  # multiple early-exit paths for failure
             "muxed v={} a={} total_skipped={} "
             "(pts_none={} dts_none={} corrupt={} mux_exc={})",
             log_prefix,
-            len(segments) - skipped_segments,
-            len(segments),
-            total_muxed_video,
-            total_muxed_audio,
-            total_skipped_packets,
-            total_skipped_pts_none,
-            total_skipped_dts_none,
-            total_skipped_corrupt,
-            total_skipped_mux_exc,
+            n_segments - self.skipped_segments,
+            n_segments,
+            self.total_muxed_video,
+            self.total_muxed_audio,
+            self.total_skipped_packets,
+            self.total_skipped_pts_none,
+            self.total_skipped_dts_none,
+            self.total_skipped_corrupt,
+            self.total_skipped_mux_exc,
         )
-        if first_skip_examples:
+        if self.first_skip_examples:
             trace_logger.trace(
                 "download.livestream: {} first {} skip examples:",
                 log_prefix,
-                len(first_skip_examples),
+                len(self.first_skip_examples),
             )
-            for example in first_skip_examples:
+            for example in self.first_skip_examples:
                 trace_logger.trace("download.livestream: {}   {}", log_prefix, example)
 
-        if skipped_segments > 0:
-            skip_pct = (skipped_segments / len(segments)) * 100
+        if self.skipped_segments > 0:
+            skip_pct = (self.skipped_segments / n_segments) * 100
             logger.warning(
                 "download.livestream: {} skipped {}/{} segments ({:.1f}%), {} packets",
                 log_prefix,
-                skipped_segments,
-                len(segments),
+                self.skipped_segments,
+                n_segments,
                 skip_pct,
-                total_skipped_packets,
+                self.total_skipped_packets,
             )
             if skip_pct > 25:
                 logger.error(
                     "download.livestream: {} >25%% segments skipped — "
                     "aborting; segments preserved at {}",
                     log_prefix,
-                    output_path.parent / f".{output_path.stem}_segments",
+                    self.output_path.parent / f".{self.output_path.stem}_segments",
                 )
                 return False
+        return True
 
-    except Exception as exc:
-        logger.exception("download.livestream: {} mux error — {}", log_prefix, exc)
-        return False
-    finally:
-        if output is not None:
-            pre_close_size = output_path.stat().st_size if output_path.exists() else 0
-            trace_logger.trace(
-                "download.livestream: {} pre-close — output_path={} size={}B",
+    def close(self) -> None:
+        """Finalize the output container, logging (not raising) close errors."""
+        output, self.output = self.output, None
+        if output is None:
+            return
+        output_path = self.output_path
+        pre_close_size = output_path.stat().st_size if output_path.exists() else 0
+        trace_logger.trace(
+            "download.livestream: {} pre-close — output_path={} size={}B",
+            self.log_prefix,
+            output_path,
+            pre_close_size,
+        )
+        try:
+            output.close()
+        except Exception as exc:
+            # MP4 writes the moov atom on close(); a swallowed close
+            # error leaves the file at 0 bytes, which the post-close
+            # size check below then reports as "output file missing
+            # or empty" — burying the actual PyAV/ffmpeg cause.
+            logger.opt(exception=exc).error(
+                "download.livestream: {} output.close() failed — {!r}",
+                self.log_prefix,
+                exc,
+            )
+        post_close_size = output_path.stat().st_size if output_path.exists() else 0
+        trace_logger.trace(
+            "download.livestream: {} post-close — size={}B (delta={})",
+            self.log_prefix,
+            post_close_size,
+            post_close_size - pre_close_size,
+        )
+
+    def verify(self) -> bool:
+        """Check the closed output exists and carries both video and audio."""
+        output_path = self.output_path
+        log_prefix = self.log_prefix
+        if not output_path.exists() or output_path.stat().st_size == 0:
+            logger.error(
+                "download.livestream: {} output file missing or empty — "
+                "muxed v={} a={} skipped={} (pts_none={} dts_none={} "
+                "corrupt={} mux_exc={})",
                 log_prefix,
-                output_path,
-                pre_close_size,
+                self.total_muxed_video,
+                self.total_muxed_audio,
+                self.total_skipped_packets,
+                self.total_skipped_pts_none,
+                self.total_skipped_dts_none,
+                self.total_skipped_corrupt,
+                self.total_skipped_mux_exc,
             )
-            try:
-                output.close()
-            except Exception as exc:
-                # MP4 writes the moov atom on close(); a swallowed close
-                # error leaves the file at 0 bytes, which the post-close
-                # size check below then reports as "output file missing
-                # or empty" — burying the actual PyAV/ffmpeg cause.
-                logger.opt(exception=exc).error(
-                    "download.livestream: {} output.close() failed — {!r}",
-                    log_prefix,
-                    exc,
-                )
-            post_close_size = output_path.stat().st_size if output_path.exists() else 0
-            trace_logger.trace(
-                "download.livestream: {} post-close — size={}B (delta={})",
+            return False
+
+        try:
+            verify = av.open(str(output_path))
+            has_video = any(s.type == "video" for s in verify.streams)
+            has_audio = any(s.type == "audio" for s in verify.streams)
+            verify.close()
+        except Exception:
+            has_video = has_audio = False
+
+        ok = has_video and has_audio
+        if ok:
+            logger.info(
+                "download.livestream: {} mux OK — {} ({:,} bytes)",
                 log_prefix,
-                post_close_size,
-                post_close_size - pre_close_size,
+                output_path.name,
+                output_path.stat().st_size,
             )
+        else:
+            logger.error(
+                "download.livestream: {} output missing streams: video={}, audio={}",
+                log_prefix,
+                has_video,
+                has_audio,
+            )
+        return ok
+
+
+def _mux_ivs_segments(
+    segments: list[Path],
+    _durations: list[float],
+    output_path: Path,
+    log_prefix: str,
+    stop_event: threading.Event | None = None,
+) -> bool:
+    """PID-based PyAV mux of IVS ``.ts`` segments into a single MP4.
+
+    IVS segments have consistent PIDs across the broadcast but **inconsistent
+    stream positions** — the video stream may be at position 0 in one segment
+    and position 1 in the next.  This function probes up to
+    ``_MAX_PROBE_SEGMENTS`` segments to identify the audio and video PIDs,
+    then routes every packet by PID rather than position.  Output streams
+    are templated from the PID-resolved input streams so codec extradata
+    (SPS/PPS) is preserved.
+
+    PTS rebasing ensures a continuous timeline across segment boundaries:
+    each segment's first PTS is zeroed and shifted by the running global
+    offset (max PTS of the previous segment + one packet duration).
+
+    Args:
+        segments: Ordered list of downloaded ``.ts`` segment paths.
+        durations: Matching list of declared segment durations (seconds).
+        output_path: Final MP4 destination path.
+        log_prefix: Log line prefix.
 
-    # Verify output has both streams.
-    if not output_path.exists() or output_path.stat().st_size == 0:
+    Returns:
+        ``True`` if the output file was written with both video and audio.
+    """
+    if not segments:
+        logger.warning("download.livestream: {} no segments to mux", log_prefix)
+        return False
+
+    # ── PID discovery ────────────────────────────────────────────────────
+    n_probe = min(_MAX_PROBE_SEGMENTS, len(segments))
+    video_pid, audio_pid = _probe_ivs_pids(segments[:n_probe], log_prefix)
+
+    if not audio_pid or not video_pid:
         logger.error(
-            "download.livestream: {} output file missing or empty — "
-            "muxed v={} a={} skipped={} (pts_none={} dts_none={} "
-            "corrupt={} mux_exc={})",
+            "download.livestream: {} could not identify audio+video PIDs "
+            "after probing {} segments — aborting mux",
             log_prefix,
-            total_muxed_video,
-            total_muxed_audio,
-            total_skipped_packets,
-            total_skipped_pts_none,
-            total_skipped_dts_none,
-            total_skipped_corrupt,
-            total_skipped_mux_exc,
+            n_probe,
         )
         return False
 
+    logger.info(
+        "download.livestream: {} PIDs — video={}, audio={}",
+        log_prefix,
+        hex(video_pid),
+        hex(audio_pid),
+    )
+
+    # ── Mux ──────────────────────────────────────────────────────────────
+    muxer = _IvsSegmentMuxer(output_path, log_prefix, video_pid, audio_pid)
     try:
-        verify = av.open(str(output_path))
-        has_video = any(s.type == "video" for s in verify.streams)
-        has_audio = any(s.type == "audio" for s in verify.streams)
-        verify.close()
-    except Exception:
-        has_video = has_audio = False
-
-    ok = has_video and has_audio
-    if ok:
+        muxer.open(len(segments))
+
+        for seg_idx, seg_path in enumerate(segments):
+            if stop_event is not None and stop_event.is_set():
+                logger.info(
+                    "download.livestream: {} mux interrupted at seg[{}/{}] — "
+                    "segments preserved",
+                    log_prefix,
+                    seg_idx + 1,
+                    len(segments),
+                )
+                return False
+            muxer.mux_segment(seg_path, f"{seg_idx + 1}/{len(segments)}")
+
+        if not muxer.check_skips(len(segments)):
+            return False
+
+    except Exception as exc:
+        logger.exception("download.livestream: {} mux error — {}", log_prefix, exc)
+        return False
+    finally:
+        muxer.close()
+
+    return muxer.verify()
+
+
+class _LiveIvsMuxer:
+    """Appends IVS segments to a fragmented MP4 while the broadcast runs.
+
+    Segments handed to :meth:`add` are muxed in arrival order on one
+    background thread through :class:`_IvsSegmentMuxer` (same PID routing
+    and PTS rebasing as the batch mux) and deleted once muxed, so disk use
+    stays near the size of the recording and the file is playable while
+    it grows.  Segments that were skipped stay on disk for inspection.
+
+    If the output never opens (PIDs not found within
+    ``_MAX_PROBE_SEGMENTS`` segments, or ``av.open`` failing), no segment is
+    deleted and :meth:`finish` returns ``None`` so the caller can fall back
+    to :func:`_mux_ivs_segments`.
+    """
+
+    def __init__(self, output_path: Path, log_prefix: str) -> None:
+        self.output_path = output_path
+        self.log_prefix = log_prefix
+        self._queue: queue.SimpleQueue[Path | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name=f"livestream-mux{log_prefix}", daemon=True
+        )
+        self._muxer: _IvsSegmentMuxer | None = None
+        self._held: list[Path] = []  # received before the PIDs were known
+        self._failed = False
+        self._received = 0
+        self._video_pid: int | None = None
+        self._audio_pid: int | None = None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def add(self, seg_path: Path) -> None:
+        """Queue a downloaded segment; muxing happens on the mux thread."""
+        self._queue.put(seg_path)
+
+    def _mux(self, muxer: _IvsSegmentMuxer, seg_path: Path) -> None:
+        self._received += 1
+        if muxer.mux_segment(seg_path, str(self._received)):
+            seg_path.unlink(missing_ok=True)
+
+    def _start_output(self, seg_path: Path) -> None:
+        """Hold *seg_path* until the PIDs are known, then open the output."""
+        self._held.append(seg_path)
+        self._video_pid, self._audio_pid = _probe_ivs_pids(
+            [seg_path], self.log_prefix, self._video_pid, self._audio_pid
+        )
+        if not self._video_pid or not self._audio_pid:
+            if len(self._held) >= _MAX_PROBE_SEGMENTS:
+                logger.error(
+                    "download.livestream: {} could not identify audio+video PIDs "
+                    "after probing {} segments — live mux disabled",
+                    self.log_prefix,
+                    len(self._held),
+                )
+                self._failed = True
+            return
+
         logger.info(
-            "download.livestream: {} mux OK — {} ({:,} bytes)",
-            log_prefix,
-            output_path.name,
-            output_path.stat().st_size,
+            "download.livestream: {} PIDs — video={}, audio={} (live mux)",
+            self.log_prefix,
+            hex(self._video_pid),
+            hex(self._audio_pid),
         )
-    else:
-        logger.error(
-            "download.livestream: {} output missing streams: video={}, audio={}",
-            log_prefix,
-            has_video,
-            has_audio,
+        muxer = _IvsSegmentMuxer(
+            self.output_path,
+            self.log_prefix,
+            self._video_pid,
+            self._audio_pid,
+            fragmented=True,
         )
-    return ok
+        try:
+            muxer.open("live")
+        except Exception as exc:
+            logger.error(
+                "download.livestream: {} live mux output open failed — {}",
+                self.log_prefix,
+                exc,
+            )
+            self._failed = True
+            return
+        self._muxer = muxer
+        held, self._held = self._held, []
+        for held_path in held:
+            self._mux(muxer, held_path)
+
+    def _run(self) -> None:
+        while (seg_path := self._queue.get()) is not None:
+            if self._failed:
+                continue
+            try:
+                if self._muxer is None:
+                    self._start_output(seg_path)
+                else:
+                    self._mux(self._muxer, seg_path)
+            except Exception as exc:
+                logger.opt(exception=exc).error(
+                    "download.livestream: {} live mux error — {!r}",
+                    self.log_prefix,
+                    exc,
+                )
+                self._failed = self._muxer is None
+
+    def finish(self) -> bool | None:
+        """Stop accepting segments, finalize the MP4 and verify it.
+
+        Blocking — call via ``asyncio.to_thread``.
+
+        Returns:
+            ``None`` if the output was never started (nothing was deleted),
+            else whether the finished MP4 is usable.
+        """
+        self._queue.put(None)
+        if self._thread.is_alive():
+            self._thread.join()
+        muxer = self._muxer
+        if muxer is None:
+            return None
+        ok = muxer.check_skips(self._received)
+        muxer.close()
+        return muxer.verify() and ok
@@ -3,14 +3,22 @@
 This module provides HLS video downloading functionality with:
 1. Direct PyAV download (fastest) - In-process HLS demux/remux via libav
 2. Direct FFmpeg subprocess (fallback) - Let ffmpeg CLI handle the HLS stream
-3. Manual segment download (robust fallback) - Download .ts files individually
+3. Manual segment download (robust fallback) - Fetch .ts files individually
+   on the shared async HTTP client and stream them through one PyAV remux;
+   with a resume directory, completed segments survive an interrupted run
 
 Always tries PyAV first, then FFmpeg subprocess, then segments.
 """
 
-import concurrent.futures
+import asyncio
+import json
 import os
+import shutil
 import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +34,14 @@ from helpers.web import get_file_name_from_url, get_qs_value, split_url
 from textio import print_debug, print_error, print_info, print_warning
 
 
+# Tier 3: tries per segment for network errors, 429 and 5xx; the delay
+# (seconds) grows linearly with the attempt number
+_SEGMENT_ATTEMPTS = 3
+_SEGMENT_RETRY_DELAY = 1.0
+# Segments queued between the fetch loop and the streaming remux thread
+_PIPE_SEGMENTS = 4
+
+
 def get_m3u8_cookies(m3u8_url: str) -> dict[str, Any]:
     """Parses an M3U8 URL and returns CloudFront cookies."""
     # Parse URL query string for required cookie values
@@ -468,120 +484,142 @@ def _try_direct_download_ffmpeg(
 # ---------------------------------------------------------------------------
 
 
-def _mux_segments_with_pyav(
-    segment_files: list[Path],
-    output_path: Path,
-) -> bool:
-    """Mux downloaded .ts segments into MP4 using PyAV.
+class _PyAVSegmentMuxer:
+    """Incremental PyAV remux of .ts segments into one MP4.
 
-    Opens each segment individually (to avoid fd accumulation), creates
-    output streams from the first valid segment, then remuxes all packets.
-    Skips corrupt packets and aborts if >25% of segments fail.
-
-    Args:
-        segment_files: Ordered list of .ts segment file paths
-        output_path: Path for the output MP4 file
-
-    Returns:
-        True if muxing succeeded, False otherwise
+    Segments are fed in playlist order with ``add`` as they become
+    available; ``finish`` closes the output and reports success. Each
+    segment is opened on its own (to avoid fd accumulation); output streams
+    come from the first valid segment. Corrupt packets are skipped, and
+    the mux fails if >25% of segments fail.
     """
-    output = None
-    try:
-        output = av.open(str(output_path), "w", options={"movflags": "faststart"})
 
-        output_streams: dict[str, Any] = {}
-        skipped_segments = 0
-        total_skipped_packets = 0
+    def __init__(self, output_path: Path) -> None:
+        self.output_path = output_path
+        self.output: Any = av.open(
+            str(output_path), "w", options={"movflags": "faststart"}
+        )
+        self.output_streams: dict[str, Any] = {}
+        self.segment_count = 0
+        self.skipped_segments = 0
+        self.skipped_packets = 0
+
+    def add(self, segment_path: Path) -> None:
+        """Remux one segment. Unreadable segments are counted and skipped."""
+        self.segment_count += 1
+        input_options = {
+            "err_detect": "ignore_err",
+            "fflags": "+discardcorrupt+genpts",
+        }
 
-        for segment_path in segment_files:
-            input_options = {
-                "err_detect": "ignore_err",
-                "fflags": "+discardcorrupt+genpts",
-            }
+        try:
+            input_container = av.open(str(segment_path), options=input_options)
+        except Exception as e:
+            print_debug(f"Segment {segment_path.name} failed to open: {e} — skipping")
+            self.skipped_segments += 1
+            return
 
-            try:
-                input_container = av.open(str(segment_path), options=input_options)
-            except Exception as e:
+        output = self.output
+        output_streams = self.output_streams
+        try:
+            # Create output streams from first valid segment
+            if not output_streams:
+                for stream in input_container.streams:
+                    if stream.type == "video" and "video" not in output_streams:
+                        output_streams["video"] = output.add_stream_from_template(
+                            stream
+                        )
+                    elif stream.type == "audio" and "audio" not in output_streams:
+                        output_streams["audio"] = output.add_stream_from_template(
+                            stream
+                        )
+
+            # Demux and remux packets, skip corrupt ones
+            skipped_packets = 0
+            for packet in input_container.demux():
+                if packet.dts is None or packet.is_corrupt:
+                    skipped_packets += 1
+                    continue
+                try:
+                    if packet.stream.type == "video" and "video" in output_streams:
+                        packet.stream = output_streams["video"]
+                        output.mux(packet)
+                    elif packet.stream.type == "audio" and "audio" in output_streams:
+                        packet.stream = output_streams["audio"]
+                        output.mux(packet)
+                except (OSError, av.error.FFmpegError):
+                    skipped_packets += 1
+
+            if skipped_packets > 0:
                 print_debug(
-                    f"Segment {segment_path.name} failed to open: {e} — skipping"
+                    f"Segment {segment_path.name}: skipped {skipped_packets} bad packets"
                 )
-                skipped_segments += 1
-                continue
+                self.skipped_packets += skipped_packets
 
-            try:
-                # Create output streams from first valid segment
-                if not output_streams:
-                    for stream in input_container.streams:
-                        if stream.type == "video" and "video" not in output_streams:
-                            output_streams["video"] = output.add_stream_from_template(
-                                stream
-                            )
-                        elif stream.type == "audio" and "audio" not in output_streams:
-                            output_streams["audio"] = output.add_stream_from_template(
-                                stream
-                            )
-
-                # Demux and remux packets, skip corrupt ones
-                skipped_packets = 0
-                for packet in input_container.demux():
-                    if packet.dts is None or packet.is_corrupt:
-                        skipped_packets += 1
-                        continue
-                    try:
-                        if packet.stream.type == "video" and "video" in output_streams:
-                            packet.stream = output_streams["video"]
-                            output.mux(packet)
-                        elif (
-                            packet.stream.type == "audio" and "audio" in output_streams
-                        ):
-                            packet.stream = output_streams["audio"]
-                            output.mux(packet)
-                    except (OSError, av.error.FFmpegError):
-                        skipped_packets += 1
-
-                if skipped_packets > 0:
-                    print_debug(
-                        f"Segment {segment_path.name}: "
-                        f"skipped {skipped_packets} bad packets"
-                    )
-                    total_skipped_packets += skipped_packets
-
-            except Exception as e:
-                print_debug(
-                    f"Segment {segment_path.name} failed: {e} — skipping entirely"
-                )
-                skipped_segments += 1
-            finally:
-                input_container.close()
+        except Exception as e:
+            print_debug(f"Segment {segment_path.name} failed: {e} — skipping entirely")
+            self.skipped_segments += 1
+        finally:
+            input_container.close()
 
+    def finish(self) -> bool:
+        """Close the output; True if it holds a usable MP4."""
         # Check failure threshold
-        if skipped_segments > 0:
-            skip_pct = (skipped_segments / len(segment_files)) * 100
+        if self.skipped_segments > 0:
+            skip_pct = (self.skipped_segments / max(1, self.segment_count)) * 100
             print_debug(
-                f"PyAV mux: {skipped_segments} segments skipped, "
-                f"{total_skipped_packets} packets skipped"
+                f"PyAV mux: {self.skipped_segments} segments skipped, "
+                f"{self.skipped_packets} packets skipped"
             )
             if skip_pct > 25:
                 print_warning(
                     f"Too many segments failed ({skip_pct:.1f}% > 25%) — aborting PyAV mux"
                 )
-                output.close()
-                output = None
+                self.close()
                 return False
 
-        output.close()
-        output = None
+        self.close()
 
-        if output_path.exists() and output_path.stat().st_size > 0:
+        if self.output_path.exists() and self.output_path.stat().st_size > 0:
             return True
 
         print_debug("PyAV mux completed but output file is missing or empty")
+        return False
 
+    def close(self) -> None:
+        """Close the output container (idempotent)."""
+        if self.output is not None:
+            output, self.output = self.output, None
+            output.close()
+
+
+def _mux_segments_with_pyav(
+    segment_files: list[Path],
+    output_path: Path,
+) -> bool:
+    """Mux downloaded .ts segments into MP4 using PyAV.
+
+    Batch wrapper around ``_PyAVSegmentMuxer`` for segments that are all
+    on disk already.
+
+    Args:
+        segment_files: Ordered list of .ts segment file paths
+        output_path: Path for the output MP4 file
+
+    Returns:
+        True if muxing succeeded, False otherwise
+    """
+    muxer = None
+    try:
+        muxer = _PyAVSegmentMuxer(output_path)
+        for segment_path in segment_files:
+            muxer.add(segment_path)
+        return muxer.finish()
     except Exception as e:
         print_debug(f"PyAV segment muxing error: {e!s}")
     finally:
-        if output is not None:
-            output.close()
+        if muxer is not None:
+            muxer.close()
 
     return False
 
@@ -627,171 +665,694 @@ def _mux_segments_with_ffmpeg(
         ffmpeg_list_file.unlink(missing_ok=True)
 
 
-def _try_segment_download(
+class _SegmentManifest:
+    """Resume state for the segment tier of one HLS download.
+
+    ``resume_dir`` holds ``segments.ts`` — every completed segment appended
+    in playlist order, which is itself a valid MPEG-TS stream — and
+    ``manifest.jsonl``: a header line naming the variant and its segments,
+    then one line per completed segment with its index and byte size. A
+    line is appended only after its bytes reach the spool, so a killed
+    process leaves at worst spool bytes without a line; ``open`` truncates
+    those away.
+    """
+
+    MANIFEST_NAME = "manifest.jsonl"
+    SPOOL_NAME = "segments.ts"
+    DIR_SUFFIX = "_hls"
+    # Resume state untouched for this long is deleted at startup; the media
+    # is either done, gone, or will simply be fetched from scratch.
+    MAX_AGE_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, resume_dir: Path, sizes: list[int]) -> None:
+        self.resume_dir = resume_dir
+        self.manifest_path = resume_dir / self.MANIFEST_NAME
+        self.spool_path = resume_dir / self.SPOOL_NAME
+        self.sizes = sizes
+        self.offsets: list[int] = []
+        self.spooled_bytes = 0
+        for size in sizes:
+            self.offsets.append(self.spooled_bytes)
+            self.spooled_bytes += size
+
+    @property
+    def completed(self) -> int:
+        """Number of leading playlist segments already in the spool."""
+        return len(self.sizes)
+
+    @classmethod
+    def exists(cls, resume_dir: Path) -> bool:
+        """True if ``resume_dir`` holds a manifest from an earlier attempt."""
+        return (resume_dir / cls.MANIFEST_NAME).is_file()
+
+    @classmethod
+    def open(cls, resume_dir: Path, playlist: M3U8) -> "_SegmentManifest":
+        """Load the resume state for ``playlist``, or start a fresh one.
+
+        State recorded for a different variant or segment list is
+        discarded. Segment URLs are compared by file name, since the
+        signed query strings change between runs.
+        """
+        header = {
+            "variant": playlist.base_uri,
+            "media_sequence": playlist.media_sequence or 0,
+            "segments": [
+                get_file_name_from_url(segment.absolute_uri)
+                for segment in playlist.segments
+            ],
+        }
+        manifest_path = resume_dir / cls.MANIFEST_NAME
+        spool_path = resume_dir / cls.SPOOL_NAME
+
+        sizes: list[int] = []
+        if manifest_path.is_file():
+            lines = manifest_path.read_text(encoding="utf-8").splitlines()
+            try:
+                stored = json.loads(lines[0]) if lines else None
+            except ValueError:
+                stored = None
+            if stored == header:
+                for line in lines[1:]:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break  # torn final line
+                    if entry.get("index") != len(sizes):
+                        break
+                    sizes.append(int(entry["size"]))
+            else:
+                print_debug(
+                    f"HLS resume state in {resume_dir} is stale — starting over"
+                )
+
+        # Keep only segments whose bytes fully reached the spool
+        spooled = spool_path.stat().st_size if spool_path.exists() else 0
+        kept: list[int] = []
+        total = 0
+        for size in sizes:
+            if total + size > spooled:
+                break
+            kept.append(size)
+            total += size
+
+        resume_dir.mkdir(parents=True, exist_ok=True)
+        with spool_path.open("ab") as spool:
+            spool.truncate(total)
+        entries = [header] + [
+            {"index": index, "size": size} for index, size in enumerate(kept)
+        ]
+        manifest_path.write_text(
+            "".join(json.dumps(entry) + "\n" for entry in entries),
+            encoding="utf-8",
+        )
+        return cls(resume_dir, kept)
+
+    def append(self, index: int, data: bytes) -> None:
+        """Spool the next segment, then record it as completed."""
+        if index != self.completed:
+            raise ValueError(
+                f"Segment {index} appended out of order (expected {self.completed})"
+            )
+        with self.spool_path.open("ab") as spool:
+            spool.write(data)
+        with self.manifest_path.open("a", encoding="utf-8") as manifest:
+            manifest.write(json.dumps({"index": index, "size": len(data)}) + "\n")
+        self.offsets.append(self.spooled_bytes)
+        self.sizes.append(len(data))
+        self.spooled_bytes += len(data)
+
+    def read_segment(self, index: int) -> bytes:
+        """Return the bytes of a completed segment from the spool."""
+        with self.spool_path.open("rb") as spool:
+            spool.seek(self.offsets[index])
+            return spool.read(self.sizes[index])
+
+    @staticmethod
+    def discard(resume_dir: Path) -> None:
+        """Delete the resume state for a finished or filtered download."""
+        shutil.rmtree(resume_dir, ignore_errors=True)
+
+    @classmethod
+    def prune(cls, base: Path, max_age: float | None = None) -> list[Path]:
+        """Delete resume dirs under ``base`` not written to for ``max_age`` s.
+
+        Age is taken from the manifest, which every completed segment
+        appends to, else from the directory itself. Returns the removed dirs.
+        """
+        if not base.is_dir():
+            return []
+        cutoff = time.time() - (cls.MAX_AGE_SECONDS if max_age is None else max_age)
+        removed: list[Path] = []
+        for path in base.iterdir():
+            if not (path.name.endswith(cls.DIR_SUFFIX) and path.is_dir()):
+                continue
+            manifest_path = path / cls.MANIFEST_NAME
+            try:
+                stamp = manifest_path if manifest_path.exists() else path
+                modified = stamp.stat().st_mtime
+            except OSError:
+                continue
+            if modified < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(path)
+        return removed
+
+
+class _StreamRemuxError(Exception):
+    """The streaming remuxer stopped before all segments were fed to it."""
+
+
+class _SegmentPipe:
+    """Blocking in-memory byte pipe from the event loop to the remux thread.
+
+    Holds at most ``max_segments`` unread segments; ``write`` blocks while
+    it is full. ``read`` blocks until data arrives and returns ``b""`` at
+    end of stream or once either side has closed the pipe. PyAV reads it
+    like a non-seekable file.
+    """
+
+    def __init__(self, max_segments: int) -> None:
+        self._chunks: deque[memoryview] = deque()
+        self._max_segments = max_segments
+        self._cond = threading.Condition()
+        self._eof = False
+        self._closed = False
+
+    def write(self, data: bytes) -> bool:
+        """Queue one segment; False if the reader has gone away."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._closed or len(self._chunks) < self._max_segments
+            )
+            if self._closed:
+                return False
+            self._chunks.append(memoryview(data))
+            self._cond.notify_all()
+            return True
+
+    def finish(self) -> None:
+        """Mark end of stream; the reader drains what is queued."""
+        with self._cond:
+            self._eof = True
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Drop queued data and wake both sides."""
+        with self._cond:
+            self._closed = True
+            self._chunks.clear()
+            self._cond.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        with self._cond:
+            self._cond.wait_for(lambda: self._chunks or self._eof or self._closed)
+            if self._closed or not self._chunks:
+                return b""
+            head = self._chunks[0]
+            if size < 0 or size >= len(head):
+                self._chunks.popleft()
+                self._cond.notify_all()
+                return head.tobytes()
+            self._chunks[0] = head[size:]
+            return head[:size].tobytes()
+
+
+def _remux_segment_stream(pipe: _SegmentPipe, output_path: Path) -> bool:
+    """Remux the MPEG-TS byte stream in ``pipe`` into one MP4.
+
+    Runs on a worker thread. A single demux session spans every segment,
+    so nothing is staged on disk and no segment is opened twice. Corrupt
+    packets are skipped.
+
+    Args:
+        pipe: Source of in-order segment bytes
+        output_path: Path for the output MP4 file
+
+    Returns:
+        True if the output holds at least one muxed packet, False otherwise
+    """
+    input_container = None
+    output = None
+    muxed_packets = 0
+    skipped_packets = 0
+    try:
+        input_container = av.open(
+            pipe,
+            "r",
+            format="mpegts",
+            options={"err_detect": "ignore_err", "fflags": "+discardcorrupt+genpts"},
+        )
+        output = av.open(str(output_path), "w", options={"movflags": "faststart"})
+
+        output_streams: dict[int, Any] = {}
+        stream_types: set[str] = set()
+        for stream in input_container.streams:
+            if stream.type in ("video", "audio") and stream.type not in stream_types:
+                stream_types.add(stream.type)
+                output_streams[stream.index] = output.add_stream_from_template(stream)
+
+        if not output_streams:
+            print_debug("Streaming remux: no audio/video streams in segment data")
+            return False
+
+        selected = [s for s in input_container.streams if s.index in output_streams]
+        for packet in input_container.demux(*selected):
+            if packet.dts is None or packet.is_corrupt:
+                skipped_packets += 1
+                continue
+            packet.stream = output_streams[packet.stream.index]
+            try:
+                output.mux(packet)
+                muxed_packets += 1
+            except (OSError, av.error.FFmpegError):
+                skipped_packets += 1
+
+    except Exception as e:
+        print_debug(f"Streaming remux error: {e!s}")
+        return False
+    finally:
+        pipe.close()
+        if input_container is not None:
+            input_container.close()
+        if output is not None:
+            output.close()
+
+    if skipped_packets > 0:
+        print_debug(f"Streaming remux: skipped {skipped_packets} bad packets")
+
+    return muxed_packets > 0 and output_path.exists() and output_path.stat().st_size > 0
+
+
+async def _fetch_segments_in_order(
     config: FanslyConfig,
-    m3u8_url: str,
-    output_path: Path,
+    playlist: M3U8,
     cookies: dict[str, str],
+    consume: Callable[[int, bytes], Awaitable[None]],
     max_bytes: int | None = None,
-    max_resolution: int | None = None,
-) -> Path:
-    """Download HLS video by fetching each segment then muxing with PyAV.
+    manifest: _SegmentManifest | None = None,
+) -> None:
+    """Fetch every playlist segment into memory and hand them over in order.
+
+    Segments are fetched on the shared async HTTP client, at most
+    ``config.m3u8_segment_concurrency`` at a time. A segment that fails
+    with a network error, 429 or 5xx is retried (identified by its
+    EXT-X-MEDIA-SEQUENCE number); other statuses fail it immediately.
+    Segments that arrive early wait in a reorder buffer of twice the
+    window; workers stall rather than run further ahead of ``consume``.
 
-    Downloads each .ts segment individually via the API, then muxes them
-    into a final MP4 using PyAV (with ffmpeg concat as internal fallback).
+    With a ``manifest``, segments it already holds are replayed from its
+    spool instead of fetched, and every fetched segment is spooled before
+    it is consumed.
 
     Args:
         config: The downloader configuration
-        m3u8_url: URL of the master HLS manifest
-        output_path: Path to save the final video
+        playlist: The VOD segment playlist
         cookies: CloudFront authentication cookies
+        consume: Called with ``(index, data)`` for each segment in
+            playlist order; an exception aborts the download.
         max_bytes: Abort threshold for the running total of downloaded
-            segment bytes across all threads.
-        max_resolution: Shorter-edge pixel cap forwarded to variant selection.
-
-    Returns:
-        Path to the downloaded video file
+            segment bytes, spooled ones included.
+        manifest: Resume state to replay from and record into
 
     Raises:
-        M3U8Error: If download or conversion fails
-        MediaFilteredError: If the running segment total exceeds max_bytes,
-            or variant selection finds no fitting resolution.
+        M3U8Error: If a segment failed to download
+        MediaFilteredError: If the running segment total exceeds max_bytes
     """
     chunk_size = 1_048_576
 
-    print_info("Using segment download path (downloading .ts files individually)...")
-    print_debug(f"Target output path: {output_path}")
+    segment_uris = [segment.absolute_uri for segment in playlist.segments]
+    first_sequence = playlist.media_sequence or 0
+    start = manifest.completed if manifest is not None else 0
+    window = max(1, min(config.m3u8_segment_concurrency, len(segment_uris) - start))
+    reorder_limit = 2 * window
+
+    api = config.get_api()
+    ready = [asyncio.Event() for _ in segment_uris]
+    fetched: dict[int, bytes] = {}
+    failed: dict[int, str] = {}
+    room = asyncio.Condition()
+    total_bytes = manifest.spooled_bytes if manifest is not None else 0
+    over_budget = max_bytes is not None and total_bytes > max_bytes
+    stopped = False
+    next_index = start
+    consumed = start
+
+    async def fetch_segment(index: int) -> bytes | None:
+        """Fetch one segment into memory, retrying transient failures."""
+        nonlocal total_bytes, over_budget
+        segment_uri = segment_uris[index]
+        sequence = first_sequence + index
+
+        for attempt in range(1, _SEGMENT_ATTEMPTS + 1):
+            retryable = True
+            buffer = bytearray()
+            response = None
+            try:
+                response = await api.get_with_ngsw(
+                    url=segment_uri,
+                    cookies=cookies,
+                    stream=True,
+                    add_fansly_headers=False,
+                    bypass_rate_limit=True,
+                )
+                if response.status_code == 200:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        if over_budget:
+                            return None
+                        buffer += chunk
+                        total_bytes += len(chunk)
+                        if max_bytes is not None and total_bytes > max_bytes:
+                            over_budget = True
+                            return None
+                    return bytes(buffer)
+                retryable = response.status_code == 429 or response.status_code >= 500
+                reason = f"status {response.status_code}"
+            except Exception as e:
+                reason = str(e) or type(e).__name__
+            finally:
+                if response is not None:
+                    await response.aclose()
+
+            # Drop the partial attempt so the budget stays exact
+            total_bytes -= len(buffer)
+            if not retryable or attempt == _SEGMENT_ATTEMPTS or over_budget:
+                print_debug(f"Segment #{sequence} failed ({reason}): {segment_uri}")
+                failed[sequence] = f"{get_file_name_from_url(segment_uri)} ({reason})"
+                return None
+            print_debug(
+                f"Segment #{sequence} attempt {attempt} failed ({reason}) — retrying"
+            )
+            await asyncio.sleep(_SEGMENT_RETRY_DELAY * attempt)
 
-    video_path = output_path.parent
-    playlist = fetch_m3u8_segment_playlist(
-        config, m3u8_url, cookies, max_resolution=max_resolution
-    )
+        return None
 
-    total_bytes = 0
-    total_bytes_lock = threading.Lock()
-    abort_event = threading.Event()
+    def aborted() -> bool:
+        return stopped or over_budget or bool(failed)
 
-    def download_ts(segment_uri: str, segment_full_path: Path) -> None:
-        """Download a single .ts segment."""
-        nonlocal total_bytes
-        if abort_event.is_set():
-            return
-        segment_response = None
+    def has_room(index: int) -> bool:
+        return aborted() or index < consumed + reorder_limit
+
+    async def worker() -> None:
+        """Pull the next unfetched segment until done or aborted."""
+        nonlocal next_index
+        while next_index < len(segment_uris) and not aborted():
+            index = next_index
+            next_index += 1
+            try:
+                async with room:
+                    await room.wait_for(partial(has_room, index))
+                if not aborted():
+                    data = await fetch_segment(index)
+                    if data is not None:
+                        fetched[index] = data
+            finally:
+                ready[index].set()
+                progress.advance(task_id)
+
+    async def run_workers() -> None:
         try:
-            segment_response = config.get_api().get_with_ngsw_sync(
-                url=segment_uri,
-                cookies=cookies,
-                stream=True,
-                add_fansly_headers=False,
-                bypass_rate_limit=True,
-            )
-            if segment_response.status_code != 200:
-                print_debug(
-                    f"Segment download failed with status "
-                    f"{segment_response.status_code}: {segment_uri}"
-                )
-                return
-            with segment_full_path.open("wb") as ts_file:
-                for chunk in segment_response.iter_bytes(chunk_size):
-                    if abort_event.is_set():
-                        break
-                    if chunk:
-                        ts_file.write(chunk)
-                        if max_bytes is not None:
-                            with total_bytes_lock:
-                                total_bytes += len(chunk)
-                                if total_bytes > max_bytes:
-                                    abort_event.set()
-        except Exception as e:
-            print_debug(f"Error downloading segment {segment_uri}: {e!s}")
+            await asyncio.gather(*(worker() for _ in range(window)))
         finally:
-            if segment_response is not None:
-                segment_response.close()
+            # Release the consumer for segments that were never scheduled
+            for event in ready:
+                event.set()
 
-    segments = playlist.segments
+    async def consume_in_order() -> None:
+        nonlocal consumed, stopped
+        try:
+            if manifest is not None:
+                for index in range(start):
+                    if over_budget:
+                        return
+                    data = await asyncio.to_thread(manifest.read_segment, index)
+                    await consume(index, data)
+            # After a failure, the segments already fetched ahead of it
+            # are still consumed (and spooled) in order
+            for index in range(start, len(segment_uris)):
+                await ready[index].wait()
+                if over_budget or index not in fetched:
+                    return
+                data = fetched.pop(index)
+                if manifest is not None:
+                    await asyncio.to_thread(manifest.append, index, data)
+                await consume(index, data)
+                consumed += 1
+                async with room:
+                    room.notify_all()
+        finally:
+            stopped = True
+            async with room:
+                room.notify_all()
 
-    segment_files: list[Path] = []
-    segment_uris: list[str] = []
+    # Display loading bar if there are many segments
+    progress = get_m3u8_progress(disable_loading_bar=len(segment_uris) < 5)
 
-    for segment in segments:
-        segment_uri = segment.absolute_uri
-        segment_file_name = get_file_name_from_url(segment_uri)
-        segment_full_path = video_path / segment_file_name
-        segment_files.append(segment_full_path)
-        segment_uris.append(segment_uri)
+    print_debug(f"Downloading {len(segment_uris)} segments ({window} at once)")
+    if start:
+        print_info(
+            f"Resuming HLS download: {start}/{len(segment_uris)} segments "
+            f"already on disk"
+        )
 
-    # Display loading bar if there are many segments
-    progress = get_m3u8_progress(disable_loading_bar=len(segment_files) < 5)
+    with progress:
+        task_id = progress.add_task(
+            f"Downloading segments ({window} at once)",
+            total=len(segment_uris),
+            completed=start,
+        )
+        workers = asyncio.create_task(run_workers())
+        try:
+            await consume_in_order()
+        finally:
+            workers.cancel()
+            await asyncio.gather(workers, return_exceptions=True)
+
+    if over_budget:
+        raise MediaFilteredError("file_size_max", observed=total_bytes)
+
+    if failed:
+        missing_segments = [failed[sequence] for sequence in sorted(failed)]
+        print_debug(f"Missing segments: {missing_segments}")
+        raise M3U8Error(f"Stream segments failed to download: {missing_segments}")
+
+
+async def _stream_segments(
+    config: FanslyConfig,
+    playlist: M3U8,
+    output_path: Path,
+    cookies: dict[str, str],
+    max_bytes: int | None = None,
+    manifest: _SegmentManifest | None = None,
+) -> bool:
+    """Fetch segments and remux them straight from memory into the MP4.
+
+    Returns:
+        True if the streaming remux produced the output, False if the
+        remuxer failed (download errors propagate instead)
+    """
+    pipe = _SegmentPipe(max_segments=_PIPE_SEGMENTS)
+    remux = asyncio.create_task(
+        asyncio.to_thread(_remux_segment_stream, pipe, output_path)
+    )
+
+    async def feed(_index: int, data: bytes) -> None:
+        if not await asyncio.to_thread(pipe.write, data):
+            raise _StreamRemuxError("remuxer stopped reading")
 
     try:
-        print_debug(f"Downloading {len(segment_files)} segments")
+        await _fetch_segments_in_order(
+            config, playlist, cookies, feed, max_bytes=max_bytes, manifest=manifest
+        )
+    except _StreamRemuxError:
+        await remux
+        return False
+    except BaseException:
+        pipe.close()
+        await asyncio.gather(remux, return_exceptions=True)
+        await asyncio.to_thread(output_path.unlink, missing_ok=True)
+        raise
 
-        # Download segments with thread pool
-        max_workers = min(16, max(4, len(segment_files) // 4))
-        with (
-            progress,
-            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor,
-        ):
-            list(
-                progress.track(
-                    executor.map(download_ts, segment_uris, segment_files),
-                    total=len(segment_files),
-                    description=f"Downloading segments ({max_workers} threads)",
-                )
-            )
+    pipe.finish()
+    return await remux
 
-        if abort_event.is_set():
-            raise MediaFilteredError("file_size_max", observed=total_bytes)
 
-        # Check for missing segments
-        missing_segments = [f for f in segment_files if not f.exists()]
-        if missing_segments:
-            print_debug(f"Missing segments: {missing_segments}")
-            raise M3U8Error(f"Stream segments failed to download: {missing_segments}")
+async def _stage_segments(
+    config: FanslyConfig,
+    playlist: M3U8,
+    output_path: Path,
+    cookies: dict[str, str],
+    max_bytes: int | None = None,
+    manifest: _SegmentManifest | None = None,
+) -> None:
+    """Fetch segments to .ts files and mux them per segment.
 
-        print_debug("All segments downloaded, muxing to MP4")
+    Fallback for streams the streaming remuxer cannot handle: each segment
+    is written to disk and fed to ``_PyAVSegmentMuxer`` in order, with
+    ffmpeg concat over the staged files when PyAV fails. Segments already
+    in ``manifest`` are taken from its spool rather than re-fetched.
 
-        # Try PyAV muxing first, fall back to ffmpeg concat
-        if _mux_segments_with_pyav(segment_files, output_path):
-            print_info(
-                f"Segment download + PyAV mux succeeded "
-                f"({output_path.stat().st_size:,} bytes)"
-            )
-        elif _mux_segments_with_ffmpeg(segment_files, output_path):
-            print_info(
-                f"Segment download + FFmpeg concat succeeded "
-                f"({output_path.stat().st_size:,} bytes)"
+    Raises:
+        M3U8Error: If download or both muxers fail
+        MediaFilteredError: If the running segment total exceeds max_bytes
+    """
+    video_path = output_path.parent
+    segment_files = [
+        video_path / get_file_name_from_url(segment.absolute_uri)
+        for segment in playlist.segments
+    ]
+
+    muxer: _PyAVSegmentMuxer | None = None
+    try:
+        muxer = await asyncio.to_thread(_PyAVSegmentMuxer, output_path)
+    except Exception as e:
+        print_debug(f"PyAV segment muxing error: {e!s}")
+
+    async def stage(index: int, data: bytes) -> None:
+        nonlocal muxer
+        segment_path = segment_files[index]
+        await asyncio.to_thread(segment_path.write_bytes, data)
+        if muxer is None:
+            return
+        try:
+            await asyncio.to_thread(muxer.add, segment_path)
+        except Exception as e:
+            print_debug(f"PyAV segment muxing error: {e!s}")
+            muxer.close()
+            muxer = None
+
+    try:
+        try:
+            await _fetch_segments_in_order(
+                config, playlist, cookies, stage, max_bytes=max_bytes, manifest=manifest
             )
+        except BaseException:
+            await asyncio.to_thread(output_path.unlink, missing_ok=True)
+            raise
+
+        print_debug("All segments downloaded, muxing to MP4")
+
+        if muxer is not None and await asyncio.to_thread(muxer.finish):
+            method = "PyAV mux"
+        elif await asyncio.to_thread(
+            _mux_segments_with_ffmpeg, segment_files, output_path
+        ):
+            method = "FFmpeg concat"
         else:
             raise M3U8Error("Both PyAV and FFmpeg muxing failed for segments")
-
-        return output_path
+        size = (await asyncio.to_thread(output_path.stat)).st_size
+        print_info(f"Segment download + {method} succeeded ({size:,} bytes)")
 
     finally:
+        if muxer is not None:
+            muxer.close()
         for file in segment_files:
             file.unlink(missing_ok=True)
 
 
+async def _try_segment_download(
+    config: FanslyConfig,
+    m3u8_url: str,
+    output_path: Path,
+    cookies: dict[str, str],
+    max_bytes: int | None = None,
+    max_resolution: int | None = None,
+    resume_dir: Path | None = None,
+) -> Path:
+    """Download HLS video by fetching each segment and remuxing with PyAV.
+
+    Segments are fetched concurrently into memory and streamed in playlist
+    order through a single PyAV demux/mux session, so no .ts file touches
+    the disk. If the streaming remuxer fails, the segments are fetched
+    again to disk and muxed per segment (PyAV, then ffmpeg concat).
+
+    With ``resume_dir``, completed segments are also spooled there with a
+    ``_SegmentManifest``; a later call resumes after the last spooled
+    segment, and the staged fallback reads the spool instead of
+    re-fetching.
+
+    Args:
+        config: The downloader configuration
+        m3u8_url: URL of the master HLS manifest
+        output_path: Path to save the final video
+        cookies: CloudFront authentication cookies
+        max_bytes: Abort threshold for the running total of downloaded
+            segment bytes across all in-flight segments.
+        max_resolution: Shorter-edge pixel cap forwarded to variant selection.
+        resume_dir: Directory holding this media's resume state, if any.
+
+    Returns:
+        Path to the downloaded video file
+
+    Raises:
+        M3U8Error: If download or conversion fails
+        MediaFilteredError: If the running segment total exceeds max_bytes,
+            or variant selection finds no fitting resolution.
+    """
+    print_info("Using segment download path (downloading .ts files individually)...")
+    print_debug(f"Target output path: {output_path}")
+
+    playlist = await asyncio.to_thread(
+        fetch_m3u8_segment_playlist,
+        config,
+        m3u8_url,
+        cookies,
+        max_resolution=max_resolution,
+    )
+
+    manifest = None
+    if resume_dir is not None:
+        manifest = await asyncio.to_thread(_SegmentManifest.open, resume_dir, playlist)
+
+    if await _stream_segments(
+        config, playlist, output_path, cookies, max_bytes=max_bytes, manifest=manifest
+    ):
+        size = (await asyncio.to_thread(output_path.stat)).st_size
+        print_info(
+            f"Segment download + streaming PyAV remux succeeded ({size:,} bytes)"
+        )
+        return output_path
+
+    if manifest is None:
+        print_warning("Streaming remux failed — re-fetching segments to disk")
+    else:
+        print_warning("Streaming remux failed — staging spooled segments on disk")
+    await asyncio.to_thread(output_path.unlink, missing_ok=True)
+    await _stage_segments(
+        config, playlist, output_path, cookies, max_bytes=max_bytes, manifest=manifest
+    )
+    return output_path
+
+
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
 
 
-def download_m3u8(
+async def download_m3u8(
     config: FanslyConfig,
     m3u8_url: str,
     save_path: Path,
     created_at: float | None = None,
     max_bytes: int | None = None,
     max_resolution: int | None = None,
+    resume_dir: Path | None = None,
 ) -> Path:
     """Download M3U8 content as MP4 using three-tier strategy.
 
     Strategy:
     1. **PyAV direct** (fastest): In-process HLS demux/remux via libav
     2. **FFmpeg subprocess** (fallback): Let ffmpeg CLI handle the HLS stream
-    3. **Segment download** (robust fallback): Download .ts files individually,
-       then mux with PyAV (or ffmpeg concat as last resort)
+    3. **Segment download** (robust fallback): Fetch .ts files concurrently
+       on the async client and mux them in order with PyAV (or ffmpeg
+       concat as last resort)
+
+    Tiers 1 and 2 block, so they run on a worker thread; tier 3 runs on
+    the event loop.
+
+    When ``resume_dir`` holds the manifest of an interrupted tier-3 run,
+    tiers 1 and 2 are skipped and tier 3 continues from it. The resume
+    state is kept when the download fails and removed once it succeeds or
+    is filtered.
 
     Args:
         config: The downloader configuration.
@@ -803,6 +1364,8 @@ def download_m3u8(
             downstream completion check is its backstop.
         max_resolution: Shorter-edge pixel cap on the selected HLS variant,
             enforced by all three tiers at variant-selection time.
+        resume_dir: Per-media directory for tier-3 resume state, or None
+            to disable resuming.
 
     Returns:
         The file path of the MPEG-4 download.
@@ -815,47 +1378,61 @@ def download_m3u8(
     video_path = save_path.parent
     full_path = video_path / f"{save_path.stem}.mp4"
 
+    resuming = resume_dir is not None and await asyncio.to_thread(
+        _SegmentManifest.exists, resume_dir
+    )
+
     try:
-        # Tier 1: PyAV direct download (fastest — in-process)
-        if _try_direct_download_pyav(
+        result: Path | None = None
+
+        if resuming:
+            print_info("Resuming an interrupted segment download")
+
+        # Tier 1: PyAV direct download (fastest — in-process).
+        # Tier 2: FFmpeg subprocess (proven, handles edge cases). Cannot
+        # enforce max_bytes mid-stream — the completion check is its backstop.
+        elif await asyncio.to_thread(
+            _try_direct_download_pyav,
             config,
             m3u8_url,
             full_path,
             cookies,
             max_bytes=max_bytes,
             max_resolution=max_resolution,
-        ):
-            if created_at:
-                os.utime(full_path, (created_at, created_at))
-            return full_path
-
-        # Tier 2: FFmpeg subprocess (proven, handles edge cases). Cannot
-        # enforce max_bytes mid-stream — the completion check is its backstop.
-        if _try_direct_download_ffmpeg(
-            config, m3u8_url, full_path, cookies, max_resolution=max_resolution
-        ):
-            if created_at:
-                os.utime(full_path, (created_at, created_at))
-            return full_path
-
-        # Tier 3: Manual segment download + mux
-        result = _try_segment_download(
+        ) or await asyncio.to_thread(
+            _try_direct_download_ffmpeg,
             config,
             m3u8_url,
             full_path,
             cookies,
-            max_bytes=max_bytes,
             max_resolution=max_resolution,
-        )
+        ):
+            result = full_path
+
+        # Tier 3: Manual segment download + mux
+        if result is None:
+            result = await _try_segment_download(
+                config,
+                m3u8_url,
+                full_path,
+                cookies,
+                max_bytes=max_bytes,
+                max_resolution=max_resolution,
+                resume_dir=resume_dir,
+            )
         if created_at:
             os.utime(result, (created_at, created_at))
 
     except M3U8Error:
         raise
     except MediaFilteredError:
+        if resume_dir is not None:
+            await asyncio.to_thread(_SegmentManifest.discard, resume_dir)
         raise
     except Exception as e:
         print_error(f"Failed to download HLS video from {m3u8_url}: {e}")
         raise M3U8Error(f"Failed to download HLS video: {e}") from e
     else:
+        if resume_dir is not None:
+            await asyncio.to_thread(_SegmentManifest.discard, resume_dir)
         return result
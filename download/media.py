@@ -3,17 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import shutil
 import tempfile
 import traceback
 from asyncio import sleep as async_sleep
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import IO
 
-from rich.progress import BarColumn, Progress, TextColumn
-from rich.table import Column
+import httpx
+from pydantic import JsonValue
 
 from config import FanslyConfig
 from errors import (
@@ -24,7 +25,11 @@ from errors import (
     MediaFilteredError,
 )
 from fileio.dedupe import dedupe_media_file, get_filename_only
-from fileio.fnmanip import get_hash_for_image, get_hash_for_other_content
+from fileio.fnmanip import (
+    StreamingContentHasher,
+    get_hash_for_image,
+    get_hash_for_other_content,
+)
 from helpers.common import batch_list, expect_dict
 from helpers.rich_progress import get_progress_manager
 from helpers.timer import timing_jitter
@@ -33,6 +38,7 @@ from metadata import process_media_download
 from metadata.media import process_media_info
 from metadata.models import AccountMedia, AccountMediaBundle, Media, get_store
 from pathio import get_media_save_path, set_create_directory_for_download
+from pathio.livestream import _get_segments_base
 from textio import (
     input_enter_continue,
     print_debug,
@@ -42,7 +48,7 @@ from textio import (
 )
 
 from .downloadstate import DownloadState
-from .m3u8 import download_m3u8
+from .m3u8 import _SegmentManifest, download_m3u8
 from .mediafilters import (
     check_media_filters,
     estimate_stream_size_gate,
@@ -91,6 +97,65 @@ async def handle_filtered_skip(
     state.filtered_count += 1
 
 
+async def _fetch_account_media_batch(
+    config: FanslyConfig, ids: Sequence[int | str]
+) -> list[JsonValue]:
+    """Fetch one batch of accountMedia infos."""
+    api = config.get_api()
+    response = await api.get_account_media(",".join(str(mid) for mid in ids))
+    media_infos = api.get_json_response_contents(response)
+    if not isinstance(media_infos, list):
+        raise TypeError("Fansly API: expected an account-media array response")
+    return media_infos
+
+
+async def _select_media_variants(
+    config: FanslyConfig,
+    state: DownloadState,
+    media_infos: list[JsonValue],
+    post_id: str | None,
+) -> list[Media]:
+    """Select the download variant of each persisted accountMedia info."""
+    selected: list[Media] = []
+    for info in media_infos:
+        filters = resolve_media_filters(config, state)
+        max_px = filters.max_resolution_px if filters else None
+        try:
+            media_dict = expect_dict(info, "media info")
+            selected.append(
+                await parse_media_info(
+                    state,
+                    media_dict,
+                    post_id,
+                    interactive=config.interactive,
+                    max_px=max_px,
+                )
+            )
+        except MediaFilteredError as e:
+            skipped = (
+                get_store().get_from_cache(Media, e.media_id)
+                if e.media_id is not None
+                else None
+            )
+            if skipped is not None:
+                await handle_filtered_skip(config, state, skipped, e.reason)
+            else:
+                print_debug(
+                    f"Filtered [{e.reason}]: media_id {e.media_id} not "
+                    f"found in cache; skip could not be recorded."
+                )
+        except Exception:
+            print_error(
+                f"Unexpected error parsing "
+                f"{state.download_type_str()} content;"
+                f"\n{traceback.format_exc()}",
+                42,
+            )
+            await input_enter_continue(config.interactive)
+
+    return selected
+
+
 async def fetch_and_process_media(
     config: FanslyConfig,
     state: DownloadState,
@@ -99,73 +164,57 @@ async def fetch_and_process_media(
 ) -> list[Media]:
     """Fetch accountMedia from API, persist to DB, select download variants.
 
+    Batches are handled in order, but up to ``config.media_info_concurrency``
+    of them are requested ahead while earlier ones are persisted. Every
+    request still passes through the API rate limiter.
+
     Returns:
         List of Media objects with download fields populated, filtered to accessible.
     """
     if not media_ids:
         return []
 
-    api = config.get_api()
+    batches = list(batch_list(media_ids, config.BATCH_SIZE))
+    window = max(1, min(config.media_info_concurrency, len(batches)))
+    fetches: list[asyncio.Task[list[JsonValue]]] = []
     all_media: list[Media] = []
     progress = get_progress_manager()
 
+    def start_fetch(index: int) -> None:
+        fetches.append(
+            asyncio.create_task(
+                _fetch_account_media_batch(config, batches[index]),
+                name=f"account-media-{index}",
+            )
+        )
+
     with progress.session():
         fetch_task = progress.add_task(
-            name="fetch_media",
+            name=state.progress_task_name("fetch_media"),
             description="Fetching media info",
             total=len(media_ids),
             show_elapsed=True,
         )
 
-        for ids in batch_list(media_ids, config.BATCH_SIZE):
-            media_ids_str = ",".join(str(mid) for mid in ids)
-
-            response = await api.get_account_media(media_ids_str)
-            media_infos = api.get_json_response_contents(response)
-            if not isinstance(media_infos, list):
-                raise TypeError("Fansly API: expected an account-media array response")
-
-            # Persist Media + AccountMedia via Pydantic pipeline
-            await process_media_info(config, {"batch": media_infos})
-
-            # Select best variant for each item
-            for info in media_infos:
-                filters = resolve_media_filters(config, state)
-                max_px = filters.max_resolution_px if filters else None
-                try:
-                    media_dict = expect_dict(info, "media info")
-                    all_media.append(
-                        await parse_media_info(
-                            state,
-                            media_dict,
-                            post_id,
-                            interactive=config.interactive,
-                            max_px=max_px,
-                        )
-                    )
-                except MediaFilteredError as e:
-                    skipped = (
-                        get_store().get_from_cache(Media, e.media_id)
-                        if e.media_id is not None
-                        else None
-                    )
-                    if skipped is not None:
-                        await handle_filtered_skip(config, state, skipped, e.reason)
-                    else:
-                        print_debug(
-                            f"Filtered [{e.reason}]: media_id {e.media_id} not "
-                            f"found in cache; skip could not be recorded."
-                        )
-                except Exception:
-                    print_error(
-                        f"Unexpected error parsing "
-                        f"{state.download_type_str()} content;"
-                        f"\n{traceback.format_exc()}",
-                        42,
-                    )
-                    await input_enter_continue(config.interactive)
-
-            progress.update_task(fetch_task, advance=len(ids))
+        try:
+            for index in range(window):
+                start_fetch(index)
+            for index, ids in enumerate(batches):
+                media_infos = await fetches[index]
+                if len(fetches) < len(batches):
+                    start_fetch(len(fetches))
+
+                # Persist Media + AccountMedia via Pydantic pipeline
+                await process_media_info(config, {"batch": media_infos})
+
+                all_media.extend(
+                    await _select_media_variants(config, state, media_infos, post_id)
+                )
+                progress.update_task(fetch_task, advance=len(ids))
+        finally:
+            for task in fetches:
+                task.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
 
     return [
         m
@@ -251,11 +300,17 @@ def _validate_media(media: Media) -> None:
         raise MediaError("Download URL for media item not defined. Aborting.")
 
 
+def _file_id(media: Media) -> int:
+    """Id of the file a media item actually downloads (preview or variant)."""
+    file_id = (media.preview_id if media.is_preview else media.download_id) or media.id
+    if file_id is None:
+        raise MediaError("Media item has no id to download under. Aborting.")
+    return file_id
+
+
 def _update_media_type_stats(state: DownloadState, media: Media) -> None:
     """Update in-memory media type statistics."""
-    media_id = str(
-        media.preview_id if media.is_preview else (media.download_id or media.id)
-    )
+    media_id = str(_file_id(media))
 
     mimetype = media.mimetype or ""
     if "image" in mimetype:
@@ -395,73 +450,429 @@ async def _download_file(
             await response.aclose()
 
 
+# Pieces a segmented download hands out to its workers; a piece that fails
+# is retried from its start, so this bounds the bytes lost to one failure.
+_RANGE_PIECE_SIZE = 16 * 1_048_576
+_RANGE_ATTEMPTS = 3
+_RANGE_RETRY_DELAY = 1.0
+
+
+def _partial_download_paths(media: Media, file_save_path: Path) -> tuple[Path, Path]:
+    """Partial-file and validator paths for a resumable regular download.
+
+    Keyed by the media (variant/preview) id instead of a random temp name,
+    so a retry in this run or a later one finds the bytes already fetched.
+    Neither name has a known mimetype, so dedupe scans ignore them.
+    """
+    stem = f".{_file_id(media)}{file_save_path.suffix}"
+    parent = file_save_path.parent
+    return parent / f"{stem}.part", parent / f"{stem}.part.meta"
+
+
+def _discard_partial_download(part_path: Path, meta_path: Path) -> None:
+    part_path.unlink(missing_ok=True)
+    meta_path.unlink(missing_ok=True)
+
+
+def _load_partial_download(part_path: Path, meta_path: Path) -> tuple[int, dict]:
+    """Return ``(bytes on disk, validators)`` of a resumable partial download.
+
+    Anything unusable (missing or corrupt validators, a part file that is
+    empty or not shorter than the recorded size) is discarded and reported
+    as ``(0, {})`` so the caller starts over.
+    """
+    try:
+        meta = json.loads(meta_path.read_text())
+        offset = part_path.stat().st_size
+    except (OSError, ValueError):
+        _discard_partial_download(part_path, meta_path)
+        return 0, {}
+    size = meta.get("size") if isinstance(meta, dict) else None
+    if not isinstance(size, int) or not 0 < offset < size:
+        _discard_partial_download(part_path, meta_path)
+        return 0, {}
+    return offset, meta
+
+
+def _range_matches(
+    response: httpx.Response, offset: int, meta: dict, end: int | None = None
+) -> bool:
+    """Whether a 206 continues exactly the representation we started.
+
+    ``end`` is the last byte asked for, when the request was bounded.
+    """
+    etag = meta.get("etag")
+    if etag and response.headers.get("etag") not in (None, etag):
+        return False
+    content_range = response.headers.get("content-range", "")
+    unit, _, spec = content_range.partition(" ")
+    span, _, total = spec.partition("/")
+    start, _, last = span.partition("-")
+    return (
+        unit == "bytes"
+        and start.isdigit()
+        and int(start) == offset
+        and (end is None or (last.isdigit() and int(last) == end))
+        and total.isdigit()
+        and int(total) == meta["size"]
+    )
+
+
+# Byte counts, Range offsets and Content-Length must all describe the file
+# itself, so download streams never accept a content coding (gzip, ...).
+_IDENTITY_ENCODING = {"Accept-Encoding": "identity"}
+
+
+async def _open_download_stream(
+    config: FanslyConfig,
+    download_url: str,
+    part_path: Path,
+    meta_path: Path,
+) -> tuple[httpx.Response, int, dict]:
+    """Open the CDN stream, continuing a partial download when possible.
+
+    Returns the streaming response, the offset it starts at and the
+    recorded validators: the part file's length and its ETag and size for a
+    validated 206, otherwise 0 and ``{}``. A 416, or a 206 for a different
+    representation (changed ETag or total size), is dropped and the file is
+    requested again from the start; a 200 to the range request means the
+    server sent the whole file anyway and is used as-is.
+    """
+    api = config.get_api()
+    offset, meta = await asyncio.to_thread(_load_partial_download, part_path, meta_path)
+    if offset:
+        range_headers = {**_IDENTITY_ENCODING, "Range": f"bytes={offset}-"}
+        if meta.get("etag"):
+            range_headers["If-Range"] = meta["etag"]
+        response = await api.get_with_ngsw(
+            url=download_url,
+            stream=True,
+            add_fansly_headers=False,
+            extra_headers=range_headers,
+        )
+        if response.status_code == 206 and _range_matches(response, offset, meta):
+            return response, offset, meta
+        if response.status_code not in (206, 416):
+            return response, 0, {}
+        await response.aclose()
+        print_debug(f"Partial download of {part_path.name} is stale, restarting")
+
+    response = await api.get_with_ngsw(
+        url=download_url,
+        stream=True,
+        add_fansly_headers=False,
+        extra_headers=_IDENTITY_ENCODING,
+    )
+    return response, 0, {}
+
+
+async def _download_ranges(
+    config: FanslyConfig,
+    download_url: str,
+    part_path: Path,
+    meta_path: Path,
+    offset: int,
+    validators: dict,
+    advance: Callable[[int], None],
+) -> None:
+    """Fetch ``[offset, size)`` of a regular file as concurrent byte ranges.
+
+    The part file is grown to its final size up front. Up to
+    ``config.segmented_download_connections`` workers then take
+    ``_RANGE_PIECE_SIZE`` pieces in order, so a fast connection ends up
+    fetching more of the file than a slow one, and write each piece at its
+    own offset through a private file handle. Every 206 must match the
+    recorded ETag and total size and deliver exactly the piece asked for.
+    A piece that fails with a network error, 429 or 5xx is retried.
+
+    If the download fails, the part file is cut back to the pieces that are
+    complete from its start, which keeps it valid for a single-stream
+    resume; if the file changed on the server, it is discarded.
+
+    Raises:
+        DownloadError: If a piece failed or the file changed on the server
+    """
+    size = validators["size"]
+    etag = validators.get("etag")
+    starts = list(range(offset, size, _RANGE_PIECE_SIZE))
+    workers = max(1, min(config.segmented_download_connections, len(starts)))
+
+    api = config.get_api()
+    done: set[int] = set()
+    failed: dict[int, str] = {}
+    changed = False
+    next_piece = 0
+
+    def preallocate() -> None:
+        with part_path.open("r+b" if offset else "wb") as part_file:
+            part_file.truncate(size)
+
+    def keep_complete_prefix() -> None:
+        if changed:
+            _discard_partial_download(part_path, meta_path)
+            return
+        prefix = offset
+        while prefix in done:
+            prefix = min(prefix + _RANGE_PIECE_SIZE, size)
+        with part_path.open("r+b") as part_file:
+            part_file.truncate(prefix)
+
+    async def fetch_piece(start: int, part_file: IO[bytes]) -> bool:
+        """Fetch one piece into place, retrying transient failures."""
+        nonlocal changed
+        length = min(_RANGE_PIECE_SIZE, size - start)
+        end = start + length - 1
+        range_headers = {**_IDENTITY_ENCODING, "Range": f"bytes={start}-{end}"}
+        if etag:
+            range_headers["If-Range"] = etag
+
+        for attempt in range(1, _RANGE_ATTEMPTS + 1):
+            retryable = True
+            received = 0
+            written = 0
+            response = None
+            try:
+                response = await api.get_with_ngsw(
+                    url=download_url,
+                    stream=True,
+                    add_fansly_headers=False,
+                    extra_headers=range_headers,
+                )
+                if response.status_code == 206 and _range_matches(
+                    response, start, validators, end
+                ):
+                    part_file.seek(start)
+                    async for chunk in response.aiter_bytes(chunk_size=1_048_576):
+                        received += len(chunk)
+                        if received <= length:
+                            part_file.write(chunk)
+                            written += len(chunk)
+                            advance(len(chunk))
+                    if received == length:
+                        return True
+                    reason = f"got {received} of {length} bytes"
+                elif response.status_code in (200, 206, 416):
+                    changed = True
+                    retryable = False
+                    reason = "file changed on the server"
+                else:
+                    retryable = (
+                        response.status_code == 429 or response.status_code >= 500
+                    )
+                    reason = f"status {response.status_code}"
+            except httpx.HTTPError as e:
+                reason = str(e) or type(e).__name__
+            finally:
+                if response is not None:
+                    await response.aclose()
+
+            # The piece is fetched again from its start
+            advance(-written)
+            if not retryable or attempt == _RANGE_ATTEMPTS or failed:
+                print_debug(
+                    f"Range {start}-{end} of {part_path.name} failed ({reason})"
+                )
+                failed[start] = reason
+                return False
+            print_debug(
+                f"Range {start}-{end} attempt {attempt} failed ({reason}) — retrying"
+            )
+            await asyncio.sleep(_RANGE_RETRY_DELAY * attempt)
+
+        return False
+
+    async def worker() -> None:
+        """Pull the next unfetched piece until done or aborted."""
+        nonlocal next_piece
+        # A handle per worker, so one worker's seek never moves another's
+        part_file = await asyncio.to_thread(part_path.open, "r+b")
+        try:
+            while next_piece < len(starts) and not failed:
+                start = starts[next_piece]
+                next_piece += 1
+                try:
+                    if await fetch_piece(start, part_file):
+                        done.add(start)
+                except BaseException:
+                    failed[start] = "aborted"
+                    raise
+        finally:
+            await asyncio.to_thread(part_file.close)
+
+    await asyncio.to_thread(preallocate)
+    completed = False
+    try:
+        results = await asyncio.gather(
+            *(worker() for _ in range(workers)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        if failed:
+            details = ", ".join(
+                f"bytes {start}- ({reason})" for start, reason in sorted(failed.items())
+            )
+            raise DownloadError(
+                f"Segmented download of {part_path.name} failed: {details}"
+            )
+        completed = True
+    finally:
+        if not completed:
+            await asyncio.to_thread(keep_complete_prefix)
+
+
 async def _download_regular_file(
     config: FanslyConfig,
     state: DownloadState,
     media: Media,
     file_save_path: Path,
-) -> None:
-    """Download a regular media file with progress bar."""
+) -> str | None:
+    """Download a regular media file with progress bar.
+
+    The body is streamed into a sibling ``.part`` file keyed by media id,
+    with the ETag and total size recorded next to it. If the transfer
+    breaks, the part file is kept and the next attempt asks for the rest
+    with an HTTP ``Range`` request, validated against those values.
+
+    The chunks written to disk also feed a `StreamingContentHasher`, so the
+    dedupe content hash is known when the stream ends.
+
+    Returns:
+        The content hash of the downloaded file, or None when it could not
+        be computed from the stream (including resumed transfers) and must
+        be taken from the file.
+    """
     download_url = media.download_url
     if download_url is None:
         raise DownloadError(
             f"Cannot download {media.get_file_name()}: no download URL resolved."
         )
+    part_path, meta_path = _partial_download_paths(media, file_save_path)
     response = None
+    content_hash: str | None = None
     try:
-        response = await config.get_api().get_with_ngsw(
-            url=download_url,
-            stream=True,
-            add_fansly_headers=False,
+        response, offset, validators = await _open_download_stream(
+            config, download_url, part_path, meta_path
         )
-        if response.status_code == 200:
-            text_column = TextColumn("", table_column=Column(ratio=1))
-            bar_column = BarColumn(bar_width=60, table_column=Column(ratio=5))
-            file_size = int(response.headers.get("content-length", 0))
+        if response.status_code == (206 if offset else 200):
+            if offset:
+                file_size = validators["size"]
+            else:
+                file_size = int(response.headers.get("content-length", 0))
 
             filters = resolve_media_filters(config, state)
             if filters is not None and file_size > 0:
                 reason = filters.size_verdict(file_size)
                 if reason:
+                    await asyncio.to_thread(
+                        _discard_partial_download, part_path, meta_path
+                    )
                     raise MediaFilteredError(reason, observed=file_size)
 
-            disable_loading_bar = file_size < 20_000_000
-
-            # Stream into a sibling temp file so a mid-stream crash doesn't
-            # leave a partial file at file_save_path that dedupe later trusts.
-            tmp_kwargs: dict = {
-                "dir": str(file_save_path.parent),
-                "prefix": f".{file_save_path.name}.",
-                "suffix": ".part",
-                "delete": False,
-            }
-            tmp_path: Path | None = None
+            # Only large files get their own byte-level bar; with several
+            # items in flight, per-file bars for small images are just noise.
+            show_transfer = file_size >= 20_000_000
+            progress = get_progress_manager()
+            transfer_task = state.progress_task_name(f"transfer_{_file_id(media)}")
+
+            # Without a known size a partial file can't be validated later,
+            # so such transfers are not resumable.
+            resumable = file_size > 0
+            if not offset:
+                if resumable:
+                    validators = {
+                        "etag": response.headers.get("etag"),
+                        "size": file_size,
+                    }
+                    await asyncio.to_thread(
+                        meta_path.write_text, json.dumps(validators)
+                    )
+                else:
+                    await asyncio.to_thread(meta_path.unlink, missing_ok=True)
+
+            # Large files from a server that honors Range are fetched as
+            # concurrent byte ranges instead of this single stream.
+            segmented = (
+                resumable
+                and config.segmented_download_connections > 1
+                and file_size - offset >= config.segmented_download_min_mb * 1_048_576
+                and (offset > 0 or response.headers.get("accept-ranges") == "bytes")
+            )
+
+            # Bytes already on disk (resumed) or arriving out of order
+            # (segmented) can't go through the streaming hasher, so those
+            # transfers leave hashing to dedupe.
+            hasher = (
+                None
+                if offset or segmented
+                else StreamingContentHasher(media.mimetype or "")
+            )
+            written = offset
+
+            def advance(size: int) -> None:
+                if show_transfer:
+                    progress.update_task(transfer_task, advance=size)
+
+            completed = False
             try:
-                with Progress(
-                    text_column,
-                    bar_column,
-                    expand=True,
-                    transient=True,
-                    disable=disable_loading_bar,
-                ) as progress:
-                    task_id = progress.add_task("", total=file_size)
-
-                    with tempfile.NamedTemporaryFile(**tmp_kwargs) as temp_file:
-                        tmp_path = Path(temp_file.name)
-                        async for chunk in response.aiter_bytes(chunk_size=1_048_576):
-                            if chunk:
-                                temp_file.write(chunk)
-                                progress.advance(task_id, len(chunk))
-
-                shutil.move(str(tmp_path), str(file_save_path))
-                tmp_path = None  # ownership transferred
+                with progress.session():
+                    if show_transfer:
+                        progress.add_task(
+                            name=transfer_task,
+                            description=file_save_path.name,
+                            total=file_size,
+                            group="transfer",
+                        )
+                        advance(offset)
+
+                    if segmented:
+                        await response.aclose()
+                        await _download_ranges(
+                            config,
+                            download_url,
+                            part_path,
+                            meta_path,
+                            offset,
+                            validators,
+                            advance,
+                        )
+                        written = file_size
+                    else:
+                        # Stream into the part file so a mid-stream crash
+                        # doesn't leave a partial file at file_save_path
+                        # that dedupe later trusts.
+                        with part_path.open("ab" if offset else "wb") as part_file:
+                            async for chunk in response.aiter_bytes(
+                                chunk_size=1_048_576
+                            ):
+                                if chunk:
+                                    part_file.write(chunk)
+                                    written += len(chunk)
+                                    if hasher is not None:
+                                        hasher.update(chunk)
+                                    advance(len(chunk))
+
+                if resumable and written != file_size:
+                    raise DownloadError(
+                        f"Download of {media.get_file_name()} is corrupt: "
+                        f"expected {file_size} bytes, got {written}."
+                    )
+                shutil.move(str(part_path), str(file_save_path))
+                completed = True
             finally:
-                if tmp_path is not None and tmp_path.exists():
-                    tmp_path.unlink(missing_ok=True)
+                # A short part is kept for the next attempt to resume; a
+                # finished, oversized or unvalidatable one is of no further use.
+                if completed or not resumable or written >= file_size:
+                    await asyncio.to_thread(
+                        _discard_partial_download, part_path, meta_path
+                    )
 
             ts = media.created_at_timestamp
             if ts:
                 os.utime(file_save_path, (ts, ts))
+
+            if hasher is not None:
+                content_hash = await asyncio.to_thread(hasher.result)
         else:
             body = await response.aread()
             raise DownloadError(
@@ -473,6 +884,44 @@ async def _download_regular_file(
         if response is not None:
             await response.aclose()
 
+    return content_hash
+
+
+def _hls_resume_dir(
+    config: FanslyConfig, state: DownloadState, media: Media
+) -> Path | None:
+    """Per-media directory for resumable HLS segment state, if enabled.
+
+    Lives next to the livestream segment dirs and is keyed by creator and
+    file id, so a retry on a later run finds the same state. Creators run
+    concurrently and may share a media item, so each gets its own dir;
+    within one creator the per-file download lock serializes access.
+    """
+    if not config.m3u8_resume:
+        return None
+    try:
+        segments_base = _get_segments_base(config)
+    except RuntimeError:
+        return None
+    return segments_base / (
+        f"{state.creator_id}_{_file_id(media)}{_SegmentManifest.DIR_SUFFIX}"
+    )
+
+
+async def prune_hls_resume_dirs(config: FanslyConfig) -> None:
+    """Delete HLS resume dirs left by downloads that never completed.
+
+    Runs at startup whether or not ``m3u8_resume`` is on, so state from
+    an earlier run with it enabled still expires.
+    """
+    try:
+        segments_base = _get_segments_base(config)
+    except RuntimeError:
+        return
+    removed = await asyncio.to_thread(_SegmentManifest.prune, segments_base)
+    if removed:
+        print_debug(f"Removed {len(removed)} stale HLS resume dir(s)")
+
 
 async def _download_m3u8_file(
     config: FanslyConfig,
@@ -500,16 +949,15 @@ async def _download_m3u8_file(
         filters = resolve_media_filters(config, state)
         max_px = filters.max_resolution_px if filters else None
 
-        # Run synchronous HLS download in thread to avoid blocking
-        # the event loop (progress bars, rate limiter would freeze otherwise)
-        temp_path = await asyncio.to_thread(
-            download_m3u8,
+        # download_m3u8 moves its blocking tiers onto worker threads itself
+        temp_path = await download_m3u8(
             config,
             download_url,
             temp_path,
             media.created_at_timestamp,
             max_bytes=filters.file_size_max if filters else None,
             max_resolution=max_px,
+            resume_dir=_hls_resume_dir(config, state, media),
         )
 
         filters = resolve_media_filters(config, state)
@@ -558,12 +1006,149 @@ async def _download_m3u8_file(
             await asyncio.to_thread(shutil.rmtree, temp_dir)
 
 
+async def _download_media_item(  # noqa: PLR0911  # one early exit per skip reason
+    config: FanslyConfig,
+    state: DownloadState,
+    media: Media,
+) -> None:
+    """Run the full skip/dedupe/download pipeline for a single media item."""
+    threshold = state.effective_duplicate_threshold(config.DUPLICATE_THRESHOLD)
+    if (
+        config.use_duplicate_threshold
+        and state.duplicate_count > threshold
+        and threshold >= 50
+    ):
+        raise DuplicateCountError(state.duplicate_count)
+
+    if media.is_preview and not config.download_media_previews:
+        return
+
+    filter_reason = check_media_filters(config, state, media)
+    if filter_reason:
+        await record_filter_observation(media, reason=filter_reason)
+        _print_filtered_skip(config, media, filter_reason)
+        state.filtered_count += 1
+        return
+
+    try:
+        _validate_media(media)
+    except MediaError as e:
+        print_warning(f"Skipping download: {e}")
+        return
+
+    # Persist media to DB — returns None if already downloaded
+    try:
+        result = await process_media_download(config, state, media)
+        if result is None:
+            if config.show_downloads and config.show_skipped_downloads:
+                print_info(
+                    f"Deduplication [Database]: {_media_type_label(media.mimetype)} '{media.get_file_name()}' → skipped (already downloaded)"
+                )
+            state.add_duplicate()
+            return
+    except Exception as e:
+        print_warning(f"Skipping download: {e}")
+        return
+
+    _update_media_type_stats(state, media)
+
+    try:
+        file_save_dir, file_save_path = get_media_save_path(config, state, media)
+        filename = media.get_file_name()
+
+        if media.file_extension == "m3u8":
+            file_save_path = file_save_path.parent / f"{file_save_path.stem}.mp4"
+            filename = f"{Path(filename).stem}.mp4"
+    except ValueError as e:
+        print_warning(f"Skipping download: {e}")
+        return
+
+    # exist_ok: a concurrent worker may create the same directory first
+    await asyncio.to_thread(file_save_dir.mkdir, parents=True, exist_ok=True)
+
+    check_path = file_save_path
+    media.local_path = str(check_path)
+
+    if await asyncio.to_thread(check_path.exists):
+        if await _verify_existing_file(config, state, media, check_path):
+            return
+
+        if media.file_extension != "m3u8" and await _verify_temp_download(
+            config, state, media, check_path
+        ):
+            return
+
+    if config.show_downloads:
+        print_info(f"Downloading {_media_type_label(media.mimetype)} '{filename}'")
+
+    try:
+        if media.file_extension == "m3u8":
+            is_dupe = await _download_m3u8_file(
+                config=config,
+                state=state,
+                media=media,
+                check_path=file_save_path,
+            )
+            if is_dupe:
+                return
+            # _download_m3u8_file already increments vid_count
+        else:
+            content_hash = await _download_regular_file(
+                config, state, media, file_save_path
+            )
+
+            if not await asyncio.to_thread(file_save_path.exists):
+                print_warning(f"File not found at expected path: {file_save_path}")
+                return
+
+            media_mime = media.mimetype or ""
+            is_dupe = await dedupe_media_file(
+                config,
+                state,
+                media_mime,
+                file_save_path,
+                media,
+                content_hash=content_hash,
+            )
+
+            state.pic_count += 1 if "image" in media_mime else 0
+            state.vid_count += 1 if "video" in media_mime else 0
+
+            if is_dupe:
+                state.add_duplicate()
+
+    except MediaFilteredError as e:
+        await handle_filtered_skip(
+            config,
+            state,
+            media,
+            e.reason,
+            observed=e.observed,
+            estimated=e.estimated,
+        )
+        return
+    except M3U8Error as ex:
+        print_warning(f"Skipping invalid item: {ex}")
+
+    await async_sleep(timing_jitter(0.4, 0.75))
+
+
 async def download_media(
     config: FanslyConfig,
     state: DownloadState,
     accessible_media: list[Media],
 ) -> None:
-    """Downloads all media items to their respective target folders."""
+    """Downloads all media items to their respective target folders.
+
+    Items are processed by up to ``config.max_concurrent_downloads`` workers,
+    each holding a slot of the run-wide ``config.get_download_slots()``
+    semaphore while an item is in flight. Every request still goes through
+    the API rate limiter, so concurrency only overlaps transfer time.
+
+    The first exception raised for any item (e.g. ``DuplicateCountError``)
+    stops workers from picking up new items; in-flight items are allowed to
+    finish and the original exception is then re-raised unchanged.
+    """
     if state.download_type == DownloadType.NOTSET:
         raise RuntimeError(
             "Internal error during media download - download type not set on state."
@@ -576,137 +1161,41 @@ async def download_media(
 
     progress = get_progress_manager()
     dl_type = state.download_type_str()
+    global_slots = config.get_download_slots()
+    worker_count = max(1, min(config.max_concurrent_downloads, len(accessible_media)))
+
+    # The same file can appear twice in one batch (bundle + standalone, or a
+    # preview shared by several posts); its items must run back-to-back so
+    # the second sees the first's DB state and partial-download files.
+    media_locks: dict[int, asyncio.Lock] = {}
+    pending = iter(accessible_media)
+    failure: list[BaseException] = []
 
     with progress.session():
         dl_task = progress.add_task(
-            name="download_media",
+            name=state.progress_task_name("download_media"),
             description=f"Downloading {dl_type} media",
             total=len(accessible_media),
             show_elapsed=False,
         )
 
-        for media in accessible_media:
-            try:
-                if (
-                    config.use_duplicate_threshold
-                    and state.duplicate_count > config.DUPLICATE_THRESHOLD
-                    and config.DUPLICATE_THRESHOLD >= 50
-                ):
-                    raise DuplicateCountError(state.duplicate_count)
-
-                if media.is_preview and not config.download_media_previews:
-                    continue
-
-                filter_reason = check_media_filters(config, state, media)
-                if filter_reason:
-                    await record_filter_observation(media, reason=filter_reason)
-                    _print_filtered_skip(config, media, filter_reason)
-                    state.filtered_count += 1
-                    continue
-
+        async def worker() -> None:
+            for media in pending:
+                if failure:
+                    return
                 try:
-                    _validate_media(media)
-                except MediaError as e:
-                    print_warning(f"Skipping download: {e}")
-                    continue
-
-                # Persist media to DB — returns None if already downloaded
-                try:
-                    result = await process_media_download(config, state, media)
-                    if result is None:
-                        if config.show_downloads and config.show_skipped_downloads:
-                            print_info(
-                                f"Deduplication [Database]: {_media_type_label(media.mimetype)} '{media.get_file_name()}' → skipped (already downloaded)"
-                            )
-                        state.add_duplicate()
-                        continue
+                    lock = media_locks.setdefault(_file_id(media), asyncio.Lock())
+                    async with lock, global_slots:
+                        if failure:
+                            return
+                        await _download_media_item(config, state, media)
                 except Exception as e:
-                    print_warning(f"Skipping download: {e}")
-                    continue
-
-                _update_media_type_stats(state, media)
-
-                try:
-                    file_save_dir, file_save_path = get_media_save_path(
-                        config, state, media
-                    )
-                    filename = media.get_file_name()
-
-                    if media.file_extension == "m3u8":
-                        file_save_path = (
-                            file_save_path.parent / f"{file_save_path.stem}.mp4"
-                        )
-                        filename = f"{Path(filename).stem}.mp4"
-                except ValueError as e:
-                    print_warning(f"Skipping download: {e}")
-                    continue
-
-                if not await asyncio.to_thread(file_save_dir.exists):
-                    await asyncio.to_thread(file_save_dir.mkdir, parents=True)
-
-                check_path = file_save_path
-                media.local_path = str(check_path)
-
-                if await asyncio.to_thread(check_path.exists):
-                    if await _verify_existing_file(config, state, media, check_path):
-                        continue
-
-                    if media.file_extension != "m3u8" and await _verify_temp_download(
-                        config, state, media, check_path
-                    ):
-                        continue
-
-                if config.show_downloads:
-                    print_info(
-                        f"Downloading {_media_type_label(media.mimetype)} '{filename}'"
-                    )
+                    failure.append(e)
+                    return
+                finally:
+                    progress.update_task(dl_task, advance=1)
 
-                try:
-                    if media.file_extension == "m3u8":
-                        is_dupe = await _download_m3u8_file(
-                            config=config,
-                            state=state,
-                            media=media,
-                            check_path=file_save_path,
-                        )
-                        if is_dupe:
-                            continue
-                        # _download_m3u8_file already increments vid_count
-                    else:
-                        await _download_regular_file(
-                            config, state, media, file_save_path
-                        )
-
-                        if not await asyncio.to_thread(file_save_path.exists):
-                            print_warning(
-                                f"File not found at expected path: {file_save_path}"
-                            )
-                            continue
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
 
-                        media_mime = media.mimetype or ""
-                        is_dupe = await dedupe_media_file(
-                            config, state, media_mime, file_save_path, media
-                        )
-
-                        state.pic_count += 1 if "image" in media_mime else 0
-                        state.vid_count += 1 if "video" in media_mime else 0
-
-                        if is_dupe:
-                            state.add_duplicate()
-
-                except MediaFilteredError as e:
-                    await handle_filtered_skip(
-                        config,
-                        state,
-                        media,
-                        e.reason,
-                        observed=e.observed,
-                        estimated=e.estimated,
-                    )
-                    continue
-                except M3U8Error as ex:
-                    print_warning(f"Skipping invalid item: {ex}")
-
-                await async_sleep(timing_jitter(0.4, 0.75))
-            finally:
-                progress.update_task(dl_task, advance=1)
+    if failure:
+        raise failure[0]
@@ -2,6 +2,8 @@
 
 from asyncio import sleep
 
+from httpx import Response
+
 from config import FanslyConfig
 from errors import DuplicatePageError
 from helpers.common import expect_dict, expect_list
@@ -17,8 +19,10 @@ from textio import (
 )
 
 from .common import (
+    PagePrefetcher,
     check_page_duplicates,
     get_unique_media_ids,
+    last_item_id,
     process_download_accessible_media,
 )
 from .downloadstate import DownloadState
@@ -150,6 +154,22 @@ async def download_messages_for_group(
     await _download_group_message_loop(config, state, group_id_str)
 
 
+def _messages_params(group_id: str, cursor: str) -> dict[str, str]:
+    params = {"groupId": group_id, "limit": "25", "ngsw-bypass": "true"}
+    if cursor != "0":
+        params["before"] = cursor
+    return params
+
+
+async def _fetch_messages_page(
+    config: FanslyConfig, group_id: str, cursor: str
+) -> Response:
+    """Request a page of messages after the usual pause between pages."""
+    # Fansly rate-limiting fix
+    await sleep(timing_jitter(2, 4))
+    return await config.get_api().get_message(_messages_params(group_id, cursor))
+
+
 async def _download_group_message_loop(
     config: FanslyConfig,
     state: DownloadState,
@@ -158,18 +178,31 @@ async def _download_group_message_loop(
     """Paginate through a DM group's messages and download attachments.
 
     Shared by :func:`download_messages` (batch path) and
-    :func:`download_messages_for_group` (daemon path).
+    :func:`download_messages_for_group` (daemon path). The next page is
+    requested while the current page's attachments download.
     """
+    with PagePrefetcher() as next_page:
+        await _download_group_message_pages(config, state, group_id, next_page)
+
+
+async def _download_group_message_pages(
+    config: FanslyConfig,
+    state: DownloadState,
+    group_id: str,
+    next_page: PagePrefetcher,
+) -> None:
     msg_cursor: str = "0"
 
     while True:
         starting_duplicates = state.duplicate_count
 
-        params = {"groupId": group_id, "limit": "25", "ngsw-bypass": "true"}
-        if msg_cursor != "0":
-            params["before"] = msg_cursor
-
-        messages_response = await config.get_api().get_message(params)
+        prefetched = next_page.take(msg_cursor)
+        if prefetched is not None:
+            messages_response = await prefetched
+        else:
+            messages_response = await config.get_api().get_message(
+                _messages_params(group_id, msg_cursor)
+            )
 
         if messages_response.status_code != 200:
             print_error(
@@ -201,6 +234,13 @@ async def _download_group_message_loop(
 
         await process_messages_metadata(config, state, messages)
 
+        # Request the next page while this one's attachments download
+        next_cursor = last_item_id(messages, "messages")
+        if next_cursor is not None:
+            next_page.start(
+                next_cursor, _fetch_messages_page(config, group_id, next_cursor)
+            )
+
         all_media_ids = get_unique_media_ids(messages)
         accessible = await fetch_and_process_media(config, state, all_media_ids)
         await process_download_accessible_media(config, state, accessible)
@@ -219,8 +259,7 @@ async def _download_group_message_loop(
 
         # Advance cursor for next page
         try:
-            # Fansly rate-limiting fix
-            await sleep(timing_jitter(2, 4))
+            # The pause before the next page is part of its prefetch
             msgs = expect_list(messages["messages"], "messages")
             msg_cursor = str(expect_dict(msgs[-1], "message")["id"])
         except IndexError:
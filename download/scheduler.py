@@ -0,0 +1,128 @@
+"""Creator-level scheduling for the batch run.
+
+``main()`` hands the creator list to this module when
+``options.max_concurrent_creators`` is above 1. Creators are ordered by the
+work they are expected to need (longest first, so the run's tail isn't one
+large creator started last) and then processed by a bounded pool of
+workers. Every worker shares the process-wide ``RateLimiter`` (via
+``config.get_api()``) and entity store (via ``get_store()``); each creator
+gets its own ``DownloadState`` from the caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from metadata.models import Account, MonitorState, TimelineStats, get_store
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+
+# A creator last checked this long ago (or never) is expected to need a full
+# timeline walk; more recently checked creators scale down linearly.
+FULL_RESCAN_AGE = timedelta(days=30)
+
+
+async def estimate_creator_work(
+    creator_name: str, now: datetime | None = None
+) -> float:
+    """Estimate how many media items a run for ``creator_name`` will touch.
+
+    Uses what the store already knows from earlier runs:
+
+    - ``TimelineStats`` image/video counts (including bundle contents) give
+      the size of the creator's timeline.
+    - ``MonitorState.lastCheckedAt`` scales that down for creators checked
+      recently — a creator swept yesterday has far less new content than
+      one last seen a month ago.
+
+    A creator with no ``Account`` row has never been downloaded, so its cost
+    is unknown but certainly a full sweep; it is reported as ``math.inf`` so
+    it starts first.
+    """
+    store = get_store()
+    try:
+        account = await store.find_one(Account, username__iexact=creator_name)
+    except Exception as exc:
+        logger.debug("scheduler: could not look up @{}: {}", creator_name, exc)
+        return math.inf
+    if account is None or account.id is None:
+        return math.inf
+    account_id = account.id
+
+    stats: TimelineStats | None = await store.get(TimelineStats, account_id)
+    total_items = 0
+    if stats is not None:
+        total_items = sum(
+            count or 0
+            for count in (
+                stats.imageCount,
+                stats.videoCount,
+                stats.bundleImageCount,
+                stats.bundleVideoCount,
+            )
+        )
+
+    monitor: MonitorState | None = await store.get(MonitorState, account_id)
+    last_checked = monitor.lastCheckedAt if monitor is not None else None
+    if last_checked is None:
+        return float(total_items)
+
+    age = (now or datetime.now(UTC)) - last_checked
+    # Floor at one day's worth so equally-fresh creators still sort by size.
+    staleness = min(1.0, max(age / FULL_RESCAN_AGE, 1 / FULL_RESCAN_AGE.days))
+    return total_items * staleness
+
+
+async def order_creators_by_expected_work(creator_names: Sequence[str]) -> list[str]:
+    """Return ``creator_names`` sorted by ``estimate_creator_work``, largest first.
+
+    The sort is stable, so creators with equal estimates keep their incoming
+    (alphabetical / reverse-alphabetical) order.
+    """
+    estimates = [await estimate_creator_work(name) for name in creator_names]
+    ranked = sorted(
+        zip(creator_names, estimates, strict=True),
+        key=lambda pair: pair[1],
+        reverse=True,
+    )
+    return [name for name, _ in ranked]
+
+
+async def run_creator_pool(
+    creator_names: Sequence[str],
+    process: Callable[[str], Awaitable[None]],
+    limit: int,
+) -> None:
+    """Run ``process(creator_name)`` for every creator, ``limit`` at a time.
+
+    Creators start in the given order. An exception escaping ``process``
+    stops further creators from starting; those already running finish, and
+    the first exception is then re-raised unchanged (not wrapped in an
+    ``ExceptionGroup``), matching what the sequential loop would have raised.
+    """
+    pending = iter(creator_names)
+    failure: list[BaseException] = []
+
+    async def worker() -> None:
+        for creator_name in pending:
+            if failure:
+                return
+            try:
+                await process(creator_name)
+            except Exception as exc:
+                failure.append(exc)
+                return
+
+    worker_count = max(1, min(limit, len(creator_names)))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+    if failure:
+        raise failure[0]
@@ -23,8 +23,10 @@ from textio import (
 )
 
 from .common import (
+    PagePrefetcher,
     check_page_duplicates,
     get_unique_media_ids,
+    last_item_id,
     process_download_accessible_media,
 )
 from .core import DownloadState
@@ -84,12 +86,23 @@ async def process_timeline_media(
     return await process_download_accessible_media(config, state, accessible)
 
 
+async def _fetch_timeline_page(
+    config: FanslyConfig, creator_id: int | str, cursor: str
+) -> Response:
+    """Request a timeline page after the usual pause between pages."""
+    # Slow down to avoid the Fansly rate-limit which was introduced in late August 2023
+    await sleep(timing_jitter(2, 4))
+    return await config.get_api().get_timeline(creator_id, cursor)
+
+
 async def download_timeline(
     config: FanslyConfig,
     state: DownloadState,
 ) -> None:
     """Download timeline posts and media.
 
+    The next page is requested while the current page's media download.
+
     Args:
         config: FanslyConfig instance
         state: Current download state
@@ -98,6 +111,15 @@ async def download_timeline(
         DuplicatePageError: If all posts on a page are already in metadata
             and use_pagination_duplication is True
     """
+    with PagePrefetcher() as next_page:
+        await _download_timeline_pages(config, state, next_page)
+
+
+async def _download_timeline_pages(
+    config: FanslyConfig,
+    state: DownloadState,
+    next_page: PagePrefetcher,
+) -> None:
     print_info("Executing Timeline functionality...")
 
     # This is important for directory creation later on.
@@ -140,9 +162,14 @@ async def download_timeline(
             if state.creator_id is None or timeline_cursor is None:
                 raise RuntimeError("Creator name or timeline cursor should not be None")
 
-            timeline_response = await config.get_api().get_timeline(
-                state.creator_id, str(timeline_cursor)
-            )
+            prefetched = next_page.take(str(timeline_cursor))
+            if prefetched is not None:
+                timeline_response = await prefetched
+            else:
+                # A retry must not be answered from the API's response cache
+                timeline_response = await config.get_api().get_timeline(
+                    state.creator_id, str(timeline_cursor), use_cache=attempts == 0
+                )
 
             timeline_response.raise_for_status()
 
@@ -206,6 +233,14 @@ async def download_timeline(
                 # Reset attempts eg. new timeline
                 attempts = 0
 
+                # Request the next page while this one's media download
+                next_cursor = last_item_id(timeline, "posts")
+                if next_cursor is not None:
+                    next_page.start(
+                        next_cursor,
+                        _fetch_timeline_page(config, state.creator_id, next_cursor),
+                    )
+
                 should_continue = await process_timeline_media(
                     config,
                     state,
@@ -228,9 +263,7 @@ async def download_timeline(
 
                 # get next timeline_cursor
                 try:
-                    # Slow down to avoid the Fansly rate-limit which was introduced in late August 2023
-                    await sleep(timing_jitter(2, 4))
-
+                    # The pause before the next page is part of its prefetch
                     page_posts = expect_list(timeline["posts"], "timeline posts")
                     timeline_cursor = int(
                         str(expect_dict(page_posts[-1], "post")["id"])
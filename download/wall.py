@@ -167,8 +167,9 @@ async def download_wall(
             if state.creator_id is None:
                 raise RuntimeError("Creator ID should not be None")
 
+            # A retry must not be answered from the API's response cache
             wall_response = await config.get_api().get_wall_posts(
-                state.creator_id, wall_id, str(before_cursor)
+                state.creator_id, wall_id, str(before_cursor), use_cache=attempts == 0
             )
 
             wall_response.raise_for_status()
@@ -55,7 +55,9 @@ from download.core import (
     get_creator_account_info,
     get_following_accounts,
     print_download_info,
+    prune_hls_resume_dirs,
 )
+from download.scheduler import order_creators_by_expected_work, run_creator_pool
 from download.statistics import (
     print_global_statistics,
     print_statistics,
@@ -77,6 +79,7 @@ from errors import (
     DownloadError,
 )
 from fileio.dedupe import dedupe_init
+from fileio.hash_executor import shutdown_hashing_executor
 from fileio.preview_repair import repair_preview_folder_items
 from helpers.common import expect_dict, open_location, parse_timestamp
 from helpers.rich_progress import get_progress_manager, get_rich_console
@@ -236,6 +239,8 @@ def cleanup_database_sync(config: FanslyConfig) -> None:
             print_info("Database connections closed successfully.")
         except Exception as e:
             print_error(f"Error closing database connections: {e}")
+    with contextlib.suppress(Exception):
+        shutdown_hashing_executor()  # Stop dedupe hashing workers
     monitor_semaphores(threshold=20)  # Report any leaked semaphores
     cleanup_semaphores(r"/mp-.*")  # Clean up multiprocessing semaphores
 
@@ -319,6 +324,153 @@ async def load_client_account_into_db(
 
 
 # @profile(precision=2, stream=open('memory_use.log', 'w', encoding='utf-8'))
+async def _process_creator(
+    config: FanslyConfig,
+    creator_name: str,
+    finished_states: list[DownloadState],
+    *,
+    cleanup_semaphores_after: bool = True,
+) -> bool:
+    """Download everything the configured mode covers for one creator.
+
+    Runs with its own ``DownloadState``; the API (and its rate limiter) and
+    the entity store are the process-wide shared instances. Once downloads
+    finish the state is appended to ``finished_states`` for the caller to
+    aggregate into ``GlobalState``.
+
+    Returns:
+        False when the creator failed in a way that should surface as
+        ``SOME_USERS_FAILED`` (account lookup or Stash background failure),
+        True otherwise.
+    """
+    succeeded = True
+    state = DownloadState(creator_name=creator_name)
+    creator_start_monotonic = monotonic()
+
+    try:
+        try:
+            print_download_info(config)
+
+            await get_creator_account_info(config, state)
+
+            print_info(f"Download mode is: {config.download_mode_str()}")
+
+            # Special treatment for deviating folder names later
+            if config.download_mode not in (
+                DownloadMode.SINGLE,
+                DownloadMode.STASH_ONLY,
+            ):
+                await dedupe_init(config, state)
+                await repair_preview_folder_items(config, state)
+
+            if config.download_mode == DownloadMode.SINGLE:
+                await download_single_post(config, state)
+
+            elif config.download_mode == DownloadMode.COLLECTION:
+                await download_collections(config, state)
+
+            elif config.download_mode != DownloadMode.STASH_ONLY:
+                if any(
+                    [
+                        config.download_mode == DownloadMode.MESSAGES,
+                        config.download_mode == DownloadMode.NORMAL,
+                    ]
+                ):
+                    await download_messages(config, state)
+
+                if any(
+                    [
+                        config.download_mode == DownloadMode.TIMELINE,
+                        config.download_mode == DownloadMode.NORMAL,
+                    ]
+                ):
+                    await download_timeline(config, state)
+
+                if any(
+                    [
+                        config.download_mode == DownloadMode.STORIES,
+                        config.download_mode == DownloadMode.NORMAL,
+                    ]
+                ):
+                    await download_stories(config, state)
+
+                if (
+                    any(
+                        [
+                            config.download_mode == DownloadMode.WALL,
+                            config.download_mode == DownloadMode.NORMAL,
+                        ]
+                    )
+                    and state.walls
+                ):
+                    walls_list = sorted(await resolve_wall_filter(config, state))
+                    if walls_list:
+                        progress_mgr = get_progress_manager()
+                        # Per-creator task name: several creators may be
+                        # walking their walls at the same time.
+                        walls_task = state.progress_task_name("download_walls")
+                        progress_mgr.add_task(
+                            name=walls_task,
+                            description=f"Processing walls @{creator_name}",
+                            total=len(walls_list),
+                            parent_task="creators",
+                            show_elapsed=True,
+                        )
+                        for wall_id in walls_list:
+                            await download_wall(config, state, wall_id)
+                            progress_mgr.update_task(walls_task, advance=1)
+                        progress_mgr.remove_task(walls_task)
+
+            finished_states.append(state)
+            print_statistics(config, state)
+
+            # open download folder
+            if state.base_path is not None:
+                open_location(
+                    state.base_path,
+                    config.open_folder_when_finished,
+                    config.interactive,
+                )
+
+            if config.stash_active:
+                # isort: off
+                # Conditional on stash_active — avoid eager-
+                # importing stash deps when integration is disabled.
+                from stash import StashProcessing  # noqa: PLC0415 # Deferred import since only used in stash context
+
+                # isort: on
+                stash_processor = StashProcessing.from_config(config, state)
+                await stash_processor.start_creator_processing()
+
+                # Wait for background processing to complete
+                if stash_processor._background_task:
+                    try:
+                        await stash_processor._background_task
+                    except Exception as e:
+                        print_error(f"Background processing failed: {e}")
+                        succeeded = False
+
+                await stash_processor.cleanup()
+            if cleanup_semaphores_after:
+                monitor_semaphores(threshold=20)
+                cleanup_semaphores(r"/mp-.*")
+
+        finally:
+            # Log creator processing time
+            creator_elapsed = monotonic() - creator_start_monotonic
+            print_info(
+                f"Completed processing @{state.creator_name} in {creator_elapsed:.1f}s"
+            )
+
+    # Still continue if one creator failed
+    except ApiAccountInfoError as e:
+        print_error(str(e))
+        await input_enter_continue(config.interactive)
+        succeeded = False
+
+    return succeeded
+
+
 async def main(config: FanslyConfig) -> int:
     """The main logic of the downloader program.
 
@@ -366,6 +518,9 @@ async def main(config: FanslyConfig) -> int:
 
     await validate_adjust_config(config, download_mode_set)
 
+    # Drop segment resume state from HLS downloads that never finished
+    await prune_hls_resume_dirs(config)
+
     if config.user_names is None or config.download_mode == DownloadMode.NOTSET:
         raise RuntimeError(
             "Internal error - user name and download mode should not be empty after validation."
@@ -486,159 +641,68 @@ async def main(config: FanslyConfig) -> int:
     if config.reverse_order:
         print_info("Processing creators in reverse order")
 
+    creator_concurrency = max(
+        1, min(config.max_concurrent_creators, len(creators_list))
+    )
+    concurrent_creators = creator_concurrency > 1
+    if concurrent_creators:
+        creators_list = await order_creators_by_expected_work(creators_list)
+        print_info(
+            f"Processing up to {creator_concurrency} creators concurrently "
+            f"(largest expected workload first)"
+        )
+
     progress_mgr = get_progress_manager()
+    show_creators_task = len(creators_list) > 1
+    active_creators: list[str] = []
+    # States reach this list once a creator's downloads finished; statistics
+    # are aggregated from it after every creator is done.
+    finished_states: list[DownloadState] = []
+
+    async def run_one_creator(creator_name: str) -> None:
+        nonlocal exit_code
+        active_creators.append(creator_name)
+        if show_creators_task:
+            progress_mgr.update_task(
+                "creators",
+                advance=0,
+                description=f"Creator: {', '.join(active_creators)}",
+            )
+        try:
+            with Timer(creator_name):
+                if not await _process_creator(
+                    config,
+                    creator_name,
+                    finished_states,
+                    cleanup_semaphores_after=not concurrent_creators,
+                ):
+                    exit_code = SOME_USERS_FAILED
+        # Advance creator progress regardless of success/failure
+        finally:
+            active_creators.remove(creator_name)
+            if show_creators_task:
+                progress_mgr.update_task("creators", advance=1)
+
     with progress_mgr.session():
-        creators_progress = progress_mgr
-        if len(creators_list) > 1:
-            creators_progress.add_task(
+        if show_creators_task:
+            progress_mgr.add_task(
                 name="creators",
                 description="Processing creators",
                 total=len(creators_list),
                 group="status",
             )
 
-        for creator_name in creators_list:
-            if len(creators_list) > 1:
-                creators_progress.update_task(
-                    "creators",
-                    advance=0,
-                    description=f"Creator: {creator_name}",
-                )
-            with Timer(creator_name):
-                try:
-                    state = DownloadState(creator_name=creator_name)
-                    creator_start_monotonic = monotonic()
-
-                    try:
-                        creator_start_monotonic = monotonic()
-
-                        print_download_info(config)
-
-                        await get_creator_account_info(config, state)
-
-                        print_info(f"Download mode is: {config.download_mode_str()}")
-
-                        # Special treatment for deviating folder names later
-                        if config.download_mode not in (
-                            DownloadMode.SINGLE,
-                            DownloadMode.STASH_ONLY,
-                        ):
-                            await dedupe_init(config, state)
-                            await repair_preview_folder_items(config, state)
-
-                        if config.download_mode == DownloadMode.SINGLE:
-                            await download_single_post(config, state)
-
-                        elif config.download_mode == DownloadMode.COLLECTION:
-                            await download_collections(config, state)
-
-                        elif config.download_mode != DownloadMode.STASH_ONLY:
-                            if any(
-                                [
-                                    config.download_mode == DownloadMode.MESSAGES,
-                                    config.download_mode == DownloadMode.NORMAL,
-                                ]
-                            ):
-                                await download_messages(config, state)
-
-                            if any(
-                                [
-                                    config.download_mode == DownloadMode.TIMELINE,
-                                    config.download_mode == DownloadMode.NORMAL,
-                                ]
-                            ):
-                                await download_timeline(config, state)
-
-                            if any(
-                                [
-                                    config.download_mode == DownloadMode.STORIES,
-                                    config.download_mode == DownloadMode.NORMAL,
-                                ]
-                            ):
-                                await download_stories(config, state)
-
-                            if (
-                                any(
-                                    [
-                                        config.download_mode == DownloadMode.WALL,
-                                        config.download_mode == DownloadMode.NORMAL,
-                                    ]
-                                )
-                                and state.walls
-                            ):
-                                walls_list = sorted(
-                                    await resolve_wall_filter(config, state)
-                                )
-                                if walls_list:
-                                    progress_mgr.add_task(
-                                        name="download_walls",
-                                        description="Processing walls",
-                                        total=len(walls_list),
-                                        parent_task="creators",
-                                        show_elapsed=True,
-                                    )
-                                    for wall_id in walls_list:
-                                        await download_wall(config, state, wall_id)
-                                        progress_mgr.update_task(
-                                            "download_walls", advance=1
-                                        )
-                                    progress_mgr.remove_task("download_walls")
-
-                        update_global_statistics(
-                            global_download_state, download_state=state
-                        )
-                        print_statistics(config, state)
-
-                        # open download folder
-                        if state.base_path is not None:
-                            open_location(
-                                state.base_path,
-                                config.open_folder_when_finished,
-                                config.interactive,
-                            )
-
-                        if config.stash_active:
-                            # isort: off
-                            # Conditional on stash_active — avoid eager-
-                            # importing stash deps when integration is disabled.
-                            from stash import StashProcessing  # noqa: PLC0415 # Deferred import since only used in stash context
-
-                            # isort: on
-                            stash_processor = StashProcessing.from_config(config, state)
-                            await stash_processor.start_creator_processing()
-
-                            # Wait for background processing to complete
-                            if stash_processor._background_task:
-                                try:
-                                    await stash_processor._background_task
-                                except Exception as e:
-                                    print_error(f"Background processing failed: {e}")
-                                    exit_code = SOME_USERS_FAILED
-
-                            await stash_processor.cleanup()
-                        monitor_semaphores(threshold=20)
-                        cleanup_semaphores(r"/mp-.*")
-
-                    finally:
-                        # Log creator processing time
-                        creator_elapsed = monotonic() - creator_start_monotonic
-                        print_info(
-                            f"Completed processing @{state.creator_name} in {creator_elapsed:.1f}s"
-                        )
+        await run_creator_pool(creators_list, run_one_creator, creator_concurrency)
 
-                # Still continue if one creator failed
-                except ApiAccountInfoError as e:
-                    print_error(str(e))
-                    await input_enter_continue(config.interactive)
-                    exit_code = SOME_USERS_FAILED
+        if show_creators_task:
+            progress_mgr.remove_task("creators")
 
-                # Advance creator progress regardless of success/failure
-                finally:
-                    if len(creators_list) > 1:
-                        creators_progress.update_task("creators", advance=1)
+    if concurrent_creators:
+        monitor_semaphores(threshold=20)
+        cleanup_semaphores(r"/mp-.*")
 
-        if len(creators_list) > 1:
-            creators_progress.remove_task("creators")
+    for finished_state in finished_states:
+        update_global_statistics(global_download_state, download_state=finished_state)
 
     timer.stop()
 
@@ -948,6 +1012,14 @@ async def cleanup_with_global_timeout(config: FanslyConfig) -> None:
             print_error(f"Error during database cleanup: {db_error}")
         phase_done("db")
 
+        # Stop the dedupe hashing workers kept alive for the whole run
+        phase_starts["hashing"] = time.perf_counter()
+        try:
+            shutdown_hashing_executor()
+        except Exception as e:
+            print_warning(f"Error shutting down hashing workers: {e}")
+        phase_done("hashing")
+
         # Finally clean up any remaining semaphores if time allows
         phase_starts["semaphores"] = time.perf_counter()
         try:
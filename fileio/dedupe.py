@@ -1,25 +1,39 @@
 """Item Deduplication"""
 
 import asyncio
-import itertools
 import mimetypes
-import multiprocessing
 import os
 import re
+import stat
 import traceback
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, nullcontext
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from config import FanslyConfig
 from download.downloadstate import DownloadState
 from errors import MediaHashMismatchError
-from fileio.fnmanip import get_hash_for_image, get_hash_for_other_content
+from fileio.fnmanip import (
+    get_hash_for_image,
+    get_hash_for_other_content,
+    get_hashes_for_images,
+)
+from fileio.hash_executor import get_hashing_executor, plan_hash_chunks
 from fileio.normalize import get_id_from_filename, normalize_filename
 from helpers.rich_progress import get_progress_manager
-from metadata import Account, Media
+from metadata import (
+    Account,
+    FileHashIndex,
+    Media,
+    load_file_hash_index,
+    update_file_hash_index,
+)
 from metadata.models import get_store
 from pathio import set_create_directory_for_download
-from textio import json_output, print_info, print_warning
+from textio import json_output, print_info
 
 
 async def migrate_full_paths_to_filenames() -> None:
@@ -102,6 +116,99 @@ async def safe_rglob(base_path: Path, pattern: str) -> list[Path]:
     return await asyncio.to_thread(lambda: list(base_path.rglob(filename)))
 
 
+# Entries per batch handed over by scan_files
+SCAN_BATCH_SIZE = 1000
+
+
+class ScannedFile(NamedTuple):
+    """A non-directory entry found by `scan_files`."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int
+    is_file: bool  # regular file (symlinks followed), like Path.is_file()
+
+    @classmethod
+    def from_stat(cls, path: Path, st: os.stat_result) -> "ScannedFile":
+        """Build a record from a stat result, folding the inode into int64.
+
+        ``file_hash_index.inode`` is a signed BIGINT, but FUSE/NFS inode
+        numbers and ReFS file ids can reach 2**63 and beyond. The inode is
+        only compared for equality, so its two's complement low 64 bits
+        serve just as well.
+        """
+        # DirEntry.stat() leaves st_ino at 0 on Windows
+        inode = st.st_ino or path.stat().st_ino
+        return cls(
+            path=path,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            inode=(inode + 2**63) % 2**64 - 2**63,
+            is_file=stat.S_ISREG(st.st_mode),
+        )
+
+
+def _scan_tree(base_path: Path, batch_size: int) -> Iterator[list[ScannedFile]]:
+    """Walk ``base_path`` with os.scandir, yielding batches of entries.
+
+    Symlinked directories are listed as entries but not descended into,
+    as with ``Path.rglob``. Directories that can't be read are skipped.
+    """
+    batch: list[ScannedFile] = []
+    directories = [os.fspath(base_path)]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(entry.path)
+                            continue
+                        record = ScannedFile.from_stat(Path(entry.path), entry.stat())
+                    except OSError:
+                        # Broken symlink or entry removed mid-scan
+                        record = ScannedFile(Path(entry.path), 0, 0, 0, False)
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+        except OSError:
+            continue
+    if batch:
+        yield batch
+
+
+async def scan_files(
+    base_path: Path, batch_size: int = SCAN_BATCH_SIZE
+) -> AsyncIterator[list[ScannedFile]]:
+    """Walk ``base_path`` once, yielding its non-directory entries in batches.
+
+    The walk runs in a single dedicated thread and stays one batch ahead
+    of the consumer, so the tree is never held in memory as a whole and
+    each entry costs no thread hop of its own. Size, mtime and inode come
+    from the scandir entry, so no second stat is needed.
+
+    Args:
+        base_path: The directory to walk
+        batch_size: Most entries per batch
+
+    Yields:
+        Lists of ScannedFile records, in no particular order
+    """
+    loop = asyncio.get_running_loop()
+    walker = _scan_tree(base_path, batch_size)
+    scanner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dedupe-scan")
+    try:
+        pending = loop.run_in_executor(scanner, next, walker, None)
+        while (batch := await pending) is not None:
+            pending = loop.run_in_executor(scanner, next, walker, None)
+            yield batch
+    finally:
+        # Don't block the loop on a batch nobody will read
+        scanner.shutdown(wait=False, cancel_futures=True)
+
+
 async def file_exists_in_download_path(
     base_path: Path | None,
     filename: str | None,
@@ -120,14 +227,41 @@ async def file_exists_in_download_path(
     return False
 
 
+class _StatSignature(NamedTuple):
+    """Stat fields that identify an unchanged file between runs."""
+
+    path: str  # relative to the download folder, POSIX separators
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+# Most files per hashing task; images in a task get their pHash DCTs run
+# over the whole batch at once by calculate_file_hashes
+IMAGE_HASH_BATCH_SIZE = 32
+
+
+def _hash_debug_info(file_path: Path, mimetype: str) -> dict[str, Any]:
+    exists = file_path.exists()
+    return {
+        "path": str(file_path),
+        "mimetype": mimetype,
+        "size": file_path.stat().st_size if exists else None,
+        "exists": exists,
+        "is_file": file_path.is_file() if exists else None,
+        "readable": os.access(file_path, os.R_OK) if exists else None,
+    }
+
+
 # Function to calculate file hash in a separate process
 def calculate_file_hash(
     file_info: tuple[Path, str],
 ) -> tuple[Path, str | None, dict[str, Any]]:
     """Calculate hash for a file in a separate process.
 
-    This is a synchronous function because it runs in multiprocessing.Pool
-    workers which have no event loop. All I/O is direct (no asyncio).
+    This is a synchronous function because it runs in the hashing
+    executor's worker processes, which have no event loop. All I/O is
+    direct (no asyncio).
 
     Args:
         file_info: Tuple of (file_path, mimetype)
@@ -136,15 +270,7 @@ def calculate_file_hash(
         Tuple of (file_path, hash or None, debug_info)
     """
     file_path, mimetype = file_info
-    exists = file_path.exists()
-    debug_info = {
-        "path": str(file_path),
-        "mimetype": mimetype,
-        "size": file_path.stat().st_size if exists else None,
-        "exists": exists,
-        "is_file": file_path.is_file() if exists else None,
-        "readable": os.access(file_path, os.R_OK) if exists else None,
-    }
+    debug_info = _hash_debug_info(file_path, mimetype)
     try:
         if "image" in mimetype:
             hash_value = get_hash_for_image(file_path)
@@ -185,6 +311,55 @@ def calculate_file_hash(
     return file_path, None, debug_info
 
 
+def calculate_file_hashes(
+    file_infos: list[tuple[Path, str]],
+) -> list[tuple[Path, str | None, dict[str, Any]]]:
+    """Calculate hashes for a batch of files in a separate process.
+
+    Images are hashed together through `get_hashes_for_images`, which
+    decodes each one once and runs the pHash DCTs over the whole batch;
+    anything else goes through `calculate_file_hash` one file at a time.
+
+    Args:
+        file_infos: Tuples of (file_path, mimetype)
+
+    Returns:
+        One (file_path, hash or None, debug_info) tuple per file, in order
+    """
+    image_results: dict[int, tuple[Path, str | None, dict[str, Any]]] = {}
+    images = [
+        index for index, (_, mimetype) in enumerate(file_infos) if "image" in mimetype
+    ]
+    hashes = get_hashes_for_images([file_infos[index][0] for index in images])
+    for index, hash_value in zip(images, hashes, strict=True):
+        file_path, mimetype = file_infos[index]
+        debug_info = _hash_debug_info(file_path, mimetype)
+        if isinstance(hash_value, RuntimeError):
+            debug_info.update(
+                {
+                    "hash_success": False,
+                    "error": str(hash_value),
+                    "error_type": type(hash_value).__name__,
+                    "traceback": "".join(traceback.format_exception(hash_value)),
+                }
+            )
+            image_results[index] = (file_path, None, debug_info)
+            continue
+        debug_info.update(
+            {
+                "hash_type": "image",
+                "hash_success": True,
+                "hash_value": hash_value,
+            }
+        )
+        image_results[index] = (file_path, hash_value, debug_info)
+
+    return [
+        image_results[index] if index in image_results else calculate_file_hash(info)
+        for index, info in enumerate(file_infos)
+    ]
+
+
 async def get_or_create_media(
     file_path: Path,
     media_id: int | None,
@@ -478,16 +653,17 @@ async def get_account_id(state: DownloadState) -> int | None:
     return None
 
 
-async def categorize_file(
+def categorize_path(
     file_path: Path,
     hash2_pattern: re.Pattern[str],
 ) -> tuple[str, tuple] | None:
     """Categorize a file into 'hash2', 'media_id', or 'needs_hash'.
 
+    Only looks at the file name, so it needs no I/O.
+
     Returns:
         Tuple of (category, file_info) or None if file should be skipped
     """
-
     filename = file_path.name
     media_id, _ = get_id_from_filename(filename)
     mimetype, _ = mimetypes.guess_type(file_path)
@@ -579,44 +755,55 @@ async def dedupe_init(
     preserved_count = 0
     hash2_pattern = re.compile(r"_hash2_([a-fA-F0-9]+)")
 
-    # Use half of available cores, but ensure at least 2 workers
-    max_workers = max(2, multiprocessing.cpu_count() // 2)
+    # Worker processes are shared by every creator and pass of this run
+    executor = get_hashing_executor()
 
-    # First, collect all files that need hashing
-    all_files = [
-        f
-        for f in await safe_rglob(state.download_path, "*")
-        if await asyncio.to_thread(f.is_file)
-    ]
     file_batches: dict[str, list[Any]] = {
         "hash2": [],  # (file_path, media_id, mimetype, hash2_value)
         "media_id": [],  # (file_path, media_id, mimetype)
         "needs_hash": [],  # (file_path, mimetype)
     }
-
-    # Categorize files with Rich progress
+    # Stat signatures of the files that may need hashing, from the scan
+    signatures: dict[Path, _StatSignature] = {}
+    # Relative POSIX paths and names of every file, for the index and DB checks
+    on_disk: set[str] = set()
+    file_names: set[str] = set()
+
+    # Scan and categorize files with Rich progress; batches stream in from
+    # the scanner thread, so categorizing overlaps the walk
     progress_mgr = get_progress_manager()
 
     with progress_mgr.session():
-        tasks = [categorize_file(f, hash2_pattern) for f in all_files]
         categorize_task = progress_mgr.add_task(
-            name="categorize_files",
+            name=state.progress_task_name("categorize_files"),
             description="Categorizing files",
-            total=len(all_files),
+            total=None,
             show_elapsed=False,
         )
 
-        for task in asyncio.as_completed(tasks):
-            if result := await task:
-                category, file_info = result
-                file_batches[category].append(file_info)
-            progress_mgr.update_task(categorize_task, advance=1)
+        async for batch in scan_files(state.download_path):
+            scanned = [entry for entry in batch if entry.is_file]
+            for entry in scanned:
+                relative_path = entry.path.relative_to(state.download_path).as_posix()
+                on_disk.add(relative_path)
+                file_names.add(entry.path.name)
+                if result := categorize_path(entry.path, hash2_pattern):
+                    category, file_info = result
+                    file_batches[category].append(file_info)
+                    if category == "needs_hash":
+                        signatures[entry.path] = _StatSignature(
+                            path=relative_path,
+                            size=entry.size,
+                            mtime_ns=entry.mtime_ns,
+                            inode=entry.inode,
+                        )
+            progress_mgr.update_task(categorize_task, advance=len(scanned))
 
     # Process hash2 files (files with known hashes)
     if file_batches["hash2"]:
         with progress_mgr.session():
             hash2_task = progress_mgr.add_task(
-                name="process_hash2",
+                name=state.progress_task_name("process_hash2"),
                 description="Processing hash2 files",
                 total=len(file_batches["hash2"]),
                 show_elapsed=False,
@@ -640,7 +827,7 @@ async def dedupe_init(
     if file_batches["media_id"]:
         with progress_mgr.session():
             media_id_task = progress_mgr.add_task(
-                name="process_media_ids",
+                name=state.progress_task_name("process_media_ids"),
                 description="Processing media ID files",
                 total=len(file_batches["media_id"]),
                 show_elapsed=False,
@@ -678,77 +865,115 @@ async def dedupe_init(
                     1 for _, hash_verified in id_results if hash_verified
                 )
 
-    # Process files needing hashes
+    # Process files needing hashes. Files whose stat signature still matches
+    # the persisted index reuse their stored hash; only new or modified files
+    # go to the pool.
+    hash_index = await load_file_hash_index(state.download_path)
+    new_index_entries: list[FileHashIndex] = []
+    hashed_count = 0
     if file_batches["needs_hash"]:
+        cached_hashes: list[tuple[Path, str]] = []
+        to_hash: list[tuple[Path, str]] = []
+        for file_info in file_batches["needs_hash"]:
+            file_path = file_info[0]
+            signature = signatures.get(file_path)
+            indexed = hash_index.get(signature.path) if signature is not None else None
+            if (
+                indexed is not None
+                and signature is not None
+                and (indexed.size, indexed.mtime_ns, indexed.inode)
+                == (signature.size, signature.mtime_ns, signature.inode)
+            ):
+                cached_hashes.append((file_path, indexed.content_hash))
+            else:
+                to_hash.append(file_info)
+        hashed_count = len(to_hash)
+
+        async def record_hash(
+            file_path: Path, file_hash: str, debug_info: dict[str, Any]
+        ) -> None:
+            nonlocal processed_count
+            try:
+                _, hash_verified = await get_or_create_media(
+                    file_path=file_path,
+                    media_id=get_id_from_filename(file_path.name)[0],
+                    mimetype=mimetypes.guess_type(file_path)[0] or "",
+                    state=state,
+                    file_hash=file_hash,
+                    trust_filename=False,
+                    config=config,
+                )
+                if hash_verified:
+                    processed_count += 1
+            except Exception as e:
+                json_output(
+                    1,
+                    "dedupe_init",
+                    {
+                        "pass": call_count,
+                        "state": "file_process_error",
+                        "file_info": debug_info,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                        "traceback": traceback.format_exc(),
+                    },
+                )
+
         with progress_mgr.session():
             hash_task = progress_mgr.add_task(
-                name="process_hashing",
-                description=f"Hashing files ({max_workers} workers)",
+                name=state.progress_task_name("process_hashing"),
+                description=f"Hashing files ({executor.workers} workers)",
                 total=len(file_batches["needs_hash"]),
                 show_elapsed=False,
             )
 
-            # Process files with a limited number of active tasks
-            active_tasks = max_workers + 4
-
-            with multiprocessing.Pool(processes=max_workers) as pool:
-                try:
-                    # Create an iterator that will process files as needed
-                    iterator = pool.imap_unordered(
-                        calculate_file_hash,
-                        file_batches["needs_hash"],
-                        chunksize=1,
-                    )
-
-                    # Take only active_tasks items at a time from the iterator
-                    while True:
-                        # Get the next batch of results (non-blocking)
-                        batch = list(itertools.islice(iterator, active_tasks))
-                        if not batch:  # No more files to process
-                            break
-
-                        # Process the current batch
-                        for file_path, file_hash, debug_info in batch:
-                            if file_hash is None:
-                                progress_mgr.update_task(hash_task, advance=1)
-                                continue
-
-                            try:
-                                _, hash_verified = await get_or_create_media(
-                                    file_path=file_path,
-                                    media_id=get_id_from_filename(file_path.name)[0],
-                                    mimetype=mimetypes.guess_type(file_path)[0] or "",
-                                    state=state,
-                                    file_hash=file_hash,
-                                    trust_filename=False,
-                                    config=config,
-                                )
-                                if hash_verified:
-                                    processed_count += 1
-                            except Exception as e:
-                                json_output(
-                                    1,
-                                    "dedupe_init",
-                                    {
-                                        "pass": call_count,
-                                        "state": "file_process_error",
-                                        "file_info": debug_info,
-                                        "error": str(e),
-                                        "error_type": type(e).__name__,
-                                        "traceback": traceback.format_exc(),
-                                    },
+            for file_path, file_hash in cached_hashes:
+                await record_hash(
+                    file_path,
+                    file_hash,
+                    {"path": str(file_path), "hash_source": "file_hash_index"},
+                )
+                progress_mgr.update_task(hash_task, advance=1)
+
+            # Small files and images share the general lane in chunks sized
+            # by byte count (images in a chunk get one stacked DCT); big
+            # videos go one at a time to the large-file lane.
+            chunks, large_tasks = plan_hash_chunks(
+                to_hash,
+                {path: signature.size for path, signature in signatures.items()},
+                workers=executor.workers,
+                max_files=IMAGE_HASH_BATCH_SIZE,
+            )
+            async for results in executor.map_unordered(
+                calculate_file_hashes, chunks, large_tasks
+            ):
+                for file_path, chunk_hash, debug_info in results:
+                    if chunk_hash is not None:
+                        if signature := signatures.get(file_path):
+                            new_index_entries.append(
+                                FileHashIndex(
+                                    directory=str(state.download_path),
+                                    path=signature.path,
+                                    size=signature.size,
+                                    mtime_ns=signature.mtime_ns,
+                                    inode=signature.inode,
+                                    content_hash=chunk_hash,
                                 )
-                            finally:
-                                progress_mgr.update_task(hash_task, advance=1)
-                finally:
-                    # Clean up resources
-                    try:
-                        pool.terminate()
-                        pool.join()
-                    except Exception as e:
-                        print_warning(f"Error cleaning up process pool: {e}")
-                    finally:
-                        pool.close()
+                            )
+                        await record_hash(file_path, chunk_hash, debug_info)
+                    progress_mgr.update_task(hash_task, advance=1)
+
+    # Replace rows for re-hashed files and drop rows for files that are gone,
+    # even when nothing needed hashing, so the index tracks the directory as
+    # it is now.
+    rehashed = {entry.path for entry in new_index_entries}
+    await update_file_hash_index(
+        state.download_path,
+        new_index_entries,
+        removed=[
+            path for path in hash_index if path in rehashed or path not in on_disk
+        ],
+    )
 
     downloaded_list = await store.find(
         Media,
@@ -768,7 +993,7 @@ async def dedupe_init(
 
     with progress_mgr.session():
         db_check_task = progress_mgr.add_task(
-            name="check_db_files",
+            name=state.progress_task_name("check_db_files"),
             description="Checking DB files",
             total=len(downloaded_list),
             show_elapsed=True,  # Show elapsed time for verification tasks
@@ -796,7 +1021,7 @@ async def dedupe_init(
 
             needs_update = False
             if media.local_filename:
-                if any(f.name == media.local_filename for f in all_files):
+                if media.local_filename in file_names:
                     progress_mgr.update_task(db_check_task, advance=1)
                     continue
                 # File marked as downloaded but not found - clean up record
@@ -844,8 +1069,9 @@ async def dedupe_init(
             "new_records": final_downloaded - existing_downloaded,
             "processed_count": processed_count,
             "preserved_count": preserved_count,
-            "total_files": len(all_files),
-            "files_hashed": len(file_batches["needs_hash"]),
+            "total_files": len(on_disk),
+            "files_hashed": hashed_count,
+            "files_from_hash_index": len(file_batches["needs_hash"]) - hashed_count,
         },
     )
 
@@ -864,16 +1090,21 @@ async def dedupe_init(
 async def _calculate_hash_for_file(
     filename: Path,
     mimetype: str,
+    known_hash: str | None = None,
 ) -> str | None:
     """Calculate hash for a file based on its mimetype.
 
     Args:
         filename: Path to the file
         mimetype: MIME type of the file
+        known_hash: Hash already computed while the file was downloaded;
+            returned as-is so the file isn't read again
 
     Returns:
         Hash string or None if hash couldn't be calculated
     """
+    if known_hash is not None:
+        return known_hash
     try:
         if "image" in mimetype:
             return await asyncio.to_thread(get_hash_for_image, filename)
@@ -915,12 +1146,32 @@ async def _check_file_exists(
     return False
 
 
+# One lock per content hash being recorded, so concurrent downloads of the
+# same content can't both miss each other's row and keep two copies.
+_content_hash_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _content_hash_lock(file_hash: str | None) -> AbstractAsyncContextManager[Any]:
+    """Serialize the check-by-hash-then-save sequence for ``file_hash``."""
+    if not file_hash:
+        return nullcontext()
+    lock = _content_hash_locks.get(file_hash)
+    if lock is None:
+        lock = asyncio.Lock()
+        _content_hash_locks[file_hash] = lock
+    return lock
+
+
 async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with many edge cases
     config: FanslyConfig,
     state: DownloadState,
     mimetype: str,
     filename: Path,
     media_record: Media,
+    *,
+    content_hash: str | None = None,
 ) -> bool:
     """Update a Media record with file information and check for duplicates.
 
@@ -936,6 +1187,8 @@ async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with
         mimetype: The MIME type of the media item
         filename: The full path of the file to examine
         media_record: Media record to update
+        content_hash: Hash computed while streaming the download, used in
+            place of hashing ``filename`` from disk
 
     Returns:
         bool: True if it is a duplicate or False otherwise
@@ -961,7 +1214,9 @@ async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with
             # Calculate hash if needed
             file_hash = None
             if existing_by_id.content_hash is None:
-                file_hash = await _calculate_hash_for_file(filename, mimetype)
+                file_hash = await _calculate_hash_for_file(
+                    filename, mimetype, content_hash
+                )
 
             # First check if filenames match
             if existing_by_id.local_filename == get_filename_only(filename):
@@ -975,41 +1230,45 @@ async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with
             if existing_by_id.local_filename is None:
                 file_hash = None
                 if not file_hash:
-                    file_hash = await _calculate_hash_for_file(filename, mimetype)
-
-                # Before marking as not duplicate, check if hash matches another media
-                if file_hash:
-                    duplicates = await store.find(
-                        Media,
-                        content_hash=file_hash,
-                        id__ne=existing_by_id.id,
-                        is_downloaded=True,
+                    file_hash = await _calculate_hash_for_file(
+                        filename, mimetype, content_hash
                     )
-                    duplicate_media = duplicates[0] if duplicates else None
-                    if duplicate_media:
-                        # Found duplicate by hash - check if its file exists
-                        db_file_exists = await _check_file_exists(
-                            state.download_path, duplicate_media.local_filename or ""
+
+                async with _content_hash_lock(file_hash):
+                    # Before marking as not duplicate, check if hash matches another media
+                    if file_hash:
+                        duplicates = await store.find(
+                            Media,
+                            content_hash=file_hash,
+                            id__ne=existing_by_id.id,
+                            is_downloaded=True,
                         )
-                        if db_file_exists:
-                            # Duplicate exists - update this record to reference it
-                            existing_by_id.content_hash = file_hash
-                            existing_by_id.local_filename = (
-                                duplicate_media.local_filename
+                        duplicate_media = duplicates[0] if duplicates else None
+                        if duplicate_media:
+                            # Found duplicate by hash - check if its file exists
+                            db_file_exists = await _check_file_exists(
+                                state.download_path,
+                                duplicate_media.local_filename or "",
                             )
-                            existing_by_id.is_downloaded = True
-                            await store.save(existing_by_id)
-                            # Remove the new file since it's a duplicate
-                            await asyncio.to_thread(filename.unlink)
-                            return True
+                            if db_file_exists:
+                                # Duplicate exists - update this record to reference it
+                                existing_by_id.content_hash = file_hash
+                                existing_by_id.local_filename = (
+                                    duplicate_media.local_filename
+                                )
+                                existing_by_id.is_downloaded = True
+                                await store.save(existing_by_id)
+                                # Remove the new file since it's a duplicate
+                                await asyncio.to_thread(filename.unlink)
+                                return True
 
-                # No duplicate found - update with new file info
-                existing_by_id.local_filename = get_filename_only(filename)
-                existing_by_id.is_downloaded = True
-                if file_hash:
-                    existing_by_id.content_hash = file_hash
-                await store.save(existing_by_id)
-                return False
+                    # No duplicate found - update with new file info
+                    existing_by_id.local_filename = get_filename_only(filename)
+                    existing_by_id.is_downloaded = True
+                    if file_hash:
+                        existing_by_id.content_hash = file_hash
+                    await store.save(existing_by_id)
+                    return False
 
             # Handle path normalization (compare strings, not str vs Path)
             if existing_by_id.local_filename == str(filename) or get_filename_only(
@@ -1023,7 +1282,9 @@ async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with
             # Different filename but same ID - check if it's actually the same file
             if existing_by_id.content_hash:  # Only if we have a hash to compare
                 if not file_hash:
-                    file_hash = await _calculate_hash_for_file(filename, mimetype)
+                    file_hash = await _calculate_hash_for_file(
+                        filename, mimetype, content_hash
+                    )
 
                 if file_hash and file_hash == existing_by_id.content_hash:
                     # Same content but wrong filename - check if DB's file exists
@@ -1099,7 +1360,9 @@ async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with
 
             # Different filename - check if it's actually the same file
             if existing_by_name.content_hash:  # Only if we have a hash to compare
-                file_hash = await _calculate_hash_for_file(filename, mimetype)
+                file_hash = await _calculate_hash_for_file(
+                    filename, mimetype, content_hash
+                )
 
                 if file_hash and file_hash == existing_by_name.content_hash:
                     # Same content but wrong filename - check if DB's file exists
@@ -1117,50 +1380,60 @@ async def dedupe_media_file(  # noqa: PLR0911 - Complex deduplication logic with
                     return True
 
     # If not in DB or no hash match, calculate hash and update DB
-    file_hash = await _calculate_hash_for_file(filename, mimetype)
-    if file_hash:
-        # Check if hash exists in database
-        media = await store.find_one(Media, content_hash=file_hash)
-        if media:
-            # Found by hash - check if DB's file exists
-            db_file_exists = await _check_file_exists(
-                state.download_path, media.local_filename or ""
-            )
+    file_hash = await _calculate_hash_for_file(filename, mimetype, content_hash)
+    if not file_hash:
+        return False
+    async with _content_hash_lock(file_hash):
+        return await _record_file_hash(state, filename, media_record, file_hash)
 
-            if db_file_exists:
-                # Update current record to reference the existing duplicate file
-                media_record.content_hash = file_hash
-                media_record.local_filename = media.local_filename
-                media_record.is_downloaded = True
-                await store.save(media_record)
 
-                # DB's file exists, this is a duplicate - remove it
-                await asyncio.to_thread(filename.unlink)
-                return True
-            # DB's file is missing but this is the same content - keep new file
-            # Update both the old record and current record to point to new file
-            media.local_filename = get_filename_only(filename)
-            media.is_downloaded = True
-            await store.save(media)
+async def _record_file_hash(
+    state: DownloadState, filename: Path, media_record: Media, file_hash: str
+) -> bool:
+    """Point ``media_record`` at ``filename``, or at an existing copy by hash."""
+    store = get_store()
+    # Check if hash exists in database
+    media = await store.find_one(Media, content_hash=file_hash)
+    if media:
+        # Found by hash - check if DB's file exists
+        db_file_exists = await _check_file_exists(
+            state.download_path, media.local_filename or ""
+        )
 
+        if db_file_exists:
+            # Update current record to reference the existing duplicate file
             media_record.content_hash = file_hash
-            media_record.local_filename = get_filename_only(filename)
+            media_record.local_filename = media.local_filename
             media_record.is_downloaded = True
             await store.save(media_record)
+
+            # DB's file exists, this is a duplicate - remove it
+            await asyncio.to_thread(filename.unlink)
             return True
+        # DB's file is missing but this is the same content - keep new file
+        # Update both the old record and current record to point to new file
+        media.local_filename = get_filename_only(filename)
+        media.is_downloaded = True
+        await store.save(media)
+
+        media_record.content_hash = file_hash
+        media_record.local_filename = get_filename_only(filename)
+        media_record.is_downloaded = True
+        await store.save(media_record)
+        return True
 
-        # No match found, update our media record
-        # Verify file exists before marking as downloaded
-        if await _check_file_exists(state.download_path, get_filename_only(filename)):
-            media_record.content_hash = file_hash
-            media_record.local_filename = get_filename_only(filename)
-            media_record.is_downloaded = True
-            await store.save(media_record)
-        else:
-            # File disappeared between download and verification
-            media_record.is_downloaded = False
-            media_record.content_hash = None
-            media_record.local_filename = None
-            await store.save(media_record)
+    # No match found, update our media record
+    # Verify file exists before marking as downloaded
+    if await _check_file_exists(state.download_path, get_filename_only(filename)):
+        media_record.content_hash = file_hash
+        media_record.local_filename = get_filename_only(filename)
+        media_record.is_downloaded = True
+        await store.save(media_record)
+    else:
+        # File disappeared between download and verification
+        media_record.is_downloaded = False
+        media_record.content_hash = None
+        media_record.local_filename = None
+        await store.save(media_record)
 
     return False
@@ -1,19 +1,29 @@
 """File Name Manipulation Functions"""
 
 import hashlib
+import io
 import re
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import IO
 
 import imagehash
+import numpy as np
+import scipy.fftpack
 from PIL import Image
 
 from errors.mp4 import InvalidMP4Error
-from fileio.mp4 import hash_mp4file
+from fileio.mp4 import MP4StreamHasher, hash_mp4file
 
 
 # turn off for our purpose unnecessary PIL safety features
 Image.MAX_IMAGE_PIXELS = None
 
+# imagehash.phash(hash_size=16) on its default 4x high-frequency factor
+PHASH_SIZE = 16
+_PHASH_THUMBNAIL_SIZE = PHASH_SIZE * 4
+
 
 def extract_media_id(filename: str) -> int | None:
     """Extracts the media_id from an existing file's name."""
@@ -25,35 +35,105 @@ def extract_media_id(filename: str) -> int | None:
     return None
 
 
-def get_hash_for_image(filename: Path) -> str:
+@contextmanager
+def _open_verified_image(filename: Path | IO[bytes]) -> Iterator[IO[bytes]]:
+    """Open and verify an image, yielding the handle rewound for decoding.
+
+    ``verify()`` leaves its Image unusable, so callers reparse from this same
+    handle instead of opening the file a second time.
+
+    Raises:
+        RuntimeError: If the file could not be opened or failed verification
+    """
+    with ExitStack() as stack:
+        try:
+            image_file = (
+                stack.enter_context(filename.open("rb"))
+                if isinstance(filename, Path)
+                else filename
+            )
+            with Image.open(image_file) as verify_img:
+                verify_img.verify()
+        except Exception as e:
+            raise RuntimeError(f"Failed to verify image {filename}: {e}")
+
+        image_file.seek(0)
+        yield image_file
+
+
+def get_hash_for_image(filename: Path | IO[bytes]) -> str:
     """Get hash for an image file.
 
     Args:
-        filename: Path to image file
+        filename: Path to image file, or a seekable binary stream with its bytes
 
     Returns:
         Hash string
 
     Raises:
         RuntimeError: If hash could not be generated
-        OSError: If file could not be opened
     """
-    # First verify the file is valid
-    try:
-        with Image.open(filename) as verify_img:
-            verify_img.verify()
-    except Exception as e:
-        raise RuntimeError(f"Failed to verify image {filename}: {e}")
+    with _open_verified_image(filename) as image_file:
+        try:
+            with Image.open(image_file) as img:
+                hash_result = imagehash.phash(img, hash_size=PHASH_SIZE)
+                if hash_result is None:
+                    raise RuntimeError("Hash generation returned None")
+                return str(hash_result)
+        except Exception as e:
+            raise RuntimeError(f"Failed to hash image {filename}: {e}")
+
+
+def _phash_thumbnail(filename: Path | IO[bytes]) -> np.ndarray:
+    """The grayscale thumbnail `imagehash.phash` computes its DCT over."""
+    with _open_verified_image(filename) as image_file:
+        try:
+            with Image.open(image_file) as img:
+                thumbnail = img.convert("L").resize(
+                    (_PHASH_THUMBNAIL_SIZE, _PHASH_THUMBNAIL_SIZE),
+                    Image.Resampling.LANCZOS,
+                )
+                return np.asarray(thumbnail)
+        except Exception as e:
+            raise RuntimeError(f"Failed to hash image {filename}: {e}")
+
+
+def get_hashes_for_images(
+    filenames: Sequence[Path | IO[bytes]],
+) -> list[str | RuntimeError]:
+    """Hash many images, running the pHash DCTs over all of them at once.
+
+    Each image is verified and decoded once, down to the grayscale thumbnail
+    `imagehash.phash` works on; the thumbnails are then stacked and put
+    through the same `scipy.fftpack.dct` passes and median threshold in one
+    call each. The hashes are identical to `get_hash_for_image`'s.
 
-    # Then open again for hashing (verify closes the file)
-    try:
-        with Image.open(filename) as img:
-            hash_result = imagehash.phash(img, hash_size=16)
-            if hash_result is None:
-                raise RuntimeError("Hash generation returned None")
-            return str(hash_result)
-    except Exception as e:
-        raise RuntimeError(f"Failed to hash image {filename}: {e}")
+    Returns:
+        One entry per file, in order: its hash, or the RuntimeError
+        `get_hash_for_image` would have raised for it.
+    """
+    results: list[str | RuntimeError] = []
+    thumbnails: list[np.ndarray] = []
+    decoded: list[int] = []
+    for filename in filenames:
+        try:
+            thumbnails.append(_phash_thumbnail(filename))
+        except RuntimeError as e:
+            results.append(e)
+        else:
+            decoded.append(len(results))
+            results.append("")
+
+    if thumbnails:
+        pixels = np.stack(thumbnails)
+        dct = scipy.fftpack.dct(scipy.fftpack.dct(pixels, axis=1), axis=2)
+        low_freq = dct[:, :PHASH_SIZE, :PHASH_SIZE]
+        medians = np.median(low_freq.reshape(len(low_freq), -1), axis=1)
+        bits = low_freq > medians[:, None, None]
+        for index, image_bits in zip(decoded, bits, strict=True):
+            results[index] = str(imagehash.ImageHash(image_bits))
+
+    return results
 
 
 def get_hash_for_other_content(filename: Path) -> str:
@@ -80,3 +160,55 @@ def get_hash_for_other_content(filename: Path) -> str:
         raise RuntimeError(f"Failed to hash file {filename}: {e}")
     else:
         return file_hash
+
+
+class StreamingContentHasher:
+    """Computes the dedupe content hash from a download's chunk stream.
+
+    Fed the same chunks that are written to disk so the hash is ready when
+    the stream ends, without reading the file back:
+
+    - video/audio: MP4 box hash via `MP4StreamHasher`, identical to
+      `get_hash_for_other_content`.
+    - image: the bytes are kept in memory (up to `IMAGE_BUFFER_LIMIT`) and
+      pHashed from there, identical to `get_hash_for_image`.
+
+    `result()` returns None whenever the hash can't be produced this way
+    (other mimetypes, oversized images, unusual MP4 layouts, decode
+    failures); callers then hash the file on disk as before.
+    """
+
+    IMAGE_BUFFER_LIMIT = 64 * 1_048_576
+
+    def __init__(self, mimetype: str) -> None:
+        self.image_buffer: bytearray | None = None
+        self.mp4_hasher: MP4StreamHasher | None = None
+        if "image" in mimetype:
+            self.image_buffer = bytearray()
+        elif "video" in mimetype or "audio" in mimetype:
+            self.mp4_hasher = MP4StreamHasher(hashlib.md5(usedforsecurity=False))
+
+    def update(self, chunk: bytes) -> None:
+        """Consume the next downloaded chunk."""
+        if self.mp4_hasher is not None:
+            self.mp4_hasher.update(chunk)
+        elif self.image_buffer is not None:
+            if len(self.image_buffer) + len(chunk) > self.IMAGE_BUFFER_LIMIT:
+                self.image_buffer = None
+            else:
+                self.image_buffer += chunk
+
+    def result(self) -> str | None:
+        """Return the content hash, or None if the file must be hashed instead.
+
+        Image pHashing decodes the whole picture, so call this off the event
+        loop.
+        """
+        if self.mp4_hasher is not None:
+            return self.mp4_hasher.hexdigest()
+        if self.image_buffer:
+            try:
+                return get_hash_for_image(io.BytesIO(self.image_buffer))
+            except RuntimeError:
+                return None
+        return None
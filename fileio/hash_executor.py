@@ -0,0 +1,268 @@
+"""Shared Process Pool for Dedupe Hashing
+
+`dedupe_init` used to start a fresh `multiprocessing.Pool` for every creator
+and pass. With many creators that each have only a few new files, process
+start-up and imports cost more than the hashing. `HashingExecutor` keeps its
+worker processes for the whole run (daemon included) and is shut down once
+at program exit.
+
+Work is split into two lanes:
+
+* the general lane takes images and small files, packed into chunks whose
+  size adapts to how many bytes there are to hash; idle workers pull the
+  next chunk from a shared queue, so a slow chunk never holds up the others
+* the large-file lane takes big videos one at a time on a couple of
+  workers, since these are bound by disk reads and more parallel readers
+  only make the disk seek
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TypeVar
+
+from textio import print_warning
+
+
+__all__ = [
+    "HashingExecutor",
+    "get_hashing_executor",
+    "plan_hash_chunks",
+    "shutdown_hashing_executor",
+]
+
+
+T = TypeVar("T")
+
+FileInfo = tuple[Path, str]
+
+# Files at least this big go to the large-file lane, one per task
+LARGE_FILE_BYTES = 256 * 1024 * 1024
+# Workers in the large-file lane
+LARGE_FILE_WORKERS = 2
+# Bounds for the per-chunk byte budget in the general lane
+_MIN_CHUNK_BYTES = 1 * 1024 * 1024
+_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+# Aim for this many chunks per general worker so the tail stays balanced
+_CHUNKS_PER_WORKER = 4
+# Chunks kept in flight per worker for one caller; the rest wait their turn
+# so concurrent creators share the pool instead of queueing behind each other
+_IN_FLIGHT_PER_WORKER = 2
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks and cgroups)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def default_worker_count() -> int:
+    """Workers for the general lane.
+
+    Half of the usable CPUs, at least 2: hashing is CPU-bound, and the other
+    half stays free for the event loop, downloads and the large-file lane.
+    """
+    return max(2, _available_cpus() // 2)
+
+
+def plan_hash_chunks(
+    file_infos: Iterable[FileInfo],
+    sizes: dict[Path, int],
+    *,
+    workers: int,
+    max_files: int,
+    large_file_bytes: int = LARGE_FILE_BYTES,
+) -> tuple[list[list[FileInfo]], list[list[FileInfo]]]:
+    """Split files into general-lane chunks and large-file tasks.
+
+    General-lane chunks are closed once they hold ``max_files`` files or
+    reach a byte budget of the total bytes spread over
+    ``workers * _CHUNKS_PER_WORKER`` chunks (clamped to 1-64 MiB). Many
+    small files therefore travel together, cutting per-task IPC, while a
+    few medium files still spread over every worker.
+
+    Args:
+        file_infos: Tuples of (file_path, mimetype)
+        sizes: File sizes by path; files without an entry count as empty
+        workers: Workers in the general lane
+        max_files: Most files per general-lane chunk
+        large_file_bytes: Size from which a non-image goes to the large lane
+
+    Returns:
+        (general-lane chunks, large-file tasks); every large-file task is a
+        single-item list
+    """
+    small: list[tuple[FileInfo, int]] = []
+    large: list[list[FileInfo]] = []
+    for info in file_infos:
+        size = sizes.get(info[0], 0)
+        if size >= large_file_bytes and "image" not in info[1]:
+            large.append([info])
+        else:
+            small.append((info, size))
+
+    total_bytes = sum(size for _, size in small)
+    budget = total_bytes // max(1, workers * _CHUNKS_PER_WORKER)
+    budget = min(_MAX_CHUNK_BYTES, max(_MIN_CHUNK_BYTES, budget))
+
+    chunks: list[list[FileInfo]] = []
+    chunk: list[FileInfo] = []
+    chunk_bytes = 0
+    for info, size in small:
+        chunk.append(info)
+        chunk_bytes += size
+        if len(chunk) >= max_files or chunk_bytes >= budget:
+            chunks.append(chunk)
+            chunk = []
+            chunk_bytes = 0
+    if chunk:
+        chunks.append(chunk)
+
+    # Biggest tasks first, so they don't end up as the last straggler
+    large.sort(key=lambda task: sizes.get(task[0][0], 0), reverse=True)
+    return chunks, large
+
+
+class HashingExecutor:
+    """Long-lived process pools for content hashing, one per lane.
+
+    Worker processes are started on first use and kept until `shutdown`.
+    A lane whose pool broke (a worker died) is replaced on the next call.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        large_file_workers: int = LARGE_FILE_WORKERS,
+    ) -> None:
+        self.workers = workers or default_worker_count()
+        self.large_file_workers = max(1, large_file_workers)
+        self._lock = threading.Lock()
+        self._pools: dict[str, concurrent.futures.ProcessPoolExecutor] = {}
+        self._closed = False
+
+    def _pool(self, lane: str) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Hashing executor has been shut down")
+            pool = self._pools.get(lane)
+            if pool is None:
+                pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=(
+                        self.large_file_workers if lane == "large" else self.workers
+                    )
+                )
+                self._pools[lane] = pool
+            return pool
+
+    def _discard_pool(
+        self, lane: str, pool: concurrent.futures.ProcessPoolExecutor
+    ) -> None:
+        with self._lock:
+            if self._pools.get(lane) is pool:
+                del self._pools[lane]
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def map_unordered(
+        self,
+        func: Callable[[list[FileInfo]], list[T]],
+        chunks: Sequence[list[FileInfo]],
+        large_tasks: Sequence[list[FileInfo]] = (),
+    ) -> AsyncIterator[list[T]]:
+        """Run ``func`` over every chunk and yield results as they finish.
+
+        ``chunks`` go to the general lane and ``large_tasks`` to the
+        large-file lane; both lanes run at the same time. Each lane keeps at
+        most ``_IN_FLIGHT_PER_WORKER`` chunks per worker queued for this
+        call.
+
+        Raises:
+            BrokenProcessPool: A worker died; the lane is replaced before
+                the error propagates.
+        """
+        loop = asyncio.get_running_loop()
+        pending: dict[asyncio.Future[list[T]], str] = {}
+        queues = {
+            "general": list(reversed(chunks)),
+            "large": list(reversed(large_tasks)),
+        }
+        limits = {
+            "general": self.workers * _IN_FLIGHT_PER_WORKER,
+            "large": self.large_file_workers * _IN_FLIGHT_PER_WORKER,
+        }
+        in_flight = dict.fromkeys(queues, 0)
+        pools: dict[str, concurrent.futures.ProcessPoolExecutor] = {}
+
+        def fill() -> None:
+            for lane, queue in queues.items():
+                while queue and in_flight[lane] < limits[lane]:
+                    if lane not in pools:
+                        pools[lane] = self._pool(lane)
+                    future = asyncio.wrap_future(
+                        pools[lane].submit(func, queue.pop()), loop=loop
+                    )
+                    pending[future] = lane
+                    in_flight[lane] += 1
+
+        try:
+            fill()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    lane = pending.pop(future)
+                    in_flight[lane] -= 1
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        self._discard_pool(lane, pools[lane])
+                        raise
+                    yield result
+                fill()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        """Stop all worker processes; later calls raise `RuntimeError`."""
+        with self._lock:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            try:
+                pool.shutdown(wait=True, cancel_futures=True)
+            except Exception as e:
+                print_warning(f"Error shutting down hashing pool: {e}")
+
+
+_executor: HashingExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_hashing_executor() -> HashingExecutor:
+    """Get the process-wide hashing executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = HashingExecutor()
+        return _executor
+
+
+def shutdown_hashing_executor() -> None:
+    """Shut down the process-wide hashing executor if one was started.
+
+    Safe to call more than once; a later `get_hashing_executor` starts a
+    new executor.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
@@ -15,7 +15,7 @@ from loguru import logger
 
 from config import FanslyConfig
 from download.downloadstate import DownloadState
-from fileio.dedupe import safe_rglob
+from fileio.dedupe import scan_files
 from fileio.normalize import get_id_from_filename, normalize_filename
 from metadata import AccountMedia, AccountMediaBundle, Media
 from metadata.models import get_store
@@ -158,10 +158,12 @@ async def repair_preview_folder_items(
 
     renamed_paths: list[str] = []
     try:
+        # Collected up front: the loop below renames files inside the tree
         all_files = [
-            f
-            for f in await safe_rglob(state.download_path, "*")
-            if await asyncio.to_thread(f.is_file)
+            entry.path
+            async for batch in scan_files(state.download_path)
+            for entry in batch
+            if entry.is_file
         ]
         for file_path in all_files:
             if not _classify(file_path.name, preview_ids):
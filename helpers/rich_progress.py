@@ -22,6 +22,7 @@ import tempfile
 import threading
 import time
 from collections.abc import Callable, Generator, Iterator
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 from typing import Any, ClassVar
@@ -376,9 +377,13 @@ class ProgressManager:
         self._task_groups: dict[str, str] = {}  # task_name → group_name
         self._lock = threading.Lock()
         self._session_count = 0
-        self.session_stack: list[
-            set[str]
-        ] = []  # Stack of session task sets for auto-cleanup
+        # Task names created in the innermost auto-cleanup session of the
+        # current asyncio task or thread. Context-local rather than a shared
+        # stack, so sessions opened by concurrent workers or creators only
+        # remove their own tasks, whatever order they exit in.
+        self._session_tasks: ContextVar[set[str] | None] = ContextVar(
+            "progress_session_tasks", default=None
+        )
 
     def _get_group(self, name: str) -> Progress:
         """Get the Progress instance for a task by name."""
@@ -403,7 +408,9 @@ class ProgressManager:
         """Context manager for progress session.
 
         Multiple sessions can be nested - the display starts when the first
-        session begins and stops when the last session ends.
+        session begins and stops when the last session ends. Sessions may
+        also overlap across asyncio tasks and threads; each one owns the
+        tasks added from its own context (and from tasks it spawns).
 
         Args:
             auto_cleanup: If True, automatically remove all progress tasks
@@ -420,21 +427,21 @@ class ProgressManager:
                 )
                 self.live.start()
 
-            # Push a new session task set if auto_cleanup is enabled
-            if auto_cleanup:
-                self.session_stack.append(set())
+        # Own a new session task set if auto_cleanup is enabled
+        session_tasks: set[str] = set()
+        token = self._session_tasks.set(session_tasks) if auto_cleanup else None
 
         try:
             yield
         finally:
+            if token is not None:
+                self._session_tasks.reset(token)
             with self._lock:
                 self._session_count -= 1
 
                 # Auto-cleanup: remove all tasks created in this session
-                if auto_cleanup and self.session_stack:
-                    session_tasks = self.session_stack.pop()
-                    for task_name in session_tasks:
-                        self._remove_task_unlocked(task_name)
+                for task_name in session_tasks:
+                    self._remove_task_unlocked(task_name)
 
                 if self._session_count <= 0 and self.live is not None:
                     self.live.stop()
@@ -496,8 +503,9 @@ class ProgressManager:
                 self._task_groups[name] = group_name
 
                 # Track task in current session for auto-cleanup
-                if self.session_stack:
-                    self.session_stack[-1].add(name)
+                session_tasks = self._session_tasks.get()
+                if session_tasks is not None:
+                    session_tasks.add(name)
 
             return name
 
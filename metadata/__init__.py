@@ -11,6 +11,7 @@ from .account import process_account_data, process_media_bundles
 from .attachment import HasAttachments
 from .database import Database
 from .entity_store import OrderBySpec, PostgresEntityStore, SortDirection
+from .file_hash_index import load_file_hash_index, update_file_hash_index
 from .hashtag import extract_hashtags, process_post_hashtags
 from .logging_config import DatabaseLogger, get_db_logger
 from .media import process_media_download, process_media_info
@@ -24,6 +25,7 @@ from .models import (
     ContentType,
     FanslyObject,
     FanslyRecord,
+    FileHashIndex,
     FollowEvent,
     Group,
     Hashtag,
@@ -79,6 +81,7 @@ __all__ = [
     "DatabaseLogger",
     "FanslyObject",
     "FanslyRecord",
+    "FileHashIndex",
     "FollowEvent",
     "Group",
     "HasAttachments",
@@ -113,6 +116,7 @@ __all__ = [
     "get_store",
     "get_stubs",
     "is_stub",
+    "load_file_hash_index",
     "log_missing_relationship",
     "print_missing_relationships_summary",
     "process_account_data",
@@ -131,4 +135,5 @@ __all__ = [
     "record_follow_observation",
     "register_stub",
     "remove_stub",
+    "update_file_hash_index",
 ]
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 from pydantic import JsonValue
 from stash_graphql_client.types import is_set
 
-from helpers.common import JsonDict, expect_dict, expect_int, expect_list
+from helpers.common import JsonDict, batch_list, expect_dict, expect_int, expect_list
 from textio import json_output
 
 from .entity_store import PostgresEntityStore
@@ -29,12 +29,78 @@ if TYPE_CHECKING:
     from download.core import DownloadState
 
 
+async def fetch_truncated_bundle_media(
+    config: FanslyConfig,
+    data: JsonDict,
+) -> list[JsonValue]:
+    """Fetch the accountMedia that *data*'s bundles list but it left out.
+
+    The same truncation ``_backfill_missing_account_media`` repairs, fetched
+    up front so a caller can make the API requests before opening
+    ``store.batch()`` (which holds a pool connection and a transaction) and
+    process the returned items inside it, ahead of the bundles.
+    """
+    store = get_store()
+    present = {
+        expect_int(am_id, "accountMedia id")
+        for item in expect_list(data.get("accountMedia") or [], "accountMedia")
+        if (am_id := expect_dict(item, "accountMedia").get("id")) is not None
+    }
+    missing_ids: list[int] = []
+    for raw_bundle in expect_list(
+        data.get("accountMediaBundles") or [], "accountMediaBundles"
+    ):
+        bundle = expect_dict(raw_bundle, "media bundle")
+        for raw_id in expect_list(
+            bundle.get("accountMediaIds") or [], "accountMediaIds"
+        ):
+            mid = expect_int(raw_id, "accountMediaId")
+            if (
+                mid not in present
+                and mid not in missing_ids
+                and store.get_from_cache(AccountMedia, mid) is None
+            ):
+                missing_ids.append(mid)
+
+    if not missing_ids:
+        return []
+
+    json_output(
+        1,
+        "meta/account - prefetch_truncated_bundles",
+        {"missing_count": len(missing_ids), "missing_ids": missing_ids},
+    )
+
+    media_infos: list[JsonValue] = []
+    try:
+        api = config.get_api()
+        for ids in batch_list(missing_ids, config.BATCH_SIZE):
+            response = await api.get_account_media(",".join(str(mid) for mid in ids))
+            media_infos.extend(
+                expect_list(api.get_json_response_contents(response), "accountMedia")
+            )
+    except Exception:
+        json_output(
+            2,
+            "meta/account - prefetch_api_error",
+            {"missing_ids": missing_ids},
+        )
+    return media_infos
+
+
 async def process_media_bundles_data(
     config: FanslyConfig,
     data: JsonDict,
     id_fields: list[str] | None = None,
+    *,
+    backfill: bool = True,
 ) -> None:
-    """Process media bundles from data."""
+    """Process media bundles from data.
+
+    With ``backfill=False`` truncated bundles are saved with the items
+    already known instead of fetching the rest (see
+    ``fetch_truncated_bundle_media``).
+    """
     if id_fields is None:
         id_fields = ["senderId", "recipientId"]
 
@@ -57,6 +123,7 @@ async def process_media_bundles_data(
             media_bundles=expect_list(
                 data["accountMediaBundles"], "accountMediaBundles"
             ),
+            backfill=backfill,
         )
 
 
@@ -64,6 +131,8 @@ async def _process_single_bundle(
     bundle: JsonDict,
     account_id: int,
     config: FanslyConfig,
+    *,
+    backfill: bool = True,
 ) -> None:
     """Process a single media bundle.
 
@@ -90,7 +159,7 @@ async def _process_single_bundle(
     resolved_ids = {am.id for am in bundle_obj.accountMedia}
     missing_ids = [mid for mid in all_media_ids if mid not in resolved_ids]
 
-    if missing_ids:
+    if missing_ids and backfill:
         await _backfill_missing_account_media(
             config,
             store,
@@ -166,6 +235,8 @@ async def process_media_bundles(
     config: FanslyConfig,
     account_id: int,
     media_bundles: list[JsonValue],
+    *,
+    backfill: bool = True,
 ) -> None:
     """Process media bundles for an account."""
     media_bundles = copy.deepcopy(media_bundles)
@@ -174,6 +245,7 @@ async def process_media_bundles(
             bundle=expect_dict(bundle, "media bundle"),
             account_id=account_id,
             config=config,
+            backfill=backfill,
         )
 
 
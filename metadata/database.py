@@ -142,10 +142,12 @@ class Database:
         self._entity_store = PostgresEntityStore(
             self._asyncpg_pool,
             db_config=db_config,
+            max_entities=config.pg_cache_max_entities,
         )
         self._entity_store.register_models()
 
-        # Preload all entities into identity map so model_validate merges
+        # Preload entities (all, or the configured creators' — see
+        # _preload_account_ids) into identity map so model_validate merges
         # API data with DB state (preserves is_downloaded, content_hash, etc.)
         from .models import (  # noqa: PLC0415  # circular: models → entity_store → database
             Account,
@@ -164,6 +166,9 @@ class Database:
             Wall,
         )
 
+        # Hub rows most entities link to; never evicted under a cache budget
+        self._entity_store.set_pinned(Account)
+
         await self._entity_store.preload(
             [
                 # Leaf entities first (no FK dependencies)
@@ -184,12 +189,34 @@ class Database:
                 Post,
                 Message,
                 Group,
-            ]
+            ],
+            account_ids=await self._preload_account_ids(),
+            # Fetch-ahead connections; leaves headroom in the pool
+            concurrency=max(1, config.pg_pool_size - 2),
         )
 
         db_logger.info("EntityStore initialized with asyncpg pool + preloaded")
         return self._entity_store
 
+    async def _preload_account_ids(self) -> list[int] | None:
+        """Account IDs a scoped preload starts from, or None for a full preload.
+
+        With ``pg_preload_scope: creators``, resolves the configured usernames
+        against the accounts table. Creators not resolved here (new ones, a
+        following list fetched later, daemon work) are loaded on demand by
+        ``PostgresEntityStore.preload_account``.
+        """
+        config = self.config
+        if config.pg_preload_scope != "creators":
+            return None
+        if not config.user_names or config.use_following:
+            return []
+        rows = await self.entity_store.pool.fetch(
+            "SELECT id FROM accounts WHERE lower(username) = ANY($1::text[])",
+            [name.lower() for name in config.user_names],
+        )
+        return [row["id"] for row in rows]
+
     @property
     def entity_store(self) -> PostgresEntityStore:
         """Access the EntityStore. Must call create_entity_store() first."""
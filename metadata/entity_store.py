@@ -2,7 +2,8 @@
 
 Architecture:
 - Local dict for identity map (sync access for Pydantic model_validator;
-  cross-thread consistency via an RLock)
+  cross-thread consistency via an RLock), optionally bounded with LRU
+  eviction of clean entities (``max_entities``)
 - asyncpg pool for stateless DB transport (no sessions, no locks)
 
 Filter syntax mirrors stash-graphql-client's StashEntityStore:
@@ -18,21 +19,27 @@ Filter syntax mirrors stash-graphql-client's StashEntityStore:
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
+import sys
 import threading
 import time
-from collections import defaultdict
+import weakref
+from collections import OrderedDict, defaultdict
 from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
 from datetime import timedelta
 from enum import StrEnum
 from typing import Any, TypedDict, TypeVar
 
 import asyncpg
 from asyncpg.exceptions import UniqueViolationError
+from pydantic import ValidationError
 from stash_graphql_client.types.unset import UnsetType
 
 from config import db_logger
-from helpers.rich_progress import get_progress_manager
+from helpers.rich_progress import ProgressManager, get_progress_manager
 
 from .logging_config import get_db_logger
 from .models import (
@@ -154,7 +161,26 @@ class CacheStats(TypedDict):
     total: int
     by_type: dict[str, int]
     fully_loaded: list[str]
+    loaded_accounts: list[int]
     stats: dict[str, int]
+    max_entities: int | None
+    evicted_alive: int
+    approx_bytes: int
+    preload_timings: dict[str, PreloadTiming]
+
+
+class PreloadTiming(TypedDict):
+    """Per-type result of the last preload, reported by ``cache_stats()``.
+
+    ``fetch_seconds`` is time spent waiting on Postgres (COUNT, association
+    rows, cursor batches); ``validate_seconds`` is time spent building and
+    autolinking models. The two overlap across types, so they don't add up
+    to the preload's wall time.
+    """
+
+    rows: int
+    fetch_seconds: float
+    validate_seconds: float
 
 
 class DbConfig(TypedDict):
@@ -167,6 +193,142 @@ class DbConfig(TypedDict):
     password: str | None
 
 
+class _PreloadFeed:
+    """Rows of one model type streamed from a preload fetch task.
+
+    The fetch task fills ``queue`` with cursor batches and ends it with
+    ``None``; the materializing side reads ``assoc_data`` and
+    ``total_rows`` once the first item has arrived.
+    """
+
+    __slots__ = ("assoc_data", "fetch_seconds", "queue", "total_rows")
+
+    def __init__(self, depth: int) -> None:
+        self.queue: asyncio.Queue[list[asyncpg.Record] | None] = asyncio.Queue(
+            maxsize=depth
+        )
+        self.assoc_data: dict[int, dict[str, Any]] = {}
+        self.total_rows = 0
+        self.fetch_seconds = 0.0
+
+
+class _UnitOfWork:
+    """State of one ``PostgresEntityStore.batch()`` scope.
+
+    ``pending`` keeps saved objects in first-save order (keyed by identity,
+    so re-saving an object doesn't move it); ``touched`` remembers every
+    object already flushed so a rollback can evict them from the cache.
+    """
+
+    __slots__ = ("conn", "flushing", "pending", "store", "task", "touched")
+
+    def __init__(
+        self,
+        store: PostgresEntityStore,
+        conn: asyncpg.pool.PoolConnectionProxy,
+        task: asyncio.Task[Any] | None,
+    ) -> None:
+        self.store = store
+        self.conn = conn
+        self.task = task
+        self.pending: dict[int, FanslyObject] = {}
+        self.touched: list[FanslyObject] = []
+        self.flushing = False
+
+
+# Active batch for the current task (see PostgresEntityStore.batch)
+_current_batch: ContextVar[_UnitOfWork | None] = ContextVar(
+    "entity_store_batch", default=None
+)
+
+# Candidates examined per eviction pass; non-evictable ones are rotated to the
+# MRU end, so a cache full of dirty/pinned entries can't stall cache_instance.
+_EVICT_SCAN_LIMIT = 256
+
+# Entities sampled per type when estimating cache_stats()["approx_bytes"]
+_SIZE_SAMPLE = 50
+
+
+def _approx_entity_size(obj: FanslyObject) -> int:
+    """Rough retained size of one cached entity, in bytes.
+
+    Shallow sizes of the instance, its field dict and values, and its
+    dirty-tracking snapshot. Related entities are excluded (they are
+    counted under their own type).
+    """
+    size = sys.getsizeof(obj) + sys.getsizeof(obj.__dict__)
+    size += sum(
+        sys.getsizeof(v)
+        for v in obj.__dict__.values()
+        if not isinstance(v, FanslyObject)
+    )
+    snapshot = obj._snapshot
+    if snapshot:
+        size += sys.getsizeof(snapshot) + sum(
+            sys.getsizeof(v)
+            for v in snapshot.values()
+            if not isinstance(v, FanslyObject)
+        )
+    return size
+
+
+# Cursor batches buffered per preload fetch task before it waits for the
+# materializing side (bounds memory while tables are fetched ahead)
+_PRELOAD_QUEUE_DEPTH = 4
+
+# Tables owned by one account, by owning column. A scoped preload selects
+# their rows by that column, and lookups filtering on it for a loaded account
+# are served from the cache (see _cache_covers).
+_ACCOUNT_COLUMNS: dict[str, str] = {
+    "accounts": "id",
+    "media": "accountId",
+    "account_media": "accountId",
+    "account_media_bundles": "accountId",
+    "media_stories": "accountId",
+    "media_story_states": "accountId",
+    "timeline_stats": "accountId",
+    "walls": "accountId",
+    "posts": "accountId",
+}
+
+_ACCOUNT_GROUPS_SQL = (
+    'SELECT "groupId" FROM group_users WHERE "accountId" = ANY($1::bigint[])'
+)
+_ACCOUNT_POSTS_SQL = 'SELECT id FROM posts WHERE "accountId" = ANY($1::bigint[])'
+_ACCOUNT_MESSAGES_WHERE = (
+    '"senderId" = ANY($1::bigint[]) OR "recipientId" = ANY($1::bigint[]) '
+    f'OR "groupId" IN ({_ACCOUNT_GROUPS_SQL})'
+)
+
+# Tables reached from an account through a parent row; $1 is the id array
+_ACCOUNT_SCOPE_SQL: dict[str, str] = {
+    "groups": f'"createdBy" = ANY($1::bigint[]) OR id IN ({_ACCOUNT_GROUPS_SQL})',
+    "messages": _ACCOUNT_MESSAGES_WHERE,
+    "post_mentions": f'"postId" IN ({_ACCOUNT_POSTS_SQL})',
+    "attachments": (
+        f'"postId" IN ({_ACCOUNT_POSTS_SQL}) '
+        f'OR "messageId" IN (SELECT id FROM messages WHERE {_ACCOUNT_MESSAGES_WHERE})'
+    ),
+}
+
+
+def _account_scope(table_name: str) -> str | None:
+    """WHERE clause selecting the rows of ``table_name`` reachable from the
+    accounts in ``$1``, or None if the table is not account-scoped (it is
+    then preloaded whole).
+    """
+    column = _ACCOUNT_COLUMNS.get(table_name)
+    if column is not None:
+        return f'"{column}" = ANY($1::bigint[])'
+    return _ACCOUNT_SCOPE_SQL.get(table_name)
+
+
+# FK dependency order: parents before children, used to order batched INSERTs
+_TABLE_RANK: dict[str, int] = {
+    table.name: rank for rank, table in enumerate(core_metadata.sorted_tables)
+}
+
+
 def _normalize_order_by(
     order_by: str | tuple[str, SortDirection] | OrderBySpec | None,
 ) -> OrderBySpec:
@@ -262,24 +424,51 @@ class PostgresEntityStore:
         *,
         db_config: DbConfig | None = None,
         default_ttl: timedelta | int | None = None,
+        max_entities: int | None = None,
     ) -> None:
         self.pool = pool
-        self._cache: dict[tuple[type, int], FanslyObject] = {}
+        # Insertion/recency ordered: with max_entities set, the front is the
+        # least recently used entry (see _evict_lru)
+        self._cache: OrderedDict[tuple[type, int], FanslyObject] = OrderedDict()
+        self._max_entities = max_entities
+        self._pinned: set[type] = set()
+        # Evicted entries still referenced elsewhere (a hub's relationship,
+        # a caller's local). Lookups revive them so identity is preserved;
+        # unreferenced ones are freed by the GC.
+        self._evicted: weakref.WeakValueDictionary[tuple[type, int], FanslyObject] = (
+            weakref.WeakValueDictionary()
+        )
+        self._evictions: dict[type, int] = defaultdict(int)
         self._type_index: dict[type, set[int]] = {}
+        # Hash indexes on each model's __indexed_fields__:
+        # type -> field -> value -> ids, plus the values each cached entry
+        # was indexed under so re-indexing can drop the old buckets.
+        self._field_index: dict[type, dict[str, dict[Any, set[int]]]] = {}
+        self._indexed_values: dict[tuple[type, int], dict[str, Any]] = {}
         if isinstance(default_ttl, int):
             default_ttl = timedelta(seconds=default_ttl)
         self._default_ttl: timedelta | None = default_ttl
         self._type_ttls: dict[type, timedelta | None] = {}
         self._cache_timestamps: dict[tuple[type, int], float] = {}
         self._fully_loaded: set[type] = set()
+        # Scoped preload (preload(account_ids=...)): per-type accounts whose
+        # rows are all cached, the accounts loaded so far, and the model
+        # types preload_account() loads for a further account
+        self._loaded_accounts: dict[type, set[int]] = defaultdict(set)
+        self._preloaded_accounts: set[int] = set()
+        self._scoped_types: list[type[FanslyObject]] | None = None
+        self._preload_timings: dict[str, PreloadTiming] = {}
         self._col_cache: dict[str, set[str]] = {}
+        self._insert_sql_cache: dict[tuple[Any, ...], str] = {}
         self._stats: dict[str, int] = defaultdict(int)
 
-        # Guards the identity-map cluster (_cache, _type_index,
-        # _cache_timestamps, _fully_loaded, _col_cache): worker threads
-        # reach this store from their own event loops (see _get_pool), and
-        # _cache/_type_index/_cache_timestamps must mutate together
-        # atomically — consistency cannot rely on the GIL. RLock because
+        # Guards the identity-map cluster (_cache, _type_index, _field_index,
+        # _indexed_values, _evicted, _evictions, _cache_timestamps,
+        # _fully_loaded, _loaded_accounts, _preloaded_accounts, _scoped_types,
+        # _preload_timings, _col_cache, _insert_sql_cache):
+        # worker threads reach this store from their own event loops (see
+        # _get_pool), and _cache/_type_index/_cache_timestamps must mutate
+        # together atomically — consistency cannot rely on the GIL. RLock because
         # get_from_cache -> invalidate re-enters.
         self._cache_lock = threading.RLock()
 
@@ -381,6 +570,139 @@ class PostgresEntityStore:
             except Exception as e:
                 db_logger.warning(f"Error closing thread pool: {e}")
 
+    # ── Connections / unit of work ───────────────────────────────────
+
+    def _active_batch(self) -> _UnitOfWork | None:
+        """Return the batch owned by the current task on this store, if any.
+
+        Tasks spawned inside a batch inherit the context variable but must
+        not share its connection, so ownership is checked by task.
+        """
+        uow = _current_batch.get()
+        if uow is None or uow.store is not self:
+            return None
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:  # pragma: no cover - no running loop
+            return None
+        return uow if uow.task is task else None
+
+    @asynccontextmanager
+    async def _connection(
+        self,
+    ) -> AsyncIterator[asyncpg.Connection | asyncpg.pool.PoolConnectionProxy]:
+        """Yield a connection for one operation.
+
+        Inside ``batch()`` this is the batch connection, after flushing any
+        deferred saves so reads see them; otherwise a pooled connection.
+        """
+        uow = self._active_batch()
+        if uow is not None:
+            await self._flush(uow)
+            yield uow.conn
+            return
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def _transaction(
+        self,
+    ) -> AsyncIterator[asyncpg.Connection | asyncpg.pool.PoolConnectionProxy]:
+        """Like ``_connection`` but inside a transaction.
+
+        The batch's own transaction already covers writes made inside
+        ``batch()``, so no nested transaction is opened there.
+        """
+        uow = self._active_batch()
+        if uow is not None:
+            await self._flush(uow)
+            yield uow.conn
+            return
+        pool = await self._get_pool()
+        async with pool.acquire() as conn, conn.transaction():
+            yield conn
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Unit of work: defer saves and write them in one transaction.
+
+        Inside the block ``save()`` only caches the object and queues it.
+        Queued objects are flushed on exit, or earlier when the same task
+        reads from the store. A flush INSERTs new rows grouped by table, in
+        FK order, with one ``executemany`` per column set. It then UPDATEs
+        dirty rows and syncs junction tables. Everything runs on one
+        connection and in one transaction.
+
+        Nested ``batch()`` calls join the outer one. If anything raises,
+        the whole batch is rolled back and the objects it wrote are evicted
+        from the identity map, so they are reloaded from the database.
+
+        Example:
+            async with store.batch():
+                for post in page_posts:
+                    await store.save(post)
+        """
+        if self._active_batch() is not None:
+            yield
+            return
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            uow = _UnitOfWork(self, conn, asyncio.current_task())
+            token = _current_batch.set(uow)
+            transaction = conn.transaction()
+            await transaction.start()
+            try:
+                yield
+                await self._flush(uow)
+            except BaseException:
+                await transaction.rollback()
+                for obj in [*uow.touched, *uow.pending.values()]:
+                    if obj.id is not None:
+                        self.invalidate(type(obj), obj.id)
+                raise
+            else:
+                await transaction.commit()
+            finally:
+                _current_batch.reset(token)
+
+    async def _flush(self, uow: _UnitOfWork) -> None:
+        """Write a batch's queued objects (no-op while already flushing)."""
+        if uow.flushing or not uow.pending:
+            return
+        objs = list(uow.pending.values())
+        uow.pending.clear()
+        uow.touched.extend(objs)
+        uow.flushing = True
+        try:
+            # Relationship changes must be read before objects are marked clean
+            assoc_changes = [(obj, self._assoc_changes(obj)) for obj in objs]
+
+            new_objs = [obj for obj in objs if obj._is_new]
+            await self._merge_stored_rows(new_objs)
+            by_table: dict[str, list[FanslyObject]] = defaultdict(list)
+            for obj in new_objs:
+                by_table[type(obj).__table_name__].append(obj)
+            for table_name in sorted(by_table, key=lambda t: _TABLE_RANK.get(t, 0)):
+                await self._insert_rows(uow.conn, table_name, by_table[table_name])
+            for obj in new_objs:
+                obj._is_new = False
+
+            new_ids = {id(obj) for obj in new_objs}
+            for obj in objs:
+                if id(obj) not in new_ids and obj.is_dirty():
+                    await self._update(obj)
+
+            for obj, changes in assoc_changes:
+                if changes:
+                    await self._sync_associations(uow.conn, obj, only_fields=changes)
+
+            for obj in objs:
+                obj.mark_clean()
+        finally:
+            uow.flushing = False
+
     @staticmethod
     def _q(name: str) -> str:
         """Quote a SQL identifier to handle reserved words."""
@@ -413,7 +735,7 @@ class PostgresEntityStore:
         is opt-in (None default); per-type override via ``set_ttl``.
         """
         with self._cache_lock:
-            cached = self._cache.get((model_type, entity_id))
+            cached = self._lookup((model_type, entity_id))
             if cached is not None and self._is_expired(model_type, entity_id):
                 self.invalidate(model_type, entity_id)
                 return None
@@ -441,6 +763,68 @@ class PostgresEntityStore:
             )
         self._type_ttls[model_type] = ttl
 
+    def set_pinned(self, model_type: type, pinned: bool = True) -> None:
+        """Exempt ``model_type`` from LRU eviction (or remove the exemption).
+
+        Only matters with ``max_entities`` set. Pin small hub types that
+        many entities link to (e.g. Account) so they stay fully loaded.
+        """
+        with self._cache_lock:
+            if pinned:
+                self._pinned.add(model_type)
+            else:
+                self._pinned.discard(model_type)
+
+    def _lookup(self, key: tuple[type, int]) -> FanslyObject | None:
+        """Identity-map lookup that records use. Caller holds the lock.
+
+        Moves a hit to the MRU end when the cache is bounded, and revives
+        an evicted entity that is still alive elsewhere.
+        """
+        obj = self._cache.get(key)
+        if obj is not None:
+            if self._max_entities is not None:
+                self._cache.move_to_end(key)
+            return obj
+        obj = self._evicted.pop(key, None)
+        if obj is not None:
+            self._stats["cache_revivals"] += 1
+            self.cache_instance(obj)
+        return obj
+
+    def _evict_lru(self) -> None:
+        """Evict least recently used entries down to ``max_entities``.
+
+        Caller holds the lock. Only clean, persisted entities of unpinned
+        types are evicted; anything else is rotated to the MRU end. An
+        evicted type drops out of ``_fully_loaded`` (and the entity's
+        account out of ``_loaded_accounts``) so cache-first reads fall back
+        to SQL.
+        """
+        budget = self._max_entities
+        if budget is None:
+            return
+        for _ in range(min(len(self._cache), _EVICT_SCAN_LIMIT)):
+            if len(self._cache) <= budget:
+                return
+            key, obj = next(iter(self._cache.items()))
+            if type(obj) in self._pinned or obj._is_new or obj.is_dirty():
+                self._cache.move_to_end(key)
+                continue
+            del self._cache[key]
+            self._cache_timestamps.pop(key, None)
+            self._unindex_fields(key)
+            ids = self._type_index.get(key[0])
+            if ids is not None:
+                ids.discard(key[1])
+            self._evicted[key] = obj
+            self._evictions[key[0]] += 1
+            self._fully_loaded.discard(key[0])
+            column = _ACCOUNT_COLUMNS.get(type(obj).__table_name__)
+            if column is not None and key[0] in self._loaded_accounts:
+                self._loaded_accounts[key[0]].discard(getattr(obj, column, None))
+            self._stats["cache_evictions"] += 1
+
     def _is_expired(self, model_type: type, entity_id: int) -> bool:
         """True if cached entry has exceeded its TTL.
 
@@ -477,8 +861,89 @@ class PostgresEntityStore:
             key = (cls, obj.id)
             with self._cache_lock:
                 self._cache[key] = obj
+                self._evicted.pop(key, None)
                 self._type_index.setdefault(cls, set()).add(obj.id)
                 self._cache_timestamps[key] = time.monotonic()
+                self._index_fields(obj)
+                if self._max_entities is not None:
+                    self._cache.move_to_end(key)
+                    if len(self._cache) > self._max_entities:
+                        self._evict_lru()
+
+    def reindex(self, obj: FanslyObject) -> None:
+        """Refresh ``obj``'s field-index entries after an indexed field changed.
+
+        Called from ``FanslyObject.__setattr__``; a no-op unless ``obj`` is
+        the instance held in the identity map.
+        """
+        if obj.id is None:
+            return
+        with self._cache_lock:
+            if self._cache.get((type(obj), obj.id)) is obj:
+                self._index_fields(obj)
+
+    def _index_fields(self, obj: FanslyObject) -> None:
+        """(Re-)add ``obj`` to its type's field indexes. Caller holds the lock."""
+        cls = type(obj)
+        obj_id = obj.id
+        if not cls.__indexed_fields__ or obj_id is None:
+            return
+        key = (cls, obj_id)
+        self._unindex_fields(key)
+        by_field = self._field_index.setdefault(cls, {})
+        indexed: dict[str, Any] = {}
+        for field in cls.__indexed_fields__:
+            value = getattr(obj, field, None)
+            try:
+                by_field.setdefault(field, {}).setdefault(value, set()).add(obj_id)
+            except TypeError:  # unhashable value: lookups fall back to a scan
+                continue
+            indexed[field] = value
+        self._indexed_values[key] = indexed
+
+    def _unindex_fields(self, key: tuple[type, int]) -> None:
+        """Drop a cache entry from the field indexes. Caller holds the lock."""
+        indexed = self._indexed_values.pop(key, None)
+        if not indexed:
+            return
+        by_field = self._field_index.get(key[0], {})
+        for field, value in indexed.items():
+            buckets = by_field.get(field)
+            ids = buckets.get(value) if buckets is not None else None
+            if ids is None:
+                continue
+            ids.discard(key[1])
+            if not ids:
+                del buckets[value]  # type: ignore[union-attr]
+
+    def _candidate_ids(
+        self, model_type: type, parsed: list[tuple[str, str, Any]]
+    ) -> set[int]:
+        """Cached ids that may match ``parsed``. Caller holds the lock.
+
+        Uses the smallest field-index bucket among the exact-match filters
+        on indexed fields, else every cached id of the type. Callers still
+        run ``_matches_filters`` on each candidate, so an entry indexed
+        under an outdated value is filtered out rather than returned.
+        """
+        by_field = self._field_index.get(model_type)
+        best: set[int] | None = None
+        if by_field:
+            for field, lookup, value in parsed:
+                if lookup != "exact" or field not in by_field:
+                    continue
+                try:
+                    ids = by_field[field].get(value)
+                except TypeError:
+                    continue
+                if ids is None:
+                    ids = set()
+                if best is None or len(ids) < len(best):
+                    best = ids
+        if best is None:
+            return self._type_index.get(model_type, set())
+        self._stats["field_index_hits"] += 1
+        return best
 
     def _autolink_relationships(self, obj: FanslyObject) -> None:
         """Resolve singular ``belongs_to`` relationships from the identity map.
@@ -506,7 +971,7 @@ class PostgresEntityStore:
                     target_type = None
                 if target_type is None:
                     continue
-                cached = self._cache.get((target_type, fk_value))
+                cached = self._lookup((target_type, fk_value))
                 if cached is not None:
                     object.__setattr__(obj, field_name, cached)
                     self._sync_autolink_snapshot(obj, field_name, cached)
@@ -531,6 +996,90 @@ class PostgresEntityStore:
         with self._cache_lock:
             return model_type in self._fully_loaded
 
+    def _cache_covers(
+        self, model_type: type[FanslyObject], parsed: list[tuple[str, str, Any]]
+    ) -> bool:
+        """True if every row matching ``parsed`` is cached. Caller holds the lock.
+
+        Either the whole type is loaded, or an exact filter on the type's
+        owning-account column names an account a scoped preload loaded.
+        """
+        if model_type in self._fully_loaded:
+            return True
+        loaded = self._loaded_accounts.get(model_type)
+        if not loaded:
+            return False
+        column = _ACCOUNT_COLUMNS.get(model_type.__table_name__)
+        return any(
+            field == column
+            and lookup == "exact"
+            and isinstance(value, int)
+            and value in loaded
+            for field, lookup, value in parsed
+        )
+
+    def _may_be_stored(self, obj: FanslyObject) -> bool:
+        """True if a new ``obj`` may already have a row. Caller holds the lock.
+
+        An identity-map miss only proves a row is absent while the cache
+        covers the type, as in ``_cache_covers``. Otherwise the row may
+        have been evicted or never preloaded (``pg_preload_scope``), and
+        the object built from API data only has defaults for DB-only
+        fields.
+        """
+        model_type = type(obj)
+        if model_type in self._fully_loaded:
+            return False
+        loaded = self._loaded_accounts.get(model_type)
+        column = _ACCOUNT_COLUMNS.get(model_type.__table_name__)
+        return not (loaded and column and getattr(obj, column, None) in loaded)
+
+    async def _merge_stored_rows(self, objs: list[FanslyObject]) -> None:
+        """Fill fields the API did not set on new objects from existing rows.
+
+        Runs before new objects are written. Objects that may already be in
+        the DB (see ``_may_be_stored``) are looked up by primary key, one
+        query per type, and every column not in ``model_fields_set`` (nor a
+        relationship FK) takes the stored value. This is the identity-map
+        validator's merge rule, applied after a cache miss, so e.g. a Media
+        keeps ``is_downloaded`` / ``content_hash`` / ``local_filename``.
+        """
+        by_type: dict[type[FanslyObject], dict[Any, FanslyObject]] = defaultdict(dict)
+        with self._cache_lock:
+            for obj in objs:
+                if obj.id is not None and self._may_be_stored(obj):
+                    pk_col = self._pk_column(type(obj))
+                    by_type[type(obj)][getattr(obj, pk_col)] = obj
+        if not by_type:
+            return
+
+        async with self._connection() as conn:
+            for model_type, by_pk in by_type.items():
+                pk_col = self._pk_column(model_type)
+                rows = await conn.fetch(
+                    f"SELECT * FROM {model_type.__table_name__} "
+                    f"WHERE {self._q(pk_col)} = ANY($1)",
+                    list(by_pk),
+                )
+                self._stats["stored_row_lookups"] += len(by_pk)
+                relationships = model_type.__relationships__
+                fk_columns = {m.fk_column for m in relationships.values()}
+                for row in rows:
+                    obj = by_pk[row[pk_col]]
+                    explicit = obj.model_fields_set
+                    for column, value in row.items():
+                        if (
+                            column in explicit
+                            or column in relationships
+                            or column in fk_columns
+                            or column not in model_type.model_fields
+                        ):
+                            continue
+                        # A value only the model validator can coerce (an
+                        # enum stored by name) keeps the object's value.
+                        with suppress(ValidationError):
+                            setattr(obj, column, value)
+
     # ── In-memory filter (lambda predicate) ──────────────────────────
 
     def filter(
@@ -561,7 +1110,7 @@ class PostgresEntityStore:
     async def get(self, model_type: type[T], entity_id: int) -> T | None:
         """Get by ID. Local cache -> DB."""
         with self._cache_lock:
-            cached = self._cache.get((model_type, entity_id))
+            cached = self._lookup((model_type, entity_id))
         if cached is not None:
             self._stats["get_cache_hits"] += 1
             return cached  # type: ignore[return-value]
@@ -599,8 +1148,8 @@ class PostgresEntityStore:
 
         results: list[T]
         with self._cache_lock:
-            if model_type in self._fully_loaded:
-                ids = self._type_index.get(model_type, set())
+            if self._cache_covers(model_type, parsed):
+                ids = self._candidate_ids(model_type, parsed)
                 results = [
                     obj
                     for eid in ids
@@ -647,8 +1196,8 @@ class PostgresEntityStore:
             self._validate_order_by(model_type, sort_spec)
 
         with self._cache_lock:
-            if model_type in self._fully_loaded:
-                ids = self._type_index.get(model_type, set())
+            if self._cache_covers(model_type, parsed):
+                ids = self._candidate_ids(model_type, parsed)
                 if sort_spec:
                     matches = [
                         obj
@@ -690,8 +1239,8 @@ class PostgresEntityStore:
         parsed = [(*_parse_lookup(k), v) for k, v in filters.items()]
 
         with self._cache_lock:
-            if model_type in self._fully_loaded:
-                ids = self._type_index.get(model_type, set())
+            if self._cache_covers(model_type, parsed):
+                ids = self._candidate_ids(model_type, parsed)
                 return sum(
                     1
                     for eid in ids
@@ -704,8 +1253,8 @@ class PostgresEntityStore:
         conditions, params, _idx = self._build_where_clauses(tbl, parsed)
         if conditions:
             sql += " WHERE " + " AND ".join(conditions)
-        pool = await self._get_pool()
-        return await pool.fetchval(sql, *params)
+        async with self._connection() as conn:
+            return await conn.fetchval(sql, *params)
 
     async def find_iter(
         self,
@@ -727,8 +1276,8 @@ class PostgresEntityStore:
 
         matched: list[T] | None = None
         with self._cache_lock:
-            if model_type in self._fully_loaded:
-                ids = self._type_index.get(model_type, set())
+            if self._cache_covers(model_type, parsed):
+                ids = self._candidate_ids(model_type, parsed)
                 matched = [
                     obj
                     for eid in ids
@@ -797,7 +1346,7 @@ class PostgresEntityStore:
         missing_ids: list[int] = []
         with self._cache_lock:
             for eid in entity_ids:
-                cached = self._cache.get((model_type, eid))
+                cached = self._lookup((model_type, eid))
                 if cached is not None:
                     self._stats["get_many_cache_hits"] += 1
                     results.append(cached)  # type: ignore[arg-type]
@@ -810,8 +1359,8 @@ class PostgresEntityStore:
         pk_col = self._pk_column(model_type)
         table_name = model_type.__table_name__
         sql = f"SELECT * FROM {table_name} WHERE {self._q(pk_col)} = ANY($1)"
-        pool = await self._get_pool()
-        rows = await pool.fetch(sql, missing_ids)
+        async with self._connection() as conn:
+            rows = await conn.fetch(sql, missing_ids)
         self._stats["get_many_pg_hits"] += len(rows)
         self._stats["get_many_misses"] += len(missing_ids) - len(rows)
         for row in rows:
@@ -838,7 +1387,18 @@ class PostgresEntityStore:
         2. INSERT/UPDATE the entity itself (scalar columns only,
            junction sync happens after related entities are saved).
         3. Sync junction table rows (both sides now exist in DB).
+
+        Inside ``batch()`` the object is cached and queued instead (along
+        with new related entities); the writes happen at flush time.
         """
+        uow = self._active_batch()
+        if uow is not None and not (obj._is_new and obj.id is None):
+            uow.pending.setdefault(id(obj), obj)
+            self.cache_instance(obj)
+            for related in self._new_assoc_related(obj):
+                await self.save(related)
+            return
+
         # Step 1: INSERT/UPDATE entity row (scalars only, no junctions yet)
         if obj._is_new:
             await self._insert_row(obj)
@@ -849,6 +1409,19 @@ class PostgresEntityStore:
         # Step 2: Save related entities for junction tables.
         # Now that the parent entity exists in DB, related entities
         # can safely reference it via FK (e.g., Media.accountId).
+        for related in self._new_assoc_related(obj):
+            await self.save(related)
+
+        # Step 3: Sync junction table rows (both sides now exist in DB)
+        await self._sync_assoc_tables(obj)
+
+        self.cache_instance(obj)
+        obj.mark_clean()
+
+    @staticmethod
+    def _new_assoc_related(obj: FanslyObject) -> list[FanslyObject]:
+        """Unsaved entities referenced through ``obj``'s junction tables."""
+        found: list[FanslyObject] = []
         for field_name, meta in type(obj).__relationships__.items():
             if not meta.assoc_table:
                 continue
@@ -856,20 +1429,78 @@ class PostgresEntityStore:
             if related is None:
                 continue
             if meta.is_list and isinstance(related, list):
-                for r in related:
-                    if isinstance(r, FanslyObject) and r._is_new:
-                        await self.save(r)
+                found.extend(
+                    r for r in related if isinstance(r, FanslyObject) and r._is_new
+                )
             elif isinstance(related, FanslyObject) and related._is_new:
-                await self.save(related)
+                found.append(related)
+        return found
+
+    def _upsert_sql(
+        self, table_name: str, columns: tuple[str, ...], pk_col: str
+    ) -> str:
+        """Return the cached idempotent INSERT for a column set.
+
+        ON CONFLICT DO UPDATE makes the save idempotent when the identity
+        map and the DB disagree — e.g., cache eviction (TTL, the
+        ``max_entities`` budget, a validation-error leak), or concurrent
+        writes from another process/task. EXCLUDED.col refers to the row
+        that WOULD have been inserted. Stored values of fields the API
+        does not send were merged into the object beforehand (see
+        ``_merge_stored_rows``).
+        """
+        key = (f"{table_name}:upsert", columns)
+        with self._cache_lock:
+            sql = self._insert_sql_cache.get(key)
+            if sql is None:
+                col_names = ", ".join(self._q(c) for c in columns)
+                placeholders = ", ".join(f"${i + 1}" for i in range(len(columns)))
+                update_cols = [c for c in columns if c != pk_col]
+                if update_cols:
+                    update_clause = ", ".join(
+                        f"{self._q(c)} = EXCLUDED.{self._q(c)}" for c in update_cols
+                    )
+                    conflict = f"DO UPDATE SET {update_clause}"
+                else:
+                    conflict = "DO NOTHING"
+                sql = (
+                    f"INSERT INTO {table_name} ({col_names}) "
+                    f"VALUES ({placeholders}) "
+                    f"ON CONFLICT ({self._q(pk_col)}) {conflict}"
+                )
+                self._insert_sql_cache[key] = sql
+            return sql
 
-        # Step 3: Sync junction table rows (both sides now exist in DB)
-        await self._sync_assoc_tables(obj)
+    async def _insert_rows(
+        self,
+        conn: asyncpg.Connection | asyncpg.pool.PoolConnectionProxy,
+        table_name: str,
+        objs: list[FanslyObject],
+    ) -> None:
+        """Upsert many objects of one table, one executemany per column set.
 
-        self.cache_instance(obj)
-        obj.mark_clean()
+        Rows go in primary-key order so concurrent batches take row locks
+        in the same order (no table has a self-referencing FK).
+        """
+        cols = self._table_columns(table_name)
+        pk_col = self._pk_column(type(objs[0]))
+        runs: list[tuple[tuple[str, ...], list[list[Any]]]] = []
+        for obj in sorted(objs, key=lambda o: getattr(o, pk_col)):
+            data = obj.to_db_dict()
+            columns = tuple(k for k in data if k in cols)
+            if not columns:
+                continue
+            values = [data[k] for k in columns]
+            if runs and runs[-1][0] == columns:
+                runs[-1][1].append(values)
+            else:
+                runs.append((columns, [values]))
+        for columns, rows in runs:
+            await conn.executemany(self._upsert_sql(table_name, columns, pk_col), rows)
 
     async def _insert_row(self, obj: FanslyObject) -> None:
         """INSERT scalar columns only (no junction sync)."""
+        await self._merge_stored_rows([obj])
         data = obj.to_db_dict()
         table_name = type(obj).__table_name__
         cols = self._table_columns(table_name)
@@ -878,13 +1509,9 @@ class PostgresEntityStore:
         if not table_data:
             return
 
-        col_names = [self._q(k) for k in table_data]
-        values = list(table_data.values())
-        placeholders = [f"${i + 1}" for i in range(len(values))]
         pk_col = self._pk_column(type(obj))
 
-        pool = await self._get_pool()
-        async with pool.acquire() as conn, conn.transaction():
+        async with self._transaction() as conn:
             if obj.id is None and pk_col == "id":
                 # Auto-increment (Hashtag): omit id column so PG generates it
                 table_data.pop("id", None)
@@ -895,33 +1522,18 @@ class PostgresEntityStore:
                     f"INSERT INTO {table_name} ({', '.join(col_names)}) "
                     f"VALUES ({', '.join(placeholders)}) RETURNING id"
                 )
-                new_id = await conn.fetchval(sql, *values)
+                if self._active_batch() is not None:
+                    # Savepoint: a unique violation (get_or_create race)
+                    # must not abort the whole batch transaction
+                    async with conn.transaction():
+                        new_id = await conn.fetchval(sql, *values)
+                else:
+                    new_id = await conn.fetchval(sql, *values)
                 obj.id = new_id
             else:
                 # Snowflake ID or non-id PK: UPSERT with provided ID.
-                # ON CONFLICT DO UPDATE makes the save idempotent when the
-                # identity map and the DB disagree — e.g., cache eviction
-                # from a validation-error leak, or concurrent writes from
-                # another process/task. EXCLUDED.col refers to the row that
-                # WOULD have been inserted.
-                update_cols = [k for k in table_data if k != pk_col]
-                if update_cols:
-                    update_clause = ", ".join(
-                        f"{self._q(k)} = EXCLUDED.{self._q(k)}" for k in update_cols
-                    )
-                    sql = (
-                        f"INSERT INTO {table_name} ({', '.join(col_names)}) "
-                        f"VALUES ({', '.join(placeholders)}) "
-                        f"ON CONFLICT ({self._q(pk_col)}) "
-                        f"DO UPDATE SET {update_clause}"
-                    )
-                else:
-                    sql = (
-                        f"INSERT INTO {table_name} ({', '.join(col_names)}) "
-                        f"VALUES ({', '.join(placeholders)}) "
-                        f"ON CONFLICT ({self._q(pk_col)}) DO NOTHING"
-                    )
-                await conn.execute(sql, *values)
+                sql = self._upsert_sql(table_name, tuple(table_data), pk_col)
+                await conn.execute(sql, *table_data.values())
 
     async def _update(self, obj: FanslyObject) -> None:
         """UPDATE only changed scalar fields (no junction sync)."""
@@ -942,8 +1554,7 @@ class PostgresEntityStore:
         if not scalar_data:
             return
 
-        pool = await self._get_pool()
-        async with pool.acquire() as conn, conn.transaction():
+        async with self._transaction() as conn:
             set_parts = []
             vals: list[Any] = []
             for i, (col, val) in enumerate(scalar_data.items(), 1):
@@ -958,30 +1569,36 @@ class PostgresEntityStore:
             )
             await conn.execute(sql, *vals)
 
-    async def _sync_assoc_tables(self, obj: FanslyObject) -> None:
-        """Sync all junction tables for an entity.
+    @staticmethod
+    def _assoc_changes(obj: FanslyObject) -> set[str]:
+        """Relationship fields whose junction rows need syncing.
 
-        Called by save() after the entity row and related entities are
-        all in the DB. Determines which relationship fields changed
-        and delegates to _sync_associations for the actual SQL.
+        For new entities (just inserted), every assoc_table relationship
+        with data; for existing entities, only the changed ones.
         """
         rel_keys = set(obj.__relationships__.keys())
         changed = obj.get_changed_fields()
         rel_changes = {k for k in changed if k in rel_keys}
 
-        # For new entities (just inserted), sync ALL assoc_table relationships
-        # For existing entities, only sync changed ones
         if not rel_changes:
             # Check if any assoc_table relationships have data (new entity path)
             for field_name, meta in type(obj).__relationships__.items():
                 if meta.assoc_table and getattr(obj, field_name, None) is not None:
                     rel_changes.add(field_name)
+        return rel_changes
 
+    async def _sync_assoc_tables(self, obj: FanslyObject) -> None:
+        """Sync all junction tables for an entity.
+
+        Called by save() after the entity row and related entities are
+        all in the DB. Determines which relationship fields changed
+        and delegates to _sync_associations for the actual SQL.
+        """
+        rel_changes = self._assoc_changes(obj)
         if not rel_changes:
             return
 
-        pool = await self._get_pool()
-        async with pool.acquire() as conn, conn.transaction():
+        async with self._transaction() as conn:
             await self._sync_associations(conn, obj, only_fields=rel_changes)
 
     async def _sync_associations(
@@ -1223,8 +1840,7 @@ class PostgresEntityStore:
                 {"postId": 456, "pos": 1, "createdAt": dt2},
             ])
         """
-        pool = await self._get_pool()
-        async with pool.acquire() as conn, conn.transaction():
+        async with self._transaction() as conn:
             await conn.execute(
                 f"DELETE FROM {assoc_table} WHERE {self._q(owner_fk)} = $1",
                 owner_id,
@@ -1254,11 +1870,11 @@ class PostgresEntityStore:
         pk_col = self._pk_column(type(obj))
         pk_value = getattr(obj, pk_col)
         table_name = type(obj).__table_name__
-        pool = await self._get_pool()
-        await pool.execute(
-            f"DELETE FROM {table_name} WHERE {self._q(pk_col)} = $1",
-            pk_value,
-        )
+        async with self._connection() as conn:
+            await conn.execute(
+                f"DELETE FROM {table_name} WHERE {self._q(pk_col)} = $1",
+                pk_value,
+            )
         self.invalidate(type(obj), obj.id)
 
     async def delete_many(self, model_type: type[T], ids: list[int]) -> int:
@@ -1267,11 +1883,11 @@ class PostgresEntityStore:
             return 0
         pk_col = self._pk_column(model_type)
         table_name = model_type.__table_name__
-        pool = await self._get_pool()
-        await pool.execute(
-            f"DELETE FROM {table_name} WHERE {self._q(pk_col)} = ANY($1)",
-            ids,
-        )
+        async with self._connection() as conn:
+            await conn.execute(
+                f"DELETE FROM {table_name} WHERE {self._q(pk_col)} = ANY($1)",
+                ids,
+            )
         for entity_id in ids:
             self.invalidate(model_type, entity_id)
         return len(ids)
@@ -1293,25 +1909,28 @@ class PostgresEntityStore:
             f"INSERT INTO {table_name} ({', '.join(col_names)}) "
             f"VALUES ({', '.join(placeholders)}) ON CONFLICT DO NOTHING"
         )
-        pool = await self._get_pool()
-        await pool.execute(sql, *values)
+        async with self._connection() as conn:
+            await conn.execute(sql, *values)
 
     async def delete_record(
         self,
         record_type: type[FanslyRecord],
         **pk_filters: Any,
     ) -> bool:
-        """DELETE a FanslyRecord by composite PK."""
+        """DELETE FanslyRecords by composite PK.
+
+        Filters take the ``find`` lookups, so ``path__in=[...]`` deletes
+        several rows in one statement.
+        """
         table_name = record_type.__table_name__
-        conditions = []
-        params = []
-        for i, (col, val) in enumerate(pk_filters.items(), 1):
-            conditions.append(f"{self._q(col)} = ${i}")
-            params.append(val)
+        conditions, params, _idx = self._build_where_clauses(
+            table_name,
+            [(*_parse_lookup(key), value) for key, value in pk_filters.items()],
+        )
 
         sql = f"DELETE FROM {table_name} WHERE {' AND '.join(conditions)}"
-        pool = await self._get_pool()
-        result = await pool.execute(sql, *params)
+        async with self._connection() as conn:
+            result = await conn.execute(sql, *params)
         return result != "DELETE 0"
 
     async def find_records(
@@ -1329,38 +1948,69 @@ class PostgresEntityStore:
             params.append(val)
         if conditions:
             sql += " WHERE " + " AND ".join(conditions)
-        pool = await self._get_pool()
-        rows = await pool.fetch(sql, *params)
+        async with self._connection() as conn:
+            rows = await conn.fetch(sql, *params)
         return [dict(row) for row in rows]
 
     # ── Bulk operations ──────────────────────────────────────────────
 
+    def _insert_sql(self, table_name: str, columns: tuple[str, ...]) -> str:
+        """Return the ``INSERT ... ON CONFLICT DO NOTHING`` for a column set.
+
+        The SQL text is cached per (table, columns) so asyncpg's per-connection
+        statement cache keeps reusing one prepared statement for it.
+        """
+        key = (table_name, columns)
+        with self._cache_lock:
+            sql = self._insert_sql_cache.get(key)
+            if sql is None:
+                placeholders = [f"${i + 1}" for i in range(len(columns))]
+                sql = (
+                    f"INSERT INTO {table_name} "
+                    f"({', '.join(self._q(c) for c in columns)}) "
+                    f"VALUES ({', '.join(placeholders)}) "
+                    f"ON CONFLICT DO NOTHING"
+                )
+                self._insert_sql_cache[key] = sql
+            return sql
+
+    async def _bulk_insert(self, table_name: str, items: list[dict[str, Any]]) -> None:
+        """INSERT ... ON CONFLICT DO NOTHING for many rows in one transaction.
+
+        Consecutive items with the same column set go out as a single
+        ``executemany`` (one prepared statement, pipelined binds) instead of
+        one round-trip per row. Runs are split only where the column set
+        changes, so rows still land in input order and the first of two
+        conflicting rows wins, as with per-row inserts. Items with no
+        matching columns are skipped.
+        """
+        if not items:
+            return
+        cols = self._table_columns(table_name)
+        runs: list[tuple[tuple[str, ...], list[list[Any]]]] = []
+        for item in items:
+            columns = tuple(k for k in item if k in cols)
+            if not columns:
+                continue
+            values = [item[k] for k in columns]
+            if runs and runs[-1][0] == columns:
+                runs[-1][1].append(values)
+            else:
+                runs.append((columns, [values]))
+        if not runs:
+            return
+
+        async with self._transaction() as conn:
+            for columns, rows in runs:
+                await conn.executemany(self._insert_sql(table_name, columns), rows)
+
     async def bulk_upsert(
         self,
         model_type: type[T],
         items: list[dict[str, Any]],
     ) -> None:
         """Bulk INSERT ... ON CONFLICT DO NOTHING for entity dicts."""
-        if not items:
-            return
-        table_name = model_type.__table_name__
-        cols = self._table_columns(table_name)
-
-        pool = await self._get_pool()
-        async with pool.acquire() as conn, conn.transaction():
-            for item in items:
-                table_data = {k: v for k, v in item.items() if k in cols}
-                if not table_data:
-                    continue
-                col_names = [self._q(k) for k in table_data]
-                values = list(table_data.values())
-                placeholders = [f"${i + 1}" for i in range(len(values))]
-                sql = (
-                    f"INSERT INTO {table_name} ({', '.join(col_names)}) "
-                    f"VALUES ({', '.join(placeholders)}) "
-                    f"ON CONFLICT DO NOTHING"
-                )
-                await conn.execute(sql, *values)
+        await self._bulk_insert(model_type.__table_name__, items)
 
     async def bulk_upsert_records(
         self,
@@ -1368,24 +2018,7 @@ class PostgresEntityStore:
         items: list[dict[str, Any]],
     ) -> None:
         """Bulk INSERT ... ON CONFLICT DO NOTHING for junction/record tables."""
-        if not items:
-            return
-        cols = self._table_columns(table_name)
-        pool = await self._get_pool()
-        async with pool.acquire() as conn, conn.transaction():
-            for item in items:
-                table_data = {k: v for k, v in item.items() if k in cols}
-                if not table_data:
-                    continue
-                col_names = [self._q(k) for k in table_data]
-                values = list(table_data.values())
-                placeholders = [f"${i + 1}" for i in range(len(values))]
-                sql = (
-                    f"INSERT INTO {table_name} ({', '.join(col_names)}) "
-                    f"VALUES ({', '.join(placeholders)}) "
-                    f"ON CONFLICT DO NOTHING"
-                )
-                await conn.execute(sql, *values)
+        await self._bulk_insert(table_name, items)
 
     # ── Preload ──────────────────────────────────────────────────────
 
@@ -1393,6 +2026,9 @@ class PostgresEntityStore:
         self,
         model_types: list[type[FanslyObject]],
         batch_size: int = 500,
+        *,
+        account_ids: list[int] | None = None,
+        concurrency: int = 3,
     ) -> None:
         """Bulk load DB -> local cache.
 
@@ -1402,7 +2038,25 @@ class PostgresEntityStore:
         Rows are fetched via a server-side cursor in batches of
         *batch_size* (default 500) to provide progress feedback and
         reduce peak memory usage for large tables.
+
+        Up to *concurrency* tables are fetched at once, each on its own pool
+        connection, while earlier tables are validated. Validation and
+        autolinking still run one type at a time in list order, since
+        they resolve relationships from the types already cached. Per-type
+        timings land in ``cache_stats()["preload_timings"]``.
+
+        With *account_ids*, account-scoped tables (see ``_account_scope``)
+        only load the rows reachable from those accounts and record a
+        per-account marker instead of ``_fully_loaded``; other tables load
+        whole. The store keeps *model_types* so ``preload_account`` can
+        load further accounts on demand.
         """
+        scope = None if account_ids is None else sorted(set(account_ids))
+        with self._cache_lock:
+            if scope is not None:
+                self._scoped_types = list(model_types)
+                self._preloaded_accounts.update(scope)
+
         progress = get_progress_manager()
 
         with progress.session():
@@ -1412,68 +2066,240 @@ class PostgresEntityStore:
                 total=len(model_types),
                 show_elapsed=True,
             )
+            await self._run_preload(
+                model_types,
+                batch_size,
+                scope,
+                concurrency,
+                progress=progress,
+                on_type_done=lambda: progress.update_task(models_task, advance=1),
+            )
 
-            for model_type in model_types:
-                db_logger.info(f"Preloading {model_type.__name__}...")
+    async def preload_account(self, account_id: int, batch_size: int = 500) -> None:
+        """Load one account's rows on demand after a scoped preload.
+
+        No-op after a full preload, or when the account is already loaded.
+        Tables that are not account-scoped were loaded whole by ``preload``
+        and are skipped.
+        """
+        with self._cache_lock:
+            model_types = self._scoped_types
+            if model_types is None or account_id in self._preloaded_accounts:
+                return
+            # Claimed up front so concurrent callers don't load it twice
+            self._preloaded_accounts.add(account_id)
 
-                # Pre-fetch all M2M associations for this type
-                assoc_data = await self._fetch_all_associations(model_type)
+        db_logger.info(f"Loading account {account_id} on demand...")
+        try:
+            await self._run_preload(
+                [t for t in model_types if _account_scope(t.__table_name__)],
+                batch_size,
+                [account_id],
+                concurrency=1,
+            )
+        except BaseException:
+            with self._cache_lock:
+                self._preloaded_accounts.discard(account_id)
+            raise
 
-                table_name = model_type.__table_name__
-                pool = await self._get_pool()
+    async def _run_preload(
+        self,
+        model_types: list[type[FanslyObject]],
+        batch_size: int,
+        scope: list[int] | None,
+        concurrency: int,
+        *,
+        progress: ProgressManager | None = None,
+        on_type_done: Callable[[], None] | None = None,
+    ) -> None:
+        """Fetch tables ahead of a strictly ordered materialize loop.
 
-                # Get total row count for the per-model progress bar
-                total_rows = await pool.fetchval(f"SELECT COUNT(*) FROM {table_name}")
+        A fetch task is started for each of the next *concurrency* types
+        not yet materialized, so at most that many pool connections are
+        busy and the type being materialized always has one.
+        """
+        plans = [
+            (
+                model_type,
+                _account_scope(model_type.__table_name__)
+                if scope is not None
+                else None,
+            )
+            for model_type in model_types
+        ]
+        feeds = [_PreloadFeed(_PRELOAD_QUEUE_DEPTH) for _ in plans]
+        fetches: list[asyncio.Task[None]] = []
+
+        def start_fetch(index: int) -> None:
+            model_type, where = plans[index]
+            fetches.append(
+                asyncio.create_task(
+                    self._fetch_preload_rows(
+                        model_type,
+                        where,
+                        [scope] if where is not None else [],
+                        batch_size,
+                        feeds[index],
+                        count_rows=progress is not None,
+                    ),
+                    name=f"preload-{model_type.__name__}",
+                )
+            )
 
+        try:
+            for index in range(min(max(1, concurrency), len(plans))):
+                start_fetch(index)
+            for index, (model_type, where) in enumerate(plans):
+                db_logger.info(f"Preloading {model_type.__name__}...")
+                timing = await self._materialize_preload_rows(
+                    model_type, where, scope, feeds[index], fetches[index], progress
+                )
+                with self._cache_lock:
+                    self._preload_timings[model_type.__name__] = timing
+                db_logger.info(
+                    f"  {model_type.__name__}: {timing['rows']} entities loaded "
+                    f"(fetch {timing['fetch_seconds']:.2f}s, "
+                    f"validate {timing['validate_seconds']:.2f}s)"
+                )
+                if on_type_done is not None:
+                    on_type_done()
+                if len(fetches) < len(plans):
+                    start_fetch(len(fetches))
+        finally:
+            for task in fetches:
+                task.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
+
+    async def _fetch_preload_rows(
+        self,
+        model_type: type[FanslyObject],
+        where: str | None,
+        params: list[Any],
+        batch_size: int,
+        feed: _PreloadFeed,
+        *,
+        count_rows: bool,
+    ) -> None:
+        """Stream one table into ``feed`` (fetch side of ``_run_preload``).
+
+        Always ends the queue with ``None``, so the materializing side
+        never waits on a fetch that failed; it re-raises the failure from
+        the task.
+        """
+        sql = f"SELECT * FROM {model_type.__table_name__}"
+        if where is not None:
+            sql += f" WHERE {where}"
+        try:
+            started = time.monotonic()
+            # Pre-fetch all M2M associations for this type
+            feed.assoc_data = await self._fetch_all_associations(
+                model_type, where, params
+            )
+            pool = await self._get_pool()
+            # Stream rows in batches via server-side cursor
+            async with pool.acquire() as conn, conn.transaction(readonly=True):
+                if count_rows:
+                    # Total row count for the per-model progress bar
+                    feed.total_rows = (
+                        await conn.fetchval(
+                            sql.replace("SELECT *", "SELECT COUNT(*)", 1), *params
+                        )
+                        or 0
+                    )
+                cursor = await conn.cursor(sql, *params)
+                while True:
+                    batch = await cursor.fetch(batch_size)
+                    if not batch:
+                        break
+                    feed.fetch_seconds += time.monotonic() - started
+                    await feed.queue.put(batch)
+                    started = time.monotonic()
+            feed.fetch_seconds += time.monotonic() - started
+        finally:
+            await feed.queue.put(None)
+
+    async def _materialize_preload_rows(
+        self,
+        model_type: type[FanslyObject],
+        where: str | None,
+        scope: list[int] | None,
+        feed: _PreloadFeed,
+        fetch: asyncio.Task[None],
+        progress: ProgressManager | None,
+    ) -> PreloadTiming:
+        """Validate one type's fetched rows into the cache, then autolink."""
+        with self._cache_lock:
+            evictions_before = self._evictions[model_type]
+
+        pk_col = self._pk_column(model_type)
+        loaded_ids: list[int] = []
+        validate_seconds = 0.0
+        row_task = None
+        while (batch := await feed.queue.get()) is not None:
+            if progress is not None and row_task is None:
                 row_task = progress.add_task(
                     name="preload_rows",
                     description=f"{model_type.__name__}",
-                    total=total_rows or 0,
+                    total=feed.total_rows,
                     parent_task="preload_models",
                     show_elapsed=True,
                 )
-
-                # Stream rows in batches via server-side cursor
-                async with pool.acquire() as conn, conn.transaction(readonly=True):
-                    cursor = await conn.cursor(f"SELECT * FROM {table_name}")
-                    while True:
-                        batch = await cursor.fetch(batch_size)
-                        if not batch:
-                            break
-                        for row in batch:
-                            data = dict(row)
-                            eid = data.get("id") or data.get(
-                                self._pk_column(model_type)
-                            )
-                            if eid and eid in assoc_data:
-                                data.update(assoc_data[eid])
-                            data = self._prepare_row_data(model_type, data)
-                            obj = model_type.model_validate(data)
-                            obj._is_new = False  # loaded from DB, not new
-                        progress.update_task(row_task, advance=len(batch))
-
-                progress.remove_task(row_task)
-                with self._cache_lock:
+            started = time.monotonic()
+            for row in batch:
+                data = dict(row)
+                eid = data.get("id") or data.get(pk_col)
+                if eid and eid in feed.assoc_data:
+                    data.update(feed.assoc_data[eid])
+                data = self._prepare_row_data(model_type, data)
+                obj = model_type.model_validate(data)
+                obj._is_new = False  # loaded from DB, not new
+                if obj.id is not None:
+                    loaded_ids.append(obj.id)
+            validate_seconds += time.monotonic() - started
+            if progress is not None and row_task is not None:
+                progress.update_task(row_task, advance=len(batch))
+        # Surfaces a fetch failure (the queue is closed either way)
+        await fetch
+
+        if progress is not None and row_task is not None:
+            progress.remove_task(row_task)
+        started = time.monotonic()
+        with self._cache_lock:
+            # A type evicted while loading no longer fits the cache
+            # budget: leave it to the SQL path
+            if self._evictions[model_type] == evictions_before:
+                if where is None:
                     self._fully_loaded.add(model_type)
-                    # Autolink belongs_to relationships now that all rows of this
-                    # type are cached. Earlier-loaded types (preload order goes
-                    # leaf -> hub) are already in the cache, so a single pass over
-                    # the freshly loaded objects resolves cross-type FKs.
-                    for eid in self._type_index.get(model_type, set()):
-                        cached_obj = self._cache.get((model_type, eid))
-                        if cached_obj is not None:
-                            self._autolink_relationships(cached_obj)
-                    count = len(self._type_index.get(model_type, ()))
-                db_logger.info(f"  {model_type.__name__}: {count} entities loaded")
-                progress.update_task(models_task, advance=1)
+                elif model_type.__table_name__ in _ACCOUNT_COLUMNS:
+                    self._loaded_accounts[model_type].update(scope or ())
+            # Autolink belongs_to relationships now that all rows of this
+            # type are cached. Earlier-loaded types (preload order goes
+            # leaf -> hub) are already in the cache, so a single pass over
+            # the freshly loaded objects resolves cross-type FKs.
+            # (by id: autolink lookups may revive and evict entries)
+            for eid in loaded_ids:
+                cached_obj = self._cache.get((model_type, eid))
+                if cached_obj is not None:
+                    self._autolink_relationships(cached_obj)
+        validate_seconds += time.monotonic() - started
+        return {
+            "rows": len(loaded_ids),
+            "fetch_seconds": round(feed.fetch_seconds, 3),
+            "validate_seconds": round(validate_seconds, 3),
+        }
 
     async def _fetch_all_associations(
-        self, model_type: type[FanslyObject]
+        self,
+        model_type: type[FanslyObject],
+        where: str | None = None,
+        params: list[Any] | None = None,
     ) -> dict[int, dict[str, Any]]:
         """Fetch all M2M data: {entity_id: {"field": [id1, ...] or id, ...}}
 
         For is_list=True relationships, returns list of IDs.
         For is_list=False relationships (e.g., avatar/banner), unwraps to single ID.
+        With *where* (a clause over *model_type*'s table), only the rows of
+        owners it selects are fetched.
         """
         result: dict[int, dict[str, Any]] = defaultdict(dict)
 
@@ -1490,11 +2316,18 @@ class PostgresEntityStore:
             else:
                 owner_fk, related_fk = col_names[0], col_names[1]
 
-            pool = await self._get_pool()
-            rows = await pool.fetch(
+            sql = (
                 f"SELECT {self._q(owner_fk)}, {self._q(related_fk)} "
                 f"FROM {meta.assoc_table}"
             )
+            if where is not None:
+                pk_col = self._q(self._pk_column(model_type))
+                sql += (
+                    f" WHERE {self._q(owner_fk)} IN (SELECT {pk_col} "
+                    f"FROM {model_type.__table_name__} WHERE {where})"
+                )
+            async with self._connection() as conn:
+                rows = await conn.fetch(sql, *(params or ()))
             for row in rows:
                 oid, rid = row[owner_fk], row[related_fk]
                 if meta.is_list:
@@ -1513,8 +2346,8 @@ class PostgresEntityStore:
         pk_col = self._pk_column(model_type)
         table_name = model_type.__table_name__
         sql = f"SELECT * FROM {table_name} WHERE {self._q(pk_col)} = $1"
-        pool = await self._get_pool()
-        return await pool.fetchrow(sql, entity_id)
+        async with self._connection() as conn:
+            return await conn.fetchrow(sql, entity_id)
 
     def _validate_order_by(
         self, model_type: type[FanslyObject], sort_spec: OrderBySpec
@@ -1597,8 +2430,8 @@ class PostgresEntityStore:
         if offset is not None:
             sql += f" OFFSET {offset}"
 
-        pool = await self._get_pool()
-        return await pool.fetch(sql, *params)
+        async with self._connection() as conn:
+            return await conn.fetch(sql, *params)
 
     @staticmethod
     def _sort_results(results: list[T], sort_spec: OrderBySpec) -> list[T]:
@@ -1648,7 +2481,9 @@ class PostgresEntityStore:
         with self._cache_lock:
             key = (model_type, entity_id)
             self._cache.pop(key, None)
+            self._evicted.pop(key, None)
             self._cache_timestamps.pop(key, None)
+            self._unindex_fields(key)
             ids = self._type_index.get(model_type)
             if ids is not None:
                 ids.discard(entity_id)
@@ -1662,27 +2497,56 @@ class PostgresEntityStore:
                     key = (model_type, eid)
                     self._cache.pop(key, None)
                     self._cache_timestamps.pop(key, None)
+                    self._indexed_values.pop(key, None)
+            for key in [k for k in list(self._evicted.keys()) if k[0] is model_type]:
+                self._evicted.pop(key, None)
+            self._field_index.pop(model_type, None)
             self._fully_loaded.discard(model_type)
+            self._loaded_accounts.pop(model_type, None)
 
     def invalidate_all(self) -> None:
         with self._cache_lock:
             self._cache.clear()
+            self._evicted.clear()
             self._type_index.clear()
+            self._field_index.clear()
+            self._indexed_values.clear()
             self._cache_timestamps.clear()
             self._fully_loaded.clear()
+            self._loaded_accounts.clear()
+            self._preloaded_accounts.clear()
 
     def cache_stats(self) -> CacheStats:
+        """Identity-map occupancy, counters and an approximate memory size.
+
+        ``approx_bytes`` extrapolates from up to ``_SIZE_SAMPLE`` entities
+        per type (see ``_approx_entity_size``).
+        """
         with self._cache_lock:
-            by_type = {
-                model_type.__name__: len(ids)
-                for model_type, ids in self._type_index.items()
-                if ids
-            }
+            by_type: dict[str, int] = {}
+            approx_bytes = 0
+            for model_type, ids in self._type_index.items():
+                if not ids:
+                    continue
+                by_type[model_type.__name__] = len(ids)
+                sample = [
+                    obj
+                    for eid in itertools.islice(ids, _SIZE_SAMPLE)
+                    if (obj := self._cache.get((model_type, eid))) is not None
+                ]
+                if sample:
+                    sampled = sum(_approx_entity_size(obj) for obj in sample)
+                    approx_bytes += sampled * len(ids) // len(sample)
             return {
                 "total": len(self._cache),
                 "by_type": by_type,
                 "fully_loaded": [t.__name__ for t in self._fully_loaded],
+                "loaded_accounts": sorted(self._preloaded_accounts),
                 "stats": dict(self._stats),
+                "max_entities": self._max_entities,
+                "evicted_alive": len(self._evicted),
+                "approx_bytes": approx_bytes,
+                "preload_timings": dict(self._preload_timings),
             }
 
     def get_stats(self) -> dict[str, int]:
@@ -1701,5 +2565,6 @@ class PostgresEntityStore:
         await self.close_thread_resources()
         with self._cache_lock:
             self._fully_loaded.clear()
+            self._loaded_accounts.clear()
         FanslyObject._store = None
         db_logger.info("PostgresEntityStore closed")
@@ -0,0 +1,40 @@
+"""Persistent (path, size, mtime, inode) → content hash index for rescans."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from .models import FileHashIndex, get_store
+
+
+async def load_file_hash_index(directory: Path) -> dict[str, FileHashIndex]:
+    """Load every indexed file under ``directory``, keyed by relative path."""
+    store = get_store()
+    rows = await store.find_records(FileHashIndex, directory=str(directory))
+    return {row["path"]: FileHashIndex(**row) for row in rows}
+
+
+async def update_file_hash_index(
+    directory: Path,
+    entries: Iterable[FileHashIndex],
+    removed: Iterable[str] = (),
+) -> None:
+    """Write new index rows and drop stale ones.
+
+    Args:
+        directory: Creator download folder the relative paths belong to
+        entries: Rows for freshly hashed files
+        removed: Relative paths whose rows no longer describe the file on
+            disk (modified or deleted). Deleted before ``entries`` are
+            written, so a modified file's row is replaced rather than kept.
+    """
+    store = get_store()
+    if removed := list(removed):
+        await store.delete_record(
+            FileHashIndex, directory=str(directory), path__in=removed
+        )
+    await store.bulk_upsert_records(
+        FileHashIndex.__table_name__,
+        [entry.model_dump() for entry in entries],
+    )
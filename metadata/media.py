@@ -47,29 +47,32 @@ async def process_media_info(
         else [media_infos]
     )
 
-    for raw_info in items_to_process:
-        info = expect_dict(raw_info, "accountMedia item")
-        account_id = info.get("accountId")
-
-        if account_id is None:
-            json_output(
-                2,
-                "meta/media - missing_accountId",
-                {"mediaId": info.get("id"), "keys": list(info.keys())},
-            )
-            continue
-
-        # Persist Media (with nested variants/locations) — FK constraint first
-        for key in ("media", "preview"):
-            if key in info:
-                nested = expect_dict(info[key], f"accountMedia.{key}")
-                nested.setdefault("accountId", account_id)
-                media = Media.model_validate(nested)
-                await store.save(media)
-
-        # Persist AccountMedia (extra="ignore" drops nested media/preview dicts)
-        am = AccountMedia.model_validate(info)
-        await store.save(am)
+    # Joins the caller's batch (e.g. a timeline page) when there is one
+    async with store.batch():
+        for raw_info in items_to_process:
+            info = expect_dict(raw_info, "accountMedia item")
+            account_id = info.get("accountId")
+
+            if account_id is None:
+                json_output(
+                    2,
+                    "meta/media - missing_accountId",
+                    {"mediaId": info.get("id"), "keys": list(info.keys())},
+                )
+                continue
+
+            # Persist Media (with nested variants/locations) — FK constraint first
+            for key in ("media", "preview"):
+                if key in info:
+                    nested = expect_dict(info[key], f"accountMedia.{key}")
+                    if "accountId" not in nested:
+                        nested = {**nested, "accountId": account_id}
+                    media = Media.model_validate(nested)
+                    await store.save(media)
+
+            # Persist AccountMedia (extra="ignore" drops nested media/preview dicts)
+            am = AccountMedia.model_validate(info)
+            await store.save(am)
 
 
 async def process_media_item_dict(
@@ -460,6 +460,8 @@ class FanslyObject(BaseModel):
     __table_name__: ClassVar[str] = ""
     __relationships__: ClassVar[dict[str, RelationshipMetadata]] = {}
     __tracked_fields__: ClassVar[set[str]] = set()
+    # Scalar fields the store hash-indexes for cache-first equality filters
+    __indexed_fields__: ClassVar[set[str]] = set()
     __fk_to_rel__: ClassVar[dict[str, tuple[str, RelationshipMetadata]]] = {}
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
@@ -540,10 +542,15 @@ class FanslyObject(BaseModel):
         - Int/float timestamps → datetime (all Fansly timestamp fields end in 'At')
         - String IDs → int is handled by Pydantic's lax mode automatically
         - Nested relationship enrichment is handled by _process_nested_cache_lookups
+
+        Like every ``before`` validator here, this never mutates *data*:
+        API payloads are validated without a defensive deep copy, so
+        changes go into a new dict.
         """
         if not isinstance(data, dict):
             return data
-        for k, v in list(data.items()):
+        updates: dict[str, Any] = {}
+        for k, v in data.items():
             if isinstance(v, str) and v:
                 # Strip unpaired surrogates (e.g., \ud835 from truncated
                 # mathematical bold chars in Fansly wall/post names).
@@ -553,12 +560,12 @@ class FanslyObject(BaseModel):
                 try:
                     v.encode("utf-8")
                 except UnicodeEncodeError:
-                    data[k] = v.encode("utf-8", errors="surrogatepass").decode(
+                    updates[k] = v.encode("utf-8", errors="surrogatepass").decode(
                         "utf-8", errors="replace"
                     )
             elif isinstance(v, (int, float)) and k.endswith("At"):
-                data[k] = parse_timestamp(v)
-        return data
+                updates[k] = parse_timestamp(v)
+        return {**data, **updates} if updates else data
 
     # Fields excluded from DB writes (extended by subclasses): inverse-only
     # relationship fields have no DB column and are populated by bidirectional sync.
@@ -837,6 +844,13 @@ class FanslyObject(BaseModel):
                 # No store → cannot resolve; mark UNSET.
                 object.__setattr__(self, rel_name, UNSET)
 
+        # Keep the store's field indexes in step (Path 1 may have set the FK)
+        if self._store and self.__indexed_fields__:
+            rel_meta = self.__relationships__.get(name)
+            fk_column = rel_meta.fk_column if rel_meta is not None else None
+            if name in self.__indexed_fields__ or fk_column in self.__indexed_fields__:
+                self._store.reindex(self)
+
     def _sync_inverse_relationship(self, field_name: str, new_value: Any) -> None:
         meta = self.__relationships__.get(field_name)
         if not meta or not meta.inverse_query_field or not meta.inverse_type:
@@ -1103,6 +1117,24 @@ class StubTracker(FanslyRecord):
     reason: str | None = None
 
 
+class FileHashIndex(FanslyRecord):
+    """Content hash of a file on disk, keyed by its stat signature.
+
+    ``path`` is relative to ``directory`` (the creator download folder).
+    A row is only trusted while ``size``, ``mtime_ns`` and ``inode`` still
+    match the file, so ``dedupe_init`` can skip re-hashing unchanged files.
+    """
+
+    __table_name__: ClassVar[str] = "file_hash_index"
+
+    directory: str
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+    content_hash: str
+
+
 class PinnedPost(FanslyRecord):
     """Junction record for account pinned posts (pos-ordered)."""
 
@@ -1155,9 +1187,11 @@ class MediaLocation(FanslyRecord):
         if not isinstance(data, dict) or "location" not in data:
             return data
         raw = data["location"]
-        data["raw_url"] = raw
-        data["location"] = FanslyObject.normalize_cdn_url(raw) or raw
-        return data
+        return {
+            **data,
+            "raw_url": raw,
+            "location": FanslyObject.normalize_cdn_url(raw) or raw,
+        }
 
 
 # ── Standalone Entities ──────────────────────────────────────────────────
@@ -1242,7 +1276,7 @@ class TimelineStats(FanslyObject):
     @classmethod
     def _set_id_from_pk(cls, data: Any) -> Any:
         if isinstance(data, dict) and "accountId" in data:
-            data["id"] = data["accountId"]
+            return {**data, "id": data["accountId"]}
         return data
 
 
@@ -1273,7 +1307,7 @@ class MediaStoryState(FanslyObject):
     @classmethod
     def _set_id_from_pk(cls, data: Any) -> Any:
         if isinstance(data, dict) and "accountId" in data:
-            data["id"] = data["accountId"]
+            return {**data, "id": data["accountId"]}
         return data
 
 
@@ -1326,7 +1360,7 @@ class MonitorState(FanslyObject):
     def _set_id_from_pk(cls, data: Any) -> Any:
         """Copy creatorId → id so the identity map can key by id."""
         if isinstance(data, dict) and "creatorId" in data:
-            data["id"] = data["creatorId"]
+            return {**data, "id": data["creatorId"]}
         return data
 
 
@@ -1356,6 +1390,7 @@ class Media(FanslyObject):
         "variants",
         "locations",
     }
+    __indexed_fields__: ClassVar[set[str]] = {"accountId", "content_hash"}
     __relationships__: ClassVar[dict[str, RelationshipMetadata]] = {
         "account": belongs_to("Account", fk_column="accountId"),
         "variants": habtm("Media", assoc_table="media_variants"),
@@ -1387,16 +1422,17 @@ class Media(FanslyObject):
             return data
         if not data.get("mimetype", "").startswith("video/"):
             return data
+        extracted: dict[str, Any] = {}
         try:
             parsed = json.loads(raw_meta)
             if "original" in parsed:
-                data.setdefault("width", parsed["original"].get("width"))
-                data.setdefault("height", parsed["original"].get("height"))
+                extracted["width"] = parsed["original"].get("width")
+                extracted["height"] = parsed["original"].get("height")
             if "duration" in parsed:
-                data.setdefault("duration", float(parsed["duration"]))
+                extracted["duration"] = float(parsed["duration"])
         except (json.JSONDecodeError, ValueError, AttributeError, KeyError):
             pass
-        return data
+        return {**extracted, **data} if extracted else data
 
     updatedAt: datetime | None = None
     local_filename: str | None = None
@@ -1484,6 +1520,7 @@ class AccountMedia(FanslyObject):
         "media",
         "preview",
     }
+    __indexed_fields__: ClassVar[set[str]] = {"accountId"}
     __relationships__: ClassVar[dict[str, RelationshipMetadata]] = {
         "account": belongs_to("Account", fk_column="accountId"),
         "media": belongs_to("Media", fk_column="mediaId"),
@@ -1544,10 +1581,9 @@ class AccountMediaBundle(FanslyObject):
         validator's _process_nested_cache_lookups would see the raw data
         before this runs. Conversion is handled in _process_single_bundle.
         """
-        if not isinstance(data, dict):
+        if not isinstance(data, dict) or "createdAt" in data:
             return data
-        data.setdefault("createdAt", datetime.now(UTC))
-        return data
+        return {**data, "createdAt": datetime.now(UTC)}
 
     accountId: SnowflakeId
     previewId: SnowflakeId | None = None
@@ -1622,7 +1658,7 @@ class Attachment(FanslyObject):
             return data
         ct = data.get("contentType")
         if isinstance(ct, str) and ct in ContentType.__members__:
-            data["contentType"] = ContentType[ct]
+            return {**data, "contentType": ContentType[ct]}
         return data
 
     id: int | None = None  # auto-increment, not a Snowflake (API sends no id)
@@ -1777,13 +1813,16 @@ class Post(FanslyObject):
             valid_types = {ct.value for ct in ContentType}
             # TIP (7) not in enum. TIP_GOALS (7100) in enum but not media.
             skip_types = {7, 7100}
-            data["attachments"] = [
-                a
-                for a in data["attachments"]
-                if isinstance(a, dict)
-                and a.get("contentType") in valid_types
-                and a.get("contentType") not in skip_types
-            ]
+            data = {
+                **data,
+                "attachments": [
+                    a
+                    for a in data["attachments"]
+                    if isinstance(a, dict)
+                    and a.get("contentType") in valid_types
+                    and a.get("contentType") not in skip_types
+                ],
+            }
 
         return data
 
@@ -1854,13 +1893,16 @@ class Message(FanslyObject):
         if "attachments" in data:
             valid_types = {ct.value for ct in ContentType}
             skip_types = {7, 7100}
-            data["attachments"] = [
-                a
-                for a in data["attachments"]
-                if isinstance(a, dict)
-                and a.get("contentType") in valid_types
-                and a.get("contentType") not in skip_types
-            ]
+            data = {
+                **data,
+                "attachments": [
+                    a
+                    for a in data["attachments"]
+                    if isinstance(a, dict)
+                    and a.get("contentType") in valid_types
+                    and a.get("contentType") not in skip_types
+                ],
+            }
         return data
 
     groupId: SnowflakeId | None = None
@@ -1938,11 +1980,11 @@ class Group(FanslyObject):
             return data
         lm = data.get("lastMessage")
         if isinstance(lm, dict) and "id" in lm:
-            data.setdefault("lastMessageId", lm["id"])
-            # Remove the nested dict so Pydantic doesn't try to validate
+            # Drop the nested dict so Pydantic doesn't try to validate
             # a raw dict as a Message object — the belongs_to cache
             # resolution will handle it via lastMessageId.
-            del data["lastMessage"]
+            data = {k: v for k, v in data.items() if k != "lastMessage"}
+            data.setdefault("lastMessageId", lm["id"])
         return data
 
     createdBy: SnowflakeId
@@ -2077,11 +2119,12 @@ class Subscription(FanslyObject):
         # String, so coerce before strict Pydantic typing rejects int → str.
         if not isinstance(data, dict):
             return data
-        for field in ("promoId", "giftCodeId", "renewCorrelationId"):
-            v = data.get(field)
-            if v is not None and not isinstance(v, str):
-                data[field] = str(v)
-        return data
+        updates = {
+            field: str(v)
+            for field in ("promoId", "giftCodeId", "renewCorrelationId")
+            if (v := data.get(field)) is not None and not isinstance(v, str)
+        }
+        return {**data, **updates} if updates else data
 
     accountId: SnowflakeId
     subscriptionTierId: SnowflakeId | None = None
@@ -2262,7 +2305,7 @@ class Account(FanslyObject):
         if not any(
             isinstance(s, dict) and s.get("id") == sub.get("id") for s in existing
         ):
-            data["subscriptions"] = [*existing, sub]
+            return {**data, "subscriptions": [*existing, sub]}
         return data
 
     @property
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING
 
 from helpers.common import (
@@ -14,7 +13,11 @@ from helpers.common import (
 )
 from textio import json_output
 
-from .account import process_account_data, process_media_bundles_data
+from .account import (
+    fetch_truncated_bundle_media,
+    process_account_data,
+    process_media_bundles_data,
+)
 from .hashtag import process_post_hashtags
 from .media import process_media_info
 from .models import Account as AccountModel
@@ -35,7 +38,6 @@ async def process_pinned_posts(
 ) -> None:
     """Process pinned posts using sync_junction."""
     store = get_store()
-    posts = copy.deepcopy(posts)
 
     if not posts:
         return
@@ -71,37 +73,54 @@ async def process_timeline_posts(
     state: DownloadState,
     posts_data: JsonDict,
 ) -> None:
-    """Process timeline posts and related data."""
-    store = get_store()
-    posts = copy.deepcopy(posts_data)
-
-    # Process accounts
-    if state.creator_id:
-        account = await store.get(AccountModel, state.creator_id)
-        if not account and "account" in posts:
-            await process_account_data(
-                config, data=expect_dict(posts["account"], "account")
-            )
-
-    for raw_account in expect_list(posts.get("accounts") or [], "accounts"):
-        await process_account_data(config, data=expect_dict(raw_account, "account"))
-
-    # Process posts
-    for raw_post in expect_list(posts.get("posts") or [], "posts"):
-        await _process_timeline_post(expect_dict(raw_post, "post"))
+    """Process timeline posts and related data.
 
-    for raw_post in expect_list(posts.get("aggregatedPosts") or [], "aggregatedPosts"):
-        await _process_timeline_post(expect_dict(raw_post, "post"))
-
-    # Process media in batches
-    account_media = expect_list(posts.get("accountMedia") or [], "accountMedia")
-    batch_size = 15
-    for i in range(0, len(account_media), batch_size):
-        batch = account_media[i : i + batch_size]
-        await process_media_info(config, {"batch": batch})
+    *posts_data* is read, never modified — model validators and
+    ``process_media_info`` copy a dict before changing it — so the page is
+    not deep-copied first and callers can keep using it.
+    """
+    store = get_store()
 
-    # Process media bundles
-    await process_media_bundles_data(config, posts, id_fields=["accountId"])
+    # Fetch truncated bundle contents first: an API request inside the batch
+    # would hold its pool connection and open transaction for the duration.
+    backfilled_media = await fetch_truncated_bundle_media(config, posts_data)
+
+    # One unit of work per API page: saves are flushed together at the end
+    async with store.batch():
+        # Process accounts
+        if state.creator_id:
+            account = await store.get(AccountModel, state.creator_id)
+            if not account and "account" in posts_data:
+                await process_account_data(
+                    config, data=expect_dict(posts_data["account"], "account")
+                )
+
+        for raw_account in expect_list(posts_data.get("accounts") or [], "accounts"):
+            await process_account_data(config, data=expect_dict(raw_account, "account"))
+
+        # Process posts
+        for raw_post in expect_list(posts_data.get("posts") or [], "posts"):
+            await _process_timeline_post(expect_dict(raw_post, "post"))
+
+        for raw_post in expect_list(
+            posts_data.get("aggregatedPosts") or [], "aggregatedPosts"
+        ):
+            await _process_timeline_post(expect_dict(raw_post, "post"))
+
+        # Process media in batches
+        account_media = [
+            *expect_list(posts_data.get("accountMedia") or [], "accountMedia"),
+            *backfilled_media,
+        ]
+        batch_size = 15
+        for i in range(0, len(account_media), batch_size):
+            batch = account_media[i : i + batch_size]
+            await process_media_info(config, {"batch": batch})
+
+        # Process media bundles
+        await process_media_bundles_data(
+            config, posts_data, id_fields=["accountId"], backfill=False
+        )
 
 
 async def _process_timeline_post(post: JsonDict) -> None:
@@ -293,6 +293,17 @@ stub_tracker = Table(
     UniqueConstraint("table_name", "record_id", name="uix_stub_tracker"),
 )
 
+file_hash_index = Table(
+    "file_hash_index",
+    metadata,
+    Column("directory", String, primary_key=True),
+    Column("path", String, primary_key=True),
+    Column("size", BigInteger, nullable=False),
+    Column("mtime_ns", BigInteger, nullable=False),
+    Column("inode", BigInteger, nullable=False),
+    Column("content_hash", String, nullable=False),
+)
+
 subscriptions = Table(
     "subscriptions",
     metadata,
@@ -58,7 +58,6 @@ async def process_wall_posts(
 ) -> None:
     """Process posts from a specific wall."""
     store = get_store()
-    posts_data = copy.deepcopy(posts_data)
 
     await process_timeline_posts(config, state, posts_data)
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark the fused JSON decode in ``FanslyApi.get_json_response_contents``.
+
+The API layer used to decode every response twice (once in
+``validate_json_response``, once for the payload), rebuild the payload with
+``convert_ids_to_int`` and then ``copy.deepcopy`` it in
+``process_timeline_posts``. It now decodes once with ID conversion running
+as the decoder's ``object_hook``, and the page is no longer deep-copied.
+
+This replays recorded API responses through both paths, checks that they
+produce the same payload, and reports time and bytes allocated per
+response. For the byte count every intermediate tree is kept alive and
+measured with ``tracemalloc``; the decoder's transient buffers are left out.
+
+Usage:
+    python -m scripts.benchmark_json_decode                     # timeline fixtures
+    python -m scripts.benchmark_json_decode --repeat 2000
+    python -m scripts.benchmark_json_decode --file response.json --file other.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from api.fansly import FanslyApi
+
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "json_data"
+DEFAULT_FILES = [
+    FIXTURES / "example_timeline.json",
+    FIXTURES / "test_timeline_response.json",
+    FIXTURES / "timeline-sample-account.json",
+    FIXTURES / "test_media_items.json",
+]
+
+
+def decode_before(response: httpx.Response, keep: list[object]) -> object:
+    """The path every timeline page took before the fused decoder."""
+    keep.append(FanslyApi._decode_json_response(response))  # validate_json_response
+    decoded = response.json()
+    keep.append(decoded)
+    contents = FanslyApi.convert_ids_to_int(decoded["response"])
+    keep.append(contents)
+    return copy.deepcopy(contents)  # process_timeline_posts
+
+
+def decode_after(response: httpx.Response, keep: list[object]) -> object:
+    decoded = FanslyApi._decode_json_response(
+        response, object_hook=FanslyApi._convert_id_fields
+    )
+    keep.append(decoded)
+    return decoded["response"]
+
+
+def _time(func, response: httpx.Response, repeat: int) -> list[float]:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(response, [])
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def _allocated(func, response: httpx.Response) -> int:
+    keep: list[object] = []
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        keep.append(func(response, keep))
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - baseline
+
+
+def benchmark(path: Path, repeat: int) -> tuple[bool, float, float]:
+    response = httpx.Response(
+        200,
+        content=path.read_bytes(),
+        request=httpx.Request("GET", "https://apiv3.fansly.com/api/v1/timeline"),
+    )
+    print(f"\n{path.name}: {len(response.content):,} bytes")
+
+    same = decode_before(response, []) == decode_after(response, [])
+    timings = {}
+    allocations = {}
+    for name, func in (("before", decode_before), ("after", decode_after)):
+        func(response, [])  # warm up
+        timings[name] = _time(func, response, repeat)
+        allocated = allocations[name] = _allocated(func, response)
+        best = min(timings[name])
+        print(
+            f"  {name:6} best {best * 1e6:8.1f}µs "
+            f"median {statistics.median(timings[name]) * 1e6:8.1f}µs "
+            f"allocated {allocated / 1024:7.1f} KiB"
+        )
+
+    speedup = min(timings["before"]) / min(timings["after"])
+    saving = allocations["before"] / max(1, allocations["after"])
+    print(
+        f"  speedup x{speedup:.2f}, allocation /{saving:.2f}, "
+        f"payloads {'match' if same else 'DIFFER'}"
+    )
+    return same, speedup, saving
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--file",
+        type=Path,
+        action="append",
+        default=[],
+        help="Recorded API response (with the success/response envelope); repeatable",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=500, help="Runs per path (default: 500)"
+    )
+    args = parser.parse_args()
+
+    identical = True
+    speedups = []
+    savings = []
+    for path in args.file or DEFAULT_FILES:
+        same, speedup, saving = benchmark(path, args.repeat)
+        identical &= same
+        speedups.append(speedup)
+        savings.append(saving)
+
+    print(
+        f"\ngeometric mean speedup x{statistics.geometric_mean(speedups):.2f}, "
+        f"allocation /{statistics.geometric_mean(savings):.2f}"
+    )
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Benchmark the memory-mapped MP4 hasher against the reader-based walk.
+
+``fileio.mp4.hash_mp4file`` hashes box bodies straight from a memory map.
+This compares it with the original walk (``get_boxes`` + ``hash_mp4box``
+over a ``BufferedReader``, 1 MiB ``bytes`` chunks), checks that both give
+the same digest, and reports throughput for both algorithm variants.
+
+Synthetic files (ftyp + moov + mdat + free, mdat filling the requested size)
+are written to --dir unless existing files are passed with --file. Both
+implementations read the same file back to back, so after the first pass
+they compete on a warm page cache; use files larger than RAM to measure
+cold reads.
+
+Usage:
+    python -m scripts.benchmark_mp4_hash                      # 1, 2, 5, 10 GB
+    python -m scripts.benchmark_mp4_hash --sizes 1 4 --repeat 5
+    python -m scripts.benchmark_mp4_hash --file video.mp4 --file other.mp4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fileio.mp4 import get_boxes, hash_mp4box, hash_mp4file
+
+
+GIB = 1024**3
+BLOCK = os.urandom(1_048_576)
+
+
+def _box_header(fourcc: bytes, size: int) -> bytes:
+    if size < 2**32:
+        return size.to_bytes(4, "big") + fourcc
+    return (1).to_bytes(4, "big") + fourcc + size.to_bytes(8, "big")
+
+
+def write_synthetic_mp4(path: Path, size: int) -> None:
+    """Write an MP4-shaped file of ``size`` bytes, mostly one large mdat."""
+    ftyp = _box_header(b"ftyp", 24) + b"isom\x00\x00\x02\x00isomiso2"
+    moov = _box_header(b"moov", 8 + 4096) + BLOCK[:4096]
+    free = _box_header(b"free", 8 + 1024) + bytes(1024)
+    head = len(ftyp) + len(moov) + len(free)
+    mdat_size = max(16, size - head)
+    mdat_header = _box_header(b"mdat", mdat_size)
+
+    with path.open("wb") as out:
+        out.write(ftyp + moov)
+        out.write(mdat_header)
+        remaining = mdat_size - len(mdat_header)
+        while remaining > 0:
+            chunk = BLOCK[: min(len(BLOCK), remaining)]
+            out.write(chunk)
+            remaining -= len(chunk)
+        out.write(free)
+
+
+def hash_with_reader(path: Path, use_broken_algo: bool) -> str:
+    """The reader-based walk hash_mp4file used before the memory map."""
+    skipped = {"moov", "mdat"} if use_broken_algo else {"free", "moov"}
+    algorithm = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as reader:
+        for box in get_boxes(reader):
+            if box.fourcc not in skipped:
+                hash_mp4box(algorithm, reader, box)
+    return algorithm.hexdigest()
+
+
+def hash_with_mmap(path: Path, use_broken_algo: bool) -> str:
+    return hash_mp4file(
+        hashlib.md5(usedforsecurity=False), path, use_broken_algo=use_broken_algo
+    )
+
+
+def _time(func, path: Path, use_broken_algo: bool) -> tuple[float, str]:
+    start = time.perf_counter()
+    digest = func(path, use_broken_algo)
+    return time.perf_counter() - start, digest
+
+
+def benchmark(path: Path, repeat: int) -> bool:
+    size = path.stat().st_size
+    print(f"\n{path.name}: {size / GIB:.2f} GiB")
+    identical = True
+
+    for use_broken_algo in (False, True):
+        timings: dict[str, list[float]] = {"reader": [], "mmap": []}
+        digests: dict[str, str] = {}
+        for _ in range(repeat):
+            for name, func in (("reader", hash_with_reader), ("mmap", hash_with_mmap)):
+                elapsed, digest = _time(func, path, use_broken_algo)
+                timings[name].append(elapsed)
+                digests[name] = digest
+
+        label = "broken algo" if use_broken_algo else "normal algo"
+        same = digests["reader"] == digests["mmap"]
+        identical &= same
+        for name, runs in timings.items():
+            best = min(runs)
+            print(
+                f"  {label:11} {name:6} best {best:7.3f}s "
+                f"median {statistics.median(runs):7.3f}s "
+                f"({size / GIB / best:6.2f} GiB/s)"
+            )
+        speedup = min(timings["reader"]) / min(timings["mmap"])
+        print(
+            f"  {label:11} speedup x{speedup:.2f}, digests "
+            f"{'match' if same else 'DIFFER'} ({digests['mmap']})"
+        )
+
+    return identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=[1, 2, 5, 10],
+        help="Synthetic file sizes in GiB (default: 1 2 5 10)",
+    )
+    parser.add_argument(
+        "--file",
+        type=Path,
+        action="append",
+        default=[],
+        help="Benchmark an existing MP4 instead of synthetic files (repeatable)",
+    )
+    parser.add_argument(
+        "--dir",
+        type=Path,
+        default=None,
+        help="Where to write synthetic files (default: a temp dir, removed after)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per implementation (default: 3)"
+    )
+    args = parser.parse_args()
+
+    if args.file:
+        return 0 if all(benchmark(path, args.repeat) for path in args.file) else 1
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as work_dir:
+        identical = True
+        for size_gib in args.sizes:
+            path = Path(work_dir) / f"synthetic_{size_gib:g}gib.mp4"
+            print(f"Writing {path} ...", flush=True)
+            write_synthetic_mp4(path, int(size_gib * GIB))
+            identical &= benchmark(path, args.repeat)
+            path.unlink()
+
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
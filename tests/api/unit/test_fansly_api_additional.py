@@ -14,7 +14,10 @@ Endpoint URLs use production constants on ``FanslyApi`` (e.g.
 so production URL changes propagate without per-test churn.
 """
 
+import asyncio
+import json
 import types
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -292,6 +295,112 @@ class TestFanslyApiAdditional:
             in request.headers["access-control-request-headers"]
         )
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cors_preflight_cached_per_endpoint(self, fansly_api_factory):
+        """A fresh preflight covers later calls to the same endpoint template.
+
+        Numeric path IDs and the query string don't split the cache; a
+        different endpoint still gets its own preflight.
+        """
+        api = fansly_api_factory()
+        options_route = respx.options(url__startswith=api.BASE_URL).mock(
+            return_value=httpx.Response(200, headers={"Access-Control-Max-Age": "600"})
+        )
+
+        try:
+            await api.cors_options_request(api.TIMELINE_NEW_ENDPOINT.format(1))
+            await api.cors_options_request(
+                f"{api.TIMELINE_NEW_ENDPOINT.format(2)}?before=3"
+            )
+            assert options_route.call_count == 1
+
+            await api.cors_options_request(api.POST_ENDPOINT)
+        finally:
+            dump_fansly_calls(
+                options_route.calls, "test_cors_preflight_cached_per_endpoint"
+            )
+
+        assert options_route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    @pytest.mark.parametrize(
+        "preflight",
+        [
+            pytest.param(
+                httpx.Response(200, headers={"Access-Control-Max-Age": "0"}),
+                id="max-age-0",
+            ),
+            pytest.param(
+                httpx.Response(200, headers={"Access-Control-Max-Age": "-5"}),
+                id="negative-max-age",
+            ),
+            pytest.param(httpx.Response(403), id="failed-preflight"),
+        ],
+    )
+    async def test_cors_preflight_not_cached(self, fansly_api_factory, preflight):
+        """Zero/negative max-age and failed preflights are never reused."""
+        api = fansly_api_factory()
+        options_route = respx.options(api.POST_ENDPOINT).mock(return_value=preflight)
+
+        try:
+            await api.cors_options_request(api.POST_ENDPOINT)
+            await api.cors_options_request(api.POST_ENDPOINT)
+        finally:
+            dump_fansly_calls(options_route.calls, "test_cors_preflight_not_cached")
+
+        assert options_route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cors_preflight_expires(self, fansly_api_factory):
+        """Without Access-Control-Max-Age an entry lives 5s, then re-preflights."""
+        api = fansly_api_factory()
+        options_route = respx.options(api.POST_ENDPOINT).mock(
+            return_value=httpx.Response(200)
+        )
+
+        try:
+            with patch("api.fansly.time.monotonic", return_value=100.0):
+                await api.cors_options_request(api.POST_ENDPOINT)
+            with patch("api.fansly.time.monotonic", return_value=104.0):
+                await api.cors_options_request(api.POST_ENDPOINT)
+            assert options_route.call_count == 1
+
+            with patch("api.fansly.time.monotonic", return_value=105.5):
+                await api.cors_options_request(api.POST_ENDPOINT)
+        finally:
+            dump_fansly_calls(options_route.calls, "test_cors_preflight_expires")
+
+        assert options_route.call_count == 2
+
+    @respx.mock
+    def test_sync_get_shares_preflight_cache(self, fansly_api_factory):
+        """get_with_ngsw_sync preflights once per endpoint like the async path."""
+        api = fansly_api_factory()
+        url = api.STREAMING_CHANNEL_ENDPOINT.format(7)
+        options_route = respx.options(url__startswith=url).mock(
+            return_value=httpx.Response(200, headers={"Access-Control-Max-Age": "600"})
+        )
+        get_route = respx.get(url__startswith=url).mock(
+            return_value=httpx.Response(200, json={"success": "true"})
+        )
+
+        try:
+            api.get_with_ngsw_sync(url)
+            api.get_with_ngsw_sync(url)
+        finally:
+            dump_fansly_calls(
+                options_route.calls, "test_sync_get_shares_preflight_cache-options"
+            )
+            dump_fansly_calls(
+                get_route.calls, "test_sync_get_shares_preflight_cache-get"
+            )
+
+        assert options_route.call_count == 1
+        assert get_route.call_count == 2
+
     @pytest.mark.parametrize(
         ("device_id", "device_id_timestamp", "fetched_device_id"),
         [
@@ -417,6 +526,221 @@ class TestConvertIdsToInt:
         assert result["accountIds"] == [111, 222, 333]
 
 
+class TestFusedJsonDecode:
+    """get_json_response_contents decodes once with ID conversion fused in."""
+
+    @staticmethod
+    def _response(content: bytes) -> httpx.Response:
+        request = httpx.Request("GET", f"{FanslyApi.BASE_URL}timeline")
+        return httpx.Response(200, content=content, request=request)
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        ["example_timeline.json", "timeline-sample-account.json"],
+    )
+    def test_matches_convert_ids_to_int(
+        self, fansly_api_factory, test_data_dir, fixture_name
+    ):
+        """Recorded responses decode to the same payload as the two-pass path."""
+        content = (Path(test_data_dir) / fixture_name).read_bytes()
+        api = fansly_api_factory()
+
+        result = api.get_json_response_contents(self._response(content))
+
+        assert result == FanslyApi.convert_ids_to_int(json.loads(content)["response"])
+
+    def test_converts_nested_ids_and_keeps_non_numeric(self, fansly_api_factory):
+        """Nested *Id/*Ids fields become ints; non-numeric IDs stay strings."""
+        body = {
+            "success": True,
+            "response": {
+                "posts": [
+                    {
+                        "id": "10",
+                        "accountId": "oops",
+                        "attachments": [{"contentId": "11", "pos": "0"}],
+                    },
+                    {"id": "12", "accountId": "13", "mediaIds": ["14", 15]},
+                ],
+            },
+        }
+        api = fansly_api_factory()
+
+        result = api.get_json_response_contents(
+            self._response(json.dumps(body).encode())
+        )
+
+        assert result == {
+            "posts": [
+                {
+                    "id": 10,
+                    "accountId": "oops",
+                    "attachments": [{"contentId": 11, "pos": "0"}],
+                },
+                {"id": 12, "accountId": 13, "mediaIds": [14, 15]},
+            ],
+        }
+
+    def test_unsuccessful_response_raises(self, fansly_api_factory):
+        """The success flag is still checked on the fused path."""
+        api = fansly_api_factory()
+        content = json.dumps({"success": False, "response": {}}).encode()
+
+        with pytest.raises(RuntimeError):
+            api.get_json_response_contents(self._response(content))
+
+
+class TestResponseCoalescing:
+    """Identical GETs to endpoints in RESPONSE_CACHE_TTLS share one request."""
+
+    _OK = {"success": "true", "response": [{"id": "7"}]}
+
+    @staticmethod
+    def _mock_routes(
+        api: FanslyApi, url: str, *responses: httpx.Response
+    ) -> respx.Route:
+        respx.options(url__startswith=api.BASE_URL).mock(
+            return_value=httpx.Response(200)
+        )
+        return respx.get(url__startswith=url).mock(side_effect=list(responses))
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrent_identical_calls_share_one_request(
+        self, fansly_api_factory
+    ):
+        """Concurrent callers get the same response from a single GET."""
+        api = fansly_api_factory()
+        route = self._mock_routes(
+            api,
+            api.ACCOUNT_BY_ID_ENDPOINT.format(""),
+            httpx.Response(200, json=self._OK),
+        )
+
+        try:
+            first, second = await asyncio.gather(
+                api.get_account_info_by_id(7), api.get_account_info_by_id(7)
+            )
+        finally:
+            dump_fansly_calls(route.calls, "test_concurrent_identical_calls")
+
+        assert route.call_count == 1
+        assert first is second
+        assert api.get_json_response_contents(first) == [{"id": 7}]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_response_reused_until_ttl_expires(self, fansly_api_factory):
+        """A 200 response is reused within the endpoint TTL, then refetched."""
+        api = fansly_api_factory()
+        route = self._mock_routes(
+            api,
+            api.ACCOUNT_MEDIA_ENDPOINT.format(""),
+            httpx.Response(200, json=self._OK),
+            httpx.Response(200, json=self._OK),
+        )
+        ttl = api.RESPONSE_CACHE_TTLS[api.ACCOUNT_MEDIA_ENDPOINT]
+
+        try:
+            with patch("api.fansly.time.monotonic", return_value=1000.0):
+                await api.get_account_media("7")
+            with patch("api.fansly.time.monotonic", return_value=1000.0 + ttl - 1):
+                await api.get_account_media("7")
+            assert route.call_count == 1
+
+            with patch("api.fansly.time.monotonic", return_value=1000.0 + ttl + 1):
+                await api.get_account_media("7")
+        finally:
+            dump_fansly_calls(route.calls, "test_response_reused_until_ttl_expires")
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    @pytest.mark.parametrize(
+        ("call", "endpoint", "first_status"),
+        [
+            pytest.param(
+                lambda api: api.get_timeline(1, "0", use_cache=False),
+                FanslyApi.TIMELINE_NEW_ENDPOINT.format(1),
+                200,
+                id="use-cache-false",
+            ),
+            pytest.param(
+                lambda api: api.get_timeline(1, "0"),
+                FanslyApi.TIMELINE_NEW_ENDPOINT.format(1),
+                404,
+                id="non-200-not-cached",
+            ),
+            pytest.param(
+                lambda api: api.get_post("7"),
+                FanslyApi.POST_ENDPOINT,
+                200,
+                id="endpoint-without-ttl",
+            ),
+            pytest.param(
+                lambda api: api.get_creator_account_info("someone"),
+                FanslyApi.ACCOUNT_BY_USERNAME_ENDPOINT.format(""),
+                200,
+                id="username-lookup-without-ttl",
+            ),
+        ],
+    )
+    async def test_request_sent_again(
+        self, fansly_api_factory, call, endpoint, first_status
+    ):
+        """Opted-out calls, failed responses and unlisted endpoints refetch."""
+        api = fansly_api_factory()
+        route = self._mock_routes(
+            api,
+            endpoint,
+            httpx.Response(first_status, json=self._OK),
+            httpx.Response(200, json=self._OK),
+        )
+
+        try:
+            await call(api)
+            await call(api)
+        finally:
+            dump_fansly_calls(route.calls, "test_request_sent_again")
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelled_caller_does_not_cancel_shared_request(
+        self, fansly_api_factory
+    ):
+        """The shared GET keeps running for the remaining callers."""
+        api = fansly_api_factory()
+        release = asyncio.Event()
+
+        async def _slow_response(_request):
+            await release.wait()
+            return httpx.Response(200, json=self._OK)
+
+        respx.options(url__startswith=api.BASE_URL).mock(
+            return_value=httpx.Response(200)
+        )
+        route = respx.get(url__startswith=api.ACCOUNT_BY_ID_ENDPOINT.format("")).mock(
+            side_effect=_slow_response
+        )
+
+        try:
+            first = asyncio.ensure_future(api.get_account_info_by_id(7))
+            second = asyncio.ensure_future(api.get_account_info_by_id(7))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            response = await second
+        finally:
+            dump_fansly_calls(route.calls, "test_cancelled_caller")
+
+        assert first.cancelled()
+        assert response.status_code == 200
+        assert route.call_count == 1
+
+
 class TestWebSocketHandlers:
     """Cover WebSocket callback handlers."""
 
@@ -5,8 +5,10 @@ end-to-end with NO behavior-replacing mocks:
 
 - **Segments are real MPEG-TS bytes** (``make_synthetic_ivs_segment`` —
   genuine H.264-High + AAC, the shape of a real IVS/CloudFront segment),
-  served via ``respx`` so they land on **real disk** under ``tmp_path``.
-- **Muxing is real PyAV** (``_mux_segments_with_pyav`` runs unmocked); the
+  served via ``respx``; the staged fallback writes them to **real disk**
+  under ``tmp_path``.
+- **Muxing is real PyAV** (``_remux_segment_stream`` and the staged
+  ``_PyAVSegmentMuxer`` run unmocked); the
   happy-path test reopens the output with ``av.open`` and asserts a real MP4
   carrying video + audio — mirroring
   ``tests/download/integration/test_livestream_recorder.py``.
@@ -63,7 +65,7 @@ class TestM3U8Integration:
     @respx.mock
     @patch("download.m3u8._try_direct_download_ffmpeg")
     @patch("download.m3u8._try_direct_download_pyav")
-    def test_full_segment_download_real_pyav_mux_workflow(
+    async def test_full_segment_download_real_pyav_mux_workflow(
         self,
         mock_pyav_direct,
         mock_ffmpeg_direct,
@@ -75,7 +77,7 @@ class TestM3U8Integration:
         Drives the full segment-download path with NO fake muxer. Two genuine
         H.264-High + AAC MPEG-TS segments are served via respx onto real disk;
         the real ``_try_segment_download`` downloads them and the real
-        ``_mux_segments_with_pyav`` produces a real MP4 which we reopen with
+        streaming remux (``_remux_segment_stream``) produces a real MP4 which we reopen with
         ``av.open`` (mirroring ``test_livestream_recorder.py``). Also asserts
         ``created_at`` is applied to the real output via ``os.utime`` — folding
         in the former ``test_m3u8_with_timestamp_setting`` (which previously
@@ -109,7 +111,7 @@ class TestM3U8Integration:
         save_path = tmp_path / "video.ts"
 
         try:
-            result = download_m3u8(
+            result = await download_m3u8(
                 config=config,
                 m3u8_url=_M3U8_URL,
                 save_path=save_path,
@@ -136,9 +138,10 @@ class TestM3U8Integration:
             assert muxed.streams.video[0].profile == "High", (
                 f"High profile not preserved: {muxed.streams.video[0].profile}"
             )
-            # The muxed video decodes to real frames. ``_mux_segments_with_pyav``
-            # does naive per-segment packet copy without DTS rebasing (unlike the
-            # livestream ``_mux_ivs_segments`` PID-router), so a reopened demux
+            # The muxed video decodes to real frames. The streaming remux
+            # copies packets without DTS rebasing (unlike the livestream
+            # ``_mux_ivs_segments`` PID-router), so the second synthetic
+            # segment's restarted timestamps are dropped and a reopened demux
             # yields the first segment's GOP (~30 frames) — proof the real mux
             # produced a decodable stream, not an empty/corrupt container.
             video_frames = sum(
@@ -169,18 +172,18 @@ class TestM3U8Integration:
     @respx.mock
     @patch("download.m3u8._try_direct_download_ffmpeg")
     @patch("download.m3u8._try_direct_download_pyav")
-    def test_missing_segment_raises_via_real_filesystem(
+    async def test_missing_segment_raises_via_real_filesystem(
         self,
         mock_pyav_direct,
         mock_ffmpeg_direct,
         m3u8_mock_config,
         tmp_path,
     ):
-        """A respx 404 leaves that ``.ts`` absent → real ``Path.exists`` fires.
+        """A respx 404 on segment2 fails it without retry → M3U8Error.
 
         No ``Path.exists``/``open`` patching: segment2 is served 404 so it is
-        genuinely never written to disk, and production's real missing-segment
-        check (``[f for f in segment_files if not f.exists()]``) raises.
+        genuinely never written to disk, 4xx is not retried, and production
+        reports it by file name in the missing-segment error.
         """
         config = m3u8_mock_config
         mock_pyav_direct.return_value = False
@@ -205,7 +208,7 @@ class TestM3U8Integration:
 
         try:
             with pytest.raises(M3U8Error) as excinfo:
-                download_m3u8(
+                await download_m3u8(
                     config=config,
                     m3u8_url=_M3U8_URL,
                     save_path=save_path,
@@ -225,7 +228,7 @@ class TestM3U8Integration:
     @respx.mock
     @patch("download.m3u8._try_direct_download_ffmpeg")
     @patch("download.m3u8._try_direct_download_pyav")
-    def test_both_mux_tiers_fail_on_unmuxable_segments(
+    async def test_both_mux_tiers_fail_on_unmuxable_segments(
         self,
         mock_pyav_direct,
         mock_ffmpeg_direct,
@@ -235,9 +238,11 @@ class TestM3U8Integration:
         """Deliberately-unmuxable bytes → real PyAV AND real ffmpeg mux fail.
 
         No muxer patching: segments are non-TS garbage that libav cannot open,
-        so real ``_mux_segments_with_pyav`` skips 100% of segments (> 25% abort
-        threshold → False) and real ``_mux_segments_with_ffmpeg`` concat also
-        fails. Production then raises the both-mux-failed M3U8Error.
+        so the real streaming remux fails and the segments are fetched again
+        (two responses per route) for the staged fallback. There the real
+        ``_PyAVSegmentMuxer`` skips 100% of segments (> 25% abort threshold
+        → False) and real ``_mux_segments_with_ffmpeg`` concat also fails.
+        Production then raises the both-mux-failed M3U8Error.
         """
         config = m3u8_mock_config
         mock_pyav_direct.return_value = False
@@ -252,17 +257,17 @@ class TestM3U8Integration:
             url__startswith="https://example.com/video.m3u8"
         ).mock(side_effect=[httpx.Response(200, text=_SEGMENT_PLAYLIST)])
         seg1_route = respx.get(url__startswith="https://example.com/segment1.ts").mock(
-            side_effect=[httpx.Response(200, content=garbage)]
+            side_effect=[httpx.Response(200, content=garbage)] * 2
         )
         seg2_route = respx.get(url__startswith="https://example.com/segment2.ts").mock(
-            side_effect=[httpx.Response(200, content=garbage)]
+            side_effect=[httpx.Response(200, content=garbage)] * 2
         )
 
         save_path = tmp_path / "video.ts"
 
         try:
             with pytest.raises(M3U8Error) as excinfo:
-                download_m3u8(
+                await download_m3u8(
                     config=config,
                     m3u8_url=_M3U8_URL,
                     save_path=save_path,
@@ -368,7 +368,7 @@ class TestUpdateStateFromAccount:
         state = DownloadState()
         state.creator_name = None  # Client account
 
-        _update_state_from_account(mock_config, state, account)
+        _update_state_from_account(state, account)
 
         assert state.creator_id == account_id
         assert state.walls == {wall_id_1, wall_id_2}
@@ -405,7 +405,7 @@ class TestUpdateStateFromAccount:
         state = DownloadState()
         state.creator_name = "creatoruser"  # Creator account
 
-        _update_state_from_account(mock_config, state, account)
+        _update_state_from_account(state, account)
 
         assert state.creator_id == account_id
         assert state.following is True
@@ -414,8 +414,10 @@ class TestUpdateStateFromAccount:
         assert state.total_timeline_videos == 50
         assert state.walls == {wall_id_1, wall_id_2}
 
-        # Custom duplicate threshold - 20% of timeline content
-        assert int(0.2 * (100 + 50)) == mock_config.DUPLICATE_THRESHOLD
+        # Custom duplicate threshold - 20% of timeline content, kept on the
+        # per-creator state; the shared config base is left untouched
+        assert int(0.2 * (100 + 50)) == state.duplicate_threshold
+        assert mock_config.DUPLICATE_THRESHOLD == 10
 
     def test_update_creator_missing_timeline_stats(self, mock_config):
         """Test error when timeline stats are missing for creator."""
@@ -430,7 +432,7 @@ class TestUpdateStateFromAccount:
         state.creator_name = "creatoruser"  # Creator account
 
         with pytest.raises(ApiAccountInfoError) as excinfo:
-            _update_state_from_account(mock_config, state, account)
+            _update_state_from_account(state, account)
 
         assert "Can not get timelineStats for creator" in str(excinfo.value)
         assert "creatoruser" in str(excinfo.value)
@@ -1,5 +1,7 @@
 """Tests for common download functionality."""
 
+import asyncio
+import gc
 import logging
 from unittest.mock import AsyncMock, patch
 
@@ -9,8 +11,10 @@ import respx
 
 import download.media as download_media_mod
 from download.common import (
+    PagePrefetcher,
     check_page_duplicates,
     get_unique_media_ids,
+    last_item_id,
     print_download_info,
     process_download_accessible_media,
 )
@@ -332,3 +336,83 @@ def test_print_download_info(mock_config, caplog):
         preview_warnings[0]
         == "Previews downloading is enabled; repetitive and/or emoji spammed media might be downloaded!"
     )
+
+
+@pytest.mark.parametrize(
+    ("page_data", "expected"),
+    [
+        pytest.param({"posts": [{"id": 1}, {"id": 22}]}, "22", id="last-id"),
+        pytest.param({"posts": []}, None, id="empty-page"),
+        pytest.param({}, None, id="missing-key"),
+        pytest.param({"posts": [{"content": "x"}]}, None, id="no-id"),
+    ],
+)
+def test_last_item_id(page_data, expected):
+    assert last_item_id(page_data, "posts") == expected
+
+
+async def _page(cursor: str, started: list[str]) -> httpx.Response:
+    started.append(cursor)
+    await asyncio.sleep(0)
+    return httpx.Response(200, json={"cursor": cursor})
+
+
+@pytest.mark.asyncio
+async def test_page_prefetcher_hands_over_matching_cursor():
+    """take() returns the running request for its cursor only once."""
+    started: list[str] = []
+    with PagePrefetcher() as next_page:
+        next_page.start("42", _page("42", started))
+        task = next_page.take("42")
+        assert task is not None
+        response = await task
+        assert next_page.take("42") is None
+
+    assert started == ["42"]
+    assert response.json() == {"cursor": "42"}
+
+
+@pytest.mark.asyncio
+async def test_page_prefetcher_drops_other_cursor_and_cancels_on_exit():
+    """A prefetch for another cursor, or one left pending, is cancelled."""
+    release = asyncio.Event()
+
+    async def _blocked() -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200)
+
+    with PagePrefetcher() as next_page:
+        next_page.start("1", _blocked())
+        first = next_page._task
+        assert next_page.take("2") is None
+
+        next_page.start("3", _blocked())
+        second = next_page._task
+    await asyncio.sleep(0)
+
+    assert first is not None
+    assert first.cancelled()
+    assert second is not None
+    assert second.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_page_prefetcher_discards_unused_failure():
+    """A failed prefetch nobody takes is not reported as unhandled."""
+    loop = asyncio.get_running_loop()
+    reported: list[dict] = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _loop, context: reported.append(context))
+
+    async def _fails() -> httpx.Response:
+        raise httpx.ConnectError("offline")
+
+    try:
+        with PagePrefetcher() as next_page:
+            next_page.start("1", _fails())
+            await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert reported == []
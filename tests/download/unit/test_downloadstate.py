@@ -49,3 +49,23 @@ def test_download_type_and_paths_walk(notset_download_state):
     notset_download_state.download_path = test_path
     assert isinstance(notset_download_state.download_path, Path)
     assert notset_download_state.download_path == test_path
+
+
+def test_effective_duplicate_threshold():
+    """Per-creator threshold overrides the config base only once set."""
+    state = DownloadState()
+    assert state.duplicate_threshold is None
+    assert state.effective_duplicate_threshold(50) == 50
+
+    state.duplicate_threshold = 120
+    assert state.effective_duplicate_threshold(50) == 120
+
+
+def test_progress_task_name_is_per_creator():
+    """Concurrent creators get distinct progress task names."""
+    first = DownloadState(creator_name="alice", creator_id=1)
+    second = DownloadState(creator_name="bob", creator_id=2)
+    assert first.progress_task_name("download_media") == "download_media_1"
+    assert first.progress_task_name("x") != second.progress_task_name("x")
+
+    assert DownloadState(creator_name="carol").progress_task_name("x") == "x_carol"
@@ -28,8 +28,10 @@ import respx
 from api.fansly import FanslyApi
 from config.fanslyconfig import FanslyConfig
 from download.livestream import (
+    _LIVE_MUX_MARKER,
     _download_segment,
     _get_authenticated_playback_url,
+    _LiveIvsMuxer,
     _mux_ivs_segments,
     _poll_segments_loop,
     _record_stream,
@@ -495,6 +497,91 @@ class TestMuxIvsSegments:
         assert isinstance(_mux_ivs_segments(segs, [6.0] * len(segs), out, "test"), bool)
 
 
+class TestLiveIvsMuxer:
+    """_LiveIvsMuxer drives the same per-segment mux on its own thread and
+    deletes each segment once it is in the fragmented output. PyAV is
+    leaf-faked exactly as in TestMuxIvsSegments."""
+
+    @staticmethod
+    def _run(
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        specs: dict[str, object],
+    ) -> tuple[list[Path], Path, bool | None]:
+        segs = TestMuxIvsSegments._write_segments(tmp_path, list(specs))
+        out = tmp_path / "live.mp4"
+        TestMuxIvsSegments._patch_av(
+            monkeypatch, make_ivs_av_open_fake_seq(output_path=out, segment_specs=specs)
+        )
+        muxer = _LiveIvsMuxer(out, "test")
+        muxer.start()
+        for seg in segs:
+            muxer.add(seg)
+        return segs, out, muxer.finish()
+
+    def test_segments_muxed_then_deleted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Every muxed segment is removed; finish() verifies the output."""
+        specs = {f"s{i}.ts": normal_av_segment() for i in range(3)}
+        segs, out, result = self._run(monkeypatch, tmp_path, specs)
+        assert result is True
+        assert out.stat().st_size > 0
+        assert not any(seg.exists() for seg in segs)
+
+    def test_pids_held_until_found(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Segments arriving before the PIDs are known are held and muxed
+        once a later segment supplies them."""
+        specs = {
+            "s0.ts": missing_pid_av_segment(present_pid=0x100),
+            "s1.ts": normal_av_segment(),
+            "s2.ts": normal_av_segment(),
+        }
+        segs, _, result = self._run(monkeypatch, tmp_path, specs)
+        assert result is False  # s0 skipped: 1/3 > 25%
+        # The skipped segment stays on disk; the muxed ones are gone.
+        assert [seg.exists() for seg in segs] == [True, False, False]
+
+    def test_no_pids_returns_none_and_keeps_segments(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No PIDs within the probe window → live mux gives up without
+        touching the segments, so the batch mux can take over."""
+        specs = {f"s{i}.ts": data_only_av_segment() for i in range(6)}
+        segs, out, result = self._run(monkeypatch, tmp_path, specs)
+        assert result is None
+        assert not out.exists()
+        assert all(seg.exists() for seg in segs)
+
+    def test_output_open_failure_returns_none(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """av.open(output) raising → None, segments untouched."""
+        specs = {"s0.ts": normal_av_segment()}
+        segs = TestMuxIvsSegments._write_segments(tmp_path, list(specs))
+        out = tmp_path / "live.mp4"
+        TestMuxIvsSegments._patch_av(
+            monkeypatch,
+            make_ivs_av_open_fake_seq(
+                output_path=out,
+                segment_specs=specs,
+                output_container_cls=FakeAvOutputContainerOpenError,
+            ),
+        )
+        muxer = _LiveIvsMuxer(out, "test")
+        muxer.start()
+        muxer.add(segs[0])
+        assert muxer.finish() is None
+        assert segs[0].exists()
+
+    def test_finish_without_segments_returns_none(self, tmp_path: Path) -> None:
+        muxer = _LiveIvsMuxer(tmp_path / "live.mp4", "test")
+        muxer.start()
+        assert muxer.finish() is None
+
+
 _VARIANT_URL = "https://use14.playlist.live-video.net/variant.m3u8"
 
 
@@ -547,9 +634,15 @@ class TestPollSegmentsLoop:
         respx.get(prefetch).mock(side_effect=[httpx.Response(200, content=b"ts")])
 
         stop = asyncio.Event()
+        handed_off: list[Path] = []
         try:
             segments, durations = await _poll_segments_loop(
-                _VARIANT_URL, tmp_path, stop, "test", manifest_poll_interval=0.0
+                _VARIANT_URL,
+                tmp_path,
+                stop,
+                "test",
+                manifest_poll_interval=0.0,
+                on_segment=handed_off.append,
             )
         finally:
             dump_fansly_calls(variant_route.calls, "poll_variant_sequence")
@@ -557,6 +650,7 @@ class TestPollSegmentsLoop:
         # seg_ok + prefetch downloaded; seg_fail skipped (404).
         assert len(segments) == 2
         assert len(durations) == 2
+        assert handed_off == segments
         assert variant_route.call_count == 3
 
     @pytest.mark.asyncio
@@ -723,6 +817,37 @@ class TestSalvageOrphanSegments:
         await _salvage_orphan_segments(config_wired)
         assert orphan.exists()
 
+    @pytest.mark.asyncio
+    async def test_live_mux_leftovers_go_to_next_part(
+        self,
+        config_wired: FanslyConfig,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A live-muxed orphan keeps its output; segments the live muxer never
+        reached are muxed into the next free _part file."""
+        base = self._base(config_wired, tmp_path)
+        assert config_wired.download_directory is not None
+        orphan = base / "live_segments"
+        orphan.mkdir(parents=True)
+        out = config_wired.download_directory / "live.mp4"
+        out.write_bytes(b"fragmented-mp4")
+        (orphan / "output_path.txt").write_text(str(out), encoding="utf-8")
+        (orphan / _LIVE_MUX_MARKER).touch()
+        (orphan / "segment_000007.ts").write_bytes(b"ts")
+        muxed_to: list[Path] = []
+
+        def _fake_mux(_segs: list[Path], _durs: list[float], path: Path, *_a: object):
+            muxed_to.append(path)
+            return True
+
+        monkeypatch.setattr("download.livestream._mux_ivs_segments", _fake_mux)
+
+        await _salvage_orphan_segments(config_wired)
+        assert muxed_to == [out.with_name("live_part2.mp4")]
+        assert out.read_bytes() == b"fragmented-mp4"
+        assert not orphan.exists()
+
     @pytest.mark.asyncio
     async def test_bridge_sets_mux_stop(
         self,
@@ -1043,6 +1168,58 @@ class TestRecordStream:
             config_wired, cid, "u", self._channel(cid), asyncio.Event(), asyncio.Event()
         )
 
+    @pytest.mark.asyncio
+    async def test_live_mux_replaces_batch_mux(
+        self,
+        config_wired: FanslyConfig,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With live muxing on, each polled segment goes to the live muxer and
+        its result decides the attempt; the batch mux is never called."""
+        self._setup(config_wired, tmp_path)
+        config_wired.monitoring_livestream_live_mux = True
+        cid = snowflake_id()
+        seg = tmp_path / "segment_000000.ts"
+        seg.write_bytes(b"ts")
+        added: list[Path] = []
+
+        class _FakeLiveMuxer:
+            def __init__(self, _output_path: Path, _log_prefix: str) -> None:
+                pass
+
+            def start(self) -> None:
+                pass
+
+            def add(self, path: Path) -> None:
+                added.append(path)
+
+            def finish(self) -> bool:
+                return True
+
+        async def _poll(
+            *_a: object, on_segment: Callable[[Path], None] | None = None
+        ) -> tuple[list[Path], list[float]]:
+            assert on_segment is not None
+            on_segment(seg)
+            return [seg], [6.0]
+
+        def _batch_mux(*_a: object, **_k: object) -> bool:
+            raise AssertionError("batch mux must not run")
+
+        monkeypatch.setattr(
+            "download.livestream._get_authenticated_playback_url", _always("a")
+        )
+        monkeypatch.setattr("download.livestream._resolve_variant_url", _always("v"))
+        monkeypatch.setattr("download.livestream._poll_segments_loop", _poll)
+        monkeypatch.setattr("download.livestream._LiveIvsMuxer", _FakeLiveMuxer)
+        monkeypatch.setattr("download.livestream._mux_ivs_segments", _batch_mux)
+        await _record_stream(
+            config_wired, cid, "u", self._channel(cid), asyncio.Event(), asyncio.Event()
+        )
+        assert added == [seg]
+        assert not list((tmp_path / "temp").rglob("*_segments"))
+
     @pytest.mark.asyncio
     async def test_forwarder_completes_and_chat_task_failure_logged(
         self,
@@ -41,6 +41,8 @@ dedicated-unit-coverage suite.
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -54,8 +56,11 @@ from m3u8 import M3U8
 from api.fansly import FanslyApi
 from config.fanslyconfig import FanslyConfig
 from download.m3u8 import (
+    _SEGMENT_ATTEMPTS,
     _mux_segments_with_ffmpeg,
     _mux_segments_with_pyav,
+    _SegmentManifest,
+    _SegmentPipe,
     _try_direct_download_ffmpeg,
     _try_direct_download_pyav,
     _try_segment_download,
@@ -71,7 +76,6 @@ from tests.fixtures.api import (
     make_synthetic_ivs_segment,
     mount_m3u8_segment_routes,
 )
-from tests.fixtures.utils import SyncExecutor
 
 
 # ---------------------------------------------------------------------------
@@ -416,7 +420,7 @@ segment1.ts
 class TestDownloadM3U8ThreeTierStrategy:
     """Orchestration tests for ``download_m3u8`` (see module comment)."""
 
-    def test_pyav_success_short_circuits(
+    async def test_pyav_success_short_circuits(
         self, mock_pyav, mock_ffmpeg, mock_segment, tmp_path
     ):
         """PyAV succeeds → FFmpeg + segment paths are not tried."""
@@ -424,7 +428,7 @@ class TestDownloadM3U8ThreeTierStrategy:
         save_path = tmp_path / "video.mp4"
         mock_pyav.return_value = True
 
-        result = download_m3u8(
+        result = await download_m3u8(
             config=config,
             m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
             save_path=save_path,
@@ -435,7 +439,7 @@ class TestDownloadM3U8ThreeTierStrategy:
         mock_ffmpeg.assert_not_called()
         mock_segment.assert_not_called()
 
-    def test_ffmpeg_fallback_when_pyav_fails(
+    async def test_ffmpeg_fallback_when_pyav_fails(
         self, mock_pyav, mock_ffmpeg, mock_segment, tmp_path
     ):
         """PyAV fails → FFmpeg tried → succeeds → segment path skipped."""
@@ -444,7 +448,7 @@ class TestDownloadM3U8ThreeTierStrategy:
         mock_pyav.return_value = False
         mock_ffmpeg.return_value = True
 
-        result = download_m3u8(
+        result = await download_m3u8(
             config=config,
             m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
             save_path=save_path,
@@ -455,7 +459,7 @@ class TestDownloadM3U8ThreeTierStrategy:
         mock_ffmpeg.assert_called_once()
         mock_segment.assert_not_called()
 
-    def test_segment_fallback_when_both_direct_fail(
+    async def test_segment_fallback_when_both_direct_fail(
         self, mock_pyav, mock_ffmpeg, mock_segment, tmp_path
     ):
         """Both PyAV + FFmpeg fail → segment path is tried."""
@@ -465,7 +469,7 @@ class TestDownloadM3U8ThreeTierStrategy:
         mock_ffmpeg.return_value = False
         mock_segment.return_value = save_path.parent / "video.mp4"
 
-        result = download_m3u8(
+        result = await download_m3u8(
             config=config,
             m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
             save_path=save_path,
@@ -482,7 +486,7 @@ class TestDownloadM3U8ThreeTierStrategy:
             pytest.param(False, False, 1633046400, id="segment_fallback"),
         ],
     )
-    def test_created_at_applied_on_each_tier(
+    async def test_created_at_applied_on_each_tier(
         self,
         mock_pyav,
         mock_ffmpeg,
@@ -511,7 +515,7 @@ class TestDownloadM3U8ThreeTierStrategy:
             "download.m3u8.os.utime", lambda p, t: utime_calls.append((p, t))
         )
 
-        download_m3u8(
+        await download_m3u8(
             config=config,
             m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
             save_path=save_path,
@@ -522,7 +526,7 @@ class TestDownloadM3U8ThreeTierStrategy:
             (save_path.parent / "video.mp4", (created_at, created_at))
         ]
 
-    def test_non_m3u8error_exception_is_wrapped(
+    async def test_non_m3u8error_exception_is_wrapped(
         self, mock_pyav, mock_ffmpeg, mock_segment, tmp_path
     ):
         """Generic exception from any tier → wrapped in M3U8Error."""
@@ -531,13 +535,13 @@ class TestDownloadM3U8ThreeTierStrategy:
         mock_pyav.side_effect = RuntimeError("unexpected crash")
 
         with pytest.raises(M3U8Error, match="Failed to download HLS video"):
-            download_m3u8(
+            await download_m3u8(
                 config=config,
                 m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
                 save_path=save_path,
             )
 
-    def test_m3u8error_reraised_untouched(
+    async def test_m3u8error_reraised_untouched(
         self, mock_pyav, mock_ffmpeg, mock_segment, tmp_path
     ):
         """M3U8Error from a tier propagates without being re-wrapped."""
@@ -546,7 +550,7 @@ class TestDownloadM3U8ThreeTierStrategy:
         mock_pyav.side_effect = M3U8Error("specific segment failure")
 
         with pytest.raises(M3U8Error, match="specific segment failure"):
-            download_m3u8(
+            await download_m3u8(
                 config=config,
                 m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
                 save_path=save_path,
@@ -1838,22 +1842,77 @@ class TestMuxSegmentsWithFFmpeg:
 
 
 # ---------------------------------------------------------------------------
-# TestSegmentDownload — real orchestration + fake API + fake mux leaves
+# TestSegmentDownload — real orchestration + respx HTTP + fake mux leaves
 # ---------------------------------------------------------------------------
 
+_SEGMENT_TEST_URL = "https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s"
+
+
+def _single_segment_playlist() -> str:
+    return (
+        "#EXTM3U\n"
+        "#EXT-X-VERSION:3\n"
+        "#EXT-X-PLAYLIST-TYPE:VOD\n"
+        "#EXT-X-TARGETDURATION:10\n"
+        "#EXT-X-MEDIA-SEQUENCE:40\n"
+        "#EXTINF:10.0,\n"
+        "segment1.ts\n"
+        "#EXT-X-ENDLIST\n"
+    )
+
+
+def _fake_segment_muxer(
+    *, succeed: bool = True, added: list[tuple[str, int]] | None = None
+) -> type:
+    """Build a stand-in for ``_PyAVSegmentMuxer``.
+
+    ``add`` records ``(file name, size)`` of each segment it is fed — the
+    file must exist on real disk at that point — and ``finish`` writes a
+    stub MP4 when ``succeed``. The real class has its own suite above
+    (through ``_mux_segments_with_pyav``).
+    """
+
+    class _FakeSegmentMuxer:
+        def __init__(self, output_path: Path) -> None:
+            self.output_path = output_path
+
+        def add(self, segment_path: Path) -> None:
+            if added is not None:
+                added.append((segment_path.name, segment_path.stat().st_size))
+
+        def finish(self) -> bool:
+            if succeed:
+                self.output_path.write_bytes(b"\x00" * 1024)
+            return succeed
+
+        def close(self) -> None:
+            pass
+
+    return _FakeSegmentMuxer
+
+
+async def _streaming_disabled(*_args, **_kwargs) -> bool:
+    """Stand-in for ``_stream_segments`` that reports a remux failure."""
+    return False
+
 
 class TestSegmentDownload:
-    """Real-code tests for ``_try_segment_download``.
-
-    Exercises the real inner ``download_ts`` function (lines 593-618)
-    against a fake ``get_with_ngsw`` that streams bytes. A
-    ``SyncExecutor`` (from ``tests.fixtures.utils``) replaces
-    ThreadPoolExecutor so coverage instrumentation sees the download_ts
-    body — otherwise threaded code is invisible to coverage.py.
-    ``_mux_segments_with_pyav`` / ``_mux_segments_with_ffmpeg`` patched
-    at module level — their own tests (above) cover their real behavior.
+    """Real-code tests for ``_try_segment_download``'s staged path.
+
+    Segments stream through the real async ``get_with_ngsw`` against respx
+    routes. The streaming remux is switched off (``_stream_segments`` →
+    False, see ``TestStreamingSegmentRemux``) so every test runs the
+    staged fallback and each segment is fetched once.
+    ``_PyAVSegmentMuxer`` / ``_mux_segments_with_ffmpeg`` are patched at
+    module level — their own tests (above) cover their real behavior.
+    Retry sleeps are zeroed via ``_SEGMENT_RETRY_DELAY``.
     """
 
+    @pytest.fixture(autouse=True)
+    def _staged_only(self, monkeypatch):
+        monkeypatch.setattr("download.m3u8._SEGMENT_RETRY_DELAY", 0)
+        monkeypatch.setattr("download.m3u8._stream_segments", _streaming_disabled)
+
     def _make_config_with_segments(self, fansly_api: FanslyApi) -> FanslyConfig:
         """Build a real config attached to ``fansly_api``.
 
@@ -1865,19 +1924,17 @@ class TestSegmentDownload:
         config._api = fansly_api
         return config
 
-    def test_success_invokes_pyav_mux(self, tmp_path, monkeypatch, respx_fansly_api):
-        """All segments downloaded + PyAV mux succeeds → returns output_path."""
+    async def test_success_muxes_segments_in_order(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """All segments downloaded → fed to PyAV in playlist order."""
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
         cookies = {"CloudFront-Policy": "abc"}
 
-        # Synchronous executor — see SyncExecutor docstring for why.
+        added: list[tuple[str, int]] = []
         monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
-        )
-        monkeypatch.setattr(
-            "download.m3u8._mux_segments_with_pyav",
-            lambda _segs, out: out.write_bytes(b"\x00" * 1024) or True,
+            "download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer(added=added)
         )
         ffmpeg_called = {"n": 0}
         monkeypatch.setattr(
@@ -1888,9 +1945,9 @@ class TestSegmentDownload:
         playlist_route, segment_route = mount_m3u8_segment_routes()
 
         try:
-            result = _try_segment_download(
+            result = await _try_segment_download(
                 config=config,
-                m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                m3u8_url=_SEGMENT_TEST_URL,
                 output_path=output_path,
                 cookies=cookies,
             )
@@ -1899,25 +1956,24 @@ class TestSegmentDownload:
             dump_fansly_calls(segment_route.calls)
 
         assert result == output_path
+        assert added == [("segment1.ts", 256), ("segment2.ts", 256)]
         # ffmpeg mux not called — PyAV succeeded first.
         assert ffmpeg_called["n"] == 0
+        # Staged segments are cleaned up.
+        assert not list(tmp_path.glob("*.ts"))
 
-    def test_ffmpeg_mux_fallback(self, tmp_path, monkeypatch, respx_fansly_api):
-        """PyAV mux fails → FFmpeg concat fallback tried."""
+    async def test_ffmpeg_mux_fallback(self, tmp_path, monkeypatch, respx_fansly_api):
+        """PyAV mux fails → FFmpeg concat fallback tried on staged files."""
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
 
         monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
-        )
-        monkeypatch.setattr(
-            "download.m3u8._mux_segments_with_pyav",
-            lambda _segs, _out: False,
+            "download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer(succeed=False)
         )
-        ffmpeg_called = {"n": 0}
+        ffmpeg_segments: list[list[str]] = []
 
-        def _ffmpeg_mux(_segs, out):
-            ffmpeg_called["n"] += 1
+        def _ffmpeg_mux(segs, out):
+            ffmpeg_segments.append([seg.name for seg in segs if seg.exists()])
             out.write_bytes(b"\x00" * 1024)
             return True
 
@@ -1926,9 +1982,9 @@ class TestSegmentDownload:
         playlist_route, segment_route = mount_m3u8_segment_routes()
 
         try:
-            result = _try_segment_download(
+            result = await _try_segment_download(
                 config=config,
-                m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                m3u8_url=_SEGMENT_TEST_URL,
                 output_path=output_path,
                 cookies={"CloudFront-Policy": "a"},
             )
@@ -1937,18 +1993,48 @@ class TestSegmentDownload:
             dump_fansly_calls(segment_route.calls)
 
         assert result == output_path
-        assert ffmpeg_called["n"] == 1
+        assert ffmpeg_segments == [["segment1.ts", "segment2.ts"]]
 
-    def test_both_mux_paths_fail_raises(self, tmp_path, monkeypatch, respx_fansly_api):
-        """Both PyAV + FFmpeg mux fail → raises M3U8Error."""
+    async def test_muxer_open_failure_falls_back_to_ffmpeg(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """``_PyAVSegmentMuxer`` raising on open → FFmpeg concat still runs."""
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
 
+        def _raising_muxer(_out):
+            raise OSError("cannot open output")
+
+        monkeypatch.setattr("download.m3u8._PyAVSegmentMuxer", _raising_muxer)
         monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
+            "download.m3u8._mux_segments_with_ffmpeg",
+            lambda _segs, out: out.write_bytes(b"\x00" * 1024) or True,
         )
+
+        playlist_route, segment_route = mount_m3u8_segment_routes()
+
+        try:
+            result = await _try_segment_download(
+                config=config,
+                m3u8_url=_SEGMENT_TEST_URL,
+                output_path=output_path,
+                cookies={"CloudFront-Policy": "a"},
+            )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(segment_route.calls)
+
+        assert result == output_path
+
+    async def test_both_mux_paths_fail_raises(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """Both PyAV + FFmpeg mux fail → raises M3U8Error."""
+        config = self._make_config_with_segments(respx_fansly_api)
+        output_path = tmp_path / "video.mp4"
+
         monkeypatch.setattr(
-            "download.m3u8._mux_segments_with_pyav", lambda *_a, **_k: False
+            "download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer(succeed=False)
         )
         monkeypatch.setattr(
             "download.m3u8._mux_segments_with_ffmpeg", lambda *_a, **_k: False
@@ -1958,9 +2044,9 @@ class TestSegmentDownload:
 
         try:
             with pytest.raises(M3U8Error, match="Both PyAV and FFmpeg muxing failed"):
-                _try_segment_download(
+                await _try_segment_download(
                     config=config,
-                    m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                    m3u8_url=_SEGMENT_TEST_URL,
                     output_path=output_path,
                     cookies={"CloudFront-Policy": "a"},
                 )
@@ -1968,25 +2054,24 @@ class TestSegmentDownload:
             dump_fansly_calls(playlist_route.calls)
             dump_fansly_calls(segment_route.calls)
 
-    def test_missing_segments_raises(self, tmp_path, monkeypatch, respx_fansly_api):
-        """Segment returns 404 → not-written on disk → raises with list."""
+    async def test_client_error_is_not_retried(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """Segment returns 404 → fails at once, no retry, raises with list."""
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
 
-        monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
-        )
-        monkeypatch.setattr(
-            "download.m3u8._mux_segments_with_pyav", lambda *_a, **_k: True
-        )
+        monkeypatch.setattr("download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer())
 
         playlist_route, segment_route = mount_m3u8_segment_routes(segment_status=404)
 
         try:
-            with pytest.raises(M3U8Error, match="Stream segments failed to download"):
-                _try_segment_download(
+            with pytest.raises(
+                M3U8Error, match="Stream segments failed to download"
+            ) as exc_info:
+                await _try_segment_download(
                     config=config,
-                    m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                    m3u8_url=_SEGMENT_TEST_URL,
                     output_path=output_path,
                     cookies={"CloudFront-Policy": "a"},
                 )
@@ -1994,68 +2079,67 @@ class TestSegmentDownload:
             dump_fansly_calls(playlist_route.calls)
             dump_fansly_calls(segment_route.calls)
 
-    def test_download_ts_skips_empty_chunks(
+        assert "status 404" in str(exc_info.value)
+        # Both segments were in flight at once; neither was retried.
+        assert segment_route.call_count == 2
+        assert not output_path.exists()
+
+    async def test_server_error_retried_until_exhausted(
         self, tmp_path, monkeypatch, respx_fansly_api
     ):
-        """iter_bytes yields empty chunks mixed with real ones → empties skipped.
-
-        Covers partial branch 612->611: the ``if chunk:`` falsy branch
-        (empty bytes) continues the loop without writing. Real httpx
-        streaming responses can yield empty chunks when the network
-        pauses; the production guard protects against writing empty data.
-        """
+        """Segment keeps returning 500 → every attempt is used, then raises."""
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
 
-        playlist_text = (
-            "#EXTM3U\n"
-            "#EXT-X-VERSION:3\n"
-            "#EXT-X-PLAYLIST-TYPE:VOD\n"
-            "#EXT-X-TARGETDURATION:10\n"
-            "#EXTINF:10.0,\n"
-            "segment1.ts\n"
-            "#EXT-X-ENDLIST\n"
-        )
-
-        class _EmptyAndRealChunkStream(httpx.SyncByteStream):
-            """Custom byte stream that yields empty chunks mixed with real bytes.
-
-            Selective deviation from real httpx behavior: real responses
-            rarely yield ``b""`` from ``iter_bytes``, but they CAN under
-            network pauses. This stream injects that deviation to exercise
-            production's ``if chunk:`` guard at download/m3u8.py line 612.
-            """
-
-            def __iter__(self):
-                yield b""  # empty chunk — hits line 612 False
-                yield b"\x00" * 128  # real chunk — hits line 612 True
-                yield b""  # another empty
-
-            def close(self) -> None:
-                pass
+        monkeypatch.setattr("download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer())
 
-        monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
+        playlist_route, segment_route = mount_m3u8_segment_routes(
+            segment_status=500, segment_count=2 * _SEGMENT_ATTEMPTS
         )
+
+        try:
+            with pytest.raises(M3U8Error, match="Stream segments failed to download"):
+                await _try_segment_download(
+                    config=config,
+                    m3u8_url=_SEGMENT_TEST_URL,
+                    output_path=output_path,
+                    cookies={"CloudFront-Policy": "a"},
+                )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(segment_route.calls)
+
+        assert segment_route.call_count == 2 * _SEGMENT_ATTEMPTS
+
+    async def test_transient_failure_retried_by_sequence(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """503 then 200 for the same media sequence → download succeeds."""
+        config = self._make_config_with_segments(respx_fansly_api)
+        output_path = tmp_path / "video.mp4"
+
+        added: list[tuple[str, int]] = []
         monkeypatch.setattr(
-            "download.m3u8._mux_segments_with_pyav",
-            lambda _segs, out: out.write_bytes(b"\x00" * 1024) or True,
+            "download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer(added=added)
         )
 
         respx.options(url__startswith="https://example.com/").mock(
             side_effect=[httpx.Response(200)] * 3
         )
         segment_route = respx.get(url__startswith="https://example.com/segment").mock(
-            side_effect=[httpx.Response(200, stream=_EmptyAndRealChunkStream())]
+            side_effect=[
+                httpx.Response(503),
+                httpx.Response(200, content=b"\x00" * 128),
+            ]
         )
         playlist_route = respx.get(url__startswith="https://example.com/v.m3u8").mock(
-            side_effect=[httpx.Response(200, text=playlist_text)]
+            side_effect=[httpx.Response(200, text=_single_segment_playlist())]
         )
 
         try:
-            result = _try_segment_download(
+            result = await _try_segment_download(
                 config=config,
-                m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                m3u8_url=_SEGMENT_TEST_URL,
                 output_path=output_path,
                 cookies={"CloudFront-Policy": "a"},
             )
@@ -2064,31 +2148,35 @@ class TestSegmentDownload:
             dump_fansly_calls(segment_route.calls)
 
         assert result == output_path
+        assert segment_route.call_count == 2
+        assert added == [("segment1.ts", 128)]
 
-    def test_download_ts_handles_non_200_status(
+    async def test_failed_segment_reports_media_sequence(
         self, tmp_path, monkeypatch, respx_fansly_api
     ):
-        """Segment returns non-200 → debug log + returns without writing.
+        """Segment get_with_ngsw raises on every attempt → M3U8Error.
 
-        Covers lines 604-609: the inner download_ts's status-check early
-        return. Unlike the 404 test above, this lets the function return
-        from ``download_ts`` without raising — the file is simply not
-        created, which is then caught by the missing-segments check.
+        The error names the segment by EXT-X-MEDIA-SEQUENCE (40 here), not
+        by its index in the playlist.
         """
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
 
-        monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
-        )
+        monkeypatch.setattr("download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer())
 
-        playlist_route, segment_route = mount_m3u8_segment_routes(segment_status=500)
+        playlist_route, segment_route = mount_m3u8_segment_routes(
+            playlist_text=_single_segment_playlist(),
+            segment_count=_SEGMENT_ATTEMPTS,
+            segment_raises=RuntimeError("segment download exception"),
+        )
 
         try:
-            with pytest.raises(M3U8Error, match="Stream segments failed to download"):
-                _try_segment_download(
+            with pytest.raises(
+                M3U8Error, match="Stream segments failed to download"
+            ) as exc_info:
+                await _try_segment_download(
                     config=config,
-                    m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                    m3u8_url=_SEGMENT_TEST_URL,
                     output_path=output_path,
                     cookies={"CloudFront-Policy": "a"},
                 )
@@ -2096,72 +2184,75 @@ class TestSegmentDownload:
             dump_fansly_calls(playlist_route.calls)
             dump_fansly_calls(segment_route.calls)
 
-    def test_download_ts_handles_http_exception(
+        assert "segment1.ts (segment download exception)" in str(exc_info.value)
+        assert segment_route.call_count == _SEGMENT_ATTEMPTS
+
+    async def test_segment_streams_in_chunks(
         self, tmp_path, monkeypatch, respx_fansly_api
     ):
-        """Segment get_with_ngsw raises → inner download_ts except fires.
-
-        Covers lines 614-615: ``except Exception`` in the inner download_ts
-        function. When ALL segments fail via exceptions, missing_segments
-        detection raises M3U8Error.
-        """
+        """A segment body arriving in several chunks is written whole."""
         config = self._make_config_with_segments(respx_fansly_api)
         output_path = tmp_path / "video.mp4"
 
-        playlist_text = (
-            "#EXTM3U\n"
-            "#EXT-X-VERSION:3\n"
-            "#EXT-X-PLAYLIST-TYPE:VOD\n"
-            "#EXT-X-TARGETDURATION:10\n"
-            "#EXTINF:10.0,\n"
-            "segment1.ts\n"
-            "#EXT-X-ENDLIST\n"
-        )
+        class _ChunkedStream(httpx.AsyncByteStream):
+            """Async byte stream yielding the body in uneven pieces."""
+
+            async def __aiter__(self):
+                yield b""
+                yield b"\x00" * 100
+                yield b"\x00" * 28
 
+            async def aclose(self) -> None:
+                pass
+
+        added: list[tuple[str, int]] = []
         monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
+            "download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer(added=added)
         )
 
-        playlist_route, segment_route = mount_m3u8_segment_routes(
-            playlist_text=playlist_text,
-            segment_count=1,
-            segment_raises=RuntimeError("segment download exception"),
+        respx.options(url__startswith="https://example.com/").mock(
+            side_effect=[httpx.Response(200)] * 3
+        )
+        segment_route = respx.get(url__startswith="https://example.com/segment").mock(
+            side_effect=[httpx.Response(200, stream=_ChunkedStream())]
+        )
+        playlist_route = respx.get(url__startswith="https://example.com/v.m3u8").mock(
+            side_effect=[httpx.Response(200, text=_single_segment_playlist())]
         )
 
         try:
-            with pytest.raises(M3U8Error, match="Stream segments failed to download"):
-                _try_segment_download(
-                    config=config,
-                    m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
-                    output_path=output_path,
-                    cookies={"CloudFront-Policy": "a"},
-                )
+            result = await _try_segment_download(
+                config=config,
+                m3u8_url=_SEGMENT_TEST_URL,
+                output_path=output_path,
+                cookies={"CloudFront-Policy": "a"},
+            )
         finally:
             dump_fansly_calls(playlist_route.calls)
             dump_fansly_calls(segment_route.calls)
 
-    def test_running_total_aborts_and_cleans_segments(
-        self, tmp_path, monkeypatch, respx_fansly_api
+        assert result == output_path
+        assert added == [("segment1.ts", 128)]
+
+    async def test_running_total_aborts_and_cleans_segments(
+        self, tmp_path, respx_fansly_api
     ):
         """Running total over max_bytes → MediaFilteredError, no .mp4/.ts left.
 
-        Four real IVS segments served sequentially via SyncExecutor so the
+        Four real IVS segments fetched one at a time (concurrency 1) so the
         running-total threshold is crossed deterministically on the third
-        segment; the fourth is skipped (abort_event already set) and the
-        function's own cleanup finally-block removes every downloaded
-        segment file — none should remain on disk.
+        segment; the fourth is never requested and the function's own
+        cleanup finally-block removes every staged segment file — none
+        should remain on disk. The real ``_PyAVSegmentMuxer`` runs here.
         """
         config = self._make_config_with_segments(respx_fansly_api)
+        config.m3u8_segment_concurrency = 1
         output_path = tmp_path / "video.mp4"
 
         segment_bytes = make_synthetic_ivs_segment()
         seg_len = len(segment_bytes)
         max_bytes = seg_len * 2 + 1  # first two segments pass; third pushes over
 
-        monkeypatch.setattr(
-            "download.m3u8.concurrent.futures.ThreadPoolExecutor", SyncExecutor
-        )
-
         playlist_text = (
             build_variant_playlist(
                 media_sequence=0,
@@ -2183,9 +2274,9 @@ class TestSegmentDownload:
 
         try:
             with pytest.raises(MediaFilteredError) as exc_info:
-                _try_segment_download(
+                await _try_segment_download(
                     config=config,
-                    m3u8_url="https://example.com/v.m3u8?Policy=a&Key-Pair-Id=k&Signature=s",
+                    m3u8_url=_SEGMENT_TEST_URL,
                     output_path=output_path,
                     cookies={"CloudFront-Policy": "a"},
                     max_bytes=max_bytes,
@@ -2196,5 +2287,357 @@ class TestSegmentDownload:
 
         assert exc_info.value.reason == "file_size_max"
         assert exc_info.value.observed == seg_len * 3
+        assert segment_route.call_count == 3
         assert not output_path.exists()
         assert not list(tmp_path.glob("*.ts"))
+
+
+# ---------------------------------------------------------------------------
+# TestStreamingSegmentRemux — in-memory segments → one PyAV session
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingSegmentRemux:
+    """Tier 3's default path: segments never staged as .ts files."""
+
+    @pytest.fixture(autouse=True)
+    def _no_retry_delay(self, monkeypatch):
+        monkeypatch.setattr("download.m3u8._SEGMENT_RETRY_DELAY", 0)
+
+    async def test_real_segments_remux_without_staging(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """Real IVS segments → real streaming remux → MP4, no .ts on disk."""
+        config = _make_real_config()
+        config._api = respx_fansly_api
+        output_path = tmp_path / "video.mp4"
+
+        async def _no_staging(*_a, **_k):
+            raise AssertionError("staged fallback must not run")
+
+        monkeypatch.setattr("download.m3u8._stage_segments", _no_staging)
+        written: list[Path] = []
+        real_write_bytes = Path.write_bytes
+        monkeypatch.setattr(
+            Path,
+            "write_bytes",
+            lambda path, data: written.append(path) or real_write_bytes(path, data),
+        )
+
+        playlist_route, segment_route = mount_m3u8_segment_routes(
+            segment_bytes=make_synthetic_ivs_segment(),
+        )
+
+        try:
+            result = await _try_segment_download(
+                config=config,
+                m3u8_url=_SEGMENT_TEST_URL,
+                output_path=output_path,
+                cookies={"CloudFront-Policy": "a"},
+            )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(segment_route.calls)
+
+        assert result == output_path
+        assert segment_route.call_count == 2
+        assert written == []
+        muxed = av.open(str(result))
+        try:
+            assert muxed.streams.video
+            assert muxed.streams.audio
+        finally:
+            muxed.close()
+
+    async def test_remux_failure_refetches_to_staged_path(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """Streaming remuxer gives up → segments re-fetched and staged.
+
+        Four segment responses are mounted: the streaming pass may fetch
+        one or both segments before it notices the remuxer is gone.
+        """
+        config = _make_real_config()
+        config._api = respx_fansly_api
+        output_path = tmp_path / "video.mp4"
+
+        def _failing_remux(pipe, _out):
+            pipe.read(16)
+            pipe.close()
+            return False
+
+        added: list[tuple[str, int]] = []
+        monkeypatch.setattr("download.m3u8._remux_segment_stream", _failing_remux)
+        monkeypatch.setattr(
+            "download.m3u8._PyAVSegmentMuxer", _fake_segment_muxer(added=added)
+        )
+
+        playlist_route, segment_route = mount_m3u8_segment_routes(segment_count=4)
+
+        try:
+            result = await _try_segment_download(
+                config=config,
+                m3u8_url=_SEGMENT_TEST_URL,
+                output_path=output_path,
+                cookies={"CloudFront-Policy": "a"},
+            )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(segment_route.calls)
+
+        assert result == output_path
+        # The staged pass fetched and muxed every segment again.
+        assert added == [("segment1.ts", 256), ("segment2.ts", 256)]
+        assert not list(tmp_path.glob("*.ts"))
+
+    async def test_download_failure_skips_staged_fallback(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """A failed segment is a download error, not a remux error."""
+        config = _make_real_config()
+        config._api = respx_fansly_api
+        output_path = tmp_path / "video.mp4"
+
+        async def _no_staging(*_a, **_k):
+            raise AssertionError("staged fallback must not run")
+
+        monkeypatch.setattr("download.m3u8._stage_segments", _no_staging)
+
+        playlist_route, segment_route = mount_m3u8_segment_routes(segment_status=404)
+
+        try:
+            with pytest.raises(M3U8Error, match="Stream segments failed to download"):
+                await _try_segment_download(
+                    config=config,
+                    m3u8_url=_SEGMENT_TEST_URL,
+                    output_path=output_path,
+                    cookies={"CloudFront-Policy": "a"},
+                )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(segment_route.calls)
+
+        assert not output_path.exists()
+
+
+class TestSegmentPipe:
+    """``_SegmentPipe`` read/write/EOF semantics (single-threaded)."""
+
+    def test_reads_span_and_split_segments(self):
+        pipe = _SegmentPipe(max_segments=4)
+        assert pipe.write(b"abcdef")
+        assert pipe.write(b"gh")
+        pipe.finish()
+
+        assert pipe.read(4) == b"abcd"
+        assert pipe.read(10) == b"ef"
+        assert pipe.read() == b"gh"
+        assert pipe.read(4) == b""
+
+    def test_close_rejects_writes_and_ends_reads(self):
+        pipe = _SegmentPipe(max_segments=1)
+        assert pipe.write(b"queued")
+        pipe.close()
+
+        assert pipe.write(b"late") is False
+        assert pipe.read(4) == b""
+
+
+# ---------------------------------------------------------------------------
+# TestSegmentManifest / TestResumableSegmentDownload — resume state on disk
+# ---------------------------------------------------------------------------
+
+
+_TWO_SEGMENT_PLAYLIST = (
+    build_variant_playlist(
+        media_sequence=0,
+        segment_uris=["segment1.ts", "segment2.ts"],
+        endlist=True,
+    )
+    + "#EXT-X-PLAYLIST-TYPE:VOD\n"
+)
+
+
+def _two_segment_playlist(base_uri: str = "https://example.com") -> M3U8:
+    return M3U8(content=_TWO_SEGMENT_PLAYLIST, base_uri=base_uri)
+
+
+class TestSegmentManifest:
+    """``_SegmentManifest`` persistence and crash-consistency rules."""
+
+    def test_reopen_restores_completed_segments(self, tmp_path):
+        resume_dir = tmp_path / "42_hls"
+        manifest = _SegmentManifest.open(resume_dir, _two_segment_playlist())
+        assert manifest.completed == 0
+        manifest.append(0, b"first")
+
+        reopened = _SegmentManifest.open(resume_dir, _two_segment_playlist())
+
+        assert reopened.completed == 1
+        assert reopened.spooled_bytes == 5
+        assert reopened.read_segment(0) == b"first"
+        assert _SegmentManifest.exists(resume_dir)
+
+    def test_torn_spool_drops_unbacked_segments(self, tmp_path):
+        """Manifest lines whose bytes never fully reached the spool are dropped."""
+        resume_dir = tmp_path / "42_hls"
+        manifest = _SegmentManifest.open(resume_dir, _two_segment_playlist())
+        manifest.append(0, b"first")
+        manifest.append(1, b"second")
+        with manifest.spool_path.open("r+b") as spool:
+            spool.truncate(8)
+        with manifest.manifest_path.open("a", encoding="utf-8") as lines:
+            lines.write('{"index": 2, "si')  # torn final line
+
+        reopened = _SegmentManifest.open(resume_dir, _two_segment_playlist())
+
+        assert reopened.completed == 1
+        assert reopened.spool_path.stat().st_size == 5
+
+    def test_different_variant_starts_over(self, tmp_path):
+        resume_dir = tmp_path / "42_hls"
+        manifest = _SegmentManifest.open(resume_dir, _two_segment_playlist())
+        manifest.append(0, b"first")
+
+        reopened = _SegmentManifest.open(
+            resume_dir, _two_segment_playlist("https://example.com/720p")
+        )
+
+        assert reopened.completed == 0
+        assert reopened.spool_path.stat().st_size == 0
+
+    def test_out_of_order_append_rejected(self, tmp_path):
+        manifest = _SegmentManifest.open(tmp_path / "42_hls", _two_segment_playlist())
+
+        with pytest.raises(ValueError, match="out of order"):
+            manifest.append(1, b"second")
+
+    def test_prune_removes_only_stale_resume_dirs(self, tmp_path):
+        stale = _SegmentManifest.open(tmp_path / "1_42_hls", _two_segment_playlist())
+        fresh = _SegmentManifest.open(tmp_path / "1_43_hls", _two_segment_playlist())
+        unrelated = tmp_path / "44_segments"
+        unrelated.mkdir()
+        week_ago = time.time() - _SegmentManifest.MAX_AGE_SECONDS - 60
+        os.utime(stale.manifest_path, (week_ago, week_ago))
+        os.utime(unrelated, (week_ago, week_ago))
+
+        removed = _SegmentManifest.prune(tmp_path)
+
+        assert removed == [stale.resume_dir]
+        assert not stale.resume_dir.exists()
+        assert fresh.resume_dir.exists()
+        assert unrelated.exists()
+        assert _SegmentManifest.prune(tmp_path / "missing") == []
+
+
+class TestResumableSegmentDownload:
+    """Interrupted tier-3 downloads keep their segments and resume."""
+
+    @pytest.fixture(autouse=True)
+    def _no_retry_delay(self, monkeypatch):
+        monkeypatch.setattr("download.m3u8._SEGMENT_RETRY_DELAY", 0)
+
+    async def test_failure_keeps_state_and_retry_resumes(
+        self, tmp_path, monkeypatch, respx_fansly_api
+    ):
+        """First run loses segment2 → second run fetches only segment2.
+
+        The retry skips tiers 1 and 2, replays segment1 from the spool into
+        the real streaming remux and removes the resume dir on success.
+        """
+        config = _make_real_config()
+        config._api = respx_fansly_api
+        resume_dir = tmp_path / "temp" / "42_hls"
+        save_path = tmp_path / "video.ts"
+        segment1 = make_synthetic_ivs_segment(seed=1)
+        segment2 = make_synthetic_ivs_segment(seed=2)
+
+        tier_calls = {"n": 0}
+
+        def _direct_tier_fails(*_a, **_k):
+            tier_calls["n"] += 1
+            return False
+
+        monkeypatch.setattr(
+            "download.m3u8._try_direct_download_pyav", _direct_tier_fails
+        )
+        monkeypatch.setattr(
+            "download.m3u8._try_direct_download_ffmpeg", _direct_tier_fails
+        )
+
+        respx.options(url__startswith="https://example.com/").mock(
+            side_effect=[httpx.Response(200)] * 8
+        )
+        playlist_route = respx.get(url__startswith="https://example.com/v.m3u8").mock(
+            side_effect=[httpx.Response(200, text=_TWO_SEGMENT_PLAYLIST)] * 2
+        )
+        seg1_route = respx.get(url__startswith="https://example.com/segment1.ts").mock(
+            side_effect=[httpx.Response(200, content=segment1)]
+        )
+        seg2_route = respx.get(url__startswith="https://example.com/segment2.ts").mock(
+            side_effect=[
+                httpx.Response(404),
+                httpx.Response(200, content=segment2),
+            ]
+        )
+
+        try:
+            with pytest.raises(M3U8Error, match=r"segment2\.ts"):
+                await download_m3u8(
+                    config=config,
+                    m3u8_url=_SEGMENT_TEST_URL,
+                    save_path=save_path,
+                    resume_dir=resume_dir,
+                )
+            assert _SegmentManifest.exists(resume_dir)
+            assert tier_calls["n"] == 2
+
+            result = await download_m3u8(
+                config=config,
+                m3u8_url=_SEGMENT_TEST_URL,
+                save_path=save_path,
+                resume_dir=resume_dir,
+            )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(seg1_route.calls + seg2_route.calls)
+
+        assert result == tmp_path / "video.mp4"
+        assert result.stat().st_size > 0
+        assert seg1_route.call_count == 1
+        assert seg2_route.call_count == 2
+        # Tiers 1 and 2 were not retried on the resumed run.
+        assert tier_calls["n"] == 2
+        assert not resume_dir.exists()
+
+    async def test_filtered_download_discards_state(self, tmp_path, respx_fansly_api):
+        """Crossing max_bytes is final — the resume dir is removed."""
+        config = _make_real_config()
+        config._api = respx_fansly_api
+        config.m3u8_segment_concurrency = 1
+        resume_dir = tmp_path / "42_hls"
+        _SegmentManifest.open(resume_dir, _two_segment_playlist()).append(
+            0, b"\x00" * 256
+        )
+
+        playlist_route, segment_route = mount_m3u8_segment_routes(
+            playlist_text=_TWO_SEGMENT_PLAYLIST,
+            segment_count=1,
+        )
+
+        try:
+            with pytest.raises(MediaFilteredError) as exc_info:
+                await download_m3u8(
+                    config=config,
+                    m3u8_url=_SEGMENT_TEST_URL,
+                    save_path=tmp_path / "video.ts",
+                    max_bytes=300,
+                    resume_dir=resume_dir,
+                )
+        finally:
+            dump_fansly_calls(playlist_route.calls)
+            dump_fansly_calls(segment_route.calls)
+
+        # The spooled segment counts toward the budget.
+        assert exc_info.value.observed == 512
+        assert not resume_dir.exists()
@@ -13,6 +13,7 @@ AccountMedia payload shape (from project memory / media/media.py:95-118):
   download_url passes the metadata-present check at media/media.py:180.
 """
 
+import asyncio
 import json
 
 import httpx
@@ -283,3 +284,86 @@ class TestFetchAndProcessMedia:
         assert media.meta_info is not None
         payload = json.loads(media.meta_info)
         assert payload["lastFilteredReason"] == "max_resolution"
+
+    @pytest.mark.asyncio
+    async def test_batches_requested_ahead_and_kept_in_order(
+        self, respx_fansly_api, mock_config, entity_store
+    ):
+        """Up to media_info_concurrency batches are in flight at once, and the
+        result still follows the order of media_ids.
+        """
+        mock_config.download_media_previews = False
+        mock_config.interactive = False
+        mock_config.BATCH_SIZE = 1
+        mock_config.media_info_concurrency = 2
+
+        account_id = snowflake_id()
+        await entity_store.save(Account(id=account_id, username=f"u_{account_id}"))
+
+        items = [_account_media_payload(account_id) for _ in range(4)]
+        by_id = {str(item["id"]): item for item in items}
+        in_flight = 0
+        peak = 0
+
+        async def serve(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            item = by_id[request.url.params["ids"]]
+            return httpx.Response(200, json={"success": True, "response": [item]})
+
+        route = respx.get(
+            url__startswith=FanslyApi.ACCOUNT_MEDIA_ENDPOINT.format("")
+        ).mock(side_effect=serve)
+
+        state = DownloadState()
+        state.creator_id = account_id
+        state.creator_name = f"u_{account_id}"
+        state.download_type = DownloadType.TIMELINE
+
+        try:
+            result = await fetch_and_process_media(
+                mock_config, state, [item["id"] for item in items]
+            )
+        finally:
+            dump_fansly_calls(route.calls, "fetch_batches_requested_ahead")
+
+        assert route.call_count == 4
+        assert peak == 2
+        assert [m.id for m in result] == [item["media"]["id"] for item in items]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_cancels_batches_requested_ahead(
+        self, respx_fansly_api, mock_config, entity_store
+    ):
+        """A batch that fails raises, and the batches fetched ahead of it are
+        cancelled instead of left running.
+        """
+        mock_config.interactive = False
+        mock_config.BATCH_SIZE = 1
+        mock_config.media_info_concurrency = 3
+
+        ids = [snowflake_id() for _ in range(3)]
+        cancelled: list[str] = []
+
+        async def serve(request: httpx.Request) -> httpx.Response:
+            batch = request.url.params["ids"]
+            if batch == str(ids[0]):
+                return httpx.Response(200, json={"success": True, "response": {}})
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(batch)
+                raise
+            return httpx.Response(500)
+
+        respx.get(url__startswith=FanslyApi.ACCOUNT_MEDIA_ENDPOINT.format("")).mock(
+            side_effect=serve
+        )
+
+        with pytest.raises(TypeError, match="account-media array"):
+            await fetch_and_process_media(mock_config, DownloadState(), ids)
+
+        assert sorted(cancelled) == sorted(str(mid) for mid in ids[1:])
@@ -56,5 +56,7 @@ class TestProcessDownloadAccessibleMedia:
             )
 
         assert original == mock_config.DUPLICATE_THRESHOLD
+        # The per-creator override is scoped to the call as well
+        assert timeline_download_state.duplicate_threshold is None
         assert timeline_download_state.download_path is not None
         assert timeline_download_state.download_path.exists()
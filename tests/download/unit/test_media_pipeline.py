@@ -14,7 +14,10 @@ database, so every content-hash constant is namespaced with the test's
 account id — two tests must never persist or probe the same hash value.
 """
 
+import asyncio
+import hashlib
 import io
+import json
 from datetime import UTC, datetime
 from unittest.mock import patch
 
@@ -29,12 +32,20 @@ from download.media import (
     _download_file,
     _download_m3u8_file,
     _download_regular_file,
+    _file_id,
     _verify_existing_file,
     _verify_temp_download,
     download_media,
 )
 from download.types import DownloadType
-from errors import DownloadError, DuplicateCountError, M3U8Error, MediaFilteredError
+from errors import (
+    DownloadError,
+    DuplicateCountError,
+    M3U8Error,
+    MediaError,
+    MediaFilteredError,
+)
+from fileio.mp4 import hash_mp4file
 from metadata.models import Account, Media
 from tests.fixtures.api import dump_fansly_calls
 from tests.fixtures.utils.test_isolation import snowflake_id
@@ -71,6 +82,30 @@ def _make_state(creator_id):
     return state
 
 
+# ── _file_id ─────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [
+        ({}, "id"),
+        ({"download_id": 22}, "download_id"),
+        ({"download_id": 22, "is_preview": True, "preview_id": 33}, "preview_id"),
+        ({"is_preview": True}, "id"),
+    ],
+)
+def test_file_id_picks_the_downloaded_file(fields, expected):
+    """The per-item download lock and partial files key on the fetched file."""
+    media = Media(id=11, accountId=snowflake_id(), **fields)
+    assert _file_id(media) == getattr(media, expected)
+
+
+def test_file_id_requires_an_id():
+    """A media item with no id at all can't be locked or named."""
+    with pytest.raises(MediaError, match="no id"):
+        _file_id(Media(id=None, accountId=snowflake_id()))
+
+
 # ── _verify_existing_file ───────────────────────────────────────────────
 
 
@@ -258,6 +293,280 @@ class TestDownloadFunctions:
             await invoke(mock_config, DownloadState(), media, tmp_path / "out.bin")
 
 
+# ── Resumable _download_regular_file ────────────────────────────────────
+
+
+class _DroppedStream(httpx.AsyncByteStream):
+    """Body that yields a prefix and then loses the connection."""
+
+    def __init__(self, prefix: bytes) -> None:
+        self.prefix = prefix
+
+    async def __aiter__(self):
+        yield self.prefix
+        raise httpx.ReadError("connection dropped")
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("download_media_pipeline_funcs")
+class TestResumableRegularDownload:
+    """Broken transfers keep a media-keyed .part and continue via Range."""
+
+    URL = "https://cdn.fansly.com/content/resume.mp4"
+    BODY = b"0123456789"
+
+    def _media(self):
+        media = _make_media(snowflake_id(), mimetype="video/mp4")
+        media.download_url = self.URL
+        return media
+
+    async def test_dropped_stream_resumes_with_range(
+        self, respx_fansly_api, mock_config, tmp_path
+    ):
+        cdn_route = respx.get(url__startswith=self.URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    headers={"content-length": "10", "etag": '"v1"'},
+                    stream=_DroppedStream(self.BODY[:4]),
+                ),
+                httpx.Response(
+                    206,
+                    headers={"content-range": "bytes 4-9/10", "etag": '"v1"'},
+                    content=self.BODY[4:],
+                ),
+            ]
+        )
+        media = self._media()
+        save = tmp_path / "resume.mp4"
+        state = _make_state(snowflake_id())
+
+        try:
+            with pytest.raises(httpx.ReadError):
+                await _download_regular_file(mock_config, state, media, save)
+            assert not save.exists()
+            assert (tmp_path / f".{media.id}.mp4.part").read_bytes() == b"0123"
+
+            content_hash = await _download_regular_file(mock_config, state, media, save)
+        finally:
+            dump_fansly_calls(cdn_route.calls, "test_dropped_stream_resumes")
+
+        assert save.read_bytes() == self.BODY
+        # Prefix bytes never went through the streaming hasher
+        assert content_hash is None
+        assert "range" not in cdn_route.calls[0].request.headers
+        # Offsets and sizes count file bytes, never gzip/deflate-coded ones
+        for call in cdn_route.calls:
+            assert call.request.headers["accept-encoding"] == "identity"
+        assert cdn_route.calls[1].request.headers["range"] == "bytes=4-"
+        assert cdn_route.calls[1].request.headers["if-range"] == '"v1"'
+        assert not list(tmp_path.glob(".*part*"))
+
+    @pytest.mark.parametrize(
+        "first_response",
+        [
+            pytest.param(
+                httpx.Response(
+                    206,
+                    headers={"content-range": "bytes 4-9/10", "etag": '"v2"'},
+                    content=b"CHANGED",
+                ),
+                id="etag_changed",
+            ),
+            pytest.param(
+                httpx.Response(
+                    206,
+                    headers={"content-range": "bytes 4-11/12", "etag": '"v1"'},
+                    content=b"CHANGED!",
+                ),
+                id="size_changed",
+            ),
+            pytest.param(httpx.Response(416), id="not_satisfiable"),
+        ],
+    )
+    async def test_stale_part_restarts_from_scratch(
+        self, respx_fansly_api, mock_config, tmp_path, first_response
+    ):
+        media = self._media()
+        (tmp_path / f".{media.id}.mp4.part").write_bytes(b"OLD!")
+        (tmp_path / f".{media.id}.mp4.part.meta").write_text(
+            json.dumps({"etag": '"v1"', "size": 10})
+        )
+        cdn_route = respx.get(url__startswith=self.URL).mock(
+            side_effect=[first_response, httpx.Response(200, content=self.BODY)]
+        )
+        save = tmp_path / "resume.mp4"
+
+        try:
+            await _download_regular_file(
+                mock_config, _make_state(snowflake_id()), media, save
+            )
+        finally:
+            dump_fansly_calls(cdn_route.calls, "test_stale_part_restarts")
+
+        assert save.read_bytes() == self.BODY
+        assert len(cdn_route.calls) == 2
+        assert "range" not in cdn_route.calls[1].request.headers
+        assert not list(tmp_path.glob(".*part*"))
+
+    async def test_full_response_to_range_overwrites_part(
+        self, respx_fansly_api, mock_config, tmp_path
+    ):
+        """A server ignoring Range sends 200 with the whole body."""
+        media = self._media()
+        (tmp_path / f".{media.id}.mp4.part").write_bytes(b"OLD!")
+        (tmp_path / f".{media.id}.mp4.part.meta").write_text('{"size": 10}')
+        cdn_route = respx.get(url__startswith=self.URL).mock(
+            side_effect=[httpx.Response(200, content=self.BODY)]
+        )
+        save = tmp_path / "resume.mp4"
+
+        try:
+            await _download_regular_file(
+                mock_config, _make_state(snowflake_id()), media, save
+            )
+        finally:
+            dump_fansly_calls(cdn_route.calls, "test_full_response_to_range")
+
+        assert save.read_bytes() == self.BODY
+        assert cdn_route.calls[0].request.headers["range"] == "bytes=4-"
+        assert "if-range" not in cdn_route.calls[0].request.headers
+        assert not list(tmp_path.glob(".*part*"))
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("download_media_pipeline_funcs")
+class TestSegmentedRegularDownload:
+    """Large files are fetched as concurrent byte ranges into one part file."""
+
+    URL = "https://cdn.fansly.com/content/large.mp4"
+    BODY = bytes(range(48)) * 3
+
+    @pytest.fixture(autouse=True)
+    def _small_pieces(self, mock_config, monkeypatch):
+        monkeypatch.setattr("download.media._RANGE_PIECE_SIZE", 16)
+        mock_config.segmented_download_connections = 3
+        mock_config.segmented_download_min_mb = 0
+
+    def _serve(self, fail_start=None, status=404):
+        body = self.BODY
+
+        def respond(request):
+            range_header = request.headers.get("range")
+            if range_header is None:
+                return httpx.Response(
+                    200,
+                    content=body,
+                    headers={"accept-ranges": "bytes", "etag": '"v1"'},
+                )
+            start, end = map(int, range_header.removeprefix("bytes=").split("-"))
+            if start == fail_start:
+                return httpx.Response(status)
+            return httpx.Response(
+                206,
+                content=body[start : end + 1],
+                headers={
+                    "content-range": f"bytes {start}-{end}/{len(body)}",
+                    "etag": '"v1"',
+                },
+            )
+
+        return respx.get(url__startswith=self.URL).mock(side_effect=respond)
+
+    def _media(self):
+        media = _make_media(snowflake_id(), mimetype="video/mp4")
+        media.download_url = self.URL
+        return media
+
+    async def test_ranges_reassemble_file(
+        self, respx_fansly_api, mock_config, tmp_path
+    ):
+        cdn_route = self._serve()
+        save = tmp_path / "large.mp4"
+
+        try:
+            content_hash = await _download_regular_file(
+                mock_config, _make_state(snowflake_id()), self._media(), save
+            )
+        finally:
+            dump_fansly_calls(cdn_route.calls, "test_ranges_reassemble_file")
+
+        assert save.read_bytes() == self.BODY
+        assert content_hash is None  # pieces arrive out of order
+        ranges = sorted(call.request.headers["range"] for call in cdn_route.calls[1:])
+        assert ranges == [f"bytes={s}-{s + 15}" for s in range(0, 144, 16)]
+        assert all(
+            call.request.headers["if-range"] == '"v1"' for call in cdn_route.calls[1:]
+        )
+        assert not list(tmp_path.glob(".*part*"))
+
+    async def test_failed_range_keeps_complete_prefix(
+        self, respx_fansly_api, mock_config, tmp_path
+    ):
+        mock_config.segmented_download_connections = 2
+        cdn_route = self._serve(fail_start=16)
+        media = self._media()
+        save = tmp_path / "large.mp4"
+
+        try:
+            with pytest.raises(DownloadError, match="bytes 16-"):
+                await _download_regular_file(
+                    mock_config, _make_state(snowflake_id()), media, save
+                )
+        finally:
+            dump_fansly_calls(cdn_route.calls, "test_failed_range_keeps_prefix")
+
+        assert not save.exists()
+        part = tmp_path / f".{media.id}.mp4.part"
+        assert part.read_bytes() == self.BODY[:16]
+        assert (tmp_path / f".{media.id}.mp4.part.meta").exists()
+
+    async def test_transient_range_failure_is_retried(
+        self, respx_fansly_api, mock_config, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("download.media._RANGE_RETRY_DELAY", 0)
+        served = self._serve()
+        respond = served.side_effect
+        attempts = []
+
+        def flaky(request):
+            if request.headers.get("range") == "bytes=32-47" and not attempts:
+                attempts.append(request)
+                return httpx.Response(503)
+            return respond(request)
+
+        served.side_effect = flaky
+        save = tmp_path / "large.mp4"
+
+        try:
+            await _download_regular_file(
+                mock_config, _make_state(snowflake_id()), self._media(), save
+            )
+        finally:
+            dump_fansly_calls(served.calls, "test_transient_range_failure")
+
+        assert save.read_bytes() == self.BODY
+        assert len(attempts) == 1
+
+    async def test_without_accept_ranges_streams_once(
+        self, respx_fansly_api, mock_config, tmp_path
+    ):
+        cdn_route = respx.get(url__startswith=self.URL).mock(
+            side_effect=[httpx.Response(200, content=self.BODY)]
+        )
+        save = tmp_path / "large.mp4"
+
+        try:
+            await _download_regular_file(
+                mock_config, _make_state(snowflake_id()), self._media(), save
+            )
+        finally:
+            dump_fansly_calls(cdn_route.calls, "test_without_accept_ranges")
+
+        assert save.read_bytes() == self.BODY
+        assert len(cdn_route.calls) == 1
+
+
 # ── _download_m3u8_file ─────────────────────────────────────────────────
 
 
@@ -464,6 +773,56 @@ class TestDownloadMedia:
 
         assert state.pic_count == 1
 
+    async def test_streamed_hash_skips_file_reread(
+        self, respx_fansly_api, mock_config, reset_class_store, tmp_path
+    ):
+        """A video's content hash comes from the download stream, not the file.
+
+        Real MP4 bytes, real box hashing: ``hash_mp4file`` (the file-reading
+        path) is wrapped so the test fails if dedupe reads the file back.
+        """
+        mock_config.use_duplicate_threshold = False
+        mock_config.download_media_previews = False
+        mock_config.download_directory = tmp_path
+        mock_config.separate_timeline = True
+        mock_config.use_folder_suffix = False
+        mock_config.separate_previews = False
+
+        acct_id = snowflake_id()
+        await reset_class_store.save(Account(id=acct_id, username=f"u_{acct_id}"))
+
+        state = _make_state(acct_id)
+        media = _make_media(acct_id, mimetype="video/mp4")
+        mp4_bytes = (
+            bytes.fromhex("00000018 66747970 6D703432 00000000 6D703432 00000000")
+            + (16).to_bytes(4, "big")
+            + b"mdat"
+            + acct_id.to_bytes(8, "big")  # unique content per test run
+        )
+        cdn_route = respx.get(url__startswith=media.download_url.split("?")[0]).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    content=mp4_bytes,
+                    headers={"content-length": str(len(mp4_bytes))},
+                )
+            ]
+        )
+
+        with patch("fileio.fnmanip.hash_mp4file", wraps=hash_mp4file) as file_hasher:
+            try:
+                await download_media(mock_config, state, [media])
+            finally:
+                dump_fansly_calls(cdn_route.calls, "test_streamed_hash")
+
+        assert state.vid_count == 1
+        file_hasher.assert_not_called()
+        saved = tmp_path / f"dl_{acct_id}" / "Timeline" / "Videos"
+        saved_file = saved / media.get_file_name()
+        assert media.content_hash == hash_mp4file(
+            hashlib.md5(usedforsecurity=False), saved_file
+        )
+
     async def test_m3u8_download_and_error(
         self, mock_config, reset_class_store, tmp_path
     ):
@@ -499,7 +858,7 @@ class TestDownloadMedia:
         call_count = [0]
 
         def m3u8_side_effect(
-            config, url, path, ts, max_bytes=None, max_resolution=None
+            config, url, path, ts, max_bytes=None, max_resolution=None, resume_dir=None
         ):
             call_count[0] += 1
             if call_count[0] == 1:
@@ -563,6 +922,8 @@ class TestDownloadMedia:
         mock_config.use_folder_suffix = False
         mock_config.separate_previews = False
         mock_config.temp_folder = None
+        # phash side effects below are consumed in item order
+        mock_config.max_concurrent_downloads = 1
 
         acct_id = snowflake_id()
         await reset_class_store.save(Account(id=acct_id, username=f"u_{acct_id}"))
@@ -796,3 +1157,128 @@ class TestDownloadMedia:
 
         assert state.duplicate_count == 1
         assert state.vid_count == 0  # dupe skipped, no vid_count
+
+
+# ── download_media concurrency ──────────────────────────────────────────
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("download_media_pipeline_concurrency")
+class TestDownloadMediaConcurrency:
+    """Bounded worker pool in download_media: per-call and run-wide limits.
+
+    The CDN route is an async respx side effect that records how many
+    requests are open at once. Patches imagehash.phash (external lib) with
+    unique per-call hashes so no item dedupes against another. The rate
+    limiter is switched off: it paces request *starts* at the refill interval,
+    which would keep 50ms mock transfers from ever overlapping.
+    """
+
+    @staticmethod
+    def _prepare(mock_config, tmp_path) -> None:
+        mock_config.use_duplicate_threshold = False
+        mock_config.download_media_previews = False
+        mock_config.download_directory = tmp_path
+        mock_config.separate_timeline = True
+        mock_config.use_folder_suffix = False
+        mock_config.separate_previews = False
+        mock_config.get_api().rate_limiter.enabled = False
+
+    @staticmethod
+    def _mock_cdn(media_items) -> dict[str, int]:
+        """Route every media URL to one handler tracking peak concurrency."""
+        jpeg_bytes = _tiny_jpeg_bytes()
+        in_flight = {"now": 0, "peak": 0, "calls": 0}
+
+        async def handler(request):
+            in_flight["calls"] += 1
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                in_flight["now"] -= 1
+            return httpx.Response(
+                200,
+                content=jpeg_bytes,
+                headers={"content-length": str(len(jpeg_bytes))},
+            )
+
+        for media in media_items:
+            respx.get(url__startswith=media.download_url.split("?")[0]).mock(
+                side_effect=handler
+            )
+        return in_flight
+
+    @staticmethod
+    async def _make_items(store, acct_id, count) -> list[Media]:
+        await store.save(Account(id=acct_id, username=f"u_{acct_id}"))
+        items = []
+        for _ in range(count):
+            media = _make_media(acct_id)
+            media.download_url = (
+                f"https://cdn.fansly.com/content/{media.id}.jpg?Key-Pair-Id=K"
+            )
+            items.append(media)
+        return items
+
+    @pytest.mark.parametrize(
+        ("per_call", "global_limit", "expected_peak"),
+        [(3, 8, 3), (4, 2, 2), (1, 8, 1)],
+    )
+    async def test_in_flight_bounded(
+        self,
+        respx_fansly_api,
+        mock_config,
+        reset_class_store,
+        tmp_path,
+        per_call,
+        global_limit,
+        expected_peak,
+    ):
+        """Peak concurrency equals min(per-call, global); every item counted."""
+        self._prepare(mock_config, tmp_path)
+        mock_config.max_concurrent_downloads = per_call
+        mock_config.max_concurrent_downloads_global = global_limit
+        mock_config._download_slots = None
+
+        acct_id = snowflake_id()
+        state = _make_state(acct_id)
+        items = await self._make_items(reset_class_store, acct_id, 6)
+        in_flight = self._mock_cdn(items)
+
+        hashes = iter(f"conc_{acct_id}_{i}" for i in range(len(items)))
+        with patch(
+            "fileio.fnmanip.imagehash.phash", side_effect=lambda *_, **__: next(hashes)
+        ):
+            try:
+                await download_media(mock_config, state, items)
+            finally:
+                dump_fansly_calls(respx.calls, "test_in_flight_bounded")
+
+        assert in_flight["peak"] == expected_peak
+        assert state.pic_count == len(items)
+        assert state.duplicate_count == 0
+        assert all(m.is_downloaded for m in items)
+
+    async def test_error_stops_new_items_and_propagates(
+        self, respx_fansly_api, mock_config, reset_class_store, tmp_path
+    ):
+        """DuplicateCountError from one worker surfaces unwrapped; queue drains."""
+        self._prepare(mock_config, tmp_path)
+        mock_config.use_duplicate_threshold = True
+        mock_config.DUPLICATE_THRESHOLD = 50
+        mock_config.max_concurrent_downloads = 2
+        mock_config._download_slots = None
+
+        acct_id = snowflake_id()
+        state = _make_state(acct_id)
+        state.duplicate_count = 100
+        items = await self._make_items(reset_class_store, acct_id, 5)
+        in_flight = self._mock_cdn(items)
+
+        with pytest.raises(DuplicateCountError):
+            await download_media(mock_config, state, items)
+
+        assert in_flight["calls"] == 0
+        assert state.pic_count == 0
@@ -0,0 +1,121 @@
+"""Tests for download/scheduler.py — creator ordering and the bounded pool.
+
+Workload estimates read real Account / TimelineStats / MonitorState rows
+from one class-shared database (``reset_class_store``). Usernames are
+namespaced with a snowflake id so lookups never collide across tests.
+"""
+
+import asyncio
+import math
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from download.scheduler import (
+    FULL_RESCAN_AGE,
+    estimate_creator_work,
+    order_creators_by_expected_work,
+    run_creator_pool,
+)
+from metadata.models import Account, MonitorState, TimelineStats
+from tests.fixtures.utils.test_isolation import snowflake_id
+
+
+async def _seed_creator(store, *, items, last_checked=None):
+    """Persist an Account + TimelineStats (+ MonitorState) and return the name."""
+    account_id = snowflake_id()
+    username = f"sched_{account_id}"
+    await store.save(Account(id=account_id, username=username))
+    await store.save(
+        TimelineStats(accountId=account_id, imageCount=items, videoCount=0)
+    )
+    if last_checked is not None:
+        await store.save(
+            MonitorState(
+                creatorId=account_id,
+                lastCheckedAt=last_checked,
+                updatedAt=datetime.now(UTC),
+            )
+        )
+    return username
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("download_scheduler")
+class TestExpectedWork:
+    """estimate_creator_work / order_creators_by_expected_work over a real DB."""
+
+    async def test_estimate_branches(self, reset_class_store):
+        """Unknown → inf; never checked → full count; fresh → scaled down."""
+        now = datetime.now(UTC)
+        never = await _seed_creator(reset_class_store, items=400)
+        stale = await _seed_creator(
+            reset_class_store, items=400, last_checked=now - FULL_RESCAN_AGE * 2
+        )
+        half = await _seed_creator(
+            reset_class_store, items=400, last_checked=now - FULL_RESCAN_AGE / 2
+        )
+        fresh = await _seed_creator(
+            reset_class_store, items=400, last_checked=now - timedelta(minutes=5)
+        )
+
+        assert await estimate_creator_work(f"missing_{snowflake_id()}") == math.inf
+        assert await estimate_creator_work(never, now=now) == 400
+        assert await estimate_creator_work(stale, now=now) == 400
+        assert await estimate_creator_work(half, now=now) == pytest.approx(200)
+        # Floored at one day's worth rather than ~0
+        assert await estimate_creator_work(fresh, now=now) == pytest.approx(
+            400 / FULL_RESCAN_AGE.days
+        )
+
+    async def test_order_largest_first_and_stable(self, reset_class_store):
+        """Larger estimates go first; equal estimates keep input order."""
+        small = await _seed_creator(reset_class_store, items=10)
+        tie_a = await _seed_creator(reset_class_store, items=50)
+        tie_b = await _seed_creator(reset_class_store, items=50)
+        unknown = f"missing_{snowflake_id()}"
+
+        ordered = await order_creators_by_expected_work([small, tie_a, unknown, tie_b])
+
+        assert ordered == [unknown, tie_a, tie_b, small]
+
+
+class TestRunCreatorPool:
+    """run_creator_pool: concurrency bound, start order, first-error semantics."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_and_in_order(self):
+        """At most ``limit`` creators run at once; they start in list order."""
+        started: list[str] = []
+        running = {"now": 0, "peak": 0}
+
+        async def process(name: str) -> None:
+            started.append(name)
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+
+        names = [f"c{i}" for i in range(7)]
+        await run_creator_pool(names, process, limit=3)
+
+        assert started == names
+        assert running["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_error_stops_new_starts_and_propagates(self):
+        """The first failure is re-raised unwrapped after in-flight work ends."""
+        finished: list[str] = []
+
+        async def process(name: str) -> None:
+            if name == "bad":
+                await asyncio.sleep(0)  # let the second worker pick up "slow"
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+            finished.append(name)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_creator_pool(["bad", "slow", "never"], process, limit=2)
+
+        # "slow" was already running and completes; "never" is not started
+        assert finished == ["slow"]
@@ -4,10 +4,13 @@ These tests use REAL database objects and EntityStore from fixtures.
 Only external calls (like hash calculation) are mocked using patch.
 """
 
+import asyncio
 import io
 import re
+import stat
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from loguru import logger as loguru_logger
@@ -16,9 +19,11 @@ from PIL import Image
 from download.types import DownloadType
 from errors import MediaHashMismatchError
 from fileio.dedupe import (
+    ScannedFile,
     _calculate_hash_for_file,
     calculate_file_hash,
-    categorize_file,
+    calculate_file_hashes,
+    categorize_path,
     dedupe_init,
     dedupe_media_file,
     file_exists_in_download_path,
@@ -27,13 +32,29 @@ from fileio.dedupe import (
     get_or_create_media,
     migrate_full_paths_to_filenames,
     safe_rglob,
+    scan_files,
 )
+from fileio.fnmanip import get_hash_for_image
+from fileio.hash_executor import shutdown_hashing_executor
 from fileio.normalize import normalize_filename
-from metadata import Account, Media
+from metadata import (
+    Account,
+    FileHashIndex,
+    Media,
+    load_file_hash_index,
+    update_file_hash_index,
+)
 from tests.fixtures.download import DownloadStateFactory
 from tests.fixtures.utils import snowflake_id
 
 
+@pytest.fixture(autouse=True)
+def _fresh_hashing_executor():
+    """Give each test its own hashing workers, forked after its patches."""
+    yield
+    shutdown_hashing_executor()
+
+
 def create_test_file(base_path, filename, content=b"test content"):
     """Helper to create a test file."""
     file_path = base_path / filename
@@ -93,6 +114,98 @@ async def test_safe_rglob(tmp_path):
     assert len(files) == 0
 
 
+@pytest.mark.asyncio
+async def test_scan_files_walks_tree_in_batches(tmp_path):
+    """scan_files finds nested files in batches with the same stat data."""
+    paths = [
+        create_test_file(tmp_path, f"{folder}file{i}.txt", b"x" * i)
+        for folder in ("", "subdir/", "subdir/deeper/")
+        for i in range(3)
+    ]
+
+    batches = [batch async for batch in scan_files(tmp_path, batch_size=4)]
+
+    assert [len(batch) for batch in batches] == [4, 4, 1]
+    entries = {entry.path: entry for batch in batches for entry in batch}
+    assert set(entries) == set(paths)
+    for path in paths:
+        st = path.stat()
+        entry = entries[path]
+        assert entry.is_file
+        assert (entry.size, entry.mtime_ns, entry.inode) == (
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ino,
+        )
+
+
+@pytest.mark.asyncio
+async def test_large_inode_folds_into_index_range(entity_store, tmp_path):
+    """Inode numbers past 2**63 are stored in the signed BIGINT column."""
+    path = create_test_file(tmp_path, "big_inode.txt")
+    stat_of = SimpleNamespace(
+        st_ino=2**64 - 1, st_size=12, st_mtime_ns=1, st_mode=stat.S_IFREG
+    )
+    entry = ScannedFile.from_stat(path, stat_of)
+    assert entry.inode == -1
+    stat_of.st_ino = 2**63
+    assert ScannedFile.from_stat(path, stat_of).inode == -(2**63)
+
+    await update_file_hash_index(
+        tmp_path,
+        [
+            FileHashIndex(
+                directory=str(tmp_path),
+                path=path.name,
+                size=entry.size,
+                mtime_ns=entry.mtime_ns,
+                inode=entry.inode,
+                content_hash="hash",
+            )
+        ],
+    )
+    index = await load_file_hash_index(tmp_path)
+    assert index[path.name].inode == entry.inode
+
+
+@pytest.mark.asyncio
+async def test_scan_files_symlinks(tmp_path):
+    """Broken links aren't files and linked directories aren't descended."""
+    target_dir = tmp_path / "elsewhere"
+    create_test_file(target_dir, "outside.txt")
+    scanned_dir = tmp_path / "scanned"
+    scanned_dir.mkdir()
+    try:
+        (scanned_dir / "linked_dir").symlink_to(target_dir, target_is_directory=True)
+        (scanned_dir / "broken.txt").symlink_to(tmp_path / "missing.txt")
+    except OSError:
+        pytest.skip("symlinks not supported here")
+    real = create_test_file(scanned_dir, "real.txt")
+
+    entries = {
+        entry.path.name: entry
+        async for batch in scan_files(scanned_dir)
+        for entry in batch
+    }
+
+    assert set(entries) == {"linked_dir", "broken.txt", "real.txt"}
+    assert entries["real.txt"].path == real
+    assert entries["real.txt"].is_file
+    assert not entries["broken.txt"].is_file
+    assert not entries["linked_dir"].is_file
+
+
+@pytest.mark.asyncio
+async def test_scan_files_stops_early(tmp_path):
+    """Leaving the loop after the first batch doesn't hang or leak errors."""
+    for i in range(10):
+        create_test_file(tmp_path, f"file{i}.txt")
+
+    async for batch in scan_files(tmp_path, batch_size=2):
+        assert len(batch) == 2
+        break
+
+
 @pytest.mark.asyncio
 async def test_calculate_file_hash(tmp_path, valid_mp4_file):
     """Test calculate_file_hash function."""
@@ -133,6 +246,31 @@ async def test_calculate_file_hash(tmp_path, valid_mp4_file):
         assert "Test error" in debug_info["error"]
 
 
+def test_calculate_file_hashes_matches_per_file(tmp_path, valid_mp4_file):
+    """A mixed batch yields, in order, what calculate_file_hash gives per file."""
+    red = create_test_image(tmp_path, "red.png", size=(40, 30), color="red")
+    gray = create_test_image(tmp_path, "gray.jpg", size=(300, 200), color="gray")
+    broken = create_test_file(tmp_path, "broken.jpg", b"not an image")
+    text_file = create_test_file(tmp_path, "test.txt", b"text content")
+    batch = [
+        (red, "image/png"),
+        (valid_mp4_file, "video/mp4"),
+        (broken, "image/jpeg"),
+        (gray, "image/jpeg"),
+        (text_file, "text/plain"),
+    ]
+
+    results = calculate_file_hashes(batch)
+
+    assert [path for path, _, _ in results] == [path for path, _ in batch]
+    for (path, hash_value, debug_info), file_info in zip(results, batch, strict=True):
+        _, expected_hash, expected_info = calculate_file_hash(file_info)
+        assert hash_value == expected_hash, path
+        assert debug_info["hash_success"] == expected_info["hash_success"]
+    assert results[0][1] == get_hash_for_image(red)
+    assert "Failed to verify image" in results[2][2]["error"]
+
+
 @pytest.mark.asyncio
 async def test_get_account_id(entity_store):
     """Test get_account_id function with EntityStore.
@@ -173,9 +311,8 @@ async def test_get_account_id(entity_store):
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_categorize_file(tmp_path):
-    """Test categorize_file function."""
+def test_categorize_path(tmp_path):
+    """Test categorize_path function."""
     hash2_pattern = re.compile(r"_hash2_([a-fA-F0-9]+)")
 
     media_id = snowflake_id()
@@ -186,28 +323,28 @@ async def test_categorize_file(tmp_path):
     text_file = create_test_file(tmp_path, "document.txt")
 
     # Test hash2 categorization
-    result = await categorize_file(hash2_file, hash2_pattern)
+    result = categorize_path(hash2_file, hash2_pattern)
     assert result is not None
     assert result[0] == "hash2"
     assert result[1][0] == hash2_file
     assert result[1][3] == "abc123"
 
     # Test media_id categorization
-    result = await categorize_file(media_id_file, hash2_pattern)
+    result = categorize_path(media_id_file, hash2_pattern)
     assert result is not None
     assert result[0] == "media_id"
     assert result[1][0] == media_id_file
     assert result[1][1] == media_id
 
     # Test needs_hash categorization
-    result = await categorize_file(regular_file, hash2_pattern)
+    result = categorize_path(regular_file, hash2_pattern)
     assert result is not None
     assert result[0] == "needs_hash"
     assert result[1][0] == regular_file
 
     # Test unsupported mimetype
     with patch("mimetypes.guess_type", return_value=("text/plain", None)):
-        result = await categorize_file(text_file, hash2_pattern)
+        result = categorize_path(text_file, hash2_pattern)
         assert result is not None
         assert result[0] == "needs_hash"
 
@@ -485,6 +622,78 @@ async def test_dedupe_init_full_pipeline(entity_store, config, tmp_path):
     assert updated_no_name.is_downloaded is False
 
 
+@pytest.mark.asyncio
+async def test_dedupe_init_reuses_file_hash_index(entity_store, config, tmp_path):
+    """Unchanged files reuse the indexed hash; modified/deleted files don't.
+
+    Run 1 hashes everything and fills the index. Two rows are then swapped
+    for a sentinel hash: run 2 must hand the sentinel to get_or_create_media
+    for the unchanged file (no re-hash), re-hash the modified file, and drop
+    the row for the deleted one. Run 3, with every file gone, empties it.
+    """
+    store = entity_store
+    config.download_directory = tmp_path
+    config.use_folder_suffix = False
+    config.separate_timeline = True
+
+    account_id = snowflake_id()
+    await store.save(Account(id=account_id, username="index_creator"))
+    state = DownloadStateFactory.build(
+        download_type=DownloadType.TIMELINE,
+        creator_name="index_creator",
+        creator_id=account_id,
+    )
+    dl_dir = tmp_path / "index_creator" / "Timeline"
+    kept = create_test_image(dl_dir, "kept.jpg", size=(16, 16), color="red")
+    changed = create_test_image(dl_dir, "changed.jpg", size=(16, 16), color="blue")
+    gone = create_test_image(dl_dir / "sub", "gone.jpg", size=(16, 16))
+
+    async def run_dedupe() -> dict[str, str]:
+        with patch(
+            "fileio.dedupe.get_or_create_media",
+            new_callable=AsyncMock,
+            return_value=(None, False),
+        ) as mock_create:
+            await dedupe_init(config, state)
+        return {
+            call.kwargs["file_path"].name: call.kwargs["file_hash"]
+            for call in mock_create.await_args_list
+        }
+
+    first = await run_dedupe()
+    index = await load_file_hash_index(dl_dir)
+    assert set(index) == {"kept.jpg", "changed.jpg", "sub/gone.jpg"}
+    assert index["kept.jpg"].content_hash == first["kept.jpg"]
+    assert index["kept.jpg"].size == kept.stat().st_size
+    assert index["kept.jpg"].inode == kept.stat().st_ino
+
+    await update_file_hash_index(
+        dl_dir,
+        [
+            index[path].model_copy(update={"content_hash": "sentinel"})
+            for path in ("kept.jpg", "changed.jpg")
+        ],
+        removed=["kept.jpg", "changed.jpg"],
+    )
+    create_test_image(dl_dir, changed.name, size=(64, 64), color="green")
+    gone.unlink()
+
+    second = await run_dedupe()
+    assert second["kept.jpg"] == "sentinel"
+    assert second["changed.jpg"] == get_hash_for_image(changed)
+
+    index = await load_file_hash_index(dl_dir)
+    assert set(index) == {"kept.jpg", "changed.jpg"}
+    assert index["changed.jpg"].content_hash == second["changed.jpg"]
+    assert index["changed.jpg"].size == changed.stat().st_size
+
+    # With nothing left to hash, stale rows are still pruned
+    kept.unlink()
+    changed.unlink()
+    assert await run_dedupe() == {}
+    assert await load_file_hash_index(dl_dir) == {}
+
+
 @pytest.mark.asyncio
 async def test_dedupe_media_file(entity_store, config, tmp_path):
     """Test dedupe_media_file with EntityStore and real Media objects."""
@@ -975,6 +1184,35 @@ class TestDedupeMediaFileEdgeCases:
 
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_concurrent_same_content_keeps_one_copy(
+        self, entity_store, config, tmp_path
+    ):
+        """Two downloads of identical content recorded at once → one is a duplicate."""
+        state = DownloadStateFactory.build(download_path=tmp_path)
+        acct_id = snowflake_id()
+        await entity_store.save(Account(id=acct_id, username=f"u_{acct_id}"))
+
+        records = []
+        files = []
+        for name in ("first_copy.jpg", "second_copy.jpg"):
+            record = Media(id=snowflake_id(), accountId=acct_id, mimetype="image/jpeg")
+            await entity_store.save(record)
+            records.append(record)
+            files.append(create_test_image(tmp_path, name))
+
+        with patch("imagehash.phash", return_value="concurrent_hash"):
+            results = await asyncio.gather(
+                *(
+                    dedupe_media_file(config, state, "image/jpeg", path, record)
+                    for path, record in zip(files, records, strict=True)
+                )
+            )
+
+        assert sorted(results) == [False, True]
+        assert sum(path.exists() for path in files) == 1
+        assert records[0].local_filename == records[1].local_filename
+
 
 class TestGetOrCreateMediaDeepBranches:
     """Cover get_or_create_media branches not hit by existing tests.
@@ -1,6 +1,7 @@
 """Unit tests for the fnmanip module."""
 
 import contextlib
+import io
 from unittest.mock import patch
 
 import pytest
@@ -8,9 +9,11 @@ from PIL import Image
 
 from errors.mp4 import InvalidMP4Error
 from fileio.fnmanip import (
+    StreamingContentHasher,
     extract_media_id,
     get_hash_for_image,
     get_hash_for_other_content,
+    get_hashes_for_images,
 )
 
 
@@ -100,6 +103,55 @@ class TestImageHash:
             get_hash_for_image(path)
 
 
+def _gradient(size: tuple[int, int]) -> Image.Image:
+    img = Image.new("L", size)
+    width, height = size
+    img.putdata([(x * 7 + y * 3) % 256 for y in range(height) for x in range(width)])
+    return img
+
+
+class TestBatchedImageHash:
+    """get_hashes_for_images must agree with get_hash_for_image bit for bit."""
+
+    def test_matches_single_image_hashes(self, tmp_path):
+        images = {
+            "solid.png": Image.new("RGB", (50, 40), color="red"),
+            "solid_gray.jpg": Image.new("L", (1, 1), color=128),
+            "gradient.png": _gradient((120, 90)),
+            "gradient.jpg": _gradient((333, 257)).convert("RGB"),
+            "rgba.webp": _gradient((64, 64)).convert("RGBA"),
+        }
+        paths = []
+        for name, img in images.items():
+            path = tmp_path / name
+            img.save(path)
+            paths.append(path)
+
+        buffer = io.BytesIO(paths[2].read_bytes())
+        results = get_hashes_for_images([*paths, buffer])
+
+        assert results == [get_hash_for_image(path) for path in paths] + [
+            get_hash_for_image(paths[2])
+        ]
+
+    def test_failures_keep_their_position(self, tmp_path):
+        good = tmp_path / "good.png"
+        _gradient((10, 10)).save(good)
+        corrupt = tmp_path / "corrupt.jpg"
+        corrupt.write_bytes(b"This is not a valid image file")
+        missing = tmp_path / "missing.png"
+
+        results = get_hashes_for_images([corrupt, good, missing])
+
+        assert isinstance(results[0], RuntimeError)
+        assert "Failed to verify image" in str(results[0])
+        assert results[1] == get_hash_for_image(good)
+        assert isinstance(results[2], RuntimeError)
+
+    def test_empty_batch(self):
+        assert get_hashes_for_images([]) == []
+
+
 class TestVideoHash:
     """Tests for the video hashing functions."""
 
@@ -162,3 +214,57 @@ class TestVideoHash:
             pytest.raises(RuntimeError, match="Failed to generate hash"),
         ):
             get_hash_for_other_content(valid_mp4_file)
+
+
+def _feed(hasher: StreamingContentHasher, data: bytes, chunk_size: int = 4096) -> None:
+    for start in range(0, len(data), chunk_size):
+        hasher.update(data[start : start + chunk_size])
+
+
+class TestStreamingContentHasher:
+    """StreamingContentHasher yields the same hash as the file-based helpers."""
+
+    def test_image_matches_file_hash(self, tmp_path):
+        """Real pHash over the buffered bytes equals get_hash_for_image(path)."""
+        path = tmp_path / "gradient.png"
+        img = Image.new("RGB", (64, 48))
+        img.putdata(
+            [(x * 4, y * 5, (x + y) % 256) for y in range(48) for x in range(64)]
+        )
+        img.save(path)
+
+        hasher = StreamingContentHasher("image/png")
+        _feed(hasher, path.read_bytes(), chunk_size=100)
+
+        assert hasher.result() == get_hash_for_image(path)
+
+    def test_image_over_buffer_limit_defers_to_file(self, tmp_path, monkeypatch):
+        """Images larger than the in-memory cap are hashed from disk instead."""
+        buf = io.BytesIO()
+        Image.new("RGB", (32, 32), color="green").save(buf, format="PNG")
+        monkeypatch.setattr(StreamingContentHasher, "IMAGE_BUFFER_LIMIT", 10)
+
+        hasher = StreamingContentHasher("image/png")
+        _feed(hasher, buf.getvalue(), chunk_size=8)
+
+        assert hasher.result() is None
+
+    def test_corrupt_image_defers_to_file(self):
+        """Undecodable image bytes report None rather than raising."""
+        hasher = StreamingContentHasher("image/jpeg")
+        hasher.update(b"not an image")
+        assert hasher.result() is None
+
+    @pytest.mark.parametrize("mimetype", ["video/mp4", "audio/mp4"])
+    def test_video_matches_file_hash(self, valid_mp4_file, mimetype):
+        """MP4 box hash over the stream equals get_hash_for_other_content."""
+        hasher = StreamingContentHasher(mimetype)
+        _feed(hasher, valid_mp4_file.read_bytes(), chunk_size=5)
+
+        assert hasher.result() == get_hash_for_other_content(valid_mp4_file)
+
+    def test_other_mimetype_has_no_hash(self):
+        """Mimetypes dedupe doesn't hash produce no streaming hash either."""
+        hasher = StreamingContentHasher("application/octet-stream")
+        hasher.update(b"data")
+        assert hasher.result() is None
@@ -0,0 +1,124 @@
+"""Unit tests for the shared dedupe hashing executor."""
+
+from pathlib import Path
+
+import pytest
+
+from fileio.hash_executor import (
+    HashingExecutor,
+    get_hashing_executor,
+    plan_hash_chunks,
+    shutdown_hashing_executor,
+)
+
+
+MIB = 1024 * 1024
+
+
+def _names(file_infos):
+    """Picklable task for the worker processes."""
+    return [path.name for path, _ in file_infos]
+
+
+def _infos(*names, mimetype="image/jpeg"):
+    return [(Path(name), mimetype) for name in names]
+
+
+class TestPlanHashChunks:
+    """Chunking by file count, byte budget and large-file lane."""
+
+    def test_small_files_are_packed_up_to_max_files(self):
+        infos = _infos(*(f"{i}.jpg" for i in range(10)))
+        sizes = {path: 10 for path, _ in infos}
+
+        chunks, large = plan_hash_chunks(infos, sizes, workers=2, max_files=4)
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert [info for chunk in chunks for info in chunk] == infos
+        assert large == []
+
+    def test_byte_budget_spreads_medium_files_over_workers(self):
+        # 16 files of 8 MiB = 128 MiB over 2 workers * 4 chunks -> 16 MiB
+        infos = _infos(*(f"{i}.mp4" for i in range(16)), mimetype="video/mp4")
+        sizes = {path: 8 * MIB for path, _ in infos}
+
+        chunks, _ = plan_hash_chunks(infos, sizes, workers=2, max_files=32)
+
+        assert [len(chunk) for chunk in chunks] == [2] * 8
+
+    def test_large_videos_get_their_own_lane_biggest_first(self):
+        small = _infos("a.mp4", mimetype="video/mp4")
+        big = _infos("big.mp4", "bigger.mp4", mimetype="video/mp4")
+        huge_image = _infos("huge.png", mimetype="image/png")
+        sizes = {
+            Path("a.mp4"): MIB,
+            Path("big.mp4"): 300 * MIB,
+            Path("bigger.mp4"): 900 * MIB,
+            Path("huge.png"): 400 * MIB,
+        }
+
+        chunks, large = plan_hash_chunks(
+            small + big + huge_image, sizes, workers=2, max_files=32
+        )
+
+        assert large == [[big[1]], [big[0]]]
+        assert [info for chunk in chunks for info in chunk] == small + huge_image
+
+    def test_unknown_sizes_count_as_empty(self):
+        infos = _infos("gone.mp4", mimetype="video/mp4")
+
+        chunks, large = plan_hash_chunks(infos, {}, workers=4, max_files=32)
+
+        assert chunks == [infos]
+        assert large == []
+
+
+class TestHashingExecutor:
+    """Results from both lanes, reuse across calls, shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_map_unordered_runs_both_lanes(self):
+        executor = HashingExecutor(workers=2, large_file_workers=1)
+        try:
+            chunks = [_infos(f"{i}a.jpg", f"{i}b.jpg") for i in range(5)]
+            large = [_infos(f"{i}.mp4", mimetype="video/mp4") for i in range(3)]
+
+            results = [
+                result async for result in executor.map_unordered(_names, chunks, large)
+            ]
+
+            assert sorted(name for result in results for name in result) == sorted(
+                path.name for chunk in chunks + large for path, _ in chunk
+            )
+            assert len(results) == len(chunks) + len(large)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_workers_survive_between_calls(self):
+        executor = HashingExecutor(workers=2)
+        try:
+            [_ async for _ in executor.map_unordered(_names, [_infos("a.jpg")])]
+            pool = executor._pools["general"]
+            [_ async for _ in executor.map_unordered(_names, [_infos("b.jpg")])]
+            assert executor._pools["general"] is pool
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_rejects_new_work(self):
+        executor = HashingExecutor(workers=2)
+        executor.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            [_ async for _ in executor.map_unordered(_names, [_infos("a.jpg")])]
+
+    def test_module_executor_is_shared_until_shutdown(self):
+        first = get_hashing_executor()
+        assert get_hashing_executor() is first
+
+        shutdown_hashing_executor()
+        shutdown_hashing_executor()  # second call is a no-op
+
+        assert get_hashing_executor() is not first
+        shutdown_hashing_executor()
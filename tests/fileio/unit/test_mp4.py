@@ -7,7 +7,14 @@ from typing import Any
 import pytest
 
 from errors.mp4 import InvalidMP4Error
-from fileio.mp4 import MP4Box, get_boxes, hash_mp4box, hash_mp4file
+from fileio.mp4 import (
+    MP4Box,
+    MP4StreamHasher,
+    get_boxes,
+    hash_mp4box,
+    hash_mp4file,
+    iter_mapped_boxes,
+)
 
 
 class TestMP4Box:
@@ -314,3 +321,141 @@ class TestHashMP4File:
 
         # Verify the error message includes the file name
         assert str(invalid_mp4_file) in str(excinfo.value)
+
+
+def _box(fourcc: bytes, payload: bytes) -> bytes:
+    return (8 + len(payload)).to_bytes(4, "big") + fourcc + payload
+
+
+def _wide_box(fourcc: bytes, payload: bytes) -> bytes:
+    return (
+        (1).to_bytes(4, "big")
+        + fourcc
+        + (16 + len(payload)).to_bytes(8, "big")
+        + payload
+    )
+
+
+_FTYP = _box(b"ftyp", b"isom\x00\x00\x02\x00isomiso2")
+
+
+class TestMP4StreamHasher:
+    """MP4StreamHasher must reproduce hash_mp4file byte-for-byte."""
+
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            _FTYP + _box(b"free", b"\x00" * 8) + _box(b"mdat", bytes(range(200))),
+            _FTYP + _box(b"moov", b"m" * 300) + _box(b"mdat", b"d" * 5000),
+            _FTYP + _wide_box(b"mdat", b"w" * 4096) + _box(b"moov", b"x" * 64),
+            # Last box claims more bytes than arrive (truncated download)
+            _FTYP + _box(b"mdat", b"t" * 100)[:60],
+            # Non-ASCII fourcc is hashed like any other box
+            _FTYP + _box(b"\xff\x01ab", b"n" * 20),
+        ],
+        ids=["ftyp_free_mdat", "moov_mdat", "wide_mdat", "truncated", "non_ascii"],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 7, 16, 1_048_576])
+    @pytest.mark.parametrize("use_broken_algo", [False, True])
+    def test_matches_hash_mp4file(self, tmp_path, layout, chunk_size, use_broken_algo):
+        """Any chunking yields the same digest as hashing the file."""
+        path = tmp_path / "stream.mp4"
+        path.write_bytes(layout)
+        expected = hash_mp4file(
+            hashlib.md5(usedforsecurity=False), path, use_broken_algo=use_broken_algo
+        )
+
+        hasher = MP4StreamHasher(
+            hashlib.md5(usedforsecurity=False), use_broken_algo=use_broken_algo
+        )
+        for start in range(0, len(layout), chunk_size):
+            hasher.update(layout[start : start + chunk_size])
+
+        assert hasher.hexdigest() == expected
+
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            b"",
+            b"\x00\x00\x00",
+            _box(b"moov", b"\x00" * 8),  # first box is not ftyp
+            _FTYP + (0).to_bytes(4, "big") + b"mdat" + b"z" * 8,  # size 0
+            _FTYP + (4).to_bytes(4, "big") + b"mdat" + b"z" * 8,  # size < header
+            _FTYP + b"\x00\x00\x00",  # header cut off by EOF
+        ],
+        ids=["empty", "too_small", "no_ftyp", "size_zero", "undersized", "cut_header"],
+    )
+    def test_unsupported_layouts_defer_to_file(self, layout):
+        """Layouts the seeking walker treats specially report None."""
+        hasher = MP4StreamHasher(hashlib.md5(usedforsecurity=False))
+        hasher.update(layout)
+        assert hasher.hexdigest() is None
+
+
+def _hash_with_reader(path, use_broken_algo: bool) -> str:
+    """The original reader-based walk `hash_mp4file` must stay identical to."""
+    skipped = {"moov", "mdat"} if use_broken_algo else {"free", "moov"}
+    algorithm = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as reader:
+        for box in get_boxes(reader):
+            if box.fourcc not in skipped:
+                hash_mp4box(algorithm, reader, box)
+    return algorithm.hexdigest()
+
+
+class TestMappedHashing:
+    """hash_mp4file walks a memory map; results must match the reader walk."""
+
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            _FTYP + _box(b"free", b"\x00" * 8) + _box(b"mdat", bytes(range(200))),
+            _FTYP + _box(b"moov", b"m" * 300) + _box(b"mdat", b"d" * 5000),
+            _FTYP + _wide_box(b"mdat", b"w" * 4096) + _box(b"moov", b"x" * 64),
+            _FTYP + _box(b"mdat", b"t" * 100)[:60],
+            _FTYP + (4).to_bytes(4, "big") + b"mdat" + b"z" * 8,
+            _FTYP + _box(b"free", b"f" * 8) + b"\x00\x00\x05",
+            _FTYP + _box(b"\xff\x01ab", b"n" * 20),
+        ],
+        ids=[
+            "ftyp_free_mdat",
+            "moov_mdat",
+            "wide_mdat",
+            "truncated",
+            "undersized",
+            "cut_header",
+            "non_ascii",
+        ],
+    )
+    @pytest.mark.parametrize("use_broken_algo", [False, True])
+    def test_matches_reader_walk(self, tmp_path, layout, use_broken_algo):
+        path = tmp_path / "mapped.mp4"
+        path.write_bytes(layout)
+
+        result = hash_mp4file(
+            hashlib.md5(usedforsecurity=False), path, use_broken_algo=use_broken_algo
+        )
+
+        assert result == _hash_with_reader(path, use_broken_algo)
+
+    def test_boxes_match_get_boxes(self):
+        layout = _FTYP + _wide_box(b"mdat", b"w" * 64) + _box(b"moov", b"x" * 8)
+
+        mapped = [
+            (box.position, box.fourcc, box.size)
+            for box in iter_mapped_boxes(memoryview(layout))
+        ]
+        read = [
+            (box.position, box.fourcc, box.size)
+            for box in get_boxes(BufferedReader(BytesIO(layout)))
+        ]
+
+        assert mapped == read
+
+    def test_zero_size_box_raises(self, tmp_path):
+        """get_boxes never advances past a size-0 box; the map walk refuses it."""
+        path = tmp_path / "zero.mp4"
+        path.write_bytes(_FTYP + (0).to_bytes(4, "big") + b"mdat" + b"z" * 8)
+
+        with pytest.raises(InvalidMP4Error, match="size 0"):
+            hash_mp4file(hashlib.md5(usedforsecurity=False), path)
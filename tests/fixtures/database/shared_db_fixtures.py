@@ -109,12 +109,21 @@ def reset_class_store(class_entity_store: PostgresEntityStore) -> PostgresEntity
     Request this (instead of ``class_entity_store``) in shared-DB tests that
     exercise in-memory cache/identity-map/TTL behavior, so each method starts
     from an empty cache + default TTL config without paying for a fresh
-    database. Clears the store's cache, type index, cache timestamps, per-type
-    TTLs, and default TTL.
+    database. Clears the store's cache, type and field indexes, cache
+    timestamps, per-type TTLs, default TTL, cache budget, pins, evicted
+    entries and scoped-preload state.
     """
     class_entity_store._default_ttl = None
     class_entity_store._type_ttls.clear()
+    class_entity_store._max_entities = None
+    class_entity_store._pinned.clear()
+    class_entity_store._evicted.clear()
+    class_entity_store._loaded_accounts.clear()
+    class_entity_store._preloaded_accounts.clear()
+    class_entity_store._scoped_types = None
     class_entity_store._cache.clear()
     class_entity_store._type_index.clear()
+    class_entity_store._field_index.clear()
+    class_entity_store._indexed_values.clear()
     class_entity_store._cache_timestamps.clear()
     return class_entity_store
@@ -22,4 +22,5 @@ def m3u8_mock_config(fansly_api_factory):
     config = MagicMock(spec=FanslyConfig)
     api = fansly_api_factory()
     config.get_api.side_effect = lambda: api
+    config.m3u8_segment_concurrency = 8
     return config
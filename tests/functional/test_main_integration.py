@@ -386,6 +386,44 @@ async def test_main_processes_creators_in_reverse_order(main_integration_env, ca
     )
 
 
+async def test_main_processes_creators_concurrently(main_integration_env, caplog):
+    """main() hands creators to the scheduler when max_concurrent_creators > 1.
+
+    Every creator still completes and the scheduler's info log fires; the
+    end-of-run statistics are aggregated from every finished state.
+    """
+    env = main_integration_env
+    env.add_creator("alpha")
+    env.add_creator("bravo")
+    env.add_creator("charlie")
+    env.config.user_names = {"alpha", "bravo", "charlie"}
+    env.config.download_mode = DownloadMode.TIMELINE
+    env.config.max_concurrent_creators = 2
+    init_logging_config(env.config)
+    env.register_empty_content(response_count=40)
+
+    caplog.set_level(logging.INFO)
+
+    with patch(
+        "fansly_downloader_ng.update_global_statistics",
+        wraps=fdng.update_global_statistics,
+    ) as aggregate:
+        result = await run_main_and_cleanup(env.config)
+
+    assert result in (EXIT_SUCCESS, SOME_USERS_FAILED), f"Concurrent: got {result}"
+
+    info_messages = [r.getMessage() for r in caplog.records if r.levelname == "INFO"]
+    assert any("Processing up to 2 creators concurrently" in m for m in info_messages)
+    for name in ("alpha", "bravo", "charlie"):
+        assert any(name in m and "Completed processing" in m for m in info_messages), (
+            f"Expected 'Completed processing @{name}' info log"
+        )
+    aggregated = {
+        call.kwargs["download_state"].creator_name for call in aggregate.call_args_list
+    }
+    assert aggregated == {"alpha", "bravo", "charlie"}
+
+
 async def test_main_use_following_returns_error_when_api_raises(
     main_integration_env, caplog
 ):
@@ -3,6 +3,7 @@
 No external boundaries — all pure logic. Uses real Rich objects.
 """
 
+import asyncio
 import threading
 import time
 from pathlib import Path
@@ -575,6 +576,32 @@ class TestProgressManager:
 
         assert pm.live is None
 
+    @pytest.mark.asyncio
+    async def test_overlapping_sessions_clean_up_own_tasks(self):
+        """Sessions from concurrent tasks remove only their own tasks on exit."""
+        pm = ProgressManager()
+        first_added = asyncio.Event()
+        second_closed = asyncio.Event()
+
+        async def first() -> None:
+            with pm.session():
+                pm.add_task("first", "First", total=1)
+                first_added.set()
+                await second_closed.wait()
+                assert "first" in pm.active_tasks
+
+        async def second() -> None:
+            await first_added.wait()
+            with pm.session():
+                pm.add_task("second", "Second", total=1)
+            second_closed.set()
+
+        await asyncio.gather(first(), second())
+
+        assert "second" not in pm.active_tasks
+        assert "first" not in pm.active_tasks
+        assert pm.live is None
+
     def test_session_no_auto_cleanup(self):
         """Lines 143-145: auto_cleanup=False → tasks persist after session."""
         pm = ProgressManager()
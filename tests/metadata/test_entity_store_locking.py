@@ -24,6 +24,7 @@ LOCKED_METHODS = frozenset(
     {
         "get_from_cache",
         "cache_instance",
+        "reindex",
         "invalidate",
         "invalidate_type",
         "invalidate_all",
@@ -36,9 +37,13 @@ LOCKED_METHODS = frozenset(
         "get_many",
         "_autolink_relationships",
         "preload",
+        "preload_account",
+        "_run_preload",
+        "_materialize_preload_rows",
         "_table_columns",
         "is_fully_loaded",
         "cache_stats",
+        "set_pinned",
         "close",
     }
 )
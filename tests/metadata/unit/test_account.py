@@ -19,7 +19,11 @@ from metadata import (
     process_account_data,
     process_media_bundles,
 )
-from metadata.account import _backfill_missing_account_media, process_media_bundles_data
+from metadata.account import (
+    _backfill_missing_account_media,
+    fetch_truncated_bundle_media,
+    process_media_bundles_data,
+)
 from metadata.wall import process_account_walls
 from tests.fixtures.utils.test_isolation import snowflake_id
 
@@ -529,3 +533,48 @@ class TestFullAccountPipeline:
         )
         # ghost_id was never resolved → else branch at line 146 fired
         assert entity_store.get_from_cache(AccountMedia, ghost_id) is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_truncated_bundle_media(
+        self, entity_store, mock_config, test_account
+    ):
+        """Only bundle ids absent from the page and the cache are requested."""
+        media = Media(id=snowflake_id(), accountId=test_account.id)
+        await entity_store.save(media)
+        cached = AccountMedia(
+            id=snowflake_id(),
+            accountId=test_account.id,
+            mediaId=media.id,
+            createdAt=datetime.now(UTC),
+        )
+        await entity_store.save(cached)
+        present_id, missing_id = snowflake_id(), snowflake_id()
+        fetched = {"id": missing_id, "accountId": test_account.id}
+
+        requested: list[str] = []
+        api_mock = type(
+            "API",
+            (),
+            {
+                "get_json_response_contents": lambda _self, _resp: [fetched],
+            },
+        )()
+        mock_config.get_api = lambda: api_mock
+
+        async def get_account_media(ids: str) -> None:
+            requested.append(ids)
+
+        api_mock.get_account_media = get_account_media
+
+        data: JsonDict = {
+            "accountMedia": [{"id": present_id}],
+            "accountMediaBundles": [
+                {"accountMediaIds": [present_id, cached.id, missing_id]},
+            ],
+        }
+        assert await fetch_truncated_bundle_media(mock_config, data) == [fetched]
+        assert requested == [str(missing_id)]
+
+        requested.clear()
+        assert await fetch_truncated_bundle_media(mock_config, {}) == []
+        assert requested == []
@@ -0,0 +1,167 @@
+"""Tests for the size-bounded identity map (``max_entities`` LRU eviction).
+
+Entities are built as if loaded from the DB (``_is_new = False``) so they
+are eligible for eviction; new, dirty and pinned entities never are.
+"""
+
+import gc
+
+import pytest
+
+from metadata.models import Account, Media
+from tests.fixtures.utils.test_isolation import snowflake_id
+
+
+def _loaded_media(account_id: int) -> Media:
+    media = Media(id=snowflake_id(), accountId=account_id)
+    media._is_new = False
+    return media
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("cache_eviction")
+class TestCacheEviction:
+    """LRU order, eligibility rules, revival and fully-loaded fallback."""
+
+    async def test_evicts_least_recently_used(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        first = _loaded_media(account_id)
+        second = _loaded_media(account_id)
+        store._max_entities = 2
+        store.reset_stats()
+
+        # Touch `first` so `second` becomes the LRU entry
+        assert store.get_from_cache(Media, first.id) is first
+        third = _loaded_media(account_id)
+
+        assert (Media, second.id) not in store._cache
+        assert second.id not in store._type_index[Media]
+        assert (Media, first.id) in store._cache
+        assert (Media, third.id) in store._cache
+        assert store.get_stats()["cache_evictions"] == 1
+
+    async def test_new_dirty_and_pinned_entities_are_kept(self, reset_class_store):
+        store = reset_class_store
+        store.set_pinned(Account)
+        account = Account(id=snowflake_id(), username="evict_pinned")
+        account._is_new = False
+        unsaved = Media(id=snowflake_id(), accountId=account.id)
+        dirty = _loaded_media(account.id)
+        dirty.mimetype = "video/mp4"
+        store._max_entities = 1
+
+        _loaded_media(account.id)
+
+        for obj in (account, unsaved, dirty):
+            assert store.get_from_cache(type(obj), obj.id) is obj
+        assert len(store._cache) > store._max_entities
+
+    async def test_referenced_entity_is_revived(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        kept = _loaded_media(account_id)
+        store._max_entities = 1
+        store.reset_stats()
+        _loaded_media(account_id)
+
+        assert (Media, kept.id) not in store._cache
+        # Still referenced here, so the lookup returns the same instance
+        assert store.get_from_cache(Media, kept.id) is kept
+        assert (Media, kept.id) in store._cache
+        assert store.get_stats()["cache_revivals"] == 1
+
+    async def test_unreferenced_entity_is_freed(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        dropped_id = _loaded_media(account_id).id
+        store._max_entities = 1
+        _loaded_media(account_id)
+        gc.collect()
+
+        assert store.get_from_cache(Media, dropped_id) is None
+        assert store.cache_stats()["evicted_alive"] == 0
+
+    async def test_eviction_clears_fully_loaded(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        _loaded_media(account_id)
+        store._fully_loaded.add(Media)
+        store._max_entities = 1
+        try:
+            _loaded_media(account_id)
+            assert not store.is_fully_loaded(Media)
+        finally:
+            store._fully_loaded.discard(Media)
+
+    async def test_cache_stats_reports_budget_and_size(self, reset_class_store):
+        store = reset_class_store
+        store._max_entities = 10
+        _loaded_media(snowflake_id())
+
+        stats = store.cache_stats()
+        assert stats["max_entities"] == 10
+        assert stats["approx_bytes"] > 0
+
+    async def test_uncached_save_keeps_db_only_columns(self, reset_class_store):
+        """An evicted row re-created from API data keeps its DB-only state."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="evict_merge")
+        await store.save(account)
+        media = Media(id=snowflake_id(), accountId=account.id, mimetype="image/jpeg")
+        await store.save(media)
+        media.is_downloaded = True
+        media.content_hash = "evict_hash"
+        await store.save(media)
+        store.invalidate(Media, media.id)  # as if evicted and freed
+        store._fully_loaded.discard(Media)
+
+        fresh = Media.model_validate(
+            {"id": media.id, "accountId": account.id, "mimetype": "image/png"}
+        )
+        assert fresh._is_new
+        await store.save(fresh)
+
+        row = await store.pool.fetchrow(
+            "SELECT mimetype, is_downloaded, content_hash FROM media WHERE id = $1",
+            media.id,
+        )
+        assert row["mimetype"] == "image/png"
+        assert row["is_downloaded"] is True
+        assert row["content_hash"] == "evict_hash"
+        # The instance now in the identity map carries the stored state too
+        assert store.get_from_cache(Media, media.id) is fresh
+        assert fresh.is_downloaded is True
+        assert fresh.content_hash == "evict_hash"
+
+    async def test_batched_uncached_save_merges_stored_row(self, reset_class_store):
+        """Inside batch() the flush merges stored columns before the upsert."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="evict_batch")
+        await store.save(account)
+        stored = Media(
+            id=snowflake_id(),
+            accountId=account.id,
+            mimetype="image/jpeg",
+            is_downloaded=True,
+            content_hash="batch_hash",
+            local_filename="batch.jpg",
+        )
+        await store.save(stored)
+        store.invalidate(Media, stored.id)
+        store._fully_loaded.discard(Media)
+
+        async with store.batch():
+            fresh = Media.model_validate({"id": stored.id, "accountId": account.id})
+            await store.save(fresh)
+            brand_new = Media.model_validate(
+                {"id": snowflake_id(), "accountId": account.id}
+            )
+            await store.save(brand_new)
+
+        assert fresh.is_downloaded is True
+        assert fresh.content_hash == "batch_hash"
+        assert fresh.local_filename == "batch.jpg"
+        assert not fresh.is_dirty()
+        assert brand_new.is_downloaded is False
+        assert brand_new.content_hash is None
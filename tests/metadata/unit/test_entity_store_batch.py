@@ -0,0 +1,138 @@
+"""Tests for PostgresEntityStore.batch() — the unit-of-work write path.
+
+Uncommitted batch writes are checked from a second pooled connection
+(``store.pool`` bypasses the batch), while reads through the store itself
+run on the batch connection and must see queued saves.
+"""
+
+import asyncio
+
+import asyncpg
+import pytest
+
+from metadata.models import Account, Media
+from tests.fixtures.utils.test_isolation import snowflake_id
+
+
+async def _committed(store, table: str, entity_id: int) -> bool:
+    """True if ``entity_id`` is visible to a connection outside the batch."""
+    row = await store.pool.fetchval(
+        f"SELECT 1 FROM {table} WHERE id = $1",
+        entity_id,
+    )
+    return row is not None
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("entity_store_batch")
+class TestEntityStoreBatch:
+    """Deferred saves, grouped flush, read-your-writes, rollback."""
+
+    async def test_saves_deferred_until_exit(self, reset_class_store):
+        """Rows are written at batch exit, children after their parents."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="batch_deferred")
+        variant = Media(id=snowflake_id(), accountId=account.id)
+        media = Media(id=snowflake_id(), accountId=account.id, variants=[variant])
+
+        async with store.batch():
+            # Saved child-first: the flush still inserts accounts before media
+            await store.save(media)
+            await store.save(account)
+            assert store.get_from_cache(Media, media.id) is media
+            assert media._is_new
+            assert not await _committed(store, "media", media.id)
+
+        assert not media._is_new
+        assert not variant._is_new
+        assert await _committed(store, "accounts", account.id)
+        assert await _committed(store, "media", variant.id)
+        linked = await store.pool.fetchval(
+            'SELECT "variantId" FROM media_variants WHERE "mediaId" = $1', media.id
+        )
+        assert linked == variant.id
+
+    async def test_reads_flush_pending_saves(self, reset_class_store):
+        """A DB read inside the batch sees earlier saves before commit."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="batch_read_your_writes")
+
+        store._fully_loaded.discard(Account)  # count() must take the SQL path
+
+        async with store.batch():
+            await store.save(account)
+            assert await store.count(Account, username=account.username) == 1
+            assert not account._is_new  # flushed by the read
+            assert not await _committed(store, "accounts", account.id)
+
+        assert await _committed(store, "accounts", account.id)
+
+    async def test_new_rows_grouped_into_one_executemany(self, reset_class_store):
+        """N new Media of one column set → one executemany with N rows."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="batch_grouped")
+        await store.save(account)
+        media = [Media(id=snowflake_id(), accountId=account.id) for _ in range(5)]
+
+        calls: list[tuple[str, int]] = []
+        real_executemany = asyncpg.connection.Connection.executemany
+
+        async def spy(conn, sql, args, *rest, **kwargs):
+            calls.append((sql, len(args)))
+            return await real_executemany(conn, sql, args, *rest, **kwargs)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(asyncpg.connection.Connection, "executemany", spy)
+            async with store.batch():
+                for m in media:
+                    await store.save(m)
+
+        assert [n for sql, n in calls if "INSERT INTO media " in sql] == [5]
+        for m in media:
+            assert await _committed(store, "media", m.id)
+
+    async def test_error_rolls_back_and_evicts(self, reset_class_store):
+        """An exception discards every batch write and its cache entries."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="batch_rollback")
+        store._fully_loaded.discard(Account)
+
+        async def failing_page() -> None:
+            async with store.batch():
+                await store.save(account)
+                await store.count(Account)  # force a flush inside the batch
+                assert not account._is_new
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await failing_page()
+
+        assert not await _committed(store, "accounts", account.id)
+        assert store.get_from_cache(Account, account.id) is None
+
+    async def test_nested_batch_joins_outer(self, reset_class_store):
+        """An inner batch() commits nothing; the outer one owns the write."""
+        store = reset_class_store
+        account = Account(id=snowflake_id(), username="batch_nested")
+
+        async with store.batch():
+            async with store.batch():
+                await store.save(account)
+            assert account._is_new
+            assert not await _committed(store, "accounts", account.id)
+
+        assert await _committed(store, "accounts", account.id)
+
+    async def test_child_task_does_not_share_batch_connection(self, reset_class_store):
+        """Tasks spawned inside a batch write through the pool directly."""
+        store = reset_class_store
+        outer = Account(id=snowflake_id(), username="batch_owner")
+        child = Account(id=snowflake_id(), username="batch_child")
+
+        async with store.batch():
+            await store.save(outer)
+            await asyncio.gather(store.save(child), store.count(Account))
+            assert await _committed(store, "accounts", child.id)
+            assert not await _committed(store, "accounts", outer.id)
+
+        assert await _committed(store, "accounts", outer.id)
@@ -10,7 +10,7 @@ import asyncio
 import threading
 from datetime import UTC, datetime
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import asyncpg
 import pytest
@@ -1113,6 +1113,51 @@ class TestEntityStoreEdgeCasesShared:
             ],
         )
 
+    async def test_bulk_upsert_records_batches_by_column_run(self, class_entity_store):
+        """One executemany per run of identical column sets; first row wins."""
+        store = class_entity_store
+        table_name = f"bulk_{snowflake_id()}"
+        ids = [snowflake_id() for _ in range(4)]
+        created = datetime.now(UTC)
+        items = [
+            *(
+                {
+                    "table_name": table_name,
+                    "record_id": rid,
+                    "created_at": created,
+                    "reason": "first",
+                }
+                for rid in ids[:3]
+            ),
+            {"table_name": table_name, "record_id": ids[3], "created_at": created},
+            # Conflicts with ids[0] → ignored, the earlier row is kept
+            {
+                "table_name": table_name,
+                "record_id": ids[0],
+                "created_at": created,
+                "reason": "second",
+            },
+        ]
+
+        real_executemany = asyncpg.connection.Connection.executemany
+        with patch.object(
+            asyncpg.connection.Connection,
+            "executemany",
+            autospec=True,
+            side_effect=real_executemany,
+        ) as spy:
+            await store.bulk_upsert_records(StubTracker.__table_name__, items)
+
+        assert [len(call.args[2]) for call in spy.call_args_list] == [3, 1, 1]
+        rows = await store.find_records(StubTracker, table_name=table_name)
+        reasons = {row["record_id"]: row["reason"] for row in rows}
+        assert reasons == {
+            ids[0]: "first",
+            ids[1]: "first",
+            ids[2]: "first",
+            ids[3]: None,
+        }
+
     async def test_ensure_junction_fk_targets_creates_stubs(self, class_entity_store):
         """_ensure_junction_fk_targets creates Post stubs for pinned_posts FK refs.
 
@@ -0,0 +1,135 @@
+"""Tests for PostgresEntityStore's per-field hash indexes.
+
+Models declare ``__indexed_fields__``; the store keeps value -> id buckets
+in step with the identity map (cache_instance / invalidate / attribute
+assignment) and narrows cache-first equality filters to one bucket.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from metadata.models import Account, AccountMedia, Media
+from tests.fixtures.utils.test_isolation import snowflake_id
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("field_index")
+class TestFieldIndexMaintenance:
+    """Buckets follow cache_instance, invalidate and field assignment."""
+
+    async def test_cache_instance_indexes_declared_fields(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        m = Media(id=snowflake_id(), accountId=account_id, content_hash="fi_hash")
+        store.cache_instance(m)
+        by_field = store._field_index[Media]
+        assert by_field["accountId"][account_id] == {m.id}
+        assert by_field["content_hash"]["fi_hash"] == {m.id}
+        assert "mimetype" not in by_field
+
+    async def test_invalidate_drops_buckets(self, reset_class_store):
+        store = reset_class_store
+        m = Media(id=snowflake_id(), accountId=snowflake_id(), content_hash="fi_gone")
+        store.cache_instance(m)
+        store.invalidate(Media, m.id)
+        assert "fi_gone" not in store._field_index[Media]["content_hash"]
+        assert (Media, m.id) not in store._indexed_values
+
+    async def test_assignment_moves_entry_between_buckets(self, reset_class_store):
+        store = reset_class_store
+        m = Media(id=snowflake_id(), accountId=snowflake_id(), content_hash="fi_old")
+        store.cache_instance(m)
+        m.content_hash = "fi_new"
+        buckets = store._field_index[Media]["content_hash"]
+        assert "fi_old" not in buckets
+        assert buckets["fi_new"] == {m.id}
+
+    async def test_relationship_assignment_reindexes_fk(self, reset_class_store):
+        store = reset_class_store
+        old_owner = Account(id=snowflake_id(), username="fi_old_owner")
+        new_owner = Account(id=snowflake_id(), username="fi_new_owner")
+        m = Media(id=snowflake_id(), accountId=old_owner.id)
+        store.cache_instance(m)
+        m.account = new_owner
+        buckets = store._field_index[Media]["accountId"]
+        assert old_owner.id not in buckets
+        assert buckets[new_owner.id] == {m.id}
+
+    async def test_invalidate_type_and_all_clear_indexes(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        m = Media(id=snowflake_id(), accountId=account_id)
+        am = AccountMedia(
+            id=snowflake_id(),
+            accountId=account_id,
+            mediaId=m.id,
+            createdAt=datetime.now(UTC),
+        )
+        store.cache_instance(m)
+        store.cache_instance(am)
+        store.invalidate_type(Media)
+        assert Media not in store._field_index
+        assert AccountMedia in store._field_index
+        store.invalidate_all()
+        assert store._field_index == {}
+        assert store._indexed_values == {}
+
+
+@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.xdist_group("field_index")
+class TestFieldIndexLookups:
+    """Cache-first find/find_one/count consult the smallest bucket."""
+
+    async def test_find_one_by_content_hash(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        target = Media(
+            id=snowflake_id(),
+            accountId=account_id,
+            content_hash="fi_target",
+            is_downloaded=True,
+        )
+        other = Media(id=snowflake_id(), accountId=account_id, content_hash="fi_x")
+        store.cache_instance(target)
+        store.cache_instance(other)
+        store._fully_loaded.add(Media)
+        try:
+            found = await store.find_one(
+                Media, content_hash="fi_target", is_downloaded=True
+            )
+            assert found is target
+            assert store.get_stats()["field_index_hits"] >= 1
+            assert await store.find_one(Media, content_hash="fi_missing") is None
+        finally:
+            store._fully_loaded.discard(Media)
+
+    async def test_find_and_count_by_account(self, reset_class_store):
+        store = reset_class_store
+        account_id = snowflake_id()
+        mine = [
+            Media(id=snowflake_id(), accountId=account_id, is_downloaded=True)
+            for _ in range(3)
+        ]
+        store.cache_instance(Media(id=snowflake_id(), accountId=snowflake_id()))
+        for m in mine:
+            store.cache_instance(m)
+        mine[0].is_downloaded = False
+        store._fully_loaded.add(Media)
+        try:
+            results = await store.find(Media, accountId=account_id, is_downloaded=True)
+            assert {m.id for m in results} == {mine[1].id, mine[2].id}
+            assert await store.count(Media, accountId=account_id) == 3
+        finally:
+            store._fully_loaded.discard(Media)
+
+    async def test_non_exact_lookup_scans_type(self, reset_class_store):
+        store = reset_class_store
+        m = Media(id=snowflake_id(), accountId=snowflake_id(), content_hash="fi_scan")
+        store.cache_instance(m)
+        store._fully_loaded.add(Media)
+        try:
+            results = await store.find(Media, content_hash__contains="fi_sc")
+            assert [r.id for r in results] == [m.id]
+        finally:
+            store._fully_loaded.discard(Media)
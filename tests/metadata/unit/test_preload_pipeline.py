@@ -0,0 +1,59 @@
+"""Tests for the pipelined preload (concurrent fetch, ordered materialize)."""
+
+import pytest
+
+from metadata.models import Account, Hashtag, Media, Post
+from tests.fixtures.metadata import AccountFactory, MediaFactory, PostFactory
+from tests.fixtures.utils.test_isolation import snowflake_id
+
+
+_PRELOAD_ORDER = [Hashtag, Media, Account, Post]
+
+
+class TestPreloadPipeline:
+    """Fetch-ahead preload loads the same graph and reports timings."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 2, 8])
+    async def test_loads_and_autolinks_every_type(self, entity_store, concurrency):
+        store = entity_store
+        account = AccountFactory(id=snowflake_id(), username=f"pipe_{concurrency}")
+        await store.save(account)
+        media = MediaFactory(id=snowflake_id(), accountId=account.id)
+        await store.save(media)
+        post = PostFactory(id=snowflake_id(), accountId=account.id)
+        await store.save(post)
+        store.invalidate_all()
+
+        await store.preload(_PRELOAD_ORDER, batch_size=1, concurrency=concurrency)
+
+        for model_type in _PRELOAD_ORDER:
+            assert store.is_fully_loaded(model_type)
+        cached_post = store.get_from_cache(Post, post.id)
+        assert cached_post is not None
+        assert cached_post.account is store.get_from_cache(Account, account.id)
+
+        timings = store.cache_stats()["preload_timings"]
+        assert set(timings) == {t.__name__ for t in _PRELOAD_ORDER}
+        assert timings["Media"]["rows"] == 1
+        assert timings["Media"]["fetch_seconds"] >= 0
+        assert timings["Media"]["validate_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_propagates(self, entity_store, monkeypatch):
+        store = entity_store
+        store.invalidate_all()
+        original = store._fetch_all_associations
+
+        async def failing(model_type, *args, **kwargs):
+            if model_type is Account:
+                raise RuntimeError("account fetch failed")
+            return await original(model_type, *args, **kwargs)
+
+        monkeypatch.setattr(store, "_fetch_all_associations", failing)
+
+        with pytest.raises(RuntimeError, match="account fetch failed"):
+            await store.preload(_PRELOAD_ORDER, concurrency=2)
+        # Types materialized before the failure are loaded, later ones aren't
+        assert store.is_fully_loaded(Media)
+        assert not store.is_fully_loaded(Post)
@@ -0,0 +1,142 @@
+"""Tests for the account-scoped preload (``preload(account_ids=...)``).
+
+Each test seeds two accounts, drops the identity map, and preloads only
+one of them; the other account's rows must stay out of the cache and be
+served from SQL.
+"""
+
+import pytest
+
+from metadata.models import Account, Hashtag, Media, Post
+from tests.fixtures.metadata import AccountFactory, MediaFactory, PostFactory
+from tests.fixtures.utils.test_isolation import snowflake_id
+
+
+_PRELOAD_ORDER = [Hashtag, Media, Account, Post]
+
+
+async def _seed_account(store, username: str) -> tuple[int, int, int]:
+    """Persist an account with one Media and one Post; returns their ids."""
+    account = AccountFactory(id=snowflake_id(), username=username)
+    await store.save(account)
+    media = MediaFactory(id=snowflake_id(), accountId=account.id)
+    await store.save(media)
+    post = PostFactory(id=snowflake_id(), accountId=account.id)
+    await store.save(post)
+    return account.id, media.id, post.id
+
+
+class TestScopedPreload:
+    """Scope filtering, per-account cache coverage and on-demand loads."""
+
+    @pytest.mark.asyncio
+    async def test_loads_only_selected_accounts(self, entity_store):
+        store = entity_store
+        alice = await _seed_account(store, "scoped_alice")
+        bob = await _seed_account(store, "scoped_bob")
+        await store.save(Hashtag(value="scoped_tag"))
+        store.invalidate_all()
+
+        await store.preload(_PRELOAD_ORDER, account_ids=[alice[0]])
+
+        for model_type, eid in zip((Account, Media, Post), alice, strict=True):
+            assert store.get_from_cache(model_type, eid) is not None
+        for model_type, eid in zip((Account, Media, Post), bob, strict=True):
+            assert store.get_from_cache(model_type, eid) is None
+        # Unscoped tables still load whole and stay type-level fully loaded
+        assert store.is_fully_loaded(Hashtag)
+        assert not store.is_fully_loaded(Media)
+        assert store.cache_stats()["loaded_accounts"] == [alice[0]]
+
+    @pytest.mark.asyncio
+    async def test_lookups_use_cache_for_loaded_accounts(self, entity_store):
+        store = entity_store
+        alice = await _seed_account(store, "scoped_cover_alice")
+        bob = await _seed_account(store, "scoped_cover_bob")
+        store.invalidate_all()
+        await store.preload(_PRELOAD_ORDER, account_ids=[alice[0]])
+        store.reset_stats()
+
+        media = await store.find(Media, accountId=alice[0])
+        assert [m.id for m in media] == [alice[1]]
+        assert store.get_stats()["find_cache_hits"] == 1
+
+        # Not loaded: falls back to SQL and still finds the row
+        media = await store.find(Media, accountId=bob[0])
+        assert [m.id for m in media] == [bob[1]]
+        assert store.get_stats()["find_pg_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_preload_account_loads_on_demand(self, entity_store):
+        store = entity_store
+        alice = await _seed_account(store, "scoped_lazy_alice")
+        bob = await _seed_account(store, "scoped_lazy_bob")
+        store.invalidate_all()
+        await store.preload(_PRELOAD_ORDER, account_ids=[alice[0]])
+
+        await store.preload_account(bob[0])
+
+        for model_type, eid in zip((Account, Media, Post), bob, strict=True):
+            assert store.get_from_cache(model_type, eid) is not None
+        assert await store.count(Post, accountId=bob[0]) == 1
+        assert sorted(store.cache_stats()["loaded_accounts"]) == sorted(
+            [alice[0], bob[0]]
+        )
+
+    @pytest.mark.asyncio
+    async def test_preload_account_is_noop_after_full_preload(self, entity_store):
+        store = entity_store
+        alice = await _seed_account(store, "scoped_full_alice")
+        store.invalidate_all()
+        await store.preload(_PRELOAD_ORDER)
+
+        await store.preload_account(alice[0])
+
+        assert store.cache_stats()["loaded_accounts"] == []
+        assert store.is_fully_loaded(Media)
+
+    @pytest.mark.asyncio
+    async def test_eviction_drops_account_marker(self, entity_store):
+        store = entity_store
+        alice = await _seed_account(store, "scoped_evict_alice")
+        store.invalidate_all()
+        await store.preload(_PRELOAD_ORDER, account_ids=[alice[0]])
+        media = store.get_from_cache(Media, alice[1])
+        assert media is not None
+
+        store._max_entities = 1
+        try:
+            store._evict_lru()
+            assert alice[0] not in store._loaded_accounts[Media]
+        finally:
+            store._max_entities = None
+
+    @pytest.mark.asyncio
+    async def test_unscoped_row_keeps_stored_state_on_save(self, entity_store):
+        """A row outside the loaded accounts is merged from the DB when saved."""
+        store = entity_store
+        alice = await _seed_account(store, "scoped_merge_alice")
+        bob = await _seed_account(store, "scoped_merge_bob")
+        stored = await store.get(Media, bob[1])
+        stored.is_downloaded = True
+        stored.content_hash = "scoped_merge_hash"
+        stored.local_filename = "scoped_merge.jpg"
+        await store.save(stored)
+        store.invalidate_all()
+        await store.preload(_PRELOAD_ORDER, account_ids=[alice[0]])
+        store.reset_stats()
+
+        # e.g. media of a reposted post: alice's page carries bob's media
+        fresh = Media.model_validate({"id": bob[1], "accountId": bob[0]})
+        assert fresh._is_new
+        await store.save(fresh)
+
+        assert fresh.is_downloaded is True
+        assert fresh.content_hash == "scoped_merge_hash"
+        assert fresh.local_filename == "scoped_merge.jpg"
+        assert store.get_stats()["stored_row_lookups"] == 1
+
+        # Alice's account is loaded, so her new rows need no lookup
+        new_media = Media.model_validate({"id": snowflake_id(), "accountId": alice[0]})
+        await store.save(new_media)
+        assert store.get_stats()["stored_row_lookups"] == 1